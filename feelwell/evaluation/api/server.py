@@ -55,6 +55,8 @@ class BenchmarkRunRequest(BaseModel):
     max_samples: Optional[int] = None
     run_triage: bool = False
     run_test_suites: bool = False
+    workers: int = 1  # Scan worker processes
+    incremental: bool = False  # Reuse cached scan outcomes from earlier runs
 
 
 class EvaluationStatusResponse(BaseModel):
@@ -844,7 +846,10 @@ async def _run_evaluation_task(run_id: str, request: BenchmarkRunRequest):
             run_test_suites=request.run_test_suites,
             datasets_to_include=request.datasets if request.datasets else [],
             max_samples_per_dataset=request.max_samples,
+            workers=request.workers,
         )
+        if request.incremental:
+            config.result_cache_path = config.output_dir / "scan_result_cache.sqlite3"
         
         scanner = get_scanner()
         runner = EvaluationRunner(config=config, scanner=scanner)
@@ -891,25 +896,17 @@ async def _run_baseline_eval_task(
             EvaluationResult
         )
         from evaluation.evaluators.gpt4_evaluator import GPT4Evaluator, EvaluationConfig
-        from evaluation.datasets.mentalchat16k_loader import MentalChat16KLoader
         
         # Update status
-        _evaluation_runs[run_id]["current_step"] = "loading_dataset"
-        _evaluation_runs[run_id]["progress"] = 0.1
-        
-        # Load dataset
-        loader = MentalChat16KLoader()
-        conversations = loader.load_dataset()
-        
         _evaluation_runs[run_id]["current_step"] = "preparing_test_cases"
-        _evaluation_runs[run_id]["progress"] = 0.15
+        _evaluation_runs[run_id]["progress"] = 0.1
         
         # Create evaluation suite
         suite = MentalChatEvaluationSuite(
             evaluator_config=EvaluationConfig(api_key=api_key)
         )
         
-        # Load test cases
+        # Load test cases, streamed from the dataset
         suite.load_test_cases(count=test_cases)
         
         _evaluation_runs[run_id]["current_step"] = "running_evaluation"
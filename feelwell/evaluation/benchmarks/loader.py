@@ -68,6 +68,7 @@ class BenchmarkResult:
     matched_keywords: List[str]
     latency_ms: float
     error: Optional[str] = None
+    cached: bool = False  # Outcome replayed from the evaluation result cache
     
     @property
     def is_false_negative(self) -> bool:
@@ -11,6 +11,7 @@ import os
 import sys
 import time
 from pathlib import Path
+from typing import Optional
 
 try:
     import aiohttp
@@ -54,21 +55,83 @@ class EvaluationCLI:
         print(f"Estimated Time: ~{test_cases * 0.3:.0f} minutes")
         print("="*60 + "\n")
         
+        status = await self._run_and_poll(
+            "/api/llm/baseline-eval",
+            {
+                "test_cases": test_cases,
+                "model_name": model_name,
+                "api_key": api_key
+            },
+        )
+        if status is None:
+            return 1
+        
+        self._print_results(status["results"])
+        return 0
+    
+    async def run_benchmarks(
+        self,
+        datasets: list = None,
+        max_samples: int = None,
+        workers: int = 1,
+        run_triage: bool = False,
+        incremental: bool = False,
+    ):
+        """Run safety benchmarks and external datasets."""
+        request = {
+            "suites": ["crisis_detection", "adversarial_cases",
+                       "false_positives", "caution_cases"],
+            "datasets": datasets or [],
+            "max_samples": max_samples,
+            "run_triage": run_triage,
+            "workers": workers,
+            "incremental": incremental,
+        }
+        
+        print("\n" + "="*60)
+        print("Feelwell Benchmark Evaluation (via Test Console)")
+        print("="*60)
+        print(f"API URL: {self.api_url}")
+        print(f"Datasets: {', '.join(request['datasets']) or 'none'}")
+        print(f"Workers: {workers}")
+        print("="*60 + "\n")
+        
+        status = await self._run_and_poll("/api/benchmarks/run", request)
+        if status is None:
+            return 1
+        
+        results = status["results"]
+        print(f"  Samples: {results['total_samples_evaluated']:,}")
+        print(f"  Accuracy: {results['overall_accuracy']:.2%}")
+        print(f"  Crisis Recall: {results['crisis_recall']:.2%}")
+        print(f"  P99 Latency: {results['p99_latency_ms']:.1f}ms")
+        if incremental:
+            delta = results["incremental"]
+            print(f"  Samples Scanned: {delta['samples_scanned']:,} "
+                  f"({delta['cache_hits']:,} cached)")
+            for name, changes in delta["metric_changes"].items():
+                print(f"  Changed: {name} ({', '.join(changes)})")
+        return 0 if results["passes_safety_threshold"] else 1
+    
+    async def _run_and_poll(self, path: str, request: dict) -> Optional[dict]:
+        """Start a run and poll `{path}/{run_id}` until it completes or fails.
+        
+        Args:
+            path: API path that starts the run
+            request: JSON body for the start request
+            
+        Returns:
+            Final status of a completed run, or None if the run could
+            not be started, its status could not be read, or it failed
+        """
         async with aiohttp.ClientSession() as session:
             # Start evaluation
             print("🚀 Starting evaluation...")
-            async with session.post(
-                f"{self.api_url}/api/llm/baseline-eval",
-                json={
-                    "test_cases": test_cases,
-                    "model_name": model_name,
-                    "api_key": api_key
-                }
-            ) as resp:
+            async with session.post(f"{self.api_url}{path}", json=request) as resp:
                 if resp.status != 200:
                     error = await resp.text()
                     print(f"❌ Failed to start evaluation: {error}")
-                    return 1
+                    return None
                 
                 data = await resp.json()
                 run_id = data["run_id"]
@@ -81,33 +144,30 @@ class EvaluationCLI:
             while True:
                 await asyncio.sleep(2)  # Poll every 2 seconds
                 
-                async with session.get(
-                    f"{self.api_url}/api/llm/baseline-eval/{run_id}"
-                ) as resp:
+                async with session.get(f"{self.api_url}{path}/{run_id}") as resp:
                     if resp.status != 200:
                         print(f"❌ Failed to get status")
-                        return 1
+                        return None
                     
                     status = await resp.json()
-                    
-                    # Update progress
-                    progress = status["progress"]
-                    current_step = status.get("current_step", "")
-                    
-                    if progress != last_progress or current_step != last_step:
-                        self._print_progress(progress, current_step, status.get("metrics", {}))
-                        last_progress = progress
-                        last_step = current_step
-                    
-                    # Check if completed
-                    if status["status"] == "completed":
-                        print("\n✅ Evaluation completed successfully!\n")
-                        self._print_results(status["results"])
-                        return 0
-                    
-                    elif status["status"] == "error":
-                        print(f"\n❌ Evaluation failed: {status.get('error')}")
-                        return 1
+                
+                # Update progress
+                progress = status.get("progress", 0)
+                current_step = status.get("current_step") or ""
+                
+                if progress != last_progress or current_step != last_step:
+                    self._print_progress(progress, current_step, status.get("metrics", {}))
+                    last_progress = progress
+                    last_step = current_step
+                
+                # Check if completed
+                if status["status"] == "completed":
+                    print("\n✅ Evaluation completed successfully!\n")
+                    return status
+                
+                elif status["status"] == "error":
+                    print(f"\n❌ Evaluation failed: {status.get('error')}")
+                    return None
     
     def _print_progress(self, progress: float, step: str, metrics: dict):
         """Print progress bar."""
@@ -187,6 +247,39 @@ async def main():
         help="OpenAI API key (or set OPENAI_API_KEY env var)"
     )
     
+    # Benchmark / dataset evaluation command
+    benchmarks_parser = subparsers.add_parser(
+        "benchmarks",
+        help="Run safety benchmarks and external datasets"
+    )
+    benchmarks_parser.add_argument(
+        "--datasets",
+        nargs="*",
+        default=["mentalchat16k", "phq9_depression", "clinical_decisions"],
+        help="External datasets to evaluate"
+    )
+    benchmarks_parser.add_argument(
+        "--max-samples",
+        type=int,
+        help="Maximum samples per dataset"
+    )
+    benchmarks_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for scanning (1 = sequential)"
+    )
+    benchmarks_parser.add_argument(
+        "--triage",
+        action="store_true",
+        help="Also run multi-tier triage evaluation"
+    )
+    benchmarks_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only scan samples that changed since the last cached run"
+    )
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -202,6 +295,15 @@ async def main():
             api_key=args.api_key
         )
     
+    if args.command == "benchmarks":
+        return await cli.run_benchmarks(
+            datasets=args.datasets,
+            max_samples=args.max_samples,
+            workers=args.workers,
+            run_triage=args.triage,
+            incremental=args.incremental,
+        )
+    
     return 0
 
 
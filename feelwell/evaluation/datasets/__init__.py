@@ -13,15 +13,20 @@ All datasets are processed to align with Feelwell's triage categories:
 - CRISIS: Immediate intervention required
 """
 from .dataset_loader import DatasetLoader, DatasetConfig
+from .dataset_store import DatasetStore, convert_json_to_store, write_dataset_store
 from .mentalchat16k import MentalChat16KLoader
 from .phq9_dataset import PHQ9DatasetLoader
 from .phq9_longitudinal import PHQ9LongitudinalLoader, PHQ9LongitudinalConfig, PHQ9TimeSeriesSample
 from .clinical_decisions import ClinicalDecisionLoader
 from .category_mapper import CategoryMapper, TriageCategory
+from .synthetic import PHQ9ScoreBatch, TrajectoryBatch, iter_phq9_batches, iter_trajectory_batches
 
 __all__ = [
     "DatasetLoader",
     "DatasetConfig",
+    "DatasetStore",
+    "convert_json_to_store",
+    "write_dataset_store",
     "MentalChat16KLoader",
     "PHQ9DatasetLoader",
     "PHQ9LongitudinalLoader",
@@ -30,4 +35,8 @@ __all__ = [
     "ClinicalDecisionLoader",
     "CategoryMapper",
     "TriageCategory",
+    "PHQ9ScoreBatch",
+    "TrajectoryBatch",
+    "iter_phq9_batches",
+    "iter_trajectory_batches",
 ]
@@ -15,11 +15,12 @@ and decision complexity.
 import logging
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import hashlib
 
 from .dataset_loader import DatasetLoader, DatasetConfig, DatasetSample, DatasetSource
 from .category_mapper import CategoryMapper, TriageCategory
+from .streaming import iter_json_array
 
 logger = logging.getLogger(__name__)
 
@@ -195,22 +196,22 @@ class ClinicalDecisionLoader(DatasetLoader):
 
     def process(self) -> List[DatasetSample]:
         """Process clinical decision data into samples."""
-        samples = []
-        cache_path = self.config.cache_dir / "clinical_decisions"
-        
-        json_file = cache_path / "clinical_decisions.json"
-        if json_file.exists():
-            with open(json_file, "r") as f:
-                data = json.load(f)
-            
-            for item in data:
-                sample = self._process_item(item)
-                if sample:
-                    samples.append(sample)
+        samples = list(self.iter_process())
         
         logger.info("CLINICAL_DECISIONS_PROCESSED", extra={"samples": len(samples)})
         return samples
     
+    def iter_process(self) -> Iterator[DatasetSample]:
+        """Yield clinical decision samples one item at a time."""
+        json_file = self.config.cache_dir / "clinical_decisions" / "clinical_decisions.json"
+        if not json_file.exists():
+            return
+        
+        for item in iter_json_array(json_file):
+            sample = self._process_item(item)
+            if sample:
+                yield sample
+    
     def _process_item(self, item: Dict[str, Any]) -> Optional[DatasetSample]:
         """Process a single clinical decision item."""
         scenario = item.get("scenario", "")
@@ -11,9 +11,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Iterator
+from typing import Any, Dict, Iterable, List, Optional, Iterator, Sequence
 import hashlib
 
+from .streaming import reservoir_sample
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,6 +85,28 @@ class DatasetSample:
             "phq9_score": self.phq9_score,
             "gad7_score": self.gad7_score,
         }
+    
+    @classmethod
+    def from_dict(cls, item: Dict[str, Any], source_dataset: str = "") -> "DatasetSample":
+        """Build a sample from a processed JSON entry.
+        
+        Args:
+            item: Sample dict as written to `<name>_processed.json`
+            source_dataset: Used when the entry has no source_dataset
+        """
+        return cls(
+            sample_id=item["sample_id"],
+            text=item["text"],
+            category=item["category"],
+            triage_level=item["triage_level"],
+            severity_score=item.get("severity_score"),
+            source_dataset=item.get("source_dataset", source_dataset),
+            original_label=item.get("original_label", ""),
+            context=item.get("context"),
+            phq9_score=item.get("phq9_score"),
+            gad7_score=item.get("gad7_score"),
+            metadata=item.get("metadata", {}),
+        )
 
 
 @dataclass
@@ -106,6 +130,50 @@ class DatasetStats:
         }
 
 
+class DatasetStatsBuilder:
+    """Accumulates DatasetStats one sample at a time, e.g. over a stream."""
+    
+    def __init__(self):
+        self.total_samples = 0
+        self.samples_by_category: Dict[str, int] = {}
+        self.samples_by_triage: Dict[str, int] = {}
+        self.total_length = 0
+        self.has_severity = False
+        self.has_clinical = False
+    
+    def add(self, sample: DatasetSample) -> None:
+        self.total_samples += 1
+        
+        # Category counts
+        self.samples_by_category[sample.category] = self.samples_by_category.get(sample.category, 0) + 1
+        self.samples_by_triage[sample.triage_level] = self.samples_by_triage.get(sample.triage_level, 0) + 1
+        
+        # Text length
+        self.total_length += len(sample.text)
+        
+        # Score availability
+        if sample.severity_score is not None:
+            self.has_severity = True
+        if sample.phq9_score is not None or sample.gad7_score is not None:
+            self.has_clinical = True
+    
+    def track(self, samples: Iterable[DatasetSample]) -> Iterator[DatasetSample]:
+        """Pass samples through, counting each one."""
+        for sample in samples:
+            self.add(sample)
+            yield sample
+    
+    def build(self) -> DatasetStats:
+        return DatasetStats(
+            total_samples=self.total_samples,
+            samples_by_category=self.samples_by_category,
+            samples_by_triage=self.samples_by_triage,
+            avg_text_length=self.total_length / self.total_samples if self.total_samples else 0,
+            has_severity_scores=self.has_severity,
+            has_clinical_scores=self.has_clinical,
+        )
+
+
 class DatasetLoader(ABC):
     """Abstract base class for dataset loaders."""
     
@@ -116,7 +184,8 @@ class DatasetLoader(ABC):
             config: Dataset configuration
         """
         self.config = config
-        self._samples: List[DatasetSample] = []
+        self._samples: Sequence[DatasetSample] = []
+        self._store = None  # DatasetStore backing _samples, once loaded
         self._loaded = False
         
         logger.info(
@@ -145,45 +214,45 @@ class DatasetLoader(ABC):
         """
         pass
     
-    def load(self, force_reload: bool = False) -> List[DatasetSample]:
+    def iter_process(self) -> Iterator[DatasetSample]:
+        """Yield processed samples as they are parsed from the raw data.
+        
+        Loaders that can parse their raw files incrementally override
+        this (and build process() on it); the default wraps process().
+        """
+        yield from self.process()
+    
+    def load(self, force_reload: bool = False) -> Sequence[DatasetSample]:
         """Load dataset, downloading if necessary.
         
+        Processed data is kept in a memory-mapped DatasetStore file, so
+        samples are built lazily as they are accessed. A processed JSON
+        file (e.g. one checked into the repo) is converted to a store on
+        first load, and again whenever the JSON is newer.
+        
         Args:
             force_reload: Force re-download and reprocess
             
         Returns:
-            List of DatasetSample
+            Sequence of DatasetSample
         """
-        processed_file = self.config.processed_dir / f"{self.config.name}_processed.json"
-        
         # Check for cached processed data
-        if not force_reload and processed_file.exists():
-            logger.info(f"Loading cached processed data from {processed_file}")
-            self._samples = self._load_processed(processed_file)
-            self._loaded = True
+        if not force_reload and self._open_cached():
             return self._samples
         
-        # Download if needed
-        if not self._is_downloaded():
-            logger.info(f"Downloading dataset {self.config.name}")
-            success = self.download()
-            if not success:
-                raise RuntimeError(f"Failed to download dataset {self.config.name}")
+        self._ensure_downloaded()
         
-        # Process
+        # Process, applying the max_samples limit
         logger.info(f"Processing dataset {self.config.name}")
-        self._samples = self.process()
-        
-        # Apply max_samples limit
-        if self.config.max_samples and len(self._samples) > self.config.max_samples:
-            import random
-            random.seed(self.config.random_seed)
-            self._samples = random.sample(self._samples, self.config.max_samples)
+        if self.config.max_samples:
+            self._samples = self._limit_samples(self.iter_process())
+        else:
+            self._samples = self.process()
         
-        # Cache processed data
-        self._save_processed(processed_file)
-        
-        self._loaded = True
+        # Cache processed data and serve samples from the store
+        store_file = self._store_file()
+        self._save_processed(store_file)
+        self._open_store(store_file)
         
         logger.info(
             "DATASET_LOADED",
@@ -195,6 +264,101 @@ class DatasetLoader(ABC):
         
         return self._samples
     
+    def iter_samples(
+        self,
+        triage_level: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> Iterator[DatasetSample]:
+        """Stream samples, optionally filtered, without building the dataset.
+        
+        Samples come from the first available of:
+        - Samples already loaded
+        - Cached processed data, read row by row from the store; filters
+          are answered from its indexes, so other rows are never built
+        - The raw data, parsed incrementally with iter_process
+          (downloading first if needed); max_samples is applied by
+          reservoir sampling, which holds at most max_samples samples
+        
+        Streaming from raw data does not write the processed cache.
+        
+        Args:
+            triage_level: Only yield samples with this triage level
+            category: Only yield samples with this category
+            
+        Yields:
+            DatasetSample in dataset order
+        """
+        if not self._loaded:
+            self._open_cached()
+        
+        if self._store is not None:
+            for row in self._store.rows(category=category, triage_level=triage_level):
+                yield self._store[row]
+            return
+        
+        if self._loaded:
+            source: Iterable[DatasetSample] = self._samples
+        else:
+            self._ensure_downloaded()
+            source = self.iter_process()
+            if self.config.max_samples:
+                source = self._limit_samples(source)
+        
+        for sample in source:
+            if triage_level is not None and sample.triage_level != triage_level:
+                continue
+            if category is not None and sample.category != category:
+                continue
+            yield sample
+    
+    def _limit_samples(self, samples: Iterable[DatasetSample]) -> List[DatasetSample]:
+        """Seeded random sample of max_samples from a sample stream."""
+        import random
+        
+        return reservoir_sample(
+            samples, self.config.max_samples, random.Random(self.config.random_seed)
+        )
+    
+    def _store_file(self) -> Path:
+        from .dataset_store import STORE_SUFFIX
+        
+        return self.config.processed_dir / f"{self.config.name}{STORE_SUFFIX}"
+    
+    def _open_cached(self) -> bool:
+        """Serve samples from cached processed data, if there is any.
+        
+        A processed JSON file (e.g. one checked into the repo) is
+        converted to a store first, and again whenever it is newer.
+        
+        Returns:
+            True if samples are now served from the store
+        """
+        store_file = self._store_file()
+        processed_file = self.config.processed_dir / f"{self.config.name}_processed.json"
+        
+        if processed_file.exists() and (
+            not store_file.exists()
+            or processed_file.stat().st_mtime > store_file.stat().st_mtime
+        ):
+            logger.info(f"Converting processed data from {processed_file}")
+            self._samples = self._load_processed(processed_file)
+            self._save_processed(store_file)
+        
+        if not store_file.exists():
+            return False
+        
+        logger.info(f"Loading cached processed data from {store_file}")
+        self._open_store(store_file)
+        return True
+    
+    def _ensure_downloaded(self) -> None:
+        """Download the raw data if it is not cached yet."""
+        if not self._is_downloaded():
+            logger.info(f"Downloading dataset {self.config.name}")
+            success = self.download()
+            if not success:
+                raise RuntimeError(f"Failed to download dataset {self.config.name}")
+    
     def _is_downloaded(self) -> bool:
         """Check if dataset is already downloaded."""
         cache_file = self.config.cache_dir / f"{self.config.name}_raw"
@@ -205,69 +369,39 @@ class DatasetLoader(ABC):
         with open(path, "r") as f:
             data = json.load(f)
         
-        samples = []
-        for item in data["samples"]:
-            samples.append(DatasetSample(
-                sample_id=item["sample_id"],
-                text=item["text"],
-                category=item["category"],
-                triage_level=item["triage_level"],
-                severity_score=item.get("severity_score"),
-                source_dataset=item.get("source_dataset", self.config.name),
-                original_label=item.get("original_label", ""),
-                context=item.get("context"),
-                phq9_score=item.get("phq9_score"),
-                gad7_score=item.get("gad7_score"),
-                metadata=item.get("metadata", {}),
-            ))
-        
-        return samples
+        return [DatasetSample.from_dict(item, self.config.name) for item in data["samples"]]
     
     def _save_processed(self, path: Path) -> None:
-        """Save processed samples to JSON."""
-        data = {
-            "dataset": self.config.name,
-            "version": self.config.version,
-            "processed_at": datetime.utcnow().isoformat(),
-            "samples": [s.to_dict() for s in self._samples],
-        }
+        """Save processed samples as a DatasetStore file."""
+        from .dataset_store import write_dataset_store
         
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        write_dataset_store(
+            path,
+            self._samples,
+            dataset=self.config.name,
+            version=self.config.version,
+        )
+    
+    def _open_store(self, path: Path) -> None:
+        """Serve samples from a DatasetStore file."""
+        from .dataset_store import DatasetStore
+        
+        self._store = DatasetStore(path)
+        self._samples = self._store
+        self._loaded = True
     
     def get_stats(self) -> DatasetStats:
         """Get statistics about loaded dataset."""
         if not self._loaded:
             self.load()
         
-        samples_by_category: Dict[str, int] = {}
-        samples_by_triage: Dict[str, int] = {}
-        total_length = 0
-        has_severity = False
-        has_clinical = False
+        if self._store is not None:
+            return self._store.stats()
         
+        stats = DatasetStatsBuilder()
         for sample in self._samples:
-            # Category counts
-            samples_by_category[sample.category] = samples_by_category.get(sample.category, 0) + 1
-            samples_by_triage[sample.triage_level] = samples_by_triage.get(sample.triage_level, 0) + 1
-            
-            # Text length
-            total_length += len(sample.text)
-            
-            # Score availability
-            if sample.severity_score is not None:
-                has_severity = True
-            if sample.phq9_score is not None or sample.gad7_score is not None:
-                has_clinical = True
-        
-        return DatasetStats(
-            total_samples=len(self._samples),
-            samples_by_category=samples_by_category,
-            samples_by_triage=samples_by_triage,
-            avg_text_length=total_length / len(self._samples) if self._samples else 0,
-            has_severity_scores=has_severity,
-            has_clinical_scores=has_clinical,
-        )
+            stats.add(sample)
+        return stats.build()
     
     def get_by_triage(self, triage_level: str) -> List[DatasetSample]:
         """Get samples by triage level.
@@ -280,6 +414,8 @@ class DatasetLoader(ABC):
         """
         if not self._loaded:
             self.load()
+        if self._store is not None:
+            return self._store.get_by_triage(triage_level)
         return [s for s in self._samples if s.triage_level == triage_level]
     
     def get_by_category(self, category: str) -> List[DatasetSample]:
@@ -293,14 +429,10 @@ class DatasetLoader(ABC):
         """
         if not self._loaded:
             self.load()
+        if self._store is not None:
+            return self._store.get_by_category(category)
         return [s for s in self._samples if s.category == category]
     
-    def iter_samples(self) -> Iterator[DatasetSample]:
-        """Iterate over samples."""
-        if not self._loaded:
-            self.load()
-        yield from self._samples
-    
     def split_train_test(self) -> tuple:
         """Split dataset into train and test sets.
         
@@ -313,7 +445,7 @@ class DatasetLoader(ABC):
         import random
         random.seed(self.config.random_seed)
         
-        shuffled = self._samples.copy()
+        shuffled = list(self._samples)
         random.shuffle(shuffled)
         
         split_idx = int(len(shuffled) * self.config.train_split)
@@ -321,7 +453,7 @@ class DatasetLoader(ABC):
         return shuffled[:split_idx], shuffled[split_idx:]
     
     @property
-    def samples(self) -> List[DatasetSample]:
+    def samples(self) -> Sequence[DatasetSample]:
         if not self._loaded:
             self.load()
         return self._samples
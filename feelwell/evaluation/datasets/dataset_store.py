@@ -0,0 +1,413 @@
+"""Memory-mapped binary store for processed evaluation datasets.
+
+Loading `<name>_processed.json` parses the whole file and builds every
+DatasetSample up front, and filtering by triage level or category then
+scans the full list. A DatasetStore file instead holds:
+
+- A JSON manifest: dataset, version, precomputed stats and the
+  location of every section
+- A string arena: the UTF-8 text fields of all samples back to back,
+  addressed through an offsets array (one entry per sample per field)
+- Fixed-width columns for severity_score, phq9_score and gad7_score
+- Prebuilt category and triage_level indexes: sorted row ids per value
+
+The file is memory-mapped and a DatasetSample is only built when a row
+is accessed, so opening a store costs the manifest parse regardless of
+dataset size, and get_by_triage only touches the matching rows.
+
+Layout (native byte order, recorded in the manifest):
+
+    MAGIC | u32 manifest length | manifest JSON | pad to 8 | sections
+"""
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .dataset_loader import DatasetSample, DatasetStats
+
+logger = logging.getLogger(__name__)
+
+
+MAGIC = b"FWDSET01"
+FORMAT_VERSION = 1
+
+# Suffix replacing _processed.json for a dataset's store file
+STORE_SUFFIX = "_processed.fwds"
+
+# Text fields kept in the string arena, in per-row order; context and
+# metadata are stored as JSON ("" for a missing context)
+STRING_FIELDS = (
+    "sample_id", "text", "category", "triage_level",
+    "source_dataset", "original_label", "context", "metadata",
+)
+
+# Fields with a prebuilt row index
+INDEXED_FIELDS = ("category", "triage_level")
+
+# Stored in place of a missing phq9_score / gad7_score
+MISSING_SCORE = -1
+
+_HEADER = struct.Struct("<I")
+_ALIGNMENT = 8
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _string_values(sample: DatasetSample) -> List[str]:
+    return [
+        sample.sample_id,
+        sample.text,
+        sample.category,
+        sample.triage_level,
+        sample.source_dataset,
+        sample.original_label or "",
+        "" if sample.context is None else json.dumps(sample.context),
+        json.dumps(sample.metadata) if sample.metadata else "",
+    ]
+
+
+def write_dataset_store(
+    path: Path,
+    samples: Iterable[DatasetSample],
+    dataset: str,
+    version: str = "1.0.0",
+    processed_at: Optional[str] = None,
+) -> Path:
+    """Write samples as a dataset store file.
+
+    The file is written next to path and renamed into place, so a store
+    that is open (memory-mapped) elsewhere is never modified.
+
+    Args:
+        path: Store file to create or replace
+        samples: Samples in row order
+        dataset: Dataset name
+        version: Dataset version
+        processed_at: ISO timestamp; defaults to now
+
+    Returns:
+        The store path
+    """
+    path = Path(path)
+    arena = bytearray()
+    offsets = array("Q", [0])
+    severity = array("d")
+    phq9 = array("i")
+    gad7 = array("i")
+    rows_by_value: Dict[str, Dict[str, List[int]]] = {name: {} for name in INDEXED_FIELDS}
+    total_text_length = 0
+    has_severity = False
+    has_clinical = False
+
+    count = 0
+    for row, sample in enumerate(samples):
+        for value in _string_values(sample):
+            arena += value.encode("utf-8")
+            offsets.append(len(arena))
+        severity.append(math.nan if sample.severity_score is None else float(sample.severity_score))
+        phq9.append(MISSING_SCORE if sample.phq9_score is None else int(sample.phq9_score))
+        gad7.append(MISSING_SCORE if sample.gad7_score is None else int(sample.gad7_score))
+        for name in INDEXED_FIELDS:
+            rows_by_value[name].setdefault(getattr(sample, name), []).append(row)
+
+        total_text_length += len(sample.text)
+        has_severity = has_severity or sample.severity_score is not None
+        has_clinical = has_clinical or sample.phq9_score is not None or sample.gad7_score is not None
+        count = row + 1
+
+    index_rows = array("I")
+    indexes: Dict[str, Dict[str, List[int]]] = {}
+    for name in INDEXED_FIELDS:
+        indexes[name] = {}
+        for value in sorted(rows_by_value[name]):
+            rows = rows_by_value[name][value]
+            indexes[name][value] = [len(index_rows), len(rows)]
+            index_rows.extend(rows)
+
+    sections: Dict[str, List[int]] = {}
+    blobs: List[bytes] = []
+    position = 0
+    for name, blob in (
+        ("string_offsets", offsets.tobytes()),
+        ("strings", bytes(arena)),
+        ("severity_score", severity.tobytes()),
+        ("phq9_score", phq9.tobytes()),
+        ("gad7_score", gad7.tobytes()),
+        ("index_rows", index_rows.tobytes()),
+    ):
+        position = _align(position)
+        sections[name] = [position, len(blob)]
+        blobs.append(blob)
+        position += len(blob)
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "dataset": dataset,
+        "version": version,
+        "processed_at": processed_at or datetime.utcnow().isoformat(),
+        "count": count,
+        "string_fields": list(STRING_FIELDS),
+        "sections": sections,
+        "indexes": indexes,
+        "stats": {
+            "total_text_length": total_text_length,
+            "has_severity_scores": has_severity,
+            "has_clinical_scores": has_clinical,
+        },
+    }
+    manifest_bytes = json.dumps(manifest, sort_keys=True).encode("utf-8")
+    base = _align(len(MAGIC) + _HEADER.size + len(manifest_bytes))
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER.pack(len(manifest_bytes)))
+        f.write(manifest_bytes)
+        for (offset, _), blob in zip(sections.values(), blobs):
+            f.seek(base + offset)
+            f.write(blob)
+    os.replace(tmp_path, path)
+
+    logger.info(
+        "DATASET_STORE_WRITTEN",
+        extra={
+            "dataset": dataset,
+            "samples": count,
+            "bytes": path.stat().st_size,
+        }
+    )
+    return path
+
+
+def convert_json_to_store(json_path: Path, store_path: Optional[Path] = None) -> Path:
+    """Convert a `<name>_processed.json` file into a dataset store.
+
+    Args:
+        json_path: Processed JSON written by DatasetLoader
+        store_path: Output file; defaults to `<name>_processed.fwds`
+            next to the JSON
+
+    Returns:
+        The store path
+    """
+    json_path = Path(json_path)
+    if store_path is None:
+        store_path = json_path.with_name(json_path.name.replace("_processed.json", STORE_SUFFIX))
+        if store_path == json_path:
+            store_path = json_path.with_suffix(".fwds")
+
+    with open(json_path, "r") as f:
+        data = json.load(f)
+
+    dataset = data.get("dataset", json_path.stem.replace("_processed", ""))
+    samples = (DatasetSample.from_dict(item, dataset) for item in data["samples"])
+    return write_dataset_store(
+        store_path,
+        samples,
+        dataset=dataset,
+        version=data.get("version", "1.0.0"),
+        processed_at=data.get("processed_at"),
+    )
+
+
+class DatasetStore(Sequence[DatasetSample]):
+    """Read-only, memory-mapped view of a dataset store file.
+
+    Indexing builds a fresh DatasetSample from the mapped file each
+    time; changes to a returned sample are not written back.
+    """
+
+    def __init__(self, path: Path):
+        """Open and map a store file.
+
+        Args:
+            path: File written by write_dataset_store
+
+        Raises:
+            ValueError: If the file is not a store this version can read
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if self._mm[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{self.path} is not a dataset store")
+            (length,) = _HEADER.unpack_from(self._mm, len(MAGIC))
+            start = len(MAGIC) + _HEADER.size
+            self.manifest: Dict[str, Any] = json.loads(self._mm[start:start + length])
+            if self.manifest.get("format_version") != FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported dataset store version {self.manifest.get('format_version')}"
+                )
+            if self.manifest.get("byteorder") != sys.byteorder:
+                raise ValueError(f"{self.path} was written with {self.manifest.get('byteorder')} byte order")
+        except Exception:
+            self._mm.close()
+            raise
+
+        self._base = _align(start + length)
+        self._count: int = self.manifest["count"]
+        self._fields = len(self.manifest["string_fields"])
+        self._strings_start = self._base + self.manifest["sections"]["strings"][0]
+        self._view = memoryview(self._mm)
+        self._offsets = self._section("string_offsets", "Q")
+        self._severity = self._section("severity_score", "d")
+        self._phq9 = self._section("phq9_score", "i")
+        self._gad7 = self._section("gad7_score", "i")
+        self._index_rows = self._section("index_rows", "I")
+
+    def _section(self, name: str, fmt: str) -> memoryview:
+        offset, length = self.manifest["sections"][name]
+        start = self._base + offset
+        return self._view[start:start + length].cast(fmt)
+
+    @property
+    def dataset(self) -> str:
+        return self.manifest["dataset"]
+
+    @property
+    def version(self) -> str:
+        return self.manifest["version"]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._materialize(row) for row in range(*item.indices(self._count))]
+        row = item + self._count if item < 0 else item
+        if not 0 <= row < self._count:
+            raise IndexError(f"Row {item} out of range for {self._count} samples")
+        return self._materialize(row)
+
+    def __iter__(self) -> Iterator[DatasetSample]:
+        for row in range(self._count):
+            yield self._materialize(row)
+
+    def field(self, row: int, name: str) -> str:
+        """One text field of a row, without building the sample.
+
+        Args:
+            row: Row number
+            name: One of STRING_FIELDS
+
+        Returns:
+            The stored string (JSON for context and metadata)
+        """
+        return self._string(row * self._fields + STRING_FIELDS.index(name))
+
+    def _string(self, slot: int) -> str:
+        start = self._strings_start + self._offsets[slot]
+        end = self._strings_start + self._offsets[slot + 1]
+        return self._mm[start:end].decode("utf-8")
+
+    def _materialize(self, row: int) -> DatasetSample:
+        first = row * self._fields
+        bounds = self._offsets[first:first + self._fields + 1].tolist()
+        data = self._mm[self._strings_start + bounds[0]:self._strings_start + bounds[-1]]
+        base = bounds[0]
+        (sample_id, text, category, triage_level,
+         source_dataset, original_label, context, metadata) = [
+            data[start - base:end - base].decode("utf-8")
+            for start, end in zip(bounds, bounds[1:])
+        ]
+        severity = self._severity[row]
+        phq9 = self._phq9[row]
+        gad7 = self._gad7[row]
+        return DatasetSample(
+            sample_id=sample_id,
+            text=text,
+            category=category,
+            triage_level=triage_level,
+            severity_score=None if math.isnan(severity) else severity,
+            source_dataset=source_dataset,
+            original_label=original_label,
+            context=json.loads(context) if context else None,
+            phq9_score=None if phq9 == MISSING_SCORE else phq9,
+            gad7_score=None if gad7 == MISSING_SCORE else gad7,
+            metadata=json.loads(metadata) if metadata else {},
+        )
+
+    def rows(self, category: Optional[str] = None, triage_level: Optional[str] = None) -> List[int]:
+        """Row numbers matching the given values, from the prebuilt indexes.
+
+        Args:
+            category: Category to match, or None for any
+            triage_level: Triage level to match, or None for any
+
+        Returns:
+            Matching row numbers in ascending order
+        """
+        matches: Optional[List[int]] = None
+        for name, value in (("category", category), ("triage_level", triage_level)):
+            if value is None:
+                continue
+            rows = self._indexed_rows(name, value)
+            if matches is None:
+                matches = rows
+            else:
+                keep = set(rows)
+                matches = [row for row in matches if row in keep]
+        return list(range(self._count)) if matches is None else matches
+
+    def _indexed_rows(self, name: str, value: str) -> List[int]:
+        entry = self.manifest["indexes"][name].get(value)
+        if entry is None:
+            return []
+        start, count = entry
+        return self._index_rows[start:start + count].tolist()
+
+    def select(self, rows: Iterable[int]) -> List[DatasetSample]:
+        """Build the samples at the given rows."""
+        return [self._materialize(row) for row in rows]
+
+    def get_by_triage(self, triage_level: str) -> List[DatasetSample]:
+        """Samples with the given triage level."""
+        return self.select(self._indexed_rows("triage_level", triage_level))
+
+    def get_by_category(self, category: str) -> List[DatasetSample]:
+        """Samples with the given category."""
+        return self.select(self._indexed_rows("category", category))
+
+    def stats(self) -> DatasetStats:
+        """Dataset statistics from the manifest, without reading any rows."""
+        precomputed = self.manifest["stats"]
+        return DatasetStats(
+            total_samples=self._count,
+            samples_by_category={
+                value: count for value, (_, count) in self.manifest["indexes"]["category"].items()
+            },
+            samples_by_triage={
+                value: count for value, (_, count) in self.manifest["indexes"]["triage_level"].items()
+            },
+            avg_text_length=precomputed["total_text_length"] / self._count if self._count else 0,
+            has_severity_scores=precomputed["has_severity_scores"],
+            has_clinical_scores=precomputed["has_clinical_scores"],
+        )
+
+    def close(self) -> None:
+        """Unmap the file; the store cannot be read afterwards."""
+        for view in (self._offsets, self._severity, self._phq9, self._gad7, self._index_rows, self._view):
+            view.release()
+        self._mm.close()
+
+    def __enter__(self) -> "DatasetStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"DatasetStore(dataset={self.dataset!r}, samples={self._count})"
@@ -14,11 +14,12 @@ import logging
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import hashlib
 
 from .dataset_loader import DatasetLoader, DatasetConfig, DatasetSample, DatasetSource
 from .category_mapper import CategoryMapper, TriageCategory
+from .streaming import iter_json_array, write_json_array
 
 logger = logging.getLogger(__name__)
 
@@ -105,11 +106,9 @@ class MentalChat16KLoader(DatasetLoader):
                 cache_path = self.config.cache_dir / "mentalchat16k"
                 cache_path.mkdir(parents=True, exist_ok=True)
                 
-                # Save each split
+                # Save each split, one row at a time
                 for split_name, split_data in dataset.items():
-                    split_file = cache_path / f"{split_name}.json"
-                    with open(split_file, "w") as f:
-                        json.dump(list(split_data), f)
+                    write_json_array(cache_path / f"{split_name}.json", split_data)
                 
                 logger.info(
                     "MENTALCHAT16K_DOWNLOADED",
@@ -252,18 +251,7 @@ class MentalChat16KLoader(DatasetLoader):
         Returns:
             List of processed samples
         """
-        samples = []
-        cache_path = self.config.cache_dir / "mentalchat16k"
-        
-        # Load all splits
-        for split_file in cache_path.glob("*.json"):
-            with open(split_file, "r") as f:
-                split_data = json.load(f)
-            
-            for idx, item in enumerate(split_data):
-                sample = self._process_item(item, split_file.stem, idx)
-                if sample:
-                    samples.append(sample)
+        samples = list(self.iter_process())
         
         logger.info(
             "MENTALCHAT16K_PROCESSED",
@@ -272,6 +260,16 @@ class MentalChat16KLoader(DatasetLoader):
         
         return samples
     
+    def iter_process(self) -> Iterator[DatasetSample]:
+        """Yield samples from every cached split, reading one item at a time."""
+        cache_path = self.config.cache_dir / "mentalchat16k"
+        
+        for split_file in sorted(cache_path.glob("*.json")):
+            for idx, item in enumerate(iter_json_array(split_file)):
+                sample = self._process_item(item, split_file.stem, idx)
+                if sample:
+                    yield sample
+    
     def _process_item(
         self,
         item: Dict[str, Any],
@@ -5,7 +5,7 @@ dataset for Feelwell-specific use cases, including student mental health scenari
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import json
@@ -63,6 +63,45 @@ class MentalChat16KLoader:
             ImportError: If datasets library not installed
             ConnectionError: If unable to download dataset
         """
+        conversations = list(self.iter_dataset(split, streaming=False))
+        
+        logger.info(
+            "Dataset loaded successfully",
+            extra={
+                "total_conversations": len(conversations),
+                "split": split
+            }
+        )
+        
+        return conversations
+    
+    def iter_dataset(
+        self,
+        split: str = "train",
+        topics: Optional[List[str]] = None,
+        source: Optional[DatasetType] = None,
+        streaming: bool = True,
+    ) -> Iterator[MentalHealthConversation]:
+        """Yield conversations as they are read from HuggingFace.
+        
+        With streaming the split is read row by row from the hub
+        instead of being downloaded and converted up front, so memory
+        stays bounded whatever the split size. Filters are applied to
+        each row before it is yielded.
+        
+        Args:
+            split: Dataset split to load (train/test/validation)
+            topics: Only yield conversations with one of these topics
+            source: Only yield conversations from this source
+            streaming: Read rows lazily from the hub
+            
+        Yields:
+            MentalHealthConversation objects
+            
+        Raises:
+            ImportError: If datasets library not installed
+            ConnectionError: If unable to read the dataset
+        """
         try:
             from datasets import load_dataset
         except ImportError:
@@ -71,39 +110,25 @@ class MentalChat16KLoader:
                 "Please install datasets library: pip install datasets"
             )
         
-        logger.info("Loading MentalChat16K dataset", extra={"split": split})
+        logger.info("Loading MentalChat16K dataset", extra={"split": split, "streaming": streaming})
         
         try:
             # Load from HuggingFace
             dataset = load_dataset(
                 "ShenLab/MentalChat16K",
                 split=split,
-                cache_dir=str(self.cache_dir)
+                cache_dir=str(self.cache_dir),
+                streaming=streaming,
             )
             
             # Convert to our format
-            conversations = []
             for item in dataset:
-                # Handle None values in dataset
-                conv = MentalHealthConversation(
-                    instruction=item.get("instruction") or "",
-                    input=item.get("input") or "",
-                    output=item.get("output") or "",
-                    source=self._determine_source(item),
-                    topics=self._extract_topics(item),
-                    metadata=self._extract_metadata(item)
-                )
-                conversations.append(conv)
-            
-            logger.info(
-                "Dataset loaded successfully",
-                extra={
-                    "total_conversations": len(conversations),
-                    "split": split
-                }
-            )
-            
-            return conversations
+                conv = self._to_conversation(item)
+                if topics and not (conv.topics and any(topic in conv.topics for topic in topics)):
+                    continue
+                if source is not None and conv.source != source:
+                    continue
+                yield conv
             
         except Exception as e:
             logger.error(
@@ -112,6 +137,17 @@ class MentalChat16KLoader:
             )
             raise ConnectionError(f"Unable to load dataset: {e}")
     
+    def _to_conversation(self, item: Dict) -> MentalHealthConversation:
+        """Convert a raw dataset row, handling None values."""
+        return MentalHealthConversation(
+            instruction=item.get("instruction") or "",
+            input=item.get("input") or "",
+            output=item.get("output") or "",
+            source=self._determine_source(item),
+            topics=self._extract_topics(item),
+            metadata=self._extract_metadata(item)
+        )
+    
     def _determine_source(self, item: Dict) -> DatasetType:
         """Determine if conversation is synthetic or interview data."""
         # Heuristic: Interview data typically has shorter inputs
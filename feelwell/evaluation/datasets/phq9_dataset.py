@@ -14,15 +14,18 @@ Item 9 (suicidal ideation) requires special handling - any positive
 response triggers crisis-level triage per clinical guidelines.
 """
 import logging
-import json
 import csv
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import hashlib
 
+import numpy as np
+
 from .dataset_loader import DatasetLoader, DatasetConfig, DatasetSample, DatasetSource
 from .category_mapper import CategoryMapper, PHQ9Thresholds, TriageCategory
+from .streaming import iter_json_array, write_json_array
+from .synthetic import PHQ9_ITEMS, band_targets, generate_phq9_batch, phq9_text
 
 logger = logging.getLogger(__name__)
 
@@ -45,19 +48,6 @@ class PHQ9Config(DatasetConfig):
         )
 
 
-# PHQ-9 Item descriptions for generating text samples
-PHQ9_ITEMS = {
-    1: "Little interest or pleasure in doing things",
-    2: "Feeling down, depressed, or hopeless",
-    3: "Trouble falling or staying asleep, or sleeping too much",
-    4: "Feeling tired or having little energy",
-    5: "Poor appetite or overeating",
-    6: "Feeling bad about yourself - or that you are a failure",
-    7: "Trouble concentrating on things",
-    8: "Moving or speaking slowly, or being fidgety/restless",
-    9: "Thoughts that you would be better off dead, or of hurting yourself",
-}
-
 # Response options
 PHQ9_RESPONSES = {
     0: "Not at all",
@@ -75,6 +65,10 @@ PHQ9_SEVERITY = {
     "severe": (20, 27),
 }
 
+# Synthetic data: samples per severity band and generator seed
+SYNTHETIC_SAMPLES_PER_SEVERITY = 50
+SYNTHETIC_SEED = 42
+
 
 class PHQ9DatasetLoader(DatasetLoader):
     """Loader for PHQ-9 depression assessment data.
@@ -124,114 +118,79 @@ class PHQ9DatasetLoader(DatasetLoader):
         cache_path = self.config.cache_dir / "phq9_depression"
         cache_path.mkdir(parents=True, exist_ok=True)
         
-        import random
-        random.seed(42)
+        rng = np.random.default_rng(SYNTHETIC_SEED)
         
-        samples = []
+        # Generate samples across severity spectrum, all bands at once
+        targets, severities = band_targets(rng, PHQ9_SEVERITY, SYNTHETIC_SAMPLES_PER_SEVERITY)
+        batch = generate_phq9_batch(rng, targets)
+        band_index = np.arange(len(batch)) % SYNTHETIC_SAMPLES_PER_SEVERITY
         
-        # Generate samples across severity spectrum
-        for severity, (min_score, max_score) in PHQ9_SEVERITY.items():
-            for i in range(50):  # 50 samples per severity level
-                # Generate item scores that sum to target range
-                total_target = random.randint(min_score, max_score)
-                item_scores = self._generate_item_scores(total_target)
-                
-                samples.append({
-                    "id": f"phq9_{severity}_{i}",
-                    "item_scores": item_scores,
-                    "total_score": sum(item_scores.values()),
-                    "severity": severity,
-                })
+        samples = (
+            {
+                "id": f"phq9_{severity}_{i}",
+                "item_scores": batch.scores(row),
+                "total_score": int(total),
+                "severity": severity,
+            }
+            for row, (severity, i, total) in enumerate(zip(severities, band_index, batch.totals))
+        )
         
         # Save synthetic data
-        with open(cache_path / "phq9_synthetic.json", "w") as f:
-            json.dump(samples, f, indent=2)
+        count = write_json_array(cache_path / "phq9_synthetic.json", samples, indent=2)
         
-        logger.info("PHQ9_SYNTHETIC_CREATED", extra={"samples": len(samples)})
+        logger.info("PHQ9_SYNTHETIC_CREATED", extra={"samples": count})
         return True
     
-    def _generate_item_scores(self, target_total: int) -> Dict[int, int]:
-        """Generate item scores that sum to approximately the target."""
-        import random
-        
-        scores = {i: 0 for i in range(1, 10)}
-        
-        if target_total == 0:
-            return scores
-        
-        # Items 1-8 (excluding item 9 for now)
-        items = list(range(1, 9))
-        current_total = 0
-        
-        # Keep adding to scores until we reach target
-        attempts = 0
-        while current_total < target_total and attempts < 100:
-            item = random.choice(items)
-            if scores[item] < 3:  # Max score per item is 3
-                scores[item] += 1
-                current_total += 1
-            attempts += 1
-        
-        # Item 9 (suicidal ideation) - special handling
-        # Only positive if severe depression (score >= 20)
-        if target_total >= 20 and random.random() < 0.5:
-            scores[9] = random.randint(1, 3)
-        elif target_total >= 15 and random.random() < 0.2:
-            scores[9] = 1
-        else:
-            scores[9] = 0
-        
-        return scores
+    def _generate_item_scores(
+        self,
+        target_total: int,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Dict[int, int]:
+        """Generate item scores whose items 1-8 sum to the target."""
+        batch = generate_phq9_batch(rng or np.random.default_rng(), [target_total])
+        return batch.scores(0)
     
     def process(self) -> List[DatasetSample]:
         """Process PHQ-9 data into DatasetSamples."""
-        samples = []
+        samples = list(self.iter_process())
+        
+        logger.info("PHQ9_PROCESSED", extra={"total_samples": len(samples)})
+        return samples
+    
+    def iter_process(self) -> Iterator[DatasetSample]:
+        """Yield PHQ-9 samples row by row, real data first."""
         cache_path = self.config.cache_dir / "phq9_depression"
         
         # Try to load real data first
-        for csv_file in cache_path.glob("*.csv"):
-            samples.extend(self._process_csv(csv_file))
+        for csv_file in sorted(cache_path.glob("*.csv")):
+            yield from self._process_csv(csv_file)
         
         # Load synthetic data
         json_file = cache_path / "phq9_synthetic.json"
         if json_file.exists():
-            samples.extend(self._process_synthetic(json_file))
-        
-        logger.info("PHQ9_PROCESSED", extra={"total_samples": len(samples)})
-        return samples
+            yield from self._process_synthetic(json_file)
 
-    def _process_csv(self, csv_path: Path) -> List[DatasetSample]:
-        """Process CSV file with PHQ-9 responses."""
-        samples = []
-        
+    def _process_csv(self, csv_path: Path) -> Iterator[DatasetSample]:
+        """Process CSV file with PHQ-9 responses, one row at a time."""
         try:
             with open(csv_path, "r") as f:
                 reader = csv.DictReader(f)
                 for idx, row in enumerate(reader):
                     sample = self._process_row(row, idx)
                     if sample:
-                        samples.append(sample)
+                        yield sample
         except Exception as e:
             logger.error("PHQ9_CSV_ERROR", extra={"file": str(csv_path), "error": str(e)})
-        
-        return samples
     
-    def _process_synthetic(self, json_path: Path) -> List[DatasetSample]:
-        """Process synthetic JSON data."""
-        samples = []
-        
-        with open(json_path, "r") as f:
-            data = json.load(f)
-        
-        for item in data:
-            sample = self._create_sample_from_scores(
+    def _process_synthetic(self, json_path: Path) -> Iterator[DatasetSample]:
+        """Process synthetic JSON data, one item at a time."""
+        for item in iter_json_array(json_path):
+            yield self._create_sample_from_scores(
                 sample_id=item["id"],
-                item_scores=item["item_scores"],
+                # JSON object keys are strings; item numbers are ints
+                item_scores={int(item): score for item, score in item["item_scores"].items()},
                 total_score=item["total_score"],
             )
-            samples.append(sample)
-        
-        return samples
     
     def _process_row(self, row: Dict[str, Any], idx: int) -> Optional[DatasetSample]:
         """Process a single CSV row."""
@@ -310,45 +269,8 @@ class PHQ9DatasetLoader(DatasetLoader):
         total_score: int,
     ) -> str:
         """Generate natural language text from PHQ-9 scores."""
-        statements = []
-        
-        # Collect statements for items with positive scores
-        for item_num in sorted(item_scores.keys()):
-            score = item_scores.get(item_num, 0)
-            if score > 0 and item_num in PHQ9_ITEMS:
-                item_text = PHQ9_ITEMS[item_num]
-                
-                if score == 3:
-                    statements.append(f"I experience {item_text.lower()} nearly every day.")
-                elif score == 2:
-                    statements.append(f"I often have {item_text.lower()}.")
-                elif score == 1:
-                    statements.append(f"Sometimes I have {item_text.lower()}.")
-        
-        # Generate severity-appropriate text even if no specific items
-        if not statements:
-            # Generate text based on total score for minimal/mild cases
-            if total_score >= 5:
-                return "I've noticed I'm not feeling quite like myself lately. Some days are harder than others."
-            else:
-                return "I've been feeling okay lately. No major concerns."
-        
-        # Add severity context prefix
-        if total_score >= 20:
-            prefix = "I've been really struggling lately. "
-        elif total_score >= 15:
-            prefix = "Things have been very difficult for me. "
-        elif total_score >= 10:
-            prefix = "I've been having some challenges lately. "
-        elif total_score >= 5:
-            prefix = "I've noticed some changes in how I feel. "
-        else:
-            prefix = ""
-        
-        # Limit to 3 statements for readability
-        text_statements = statements[:3]
-        
-        return prefix + " ".join(text_statements)
+        scores = [item_scores.get(item_num, 0) for item_num in PHQ9_ITEMS]
+        return phq9_text(scores, total_score)
     
     def _get_severity_label(self, total_score: int) -> str:
         """Get severity label from total score."""
@@ -24,15 +24,18 @@ Usage:
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from pathlib import Path
 import statistics
 
+import numpy as np
+
 from feelwell.shared.utils import hash_pii
 from ..triage.longitudinal_triage import (
     StudentHistory,
     LongitudinalPattern,
 )
+from .synthetic import DEFAULT_BATCH_SIZE, iter_trajectory_batches
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +47,7 @@ class PHQ9LongitudinalConfig:
     max_samples: int = 100
     min_days: int = 7  # Minimum days of data required
     normalize_scores: bool = True  # Normalize to 0-1 range
+    random_seed: Optional[int] = 42  # Seed for synthetic samples; None for a fresh draw
 
 
 @dataclass
@@ -307,74 +311,45 @@ class PHQ9LongitudinalLoader:
     
     def _generate_synthetic_samples(self) -> List[PHQ9TimeSeriesSample]:
         """Generate synthetic PHQ-9 longitudinal samples for testing."""
-        import random
-        
-        samples = []
-        patterns = list(LongitudinalPattern)
-        
-        for idx in range(self.config.max_samples):
-            pattern = patterns[idx % len(patterns)]
-            sample = self._generate_sample_for_pattern(pattern, idx)
-            samples.append(sample)
+        samples = list(self.iter_synthetic_samples(self.config.max_samples))
         
         logger.info(f"Generated {len(samples)} synthetic PHQ-9 longitudinal samples")
         return samples
     
-    def _generate_sample_for_pattern(
+    def iter_synthetic_samples(
         self,
-        pattern: LongitudinalPattern,
-        idx: int,
-    ) -> PHQ9TimeSeriesSample:
-        """Generate a synthetic sample matching a specific pattern."""
-        import random
-        import math
-        
-        # Generate 14 days of data
-        days = list(range(1, 15))
-        daily_scores = []
+        count: int,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[PHQ9TimeSeriesSample]:
+        """Yield synthetic samples cycling through every pattern.
         
-        for day in days:
-            progress = day / 14.0
-            
-            if pattern == LongitudinalPattern.STABLE_HEALTHY:
-                base = 0.1 + random.uniform(-0.05, 0.05)
-            
-            elif pattern == LongitudinalPattern.CHRONIC_LOW:
-                base = 0.35 + random.uniform(-0.05, 0.05)
-            
-            elif pattern == LongitudinalPattern.GRADUAL_DECLINE:
-                base = 0.2 + (0.5 * progress) + random.uniform(-0.05, 0.05)
-            
-            elif pattern == LongitudinalPattern.ACUTE_CRISIS:
-                if progress > 0.7:
-                    base = 0.8 + random.uniform(0, 0.15)
-                else:
-                    base = 0.25 + random.uniform(-0.05, 0.05)
-            
-            elif pattern == LongitudinalPattern.CYCLICAL:
-                base = 0.35 + 0.2 * math.sin(progress * 3 * math.pi) + random.uniform(-0.05, 0.05)
-            
-            elif pattern == LongitudinalPattern.RECOVERY:
-                base = 0.6 - (0.4 * progress) + random.uniform(-0.05, 0.05)
-            
-            elif pattern == LongitudinalPattern.SEASONAL:
-                # Simulate weekly pattern
-                base = 0.3 + (0.2 if day % 7 < 3 else 0) + random.uniform(-0.05, 0.05)
-            
-            else:
-                base = 0.3 + random.uniform(-0.1, 0.1)
-            
-            daily_scores.append(max(0, min(1, base)))
+        Trajectories are drawn in batches from a generator seeded with
+        config.random_seed; samples are built one at a time as they are
+        consumed.
         
-        return PHQ9TimeSeriesSample(
-            participant_id=f"phq9_synth_{idx}",
-            daily_scores=daily_scores,
-            days=days,
-            age=random.randint(18, 65),
-            sex=random.choice(['M', 'F']),
-            happiness_score=1.0 - statistics.mean(daily_scores),  # Inverse correlation
-            inferred_pattern=pattern,
-        )
+        Args:
+            count: Number of samples
+            batch_size: Trajectories drawn per batch
+            
+        Yields:
+            PHQ9TimeSeriesSample with inferred_pattern set to its pattern
+        """
+        rng = np.random.default_rng(self.config.random_seed)
+        idx = 0
+        for batch in iter_trajectory_batches(rng, count, batch_size):
+            days = batch.days.tolist()
+            happiness = 1.0 - batch.daily_scores.mean(axis=1)  # Inverse correlation
+            for row in range(len(batch)):
+                yield PHQ9TimeSeriesSample(
+                    participant_id=f"phq9_synth_{idx}",
+                    daily_scores=batch.daily_scores[row].tolist(),
+                    days=days,
+                    age=int(batch.ages[row]),
+                    sex=str(batch.sexes[row]),
+                    happiness_score=float(happiness[row]),
+                    inferred_pattern=batch.pattern(row),
+                )
+                idx += 1
     
     def to_student_histories(
         self,
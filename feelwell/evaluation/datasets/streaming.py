@@ -0,0 +1,140 @@
+"""Streaming helpers for dataset loaders.
+
+Raw dataset files are JSON arrays that can be far larger than the
+samples a run needs. These helpers let loaders work through them one
+item at a time:
+
+- iter_json_array: yield the items of a JSON array file without
+  parsing the whole file
+- write_json_array: write items as a JSON array without building a list
+- reservoir_sample: uniform sample of k items from a stream of unknown
+  length, holding only k items
+"""
+import json
+import random
+import re
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Characters read from disk per refill
+STREAM_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"\s*")
+
+
+def iter_json_array(path: Path, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array one at a time.
+
+    Only the item being decoded (plus one read chunk) is held in memory.
+
+    Args:
+        path: File containing a JSON array
+        chunk_size: Characters read per refill
+
+    Raises:
+        ValueError: If the file is not a well-formed JSON array
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buffer, pos, eof = "", 0, False
+        state = "open"  # open -> first -> (value -> separator)* -> done
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                if eof:
+                    raise ValueError(f"Unexpected end of JSON array in {path}")
+                chunk = f.read(chunk_size)
+                buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+                continue
+
+            char = buffer[pos]
+            if state == "open":
+                if char != "[":
+                    raise ValueError(f"{path} does not contain a JSON array")
+                pos += 1
+                state = "first"
+                continue
+            if state in ("first", "separator") and char == "]":
+                return
+            if state == "separator":
+                if char != ",":
+                    raise ValueError(f"Expected ',' in JSON array in {path}")
+                pos += 1
+                state = "value"
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                following = _WHITESPACE.match(buffer, end).end()
+            except json.JSONDecodeError:
+                end = None
+            # A value cut at the buffer edge can still decode (a number
+            # missing digits or its exponent), so only accept it once the
+            # next ',' or ']' has been read
+            if end is None or (
+                not eof and (following == len(buffer) or buffer[following] not in ",]")
+            ):
+                if eof:
+                    raise ValueError(f"Malformed JSON array item in {path}")
+                chunk = f.read(chunk_size)
+                buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+                continue
+
+            yield item
+            pos = end
+            state = "separator"
+
+
+def write_json_array(path: Path, items: Iterable[Any], indent: Optional[int] = None) -> int:
+    """Write items as a JSON array, one item at a time.
+
+    Args:
+        path: Output file
+        items: JSON-serializable items
+        indent: Passed to json.dumps for each item
+
+    Returns:
+        Number of items written
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for item in items:
+            f.write(",\n" if count else "\n")
+            f.write(json.dumps(item, indent=indent))
+            count += 1
+        f.write("\n]" if count else "]")
+    return count
+
+
+def reservoir_sample(
+    items: Iterable[T],
+    k: int,
+    rng: Optional[random.Random] = None,
+) -> List[T]:
+    """Uniform random sample of up to k items from a stream.
+
+    Args:
+        items: Stream of any length
+        k: Sample size
+        rng: Random source; a fresh unseeded one by default
+
+    Returns:
+        Up to k items in random order
+    """
+    rng = rng or random.Random()
+    reservoir: List[T] = []
+    if k <= 0:
+        return reservoir
+    for seen, item in enumerate(items):
+        if seen < k:
+            reservoir.append(item)
+            continue
+        slot = rng.randint(0, seen)
+        if slot < k:
+            reservoir[slot] = item
+    rng.shuffle(reservoir)
+    return reservoir
@@ -0,0 +1,296 @@
+"""Seeded, vectorized synthetic PHQ-9 data.
+
+Synthetic PHQ-9 respondents and longitudinal participants used to be
+drawn one value at a time from the global `random` module, which is
+slow at scale and not reproducible across callers. This module draws
+them in bulk from a numpy Generator:
+
+- Item scores for n respondents as one (n, 9) array
+- 14-day score trajectories for n participants as one (n, days) array
+
+Text is not generated with the scores; PHQ9ScoreBatch renders a
+respondent's text only when it is asked for. Chunked iterators bound
+memory when generating millions of rows. The same seed and batch size
+always produce the same data.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..triage.longitudinal_triage import LongitudinalPattern
+
+# Rows generated per chunk by the iter_* functions
+DEFAULT_BATCH_SIZE = 100_000
+
+PHQ9_MAX_TOTAL = 27
+PHQ9_MAX_ITEM_SCORE = 3
+
+# Items 1-8 share the target total; item 9 is drawn separately
+_SHARED_ITEMS = 8
+_SHARED_SLOTS = _SHARED_ITEMS * PHQ9_MAX_ITEM_SCORE
+
+# PHQ-9 Item descriptions for generating text samples
+PHQ9_ITEMS = {
+    1: "Little interest or pleasure in doing things",
+    2: "Feeling down, depressed, or hopeless",
+    3: "Trouble falling or staying asleep, or sleeping too much",
+    4: "Feeling tired or having little energy",
+    5: "Poor appetite or overeating",
+    6: "Feeling bad about yourself - or that you are a failure",
+    7: "Trouble concentrating on things",
+    8: "Moving or speaking slowly, or being fidgety/restless",
+    9: "Thoughts that you would be better off dead, or of hurting yourself",
+}
+
+# Pattern order for trajectory pattern codes
+TRAJECTORY_PATTERNS: Tuple[LongitudinalPattern, ...] = tuple(LongitudinalPattern)
+
+TRAJECTORY_DAYS = 14
+
+
+def band_targets(
+    rng: np.random.Generator,
+    bands: Mapping[str, Tuple[int, int]],
+    per_band: int,
+) -> Tuple[np.ndarray, List[str]]:
+    """Target totals drawn uniformly within each severity band.
+
+    Args:
+        rng: Random source
+        bands: {label: (min_total, max_total)}, inclusive
+        per_band: Respondents per band
+
+    Returns:
+        Tuple of (targets in band order, band label per target)
+    """
+    lows = np.repeat([low for low, _ in bands.values()], per_band)
+    highs = np.repeat([high for _, high in bands.values()], per_band)
+    labels = [label for label in bands for _ in range(per_band)]
+    return rng.integers(lows, highs + 1), labels
+
+
+def phq9_item_scores(rng: np.random.Generator, targets: Sequence[int]) -> np.ndarray:
+    """Item scores whose items 1-8 add up to each target.
+
+    Each of items 1-8 holds up to 3 points, so the 24 possible points
+    are shuffled per row and the first `target` are filled. Item 9
+    (suicidal ideation) is only positive for high totals: 1-3 with
+    probability 0.5 at 20+, otherwise 1 with probability 0.2 at 15+.
+
+    Args:
+        rng: Random source
+        targets: Target total per respondent (items 1-8 cap at 24)
+
+    Returns:
+        (n, 9) int8 array; column i holds item i + 1
+    """
+    targets = np.asarray(targets, dtype=np.int64)
+    n = len(targets)
+    scores = np.zeros((n, 9), dtype=np.int8)
+
+    ranks = rng.random((n, _SHARED_SLOTS)).argsort(axis=1).argsort(axis=1)
+    filled = ranks < np.minimum(targets, _SHARED_SLOTS)[:, None]
+    scores[:, :_SHARED_ITEMS] = filled.reshape(n, _SHARED_ITEMS, PHQ9_MAX_ITEM_SCORE).sum(axis=2)
+
+    severe = (targets >= 20) & (rng.random(n) < 0.5)
+    elevated = (targets >= 15) & (rng.random(n) < 0.2)
+    scores[:, 8] = np.where(severe, rng.integers(1, 4, n), np.where(elevated, 1, 0))
+    return scores
+
+
+def phq9_text(item_scores: Sequence[int], total_score: int) -> str:
+    """Natural language text for one respondent's scores.
+
+    Args:
+        item_scores: Scores for items 1-9, in order
+        total_score: PHQ-9 total
+
+    Returns:
+        Up to three symptom statements with a severity prefix
+    """
+    statements = []
+    for item_num, score in enumerate(item_scores, start=1):
+        if len(statements) == 3:
+            break
+        item_text = PHQ9_ITEMS[item_num].lower()
+        if score == 3:
+            statements.append(f"I experience {item_text} nearly every day.")
+        elif score == 2:
+            statements.append(f"I often have {item_text}.")
+        elif score == 1:
+            statements.append(f"Sometimes I have {item_text}.")
+
+    # Generate severity-appropriate text even if no specific items
+    if not statements:
+        if total_score >= 5:
+            return "I've noticed I'm not feeling quite like myself lately. Some days are harder than others."
+        return "I've been feeling okay lately. No major concerns."
+
+    if total_score >= 20:
+        prefix = "I've been really struggling lately. "
+    elif total_score >= 15:
+        prefix = "Things have been very difficult for me. "
+    elif total_score >= 10:
+        prefix = "I've been having some challenges lately. "
+    elif total_score >= 5:
+        prefix = "I've noticed some changes in how I feel. "
+    else:
+        prefix = ""
+
+    return prefix + " ".join(statements)
+
+
+@dataclass(frozen=True)
+class PHQ9ScoreBatch:
+    """Item scores for a batch of synthetic respondents.
+
+    Text is rendered per respondent on access, never for the batch.
+    """
+    item_scores: np.ndarray  # (n, 9) int8
+
+    def __len__(self) -> int:
+        return len(self.item_scores)
+
+    @property
+    def totals(self) -> np.ndarray:
+        return self.item_scores.sum(axis=1, dtype=np.int16)
+
+    def scores(self, row: int) -> Dict[int, int]:
+        """Scores of one respondent keyed by item number."""
+        return {item: int(score) for item, score in enumerate(self.item_scores[row], start=1)}
+
+    def text(self, row: int) -> str:
+        scores = self.item_scores[row].tolist()
+        return phq9_text(scores, sum(scores))
+
+
+def generate_phq9_batch(rng: np.random.Generator, targets: Sequence[int]) -> PHQ9ScoreBatch:
+    """Draw item scores for the given target totals."""
+    return PHQ9ScoreBatch(item_scores=phq9_item_scores(rng, targets))
+
+
+def iter_phq9_batches(
+    rng: np.random.Generator,
+    count: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[PHQ9ScoreBatch]:
+    """Batches of respondents with target totals uniform over 0-27.
+
+    Args:
+        rng: Random source
+        count: Respondents in total
+        batch_size: Respondents per batch
+
+    Yields:
+        PHQ9ScoreBatch of up to batch_size respondents
+    """
+    for start in range(0, count, batch_size):
+        size = min(batch_size, count - start)
+        yield generate_phq9_batch(rng, rng.integers(0, PHQ9_MAX_TOTAL + 1, size))
+
+
+def _trajectory_tables(days: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per pattern and day: base score, noise low and noise width."""
+    day = np.arange(1, days + 1)
+    progress = day / days
+    base = np.empty((len(TRAJECTORY_PATTERNS), days))
+    low = np.full_like(base, -0.05)
+    width = np.full_like(base, 0.1)
+
+    for code, pattern in enumerate(TRAJECTORY_PATTERNS):
+        if pattern == LongitudinalPattern.STABLE_HEALTHY:
+            base[code] = 0.1
+        elif pattern == LongitudinalPattern.CHRONIC_LOW:
+            base[code] = 0.35
+        elif pattern == LongitudinalPattern.GRADUAL_DECLINE:
+            base[code] = 0.2 + 0.5 * progress
+        elif pattern == LongitudinalPattern.ACUTE_CRISIS:
+            late = progress > 0.7
+            base[code] = np.where(late, 0.8, 0.25)
+            low[code] = np.where(late, 0.0, -0.05)
+            width[code] = np.where(late, 0.15, 0.1)
+        elif pattern == LongitudinalPattern.CYCLICAL:
+            base[code] = 0.35 + 0.2 * np.sin(progress * 3 * np.pi)
+        elif pattern == LongitudinalPattern.RECOVERY:
+            base[code] = 0.6 - 0.4 * progress
+        elif pattern == LongitudinalPattern.SEASONAL:
+            # Simulate weekly pattern
+            base[code] = 0.3 + np.where(day % 7 < 3, 0.2, 0.0)
+        else:
+            base[code], low[code], width[code] = 0.3, -0.1, 0.2
+    return base, low, width
+
+
+@dataclass(frozen=True)
+class TrajectoryBatch:
+    """Daily normalized PHQ-9 scores for a batch of synthetic participants."""
+    pattern_codes: np.ndarray  # (n,) index into TRAJECTORY_PATTERNS
+    daily_scores: np.ndarray  # (n, days), in [0, 1]
+    ages: np.ndarray  # (n,)
+    sexes: np.ndarray  # (n,) "M" or "F"
+
+    def __len__(self) -> int:
+        return len(self.pattern_codes)
+
+    @property
+    def days(self) -> np.ndarray:
+        return np.arange(1, self.daily_scores.shape[1] + 1)
+
+    def pattern(self, row: int) -> LongitudinalPattern:
+        return TRAJECTORY_PATTERNS[self.pattern_codes[row]]
+
+
+def phq9_trajectories(
+    rng: np.random.Generator,
+    pattern_codes: Sequence[int],
+    days: int = TRAJECTORY_DAYS,
+) -> TrajectoryBatch:
+    """Daily score trajectories following each participant's pattern.
+
+    Args:
+        rng: Random source
+        pattern_codes: Index into TRAJECTORY_PATTERNS per participant
+        days: Days per trajectory
+
+    Returns:
+        TrajectoryBatch with uniform noise around each pattern's curve
+    """
+    codes = np.asarray(pattern_codes, dtype=np.int8)
+    base, low, width = _trajectory_tables(days)
+    noise = rng.random((len(codes), days))
+    scores = np.clip(base[codes] + low[codes] + width[codes] * noise, 0.0, 1.0)
+    return TrajectoryBatch(
+        pattern_codes=codes,
+        daily_scores=scores,
+        ages=rng.integers(18, 66, len(codes)),
+        sexes=rng.choice(np.array(["M", "F"]), len(codes)),
+    )
+
+
+def iter_trajectory_batches(
+    rng: np.random.Generator,
+    count: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    days: int = TRAJECTORY_DAYS,
+    pattern_codes: Optional[Sequence[int]] = None,
+) -> Iterator[TrajectoryBatch]:
+    """Batches of participants cycling through every pattern.
+
+    Args:
+        rng: Random source
+        count: Participants in total
+        batch_size: Participants per batch
+        days: Days per trajectory
+        pattern_codes: Patterns to cycle through; all by default
+
+    Yields:
+        TrajectoryBatch of up to batch_size participants
+    """
+    cycle = np.asarray(
+        range(len(TRAJECTORY_PATTERNS)) if pattern_codes is None else pattern_codes,
+        dtype=np.int8,
+    )
+    for start in range(0, count, batch_size):
+        rows = np.arange(start, min(start + batch_size, count))
+        yield phq9_trajectories(rng, cycle[rows % len(cycle)], days)
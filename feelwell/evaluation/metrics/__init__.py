@@ -4,6 +4,7 @@ Includes:
 - Clinical metrics based on MentalChat16K paper (KDD 2025)
 - Safety metrics for crisis detection
 - Triage accuracy metrics
+- Mergeable latency histograms
 """
 from .clinical_metrics import (
     ClinicalMetric,
@@ -11,10 +12,13 @@ from .clinical_metrics import (
     ClinicalEvaluationResult,
     MetricScore,
 )
+from .latency import LatencyHistogram, merge_histograms
 
 __all__ = [
     "ClinicalMetric",
     "ClinicalMetricsEvaluator",
     "ClinicalEvaluationResult",
     "MetricScore",
+    "LatencyHistogram",
+    "merge_histograms",
 ]
@@ -0,0 +1,187 @@
+"""Mergeable latency histogram for evaluation metrics.
+
+Keeping every latency in a list and sorting it for percentiles costs
+memory proportional to the sample count and cannot be combined across
+worker processes without shipping the lists around. LatencyHistogram
+records latencies into log-linear (HDR-style) buckets instead:
+
+- Values are recorded in whole microseconds
+- Below 2**PRECISION_BITS us every value has its own bucket (exact)
+- Above that, each power-of-two range is split into 2**PRECISION_BITS
+  equal sub-buckets, bounding the relative error of any percentile to
+  1 / 2**PRECISION_BITS (under 0.8% with the default 7 bits)
+
+Buckets are stored sparsely, so memory depends on the spread of
+latencies, not on how many were recorded. Two histograms merge by
+adding bucket counts, which is exact and order independent.
+"""
+import math
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Sub-bucket resolution; relative error is at most 1 / 2**PRECISION_BITS
+PRECISION_BITS = 7
+
+# Percentiles reported by summary()
+SUMMARY_PERCENTILES = {"p50_ms": 0.50, "p95_ms": 0.95, "p99_ms": 0.99, "p999_ms": 0.999}
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with exact merge."""
+
+    def __init__(self, precision_bits: int = PRECISION_BITS):
+        """Initialize an empty histogram.
+
+        Args:
+            precision_bits: Sub-buckets per power of two, as a power of two
+        """
+        self.precision_bits = precision_bits
+        self._sub_buckets = 1 << precision_bits
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.sum_ms = 0.0
+        self.min_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        """Record one latency in milliseconds."""
+        micros = max(0, int(round(latency_ms * 1000)))
+        index = self._index(micros)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if self.count == 0:
+            self.min_ms = self.max_ms = latency_ms
+        else:
+            self.min_ms = min(self.min_ms, latency_ms)
+            self.max_ms = max(self.max_ms, latency_ms)
+        self.count += 1
+        self.sum_ms += latency_ms
+
+    def record_many(self, latencies_ms: Iterable[float]) -> None:
+        """Record several latencies in milliseconds."""
+        for latency_ms in latencies_ms:
+            self.record(latency_ms)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add another histogram's samples into this one.
+
+        Args:
+            other: Histogram with the same precision
+
+        Returns:
+            self, for chaining
+
+        Raises:
+            ValueError: If the precisions differ
+        """
+        if other.precision_bits != self.precision_bits:
+            raise ValueError(
+                f"Cannot merge histograms with precision {other.precision_bits} "
+                f"into precision {self.precision_bits}"
+            )
+        if other.count == 0:
+            return self
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        if self.count == 0:
+            self.min_ms, self.max_ms = other.min_ms, other.max_ms
+        else:
+            self.min_ms = min(self.min_ms, other.min_ms)
+            self.max_ms = max(self.max_ms, other.max_ms)
+        self.count += other.count
+        self.sum_ms += other.sum_ms
+        return self
+
+    def __iadd__(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        return self.merge(other)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.sum_ms / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Latency at quantile q (nearest rank), in milliseconds.
+
+        Args:
+            q: Quantile in [0, 1], e.g. 0.99 for P99
+
+        Returns:
+            Midpoint of the bucket holding the ranked sample, clamped to
+            the observed min and max; 0.0 when empty
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                low, width = self._bounds(index)
+                value_ms = (low + (width - 1) / 2) / 1000
+                return min(max(value_ms, self.min_ms), self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> Dict[str, float]:
+        """Count, mean, max and the standard percentiles, rounded for reports."""
+        summary = {
+            "count": self.count,
+            "mean_ms": round(self.mean_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+        for key, q in SUMMARY_PERCENTILES.items():
+            summary[key] = round(self.percentile(q), 3)
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact serialized form; buckets as sorted [index, count] pairs."""
+        return {
+            "precision_bits": self.precision_bits,
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 6),
+            "min_ms": round(self.min_ms, 6),
+            "max_ms": round(self.max_ms, 6),
+            "buckets": [[index, self._counts[index]] for index in sorted(self._counts)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Rebuild a histogram serialized with to_dict."""
+        histogram = cls(precision_bits=data.get("precision_bits", PRECISION_BITS))
+        histogram._counts = {int(index): int(count) for index, count in data.get("buckets", [])}
+        histogram.count = int(data.get("count", 0))
+        histogram.sum_ms = float(data.get("sum_ms", 0.0))
+        histogram.min_ms = float(data.get("min_ms", 0.0))
+        histogram.max_ms = float(data.get("max_ms", 0.0))
+        return histogram
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LatencyHistogram):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return (
+            f"LatencyHistogram(count={self.count}, "
+            f"p50_ms={self.percentile(0.5):.3f}, p99_ms={self.percentile(0.99):.3f})"
+        )
+
+    def _index(self, micros: int) -> int:
+        if micros < self._sub_buckets:
+            return micros
+        shift = micros.bit_length() - self.precision_bits - 1
+        return (shift + 1) * self._sub_buckets + ((micros >> shift) - self._sub_buckets)
+
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        """(lowest value, width) of a bucket, in microseconds."""
+        if index < self._sub_buckets:
+            return index, 1
+        shift = index // self._sub_buckets - 1
+        low = ((index % self._sub_buckets) + self._sub_buckets) << shift
+        return low, 1 << shift
+
+
+def merge_histograms(histograms: Iterable[Optional[LatencyHistogram]]) -> LatencyHistogram:
+    """Merge histograms into a new one, skipping None."""
+    total = LatencyHistogram()
+    for histogram in histograms:
+        if histogram is not None:
+            total.merge(histogram)
+    return total
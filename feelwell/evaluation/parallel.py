@@ -0,0 +1,364 @@
+"""Sharded, multi-process scanning for evaluation runs.
+
+The scanner is CPU bound, so scanning large datasets one sample at a
+time on one core dominates an evaluation run. Scan work is split into
+shards:
+
+- Each internal benchmark suite is one shard
+- Each external dataset is split into chunks of shard_size samples
+
+Shards run either in-process or on a process pool whose workers each
+build one SafetyScanner at startup. Every shard returns counts plus a
+LatencyHistogram; results are merged in (dataset, shard index) order,
+so the merged metrics do not depend on which worker finished first.
+
+Shards can be produced lazily from a sample stream; the pool keeps at
+most max_pending shards queued, so a dataset is never held in memory
+as a whole.
+
+With a result cache, workers receive the known outcomes at startup and
+return new ones with their shard results; only the parent writes.
+"""
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .metrics.latency import LatencyHistogram
+from .result_cache import CachingScanner, ScanOutcome
+
+logger = logging.getLogger(__name__)
+
+
+# Samples per external dataset shard
+DEFAULT_SHARD_SIZE = 500
+
+# Shards queued per worker when streaming shards into a pool
+PENDING_SHARDS_PER_WORKER = 2
+
+BENCHMARK = "benchmark"
+DATASET = "dataset"
+
+# Student id used for every evaluation scan
+EVAL_STUDENT_ID = "eval_student"
+
+# (sample_id, text, expected triage level)
+SampleTuple = Tuple[str, str, str]
+
+ScannerFactory = Callable[[], Any]
+
+
+def _metrics_key(kind: str, name: str) -> str:
+    return f"benchmark_{name}" if kind == BENCHMARK else name
+
+
+@dataclass(frozen=True)
+class Shard:
+    """A unit of scan work.
+
+    Attributes:
+        kind: BENCHMARK (a whole suite) or DATASET (a chunk of samples)
+        name: Benchmark suite or dataset name
+        index: Position of this shard within its dataset
+        samples: Sample tuples; empty for benchmark shards
+    """
+    kind: str
+    name: str
+    index: int = 0
+    samples: Tuple[SampleTuple, ...] = ()
+
+    @property
+    def key(self) -> str:
+        """Name of the metrics entry this shard contributes to."""
+        return _metrics_key(self.kind, self.name)
+
+
+@dataclass
+class ShardResult:
+    """Counts and latencies from scanning one shard (or a merged dataset)."""
+    kind: str
+    name: str
+    index: int = 0
+    total: int = 0
+    correct: int = 0
+    errors: int = 0  # Samples whose scan raised
+    crisis_tp: int = 0
+    crisis_fp: int = 0
+    crisis_fn: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)  # Fresh scans only
+    error: Optional[str] = None  # Set when the whole shard failed
+    cache_hits: int = 0
+    new_outcomes: Dict[str, ScanOutcome] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return _metrics_key(self.kind, self.name)
+
+    def merge(self, other: "ShardResult") -> "ShardResult":
+        """Add another shard's counts and latencies into this one."""
+        self.total += other.total
+        self.correct += other.correct
+        self.errors += other.errors
+        self.crisis_tp += other.crisis_tp
+        self.crisis_fp += other.crisis_fp
+        self.crisis_fn += other.crisis_fn
+        self.latency.merge(other.latency)
+        self.error = self.error or other.error
+        self.cache_hits += other.cache_hits
+        self.new_outcomes.update(other.new_outcomes)
+        return self
+
+
+@dataclass(frozen=True)
+class SafetyScannerFactory:
+    """Picklable factory building a SafetyScanner in a worker process."""
+    config: Any = None  # SafetyConfig; None for the default
+
+    def __call__(self):
+        from feelwell.services.safety_service.scanner import SafetyScanner
+        return SafetyScanner(config=self.config)
+
+
+def build_dataset_shards(
+    name: str,
+    samples: Iterable[Any],
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> List[Shard]:
+    """Split a dataset's samples into shards.
+
+    Args:
+        name: Dataset name
+        samples: DatasetSample-like objects with sample_id, text and
+            triage_level
+        shard_size: Samples per shard
+
+    Returns:
+        Shards in sample order; a single empty shard for an empty dataset
+    """
+    return list(iter_dataset_shards(name, samples, shard_size))
+
+
+def iter_dataset_shards(
+    name: str,
+    samples: Iterable[Any],
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> Iterator[Shard]:
+    """Split a sample stream into shards as it is read.
+
+    Only one shard's samples are held at a time.
+
+    Args:
+        name: Dataset name
+        samples: DatasetSample-like objects with sample_id, text and
+            triage_level
+        shard_size: Samples per shard
+
+    Yields:
+        Shards in sample order; a single empty shard for an empty dataset
+    """
+    shard_size = max(1, shard_size)
+    chunk: List[SampleTuple] = []
+    index = 0
+    for s in samples:
+        chunk.append((s.sample_id, s.text, s.triage_level))
+        if len(chunk) == shard_size:
+            yield Shard(kind=DATASET, name=name, index=index, samples=tuple(chunk))
+            chunk = []
+            index += 1
+    if chunk or index == 0:
+        yield Shard(kind=DATASET, name=name, index=index, samples=tuple(chunk))
+
+
+def evaluate_shard(scanner, shard: Shard) -> ShardResult:
+    """Scan one shard.
+
+    Args:
+        scanner: SafetyScanner (or compatible); None counts dataset
+            samples without scanning them. A CachingScanner also reports
+            cache hits and new outcomes on the result
+        shard: Work to do
+
+    Returns:
+        ShardResult; a failed benchmark suite sets error instead of raising
+    """
+    if shard.kind == BENCHMARK:
+        result = _evaluate_benchmark(scanner, shard)
+    else:
+        result = _evaluate_samples(scanner, shard)
+    if isinstance(scanner, CachingScanner):
+        result.cache_hits, result.new_outcomes = scanner.drain()
+    return result
+
+
+def _evaluate_samples(scanner, shard: Shard) -> ShardResult:
+    result = ShardResult(kind=shard.kind, name=shard.name, index=shard.index)
+    result.total = len(shard.samples)
+    if scanner is None:
+        return result
+
+    for sample_id, text, triage_level in shard.samples:
+        started = time.perf_counter()
+        try:
+            scan_result = scanner.scan(
+                message_id=sample_id,
+                text=text,
+                student_id=EVAL_STUDENT_ID,
+            )
+        except Exception:
+            result.errors += 1
+            continue
+        if not getattr(scan_result, "cached", False):
+            result.latency.record((time.perf_counter() - started) * 1000)
+        if scan_result.risk_level.value == triage_level:
+            result.correct += 1
+    return result
+
+
+def _evaluate_benchmark(scanner, shard: Shard) -> ShardResult:
+    from .benchmarks import BenchmarkLoader
+    from .triage import ImmediateTriageEvaluator
+
+    result = ShardResult(kind=shard.kind, name=shard.name, index=shard.index)
+    try:
+        evaluator = ImmediateTriageEvaluator(scanner=scanner, benchmark_loader=BenchmarkLoader())
+        metrics = evaluator.evaluate_suite(shard.name).metrics
+    except FileNotFoundError:
+        logger.warning(f"Benchmark suite {shard.name} not found")
+        result.error = "not found"
+        return result
+    except Exception as e:
+        logger.error(f"Error running {shard.name}: {e}")
+        result.error = str(e)
+        return result
+
+    result.total = metrics.total_cases
+    result.correct = metrics.passed
+    result.crisis_tp = metrics.crisis_detected
+    result.crisis_fp = metrics.false_alarms
+    result.crisis_fn = metrics.crisis_missed
+    result.latency.merge(metrics.latency)
+    return result
+
+
+def merge_shard_results(results: Iterable[ShardResult]) -> Dict[str, ShardResult]:
+    """Merge shard results per dataset in a deterministic order.
+
+    Args:
+        results: Shard results in any order (e.g. completion order)
+
+    Returns:
+        Merged result per metrics key, keys in sorted order
+    """
+    merged: Dict[str, ShardResult] = {}
+    for result in sorted(results, key=lambda r: (r.key, r.index)):
+        if result.key not in merged:
+            merged[result.key] = ShardResult(kind=result.kind, name=result.name)
+        merged[result.key].merge(result)
+    return merged
+
+
+# Per-process scanner, built once by the pool initializer
+_worker_scanner = None
+
+
+def _init_worker(
+    scanner_factory: ScannerFactory,
+    pii_salt: Optional[str],
+    known_outcomes: Optional[Dict[str, ScanOutcome]],
+) -> None:
+    global _worker_scanner
+    if pii_salt:
+        from feelwell.shared.utils import configure_pii_salt
+        configure_pii_salt(pii_salt)
+    _worker_scanner = scanner_factory()
+    if known_outcomes is not None:
+        _worker_scanner = CachingScanner(_worker_scanner, known_outcomes)
+
+
+def _evaluate_in_worker(shard: Shard) -> ShardResult:
+    return evaluate_shard(_worker_scanner, shard)
+
+
+class ShardPool:
+    """Process pool scanning shards with one scanner per worker.
+
+    Use as a context manager; submit() returns immediately so the caller
+    can do other work while shards are scanned.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        scanner_factory: ScannerFactory,
+        pii_salt: Optional[str] = None,
+        known_outcomes: Optional[Dict[str, ScanOutcome]] = None,
+        max_pending: Optional[int] = None,
+    ):
+        """Initialize pool.
+
+        Args:
+            workers: Worker processes
+            scanner_factory: Picklable callable returning a scanner
+            pii_salt: PII salt configured in each worker; scans hash the
+                student id, which fails without one
+            known_outcomes: Cached outcomes by content hash; when given,
+                workers scan through a CachingScanner
+            max_pending: Shards queued at once by stream(); defaults to
+                PENDING_SHARDS_PER_WORKER per worker
+        """
+        self.workers = workers
+        self.max_pending = max_pending or workers * PENDING_SHARDS_PER_WORKER
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(scanner_factory, pii_salt, known_outcomes),
+        )
+
+    def submit(self, shards: Sequence[Shard]) -> List["Future[ShardResult]"]:
+        """Queue shards, largest first so stragglers start early."""
+        ordered = sorted(shards, key=lambda s: len(s.samples), reverse=True)
+        logger.info(
+            "EVALUATION_SHARDS_SUBMITTED",
+            extra={"shards": len(ordered), "workers": self.workers}
+        )
+        return [self._executor.submit(_evaluate_in_worker, shard) for shard in ordered]
+
+    def stream(
+        self,
+        shards: Iterable[Shard],
+        pending: Iterable["Future[ShardResult]"] = (),
+    ) -> Iterator[ShardResult]:
+        """Scan shards from a (lazy) iterable, at most max_pending at a time.
+
+        Args:
+            shards: Shards, read only as queue slots free up
+            pending: Futures already submitted, e.g. by submit()
+
+        Yields:
+            Shard results in completion order
+        """
+        queued = set(pending)
+        shards = iter(shards)
+        exhausted = False
+        while True:
+            while not exhausted and len(queued) < self.max_pending:
+                shard = next(shards, None)
+                if shard is None:
+                    exhausted = True
+                    break
+                queued.add(self._executor.submit(_evaluate_in_worker, shard))
+            if not queued:
+                return
+            done, queued = wait(queued, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ShardPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -10,18 +10,32 @@ import logging
 import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 import uuid
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+# Initial rows in the embedding matrix; capacity doubles when full
+INITIAL_CAPACITY = 1024
+
+# Upper bound on query x document scores computed at once by batched
+# search (float32, so 64 MiB)
+MAX_SCORE_ELEMENTS = 1 << 24
+
+
 @dataclass
 class Document:
-    """Document stored in vector store."""
+    """Document stored in vector store.
+    
+    Documents held by a VectorStore have embedding=None; the vector
+    lives in the store's matrix (see VectorStore.get_embedding).
+    """
     doc_id: str
     content: str
-    embedding: List[float]
+    embedding: Optional[Sequence[float]]
     metadata: Dict[str, Any]
     created_at: datetime = field(default_factory=datetime.utcnow)
     
@@ -51,6 +65,11 @@ class VectorStore:
     
     Production would use Pinecone, Weaviate, or pgvector.
     This implementation uses cosine similarity for testing.
+    
+    Embeddings are kept as unit-normalized rows of one contiguous
+    float32 matrix, so cosine similarity is a matrix-vector product.
+    Each student's rows are indexed, and top-k uses argpartition
+    rather than a full sort.
     """
     
     def __init__(self, embedding_dim: int = 384):
@@ -61,18 +80,26 @@ class VectorStore:
         """
         self.embedding_dim = embedding_dim
         self._documents: Dict[str, Document] = {}
-        self._student_index: Dict[str, List[str]] = {}  # student_hash -> doc_ids
+        self._init_storage()
         
         logger.info(
             "VECTOR_STORE_INITIALIZED",
             extra={"embedding_dim": embedding_dim}
         )
     
+    def _init_storage(self) -> None:
+        self._matrix = np.zeros((INITIAL_CAPACITY, self.embedding_dim), dtype=np.float32)
+        self._size = 0
+        self._rows: List[Document] = []  # row -> document
+        self._doc_rows: Dict[str, int] = {}  # doc_id -> row
+        self._student_index: Dict[str, List[int]] = {}  # student_hash -> rows
+        self._student_rows: Dict[str, np.ndarray] = {}  # student_hash -> rows, as an array
+    
     def add_document(
         self,
         content: str,
         metadata: Dict[str, Any],
-        embedding: Optional[List[float]] = None,
+        embedding: Optional[Sequence[float]] = None,
     ) -> Document:
         """Add a document to the store.
         
@@ -80,42 +107,120 @@ class VectorStore:
             content: Text content of document
             metadata: Document metadata (must include student_id_hash)
             embedding: Pre-computed embedding (or will be generated)
-            
+        
         Returns:
             Created Document
-        """
-        doc_id = f"doc_{uuid.uuid4().hex[:12]}"
         
-        # Generate simple embedding if not provided
-        if embedding is None:
-            embedding = self._generate_embedding(content)
+        Raises:
+            ValueError: If the embedding does not have embedding_dim values
+        """
+        embeddings = None if embedding is None else np.asarray(embedding)[np.newaxis, :]
+        doc = self._append([content], [metadata], embeddings)[0]
         
-        doc = Document(
-            doc_id=doc_id,
-            content=content,
-            embedding=embedding,
-            metadata=metadata,
+        logger.info(
+            "DOCUMENT_ADDED",
+            extra={
+                "doc_id": doc.doc_id,
+                "student_id_hash": doc.student_id_hash,
+                "content_length": len(content),
+            }
         )
         
-        self._documents[doc_id] = doc
+        return doc
+    
+    def add_documents(
+        self,
+        contents: Sequence[str],
+        metadatas: Sequence[Dict[str, Any]],
+        embeddings: Optional[np.ndarray] = None,
+    ) -> List[Document]:
+        """Add many documents in one step.
+        
+        Args:
+            contents: Text content per document
+            metadatas: Metadata per document
+            embeddings: (n, embedding_dim) pre-computed embeddings (or
+                will be generated)
+        
+        Returns:
+            Created Documents, in input order
+        
+        Raises:
+            ValueError: If the inputs differ in length or the embeddings
+                do not have embedding_dim columns
+        """
+        if len(contents) != len(metadatas):
+            raise ValueError("contents and metadatas must have the same length")
         
-        # Index by student
-        student_hash = metadata.get("student_id_hash")
-        if student_hash:
-            if student_hash not in self._student_index:
-                self._student_index[student_hash] = []
-            self._student_index[student_hash].append(doc_id)
+        docs = self._append(contents, metadatas, embeddings)
         
         logger.info(
-            "DOCUMENT_ADDED",
+            "DOCUMENTS_ADDED",
             extra={
-                "doc_id": doc_id,
-                "student_id_hash": student_hash,
-                "content_length": len(content),
+                "documents": len(docs),
+                "students": len({doc.student_id_hash for doc in docs} - {None}),
             }
         )
         
-        return doc
+        return docs
+    
+    def _append(
+        self,
+        contents: Sequence[str],
+        metadatas: Sequence[Dict[str, Any]],
+        embeddings: Optional[np.ndarray],
+    ) -> List[Document]:
+        """Write normalized rows and index the new documents."""
+        if embeddings is None:
+            embeddings = np.array([self._generate_embedding(c) for c in contents], dtype=np.float32)
+        embeddings = self._normalized(embeddings, "embeddings")
+        
+        start = self._size
+        self._reserve(start + len(contents))
+        self._matrix[start:start + len(contents)] = embeddings
+        self._size += len(contents)
+        
+        docs = []
+        for row, (content, metadata) in enumerate(zip(contents, metadatas), start=start):
+            doc = Document(
+                doc_id=f"doc_{uuid.uuid4().hex[:12]}",
+                content=content,
+                embedding=None,
+                metadata=metadata,
+            )
+            self._documents[doc.doc_id] = doc
+            self._rows.append(doc)
+            self._doc_rows[doc.doc_id] = row
+            
+            # Index by student
+            student_hash = metadata.get("student_id_hash")
+            if student_hash:
+                self._student_index.setdefault(student_hash, []).append(row)
+                self._student_rows.pop(student_hash, None)
+            docs.append(doc)
+        
+        return docs
+    
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix, doubling capacity, to hold at least rows."""
+        capacity = len(self._matrix)
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        grown = np.zeros((capacity, self.embedding_dim), dtype=np.float32)
+        grown[:self._size] = self._matrix[:self._size]
+        self._matrix = grown
+    
+    def _normalized(self, vectors: np.ndarray, name: str) -> np.ndarray:
+        """(n, embedding_dim) float32 unit vectors; zero vectors stay zero."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[1] != self.embedding_dim:
+            raise ValueError(
+                f"{name} must have {self.embedding_dim} dimensions, got shape {vectors.shape}"
+            )
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
     
     def search(
         self,
@@ -131,47 +236,133 @@ class VectorStore:
             student_id_hash: Filter to specific student
             top_k: Number of results to return
             min_similarity: Minimum similarity threshold
-            
+        
         Returns:
             List of SearchResult ordered by similarity
         """
-        query_embedding = self._generate_embedding(query)
-        
-        # Get candidate documents
-        if student_id_hash:
-            doc_ids = self._student_index.get(student_id_hash, [])
-            candidates = [self._documents[did] for did in doc_ids if did in self._documents]
-        else:
-            candidates = list(self._documents.values())
-        
-        # Calculate similarities
-        results = []
-        for doc in candidates:
-            similarity = self._cosine_similarity(query_embedding, doc.embedding)
-            if similarity >= min_similarity:
-                results.append((doc, similarity))
-        
-        # Sort by similarity
-        results.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return top_k
-        search_results = [
-            SearchResult(document=doc, similarity_score=sim, rank=idx + 1)
-            for idx, (doc, sim) in enumerate(results[:top_k])
-        ]
+        search_results = self.search_batch(
+            [query],
+            student_id_hash=student_id_hash,
+            top_k=top_k,
+            min_similarity=min_similarity,
+        )[0]
         
         logger.info(
             "VECTOR_SEARCH_COMPLETED",
             extra={
                 "query_length": len(query),
                 "student_filter": student_id_hash is not None,
-                "candidates": len(candidates),
+                "candidates": self._candidate_count(student_id_hash),
                 "results": len(search_results),
             }
         )
         
         return search_results
     
+    def search_batch(
+        self,
+        queries: Sequence[str],
+        student_id_hash: Optional[str] = None,
+        top_k: int = 5,
+        min_similarity: float = 0.0,
+    ) -> List[List[SearchResult]]:
+        """Search for several queries with one matrix product.
+        
+        Args:
+            queries: Search query texts
+            student_id_hash: Filter to specific student
+            top_k: Number of results per query
+            min_similarity: Minimum similarity threshold
+        
+        Returns:
+            One list of SearchResult per query, ordered by similarity
+        """
+        if not queries:
+            return []
+        embeddings = np.array([self._generate_embedding(q) for q in queries], dtype=np.float32)
+        return self.search_embeddings(
+            embeddings,
+            student_id_hash=student_id_hash,
+            top_k=top_k,
+            min_similarity=min_similarity,
+        )
+    
+    def search_embeddings(
+        self,
+        query_embeddings: np.ndarray,
+        student_id_hash: Optional[str] = None,
+        top_k: int = 5,
+        min_similarity: float = 0.0,
+    ) -> List[List[SearchResult]]:
+        """Search with pre-computed query embeddings.
+        
+        Args:
+            query_embeddings: (q, embedding_dim) query vectors
+            student_id_hash: Filter to specific student
+            top_k: Number of results per query
+            min_similarity: Minimum similarity threshold
+        
+        Returns:
+            One list of SearchResult per query, ordered by similarity
+        
+        Raises:
+            ValueError: If the queries do not have embedding_dim columns
+        """
+        queries = self._normalized(query_embeddings, "query_embeddings")
+        
+        # Get candidate rows
+        if student_id_hash:
+            rows = self._student_row_array(student_id_hash)
+            candidates = self._matrix[rows]
+        else:
+            rows = None
+            candidates = self._matrix[:self._size]
+        
+        top_k = min(top_k, len(candidates))
+        if top_k <= 0:
+            return [[] for _ in range(len(queries))]
+        
+        # Bound the (queries x candidates) score matrix held at once
+        step = max(1, MAX_SCORE_ELEMENTS // len(candidates))
+        results = []
+        for start in range(0, len(queries), step):
+            scores = queries[start:start + step] @ candidates.T
+            for query_scores in scores:
+                top = _top_k(query_scores, top_k)
+                top = top[query_scores[top] >= min_similarity]
+                doc_rows = top if rows is None else rows[top]
+                results.append([
+                    SearchResult(
+                        document=self._rows[row],
+                        similarity_score=float(query_scores[idx]),
+                        rank=rank,
+                    )
+                    for rank, (row, idx) in enumerate(zip(doc_rows.tolist(), top.tolist()), start=1)
+                ])
+        
+        return results
+    
+    def _candidate_count(self, student_id_hash: Optional[str]) -> int:
+        if student_id_hash:
+            return len(self._student_index.get(student_id_hash, ()))
+        return self._size
+    
+    def _student_row_array(self, student_id_hash: str) -> np.ndarray:
+        """A student's rows as an int64 array, cached until the student's next add."""
+        rows = self._student_rows.get(student_id_hash)
+        if rows is None:
+            rows = np.array(self._student_index.get(student_id_hash, []), dtype=np.int64)
+            self._student_rows[student_id_hash] = rows
+        return rows
+    
+    def get_embedding(self, doc_id: str) -> np.ndarray:
+        """Unit-normalized embedding of a stored document.
+        
+        Raises:
+            KeyError: If the document is not in the store
+        """
+        return self._matrix[self._doc_rows[doc_id]].copy()
+    
     def get_student_history(
         self,
         student_id_hash: str,
@@ -182,57 +373,35 @@ class VectorStore:
         Args:
             student_id_hash: Hashed student identifier
             limit: Maximum documents to return
-            
+        
         Returns:
             List of documents sorted by creation time
         """
-        doc_ids = self._student_index.get(student_id_hash, [])
-        docs = [self._documents[did] for did in doc_ids if did in self._documents]
+        docs = [self._rows[row] for row in self._student_index.get(student_id_hash, [])]
         
         # Sort by creation time
         docs.sort(key=lambda d: d.created_at)
         
         return docs[:limit]
     
-    def _generate_embedding(self, text: str) -> List[float]:
+    def _generate_embedding(self, text: str) -> np.ndarray:
         """Generate simple embedding for text.
         
         Production would use sentence-transformers or similar.
         This uses a hash-based approach for testing.
         """
-        # Simple hash-based embedding for testing
-        text_hash = hashlib.sha256(text.encode()).hexdigest()
-        
-        # Convert hash to float vector
-        embedding = []
-        for i in range(0, min(len(text_hash), self.embedding_dim * 2), 2):
-            byte_val = int(text_hash[i:i+2], 16)
-            embedding.append((byte_val - 128) / 128.0)
-        
-        # Pad or truncate to embedding_dim
-        while len(embedding) < self.embedding_dim:
-            embedding.append(0.0)
-        
-        return embedding[:self.embedding_dim]
-    
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """Calculate cosine similarity between vectors."""
-        if len(vec1) != len(vec2):
-            return 0.0
-        
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = sum(a * a for a in vec1) ** 0.5
-        norm2 = sum(b * b for b in vec2) ** 0.5
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return dot_product / (norm1 * norm2)
+        # Simple hash-based embedding for testing: one value per
+        # digest byte, zero-padded to embedding_dim
+        digest = np.frombuffer(hashlib.sha256(text.encode()).digest(), dtype=np.uint8)
+        embedding = np.zeros(self.embedding_dim, dtype=np.float32)
+        values = digest[:self.embedding_dim]
+        embedding[:len(values)] = (values.astype(np.float32) - 128) / 128.0
+        return embedding
     
     def clear(self) -> None:
         """Clear all documents from store."""
         self._documents.clear()
-        self._student_index.clear()
+        self._init_storage()
         logger.info("VECTOR_STORE_CLEARED")
     
     @property
@@ -242,3 +411,18 @@ class VectorStore:
     @property
     def student_count(self) -> int:
         return len(self._student_index)
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held by the embedding matrix and student row indexes."""
+        return self._matrix.nbytes + sum(rows.nbytes for rows in self._student_rows.values())
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indexes of the k highest scores, highest first."""
+    if k < len(scores):
+        top = np.argpartition(scores, len(scores) - k)[len(scores) - k:]
+    else:
+        top = np.arange(len(scores))
+    # Stable on negated scores so ties keep insertion order
+    return top[np.argsort(-scores[top], kind="stable")]
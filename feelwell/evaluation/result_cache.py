@@ -0,0 +1,311 @@
+"""Persistent per-sample scan cache for incremental evaluation runs.
+
+A scan outcome depends only on the message text and the scanner, so
+re-running an evaluation with an unchanged scanner rescans the whole
+corpus for nothing. EvalResultCache stores outcomes in a local SQLite
+file keyed on:
+
+- sha256 of the sample text
+- scanner_version (SafetyConfig.pattern_version)
+- config_hash: the scanner config, clinical thresholds, semantic flag
+  and keyword lists, so editing a pattern list invalidates the cache
+  even if pattern_version was not bumped
+
+Expected labels are not part of the key; correctness is recomputed
+from each sample's current label on every run. The cache also keeps
+the last metrics per dataset, so a run can report which metrics moved.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from feelwell.shared.models import RiskLevel
+
+logger = logging.getLogger(__name__)
+
+
+# Metrics compared between runs to report what moved
+TRACKED_METRICS = (
+    "total", "correct", "accuracy", "pass_rate", "crisis_recall", "crisis_fn",
+)
+
+# Changes smaller than this are not reported
+METRIC_CHANGE_TOLERANCE = 1e-9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scan_results (
+    content_hash TEXT NOT NULL,
+    scanner_version TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    risk_level TEXT NOT NULL,
+    bypass_llm INTEGER NOT NULL,
+    risk_score REAL NOT NULL,
+    matched_keywords TEXT NOT NULL,
+    PRIMARY KEY (content_hash, scanner_version, config_hash)
+);
+CREATE TABLE IF NOT EXISTS dataset_metrics (
+    dataset TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    scanner_version TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    metrics TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+def content_hash(text: str) -> str:
+    """Cache key for a sample's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def scanner_fingerprint(scanner) -> Tuple[str, str]:
+    """(scanner_version, config_hash) identifying a scanner's behavior.
+
+    Args:
+        scanner: SafetyScanner (or compatible with a config attribute)
+
+    Returns:
+        Tuple of pattern_version and a hash over everything that
+        changes scan outcomes
+    """
+    from feelwell.services.safety_service.config import CAUTION_KEYWORDS, CRISIS_KEYWORDS
+
+    config = getattr(scanner, "config", None)
+    thresholds = getattr(scanner, "thresholds", None)
+    parts = {
+        "scanner": type(scanner).__name__,
+        "config": asdict(config) if is_dataclass(config) else repr(config),
+        "thresholds": asdict(thresholds) if is_dataclass(thresholds) else repr(thresholds),
+        "semantic": getattr(scanner, "enable_semantic", None),
+        "crisis_keywords": sorted(CRISIS_KEYWORDS),
+        "caution_keywords": sorted(CAUTION_KEYWORDS),
+    }
+    digest = hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+    return getattr(config, "pattern_version", "unknown"), digest[:16]
+
+
+@dataclass(frozen=True)
+class ScanOutcome:
+    """The parts of a scan result the evaluation uses."""
+    risk_level: str
+    bypass_llm: bool
+    risk_score: float
+    matched_keywords: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_scan_result(cls, scan_result) -> "ScanOutcome":
+        return cls(
+            risk_level=scan_result.risk_level.value,
+            bypass_llm=bool(scan_result.bypass_llm),
+            risk_score=float(scan_result.risk_score),
+            matched_keywords=tuple(scan_result.matched_keywords),
+        )
+
+
+@dataclass(frozen=True)
+class CachedScanResult:
+    """Scan result replayed from the cache; cached marks it as not scanned."""
+    risk_level: RiskLevel
+    bypass_llm: bool
+    risk_score: float
+    matched_keywords: List[str]
+    cached: bool = True
+
+    @classmethod
+    def from_outcome(cls, outcome: ScanOutcome) -> "CachedScanResult":
+        return cls(
+            risk_level=RiskLevel(outcome.risk_level),
+            bypass_llm=outcome.bypass_llm,
+            risk_score=outcome.risk_score,
+            matched_keywords=list(outcome.matched_keywords),
+        )
+
+
+class CachingScanner:
+    """Scanner wrapper answering repeated texts from known outcomes.
+
+    New outcomes are collected rather than written, so worker processes
+    never touch the SQLite file; the runner writes them once.
+    """
+
+    def __init__(self, scanner, known: Optional[Dict[str, ScanOutcome]] = None):
+        """Initialize wrapper.
+
+        Args:
+            scanner: Scanner to delegate cache misses to
+            known: Outcomes by content hash, e.g. from EvalResultCache.load
+        """
+        self.scanner = scanner
+        self.config = getattr(scanner, "config", None)
+        self._known = dict(known or {})
+        self._hits = 0
+        self._new: Dict[str, ScanOutcome] = {}
+
+    def scan(self, message_id: str, text: str, student_id: str):
+        key = content_hash(text)
+        outcome = self._known.get(key)
+        if outcome is not None:
+            self._hits += 1
+            return CachedScanResult.from_outcome(outcome)
+
+        scan_result = self.scanner.scan(
+            message_id=message_id,
+            text=text,
+            student_id=student_id,
+        )
+        outcome = ScanOutcome.from_scan_result(scan_result)
+        self._known[key] = outcome
+        self._new[key] = outcome
+        return scan_result
+
+    def drain(self) -> Tuple[int, Dict[str, ScanOutcome]]:
+        """Cache hits and new outcomes since the last drain."""
+        hits, new = self._hits, self._new
+        self._hits, self._new = 0, {}
+        return hits, new
+
+
+class EvalResultCache:
+    """SQLite-backed scan outcomes and last-run metrics."""
+
+    def __init__(self, path: Path, scanner_version: str, config_hash: str):
+        """Open (or create) the cache file.
+
+        Args:
+            path: SQLite file
+            scanner_version: SafetyConfig.pattern_version of the scanner
+            config_hash: Hash from scanner_fingerprint
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.scanner_version = scanner_version
+        self.config_hash = config_hash
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def for_scanner(cls, path: Path, scanner) -> "EvalResultCache":
+        """Open the cache for a scanner's current version and config."""
+        return cls(path, *scanner_fingerprint(scanner))
+
+    def load(self) -> Dict[str, ScanOutcome]:
+        """All outcomes recorded for this scanner version and config."""
+        rows = self._conn.execute(
+            "SELECT content_hash, risk_level, bypass_llm, risk_score, matched_keywords "
+            "FROM scan_results WHERE scanner_version = ? AND config_hash = ?",
+            (self.scanner_version, self.config_hash),
+        )
+        return {
+            key: ScanOutcome(
+                risk_level=risk_level,
+                bypass_llm=bool(bypass_llm),
+                risk_score=risk_score,
+                matched_keywords=tuple(json.loads(keywords)),
+            )
+            for key, risk_level, bypass_llm, risk_score, keywords in rows
+        }
+
+    def store(self, outcomes: Dict[str, ScanOutcome]) -> None:
+        """Persist new outcomes in one transaction."""
+        if not outcomes:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO scan_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        key, self.scanner_version, self.config_hash,
+                        o.risk_level, int(o.bypass_llm), o.risk_score,
+                        json.dumps(list(o.matched_keywords)),
+                    )
+                    for key, o in sorted(outcomes.items())
+                ],
+            )
+
+    def previous_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics per dataset from the last run that saved them."""
+        rows = self._conn.execute("SELECT dataset, metrics FROM dataset_metrics")
+        return {dataset: json.loads(metrics) for dataset, metrics in rows}
+
+    def save_metrics(self, run_id: str, metrics_by_dataset: Dict[str, Dict[str, Any]]) -> None:
+        """Remember tracked metrics per dataset for the next run's comparison."""
+        now = datetime.utcnow().isoformat()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO dataset_metrics VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        dataset, run_id, self.scanner_version, self.config_hash,
+                        json.dumps(_tracked(metrics)), now,
+                    )
+                    for dataset, metrics in sorted(metrics_by_dataset.items())
+                    if "error" not in metrics
+                ],
+            )
+
+    def prune(self) -> int:
+        """Drop outcomes from other scanner versions or configs.
+
+        Returns:
+            Number of rows deleted
+        """
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM scan_results WHERE scanner_version != ? OR config_hash != ?",
+                (self.scanner_version, self.config_hash),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "EvalResultCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _tracked(metrics: Dict[str, Any]) -> Dict[str, float]:
+    return {
+        key: metrics[key]
+        for key in TRACKED_METRICS
+        if isinstance(metrics.get(key), (int, float)) and not isinstance(metrics.get(key), bool)
+    }
+
+
+def metric_changes(
+    previous: Dict[str, Dict[str, Any]],
+    current: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+    """Tracked metrics that moved between two runs.
+
+    Args:
+        previous: Metrics per dataset from the last run
+        current: Metrics per dataset from this run
+
+    Returns:
+        {dataset: {metric: {"before": x, "after": y}}} for changed
+        metrics; datasets new in this run report before as None
+    """
+    changes: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+    for dataset in sorted(current):
+        if "error" in current[dataset]:
+            continue
+        after = _tracked(current[dataset])
+        before = previous.get(dataset, {})
+        moved = {
+            key: {"before": before.get(key), "after": value}
+            for key, value in after.items()
+            if key not in before or abs(before[key] - value) > METRIC_CHANGE_TOLERANCE
+        }
+        if moved:
+            changes[dataset] = moved
+    return changes
+
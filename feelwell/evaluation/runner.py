@@ -9,17 +9,39 @@ Runs comprehensive evaluation against:
 Generates detailed reports with metrics for:
 - Safety (crisis recall, false negative rate)
 - Accuracy (precision, recall, F1 by category)
-- Latency (P50, P99)
+- Latency (P50, P95, P99, P99.9)
 - Clinical alignment (PHQ-9 correlation, decision accuracy)
+
+Benchmark and dataset scans are split into shards (see parallel.py) and
+run in-process, or on a process pool when config.workers > 1. With
+config.result_cache_path set, scan outcomes are cached per sample (see
+result_cache.py) and only new or changed samples are scanned.
 """
 import logging
 import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 import uuid
 
+from .metrics.latency import LatencyHistogram
+from .result_cache import CachingScanner, EvalResultCache, ScanOutcome, metric_changes
+from .parallel import (
+    BENCHMARK,
+    DATASET,
+    DEFAULT_SHARD_SIZE,
+    SafetyScannerFactory,
+    ScannerFactory,
+    Shard,
+    ShardPool,
+    ShardResult,
+    evaluate_shard,
+    iter_dataset_shards,
+    merge_shard_results,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +60,13 @@ class EvaluationConfig:
         "mentalchat16k", "phq9_depression", "clinical_decisions"
     ])
     
+    # Parallelism: worker processes for benchmark/dataset scans (1 = in-process)
+    workers: int = 1
+    shard_size: int = DEFAULT_SHARD_SIZE
+    
+    # Incremental runs: SQLite scan result cache (None rescans everything)
+    result_cache_path: Optional[Path] = None
+    
     # Output options
     output_dir: Path = field(default_factory=lambda: Path("feelwell/evaluation/results"))
     save_detailed_results: bool = True
@@ -110,14 +139,20 @@ class EvaluationResult:
     integration_results: Optional[Dict[str, Any]] = None
     canary_results: Optional[Dict[str, Any]] = None
     
-    # Latency
+    # Latency, merged across every benchmark and dataset scan
     avg_latency_ms: float = 0.0
     p99_latency_ms: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
     
     # Safety assessment
     passes_safety_threshold: bool = False
     safety_issues: List[str] = field(default_factory=list)
     
+    # Incremental evaluation (result cache)
+    cache_hits: int = 0
+    samples_scanned: int = 0
+    metric_changes: Dict[str, Dict[str, Dict[str, Any]]] = field(default_factory=dict)
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "run_id": self.run_id,
@@ -133,6 +168,8 @@ class EvaluationResult:
             "safety_issues": self.safety_issues,
             "avg_latency_ms": round(self.avg_latency_ms, 2),
             "p99_latency_ms": round(self.p99_latency_ms, 2),
+            "latency": self.latency.summary(),
+            "latency_histogram": self.latency.to_dict(),
             "metrics_by_category": {
                 k: v.to_dict() for k, v in self.metrics_by_category.items()
             },
@@ -140,6 +177,11 @@ class EvaluationResult:
             "e2e_results": self.e2e_results,
             "integration_results": self.integration_results,
             "canary_results": self.canary_results,
+            "incremental": {
+                "cache_hits": self.cache_hits,
+                "samples_scanned": self.samples_scanned,
+                "metric_changes": self.metric_changes,
+            },
         }
 
 
@@ -151,6 +193,7 @@ class EvaluationRunner:
         config: Optional[EvaluationConfig] = None,
         scanner=None,
         analyzer=None,
+        scanner_factory: Optional[ScannerFactory] = None,
     ):
         """Initialize runner.
         
@@ -158,10 +201,14 @@ class EvaluationRunner:
             config: Evaluation configuration
             scanner: SafetyScanner instance
             analyzer: MessageAnalyzer instance
+            scanner_factory: Picklable callable building the scanner in
+                each worker process when config.workers > 1; defaults to
+                a SafetyScanner with the same config as scanner
         """
         self.config = config or EvaluationConfig()
         self.scanner = scanner
         self.analyzer = analyzer
+        self.scanner_factory = scanner_factory
         
         # Initialize components lazily
         self._benchmark_loader = None
@@ -192,53 +239,47 @@ class EvaluationRunner:
             config=self.config,
         )
         
-        all_latencies = []
         total_correct = 0
         total_samples = 0
         crisis_tp = 0
         crisis_fp = 0
         crisis_fn = 0
         
+        cache = self._open_result_cache()
+        
         try:
-            # 1. Internal benchmarks
-            if self.config.run_internal_benchmarks:
-                benchmark_results = self._run_internal_benchmarks()
-                for name, metrics in benchmark_results.items():
-                    result.metrics_by_dataset[f"benchmark_{name}"] = metrics
-                    total_samples += metrics.get("total", 0)
-                    total_correct += metrics.get("correct", 0)
-                    crisis_tp += metrics.get("crisis_tp", 0)
-                    crisis_fp += metrics.get("crisis_fp", 0)
-                    crisis_fn += metrics.get("crisis_fn", 0)
-                    all_latencies.extend(metrics.get("latencies", []))
+            # 1-2. Internal benchmarks and external datasets, as shards
+            # streamed from the loaders (dataset_info fills as they run).
+            # 3-4. Triage and test suites run while a worker pool scans.
+            dataset_info: Dict[str, Dict[str, Any]] = {}
+            known = cache.load() if cache else None
+            shard_results = self._run_scan_shards(
+                self._iter_scan_shards(dataset_info), result, known
+            )
+            merged = merge_shard_results(shard_results)
             
-            # 2. External datasets
-            if self.config.run_external_datasets:
-                dataset_results = self._run_external_datasets()
-                for name, metrics in dataset_results.items():
-                    result.metrics_by_dataset[name] = metrics
-                    result.metrics_by_category[metrics.get("category", "unknown")] = \
-                        CategoryMetrics(
-                            category=metrics.get("category", "unknown"),
-                            total=metrics.get("total", 0),
-                            correct=metrics.get("correct", 0),
-                        )
-                    total_samples += metrics.get("total", 0)
-                    total_correct += metrics.get("correct", 0)
+            for name, metrics in self._benchmark_metrics(merged).items():
+                result.metrics_by_dataset[f"benchmark_{name}"] = metrics
+                total_samples += metrics.get("total", 0)
+                total_correct += metrics.get("correct", 0)
+                crisis_tp += metrics.get("crisis_tp", 0)
+                crisis_fp += metrics.get("crisis_fp", 0)
+                crisis_fn += metrics.get("crisis_fn", 0)
             
-            # 3. Triage evaluation
-            if self.config.run_triage_evaluation:
-                triage_results = self._run_triage_evaluation()
-                result.immediate_triage_metrics = triage_results.get("immediate")
-                result.session_triage_metrics = triage_results.get("session")
-                result.longitudinal_triage_metrics = triage_results.get("longitudinal")
+            for name, metrics in self._dataset_metrics(merged, dataset_info).items():
+                result.metrics_by_dataset[name] = metrics
+                result.metrics_by_category[metrics.get("category", "unknown")] = \
+                    CategoryMetrics(
+                        category=metrics.get("category", "unknown"),
+                        total=metrics.get("total", 0),
+                        correct=metrics.get("correct", 0),
+                    )
+                total_samples += metrics.get("total", 0)
+                total_correct += metrics.get("correct", 0)
             
-            # 4. Test suites
-            if self.config.run_test_suites:
-                suite_results = self._run_test_suites()
-                result.e2e_results = suite_results.get("e2e")
-                result.integration_results = suite_results.get("integration")
-                result.canary_results = suite_results.get("canary")
+            # merged is in sorted key order, so float sums are reproducible
+            for shard_result in merged.values():
+                result.latency.merge(shard_result.latency)
             
             # Calculate aggregate metrics
             result.total_samples_evaluated = total_samples
@@ -249,12 +290,9 @@ class EvaluationRunner:
             result.crisis_precision = crisis_tp / (crisis_tp + crisis_fp) if (crisis_tp + crisis_fp) > 0 else 1.0
             result.false_negative_count = crisis_fn
             
-            # Latency metrics
-            if all_latencies:
-                all_latencies.sort()
-                result.avg_latency_ms = sum(all_latencies) / len(all_latencies)
-                p99_idx = int(len(all_latencies) * 0.99)
-                result.p99_latency_ms = all_latencies[min(p99_idx, len(all_latencies) - 1)]
+            # Latency metrics, from the merged histogram of every scan
+            result.avg_latency_ms = result.latency.mean_ms
+            result.p99_latency_ms = result.latency.percentile(0.99)
             
             # Safety assessment
             result.passes_safety_threshold = (
@@ -271,9 +309,17 @@ class EvaluationRunner:
                     f"False negatives detected: {result.false_negative_count}"
                 )
             
+            result.cache_hits = sum(r.cache_hits for r in merged.values())
+            result.samples_scanned = total_samples - result.cache_hits
+            if cache:
+                self._update_result_cache(cache, result, merged)
+            
         except Exception as e:
             logger.error("EVALUATION_ERROR", extra={"error": str(e)})
             result.safety_issues.append(f"Evaluation error: {str(e)}")
+        finally:
+            if cache:
+                cache.close()
         
         result.completed_at = datetime.utcnow()
         
@@ -298,47 +344,30 @@ class EvaluationRunner:
         
         return result
 
-    def _run_internal_benchmarks(self) -> Dict[str, Dict[str, Any]]:
-        """Run evaluation against internal benchmarks."""
-        from .benchmarks import BenchmarkLoader
-        from .triage import ImmediateTriageEvaluator
+    def _iter_scan_shards(self, dataset_info: Dict[str, Dict[str, Any]]) -> Iterator[Shard]:
+        """Yield benchmark suites, then datasets streamed from their loaders, as shards.
         
-        results = {}
-        loader = BenchmarkLoader()
+        Dataset samples are read from the loaders' streams as shards are
+        consumed, so only the shards in flight are held in memory.
         
-        if self.scanner:
-            evaluator = ImmediateTriageEvaluator(
-                scanner=self.scanner,
-                benchmark_loader=loader,
-            )
+        Args:
+            dataset_info: Filled with per-dataset category and stats once
+                a dataset's stream is exhausted, or error for datasets
+                that failed to load
             
-            # Run each benchmark suite
-            for suite_name in ["crisis_detection", "adversarial_cases", 
-                              "false_positives", "caution_cases"]:
-                try:
-                    suite_result = evaluator.evaluate_suite(suite_name)
-                    results[suite_name] = {
-                        "total": suite_result.metrics.total_cases,
-                        "correct": suite_result.metrics.passed,
-                        "crisis_tp": suite_result.metrics.crisis_detected,
-                        "crisis_fp": suite_result.metrics.false_alarms,
-                        "crisis_fn": suite_result.metrics.crisis_missed,
-                        "latencies": suite_result.metrics.latencies_ms,
-                        "pass_rate": suite_result.metrics.overall_accuracy,
-                        "crisis_recall": suite_result.metrics.crisis_recall,
-                    }
-                except FileNotFoundError:
-                    logger.warning(f"Benchmark suite {suite_name} not found")
-                except Exception as e:
-                    logger.error(f"Error running {suite_name}: {e}")
-        
-        return results
-    
-    def _run_external_datasets(self) -> Dict[str, Dict[str, Any]]:
-        """Run evaluation against external datasets."""
+        Yields:
+            Shards in dataset order
+        """
         from .datasets import MentalChat16KLoader, PHQ9DatasetLoader, ClinicalDecisionLoader
+        from .datasets.dataset_loader import DatasetStatsBuilder
         
-        results = {}
+        if self.config.run_internal_benchmarks and self.scanner:
+            for suite_name in ["crisis_detection", "adversarial_cases",
+                              "false_positives", "caution_cases"]:
+                yield Shard(kind=BENCHMARK, name=suite_name)
+        
+        if not self.config.run_external_datasets:
+            return
         
         loaders = {
             "mentalchat16k": MentalChat16KLoader,
@@ -350,6 +379,7 @@ class EvaluationRunner:
             if name not in loaders:
                 continue
             
+            stats = DatasetStatsBuilder()
             try:
                 loader_class = loaders[name]
                 loader = loader_class()
@@ -358,39 +388,169 @@ class EvaluationRunner:
                 if self.config.max_samples_per_dataset:
                     loader.config.max_samples = self.config.max_samples_per_dataset
                 
-                samples = loader.load()
-                stats = loader.get_stats()
-                
-                # Evaluate samples
-                correct = 0
-                total = len(samples)
-                
-                if self.scanner:
-                    for sample in samples:
-                        try:
-                            scan_result = self.scanner.scan(
-                                message_id=sample.sample_id,
-                                text=sample.text,
-                                student_id="eval_student",
-                            )
-                            
-                            if scan_result.risk_level.value == sample.triage_level:
-                                correct += 1
-                        except Exception:
-                            pass
-                
-                results[name] = {
-                    "total": total,
-                    "correct": correct,
-                    "accuracy": correct / total if total > 0 else 0.0,
+                samples = stats.track(loader.iter_samples())
+                yield from iter_dataset_shards(name, samples, self.config.shard_size)
+                dataset_info[name] = {
                     "category": name.split("_")[0],
-                    "stats": stats.to_dict(),
+                    "stats": stats.build().to_dict(),
                 }
                 
             except Exception as e:
                 logger.error(f"Error loading dataset {name}: {e}")
-                results[name] = {"error": str(e)}
+                dataset_info[name] = {"error": str(e)}
+    
+    def _run_scan_shards(
+        self,
+        shards: Iterable[Shard],
+        result: EvaluationResult,
+        known: Optional[Dict[str, ScanOutcome]] = None,
+    ) -> List[ShardResult]:
+        """Scan shards and run the triage and test suite tiers.
+        
+        With workers > 1 the first shards go to a process pool, the
+        triage and test suite tiers run in this process meanwhile, and
+        the remaining shards are streamed into the pool as slots free up.
         
+        Args:
+            shards: Scan work, consumed lazily
+            result: Result receiving triage and test suite metrics
+            known: Cached outcomes by content hash; None disables caching
+            
+        Returns:
+            Shard results in completion order
+        """
+        factory = self._scanner_factory()
+        if self.config.workers <= 1 or factory is None:
+            scanner = self.scanner
+            if known is not None and scanner is not None:
+                scanner = CachingScanner(scanner, known)
+            shard_results = [evaluate_shard(scanner, shard) for shard in shards]
+            self._run_tiers(result)
+            return shard_results
+        
+        from feelwell.shared.utils import pii
+        
+        with ShardPool(
+            self.config.workers, factory, pii_salt=pii._PII_SALT, known_outcomes=known,
+        ) as pool:
+            shards = iter(shards)
+            pending = pool.submit(list(islice(shards, pool.max_pending)))
+            self._run_tiers(result)
+            return list(pool.stream(shards, pending))
+    
+    def _open_result_cache(self) -> Optional[EvalResultCache]:
+        """Open the scan result cache for this scanner, if configured."""
+        if self.config.result_cache_path is None:
+            return None
+        if self.scanner is None:
+            logger.warning("EVALUATION_RESULT_CACHE_DISABLED", extra={"reason": "no scanner"})
+            return None
+        return EvalResultCache.for_scanner(self.config.result_cache_path, self.scanner)
+    
+    def _update_result_cache(
+        self,
+        cache: EvalResultCache,
+        result: EvaluationResult,
+        merged: Dict[str, ShardResult],
+    ) -> None:
+        """Store new outcomes and record which metrics moved since last run."""
+        new_outcomes: Dict[str, ScanOutcome] = {}
+        for shard_result in merged.values():
+            new_outcomes.update(shard_result.new_outcomes)
+        cache.store(new_outcomes)
+        
+        current = dict(result.metrics_by_dataset)
+        current["overall"] = {
+            "total": result.total_samples_evaluated,
+            "accuracy": result.overall_accuracy,
+            "crisis_recall": result.crisis_recall,
+            "crisis_fn": result.false_negative_count,
+        }
+        result.metric_changes = metric_changes(cache.previous_metrics(), current)
+        cache.save_metrics(result.run_id, current)
+        
+        logger.info(
+            "EVALUATION_RESULT_CACHE_UPDATED",
+            extra={
+                "scanner_version": cache.scanner_version,
+                "cache_hits": result.cache_hits,
+                "samples_scanned": result.samples_scanned,
+                "new_outcomes": len(new_outcomes),
+                "datasets_changed": sorted(result.metric_changes),
+            }
+        )
+    
+    def _scanner_factory(self) -> Optional[ScannerFactory]:
+        """Factory for worker scanners; None when there is nothing to scan with."""
+        if self.scanner_factory is not None:
+            return self.scanner_factory
+        if self.scanner is None:
+            return None
+        return SafetyScannerFactory(config=getattr(self.scanner, "config", None))
+    
+    def _run_tiers(self, result: EvaluationResult) -> None:
+        """Run triage evaluation and test suites into result."""
+        # 3. Triage evaluation
+        if self.config.run_triage_evaluation:
+            triage_results = self._run_triage_evaluation()
+            result.immediate_triage_metrics = triage_results.get("immediate")
+            result.session_triage_metrics = triage_results.get("session")
+            result.longitudinal_triage_metrics = triage_results.get("longitudinal")
+        
+        # 4. Test suites
+        if self.config.run_test_suites:
+            suite_results = self._run_test_suites()
+            result.e2e_results = suite_results.get("e2e")
+            result.integration_results = suite_results.get("integration")
+            result.canary_results = suite_results.get("canary")
+    
+    def _benchmark_metrics(
+        self,
+        merged: Dict[str, ShardResult],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Metrics per benchmark suite from merged shard results."""
+        results = {}
+        for shard_result in merged.values():
+            if shard_result.kind != BENCHMARK or shard_result.error:
+                continue
+            detected = shard_result.crisis_tp + shard_result.crisis_fn
+            results[shard_result.name] = {
+                "total": shard_result.total,
+                "correct": shard_result.correct,
+                "crisis_tp": shard_result.crisis_tp,
+                "crisis_fp": shard_result.crisis_fp,
+                "crisis_fn": shard_result.crisis_fn,
+                "pass_rate": (
+                    shard_result.correct / shard_result.total if shard_result.total else 0.0
+                ),
+                "crisis_recall": shard_result.crisis_tp / detected if detected else 1.0,
+                "latency": shard_result.latency.summary(),
+                "latency_histogram": shard_result.latency.to_dict(),
+            }
+        return results
+    
+    def _dataset_metrics(
+        self,
+        merged: Dict[str, ShardResult],
+        dataset_info: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Metrics per external dataset from merged shard results."""
+        results = {}
+        for name, info in dataset_info.items():
+            if "error" in info:
+                results[name] = info
+                continue
+            shard_result = merged.get(name) or ShardResult(kind=DATASET, name=name)
+            total = shard_result.total
+            results[name] = {
+                "total": total,
+                "correct": shard_result.correct,
+                "accuracy": shard_result.correct / total if total > 0 else 0.0,
+                "scan_errors": shard_result.errors,
+                "latency": shard_result.latency.summary(),
+                "latency_histogram": shard_result.latency.to_dict(),
+                **info,
+            }
         return results
     
     def _run_triage_evaluation(self) -> Dict[str, Dict[str, Any]]:
@@ -509,7 +669,10 @@ class EvaluationRunner:
             f"- Total Samples Evaluated: {result.total_samples_evaluated:,}",
             f"- Overall Accuracy: {result.overall_accuracy:.2%}",
             f"- Average Latency: {result.avg_latency_ms:.1f}ms",
+            f"- P50 / P95 Latency: {result.latency.percentile(0.50):.1f}ms / "
+            f"{result.latency.percentile(0.95):.1f}ms",
             f"- P99 Latency: {result.p99_latency_ms:.1f}ms",
+            f"- P99.9 Latency: {result.latency.percentile(0.999):.1f}ms",
             "",
             "## Results by Dataset",
             "",
@@ -524,6 +687,23 @@ class EvaluationRunner:
                     f"| {name} | {metrics.get('total', 0):,} | {acc:.2%} | |"
                 )
         
+        if self.config.result_cache_path is not None:
+            lines.extend([
+                "",
+                "## Changes Since Last Run",
+                "",
+                f"- Cached Outcomes Reused: {result.cache_hits:,}",
+                f"- Samples Scanned: {result.samples_scanned:,}",
+                "",
+            ])
+            for name, changes in result.metric_changes.items():
+                for metric, change in changes.items():
+                    before = change["before"]
+                    before_text = "new" if before is None else f"{before:.4g}"
+                    lines.append(f"- {name} {metric}: {before_text} → {change['after']:.4g}")
+            if not result.metric_changes:
+                lines.append("- No tracked metric changed")
+        
         lines.extend([
             "",
             "## Triage Evaluation",
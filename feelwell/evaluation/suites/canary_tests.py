@@ -19,6 +19,7 @@ from typing import Any, Dict, List, Optional
 from enum import Enum
 
 from feelwell.shared.utils import hash_pii, configure_pii_salt
+from feelwell.evaluation.metrics.latency import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +127,7 @@ class CanarySuiteResult:
     passed: int
     failed: int
     scenario_results: List[CanaryScenarioResult]
+    crisis_detection_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
     
     @property
     def pass_rate(self) -> float:
@@ -135,14 +137,7 @@ class CanarySuiteResult:
     
     @property
     def avg_crisis_detection_latency(self) -> float:
-        latencies = [
-            r.crisis_detection_latency_ms
-            for r in self.scenario_results
-            if r.crisis_detection_latency_ms is not None
-        ]
-        if not latencies:
-            return 0.0
-        return sum(latencies) / len(latencies)
+        return self.crisis_detection_latency.mean_ms
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -154,6 +149,7 @@ class CanarySuiteResult:
             "failed": self.failed,
             "pass_rate": round(self.pass_rate, 4),
             "avg_crisis_detection_latency_ms": round(self.avg_crisis_detection_latency, 2),
+            "crisis_detection_latency": self.crisis_detection_latency.summary(),
         }
 
 
@@ -606,12 +602,15 @@ class CanaryTestSuite:
         )
         
         results = []
+        crisis_latency = LatencyHistogram()
         passed = 0
         failed = 0
         
         for scenario in self.SCENARIOS:
             result = self.run_scenario(scenario)
             results.append(result)
+            if result.crisis_detection_latency_ms is not None:
+                crisis_latency.record(result.crisis_detection_latency_ms)
             
             if result.passed:
                 passed += 1
@@ -628,6 +627,7 @@ class CanaryTestSuite:
             passed=passed,
             failed=failed,
             scenario_results=results,
+            crisis_detection_latency=crisis_latency,
         )
         
         logger.info(
@@ -657,12 +657,15 @@ class CanaryTestSuite:
         started_at = datetime.utcnow()
         
         results = []
+        crisis_latency = LatencyHistogram()
         passed = 0
         failed = 0
         
         for scenario in matching:
             result = self.run_scenario(scenario)
             results.append(result)
+            if result.crisis_detection_latency_ms is not None:
+                crisis_latency.record(result.crisis_detection_latency_ms)
             
             if result.passed:
                 passed += 1
@@ -679,4 +682,5 @@ class CanaryTestSuite:
             passed=passed,
             failed=failed,
             scenario_results=results,
+            crisis_detection_latency=crisis_latency,
         )
@@ -18,6 +18,7 @@ from enum import Enum
 
 from shared.utils import hash_pii, configure_pii_salt
 from shared.models import RiskLevel
+from feelwell.evaluation.metrics.latency import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +136,7 @@ class E2ESuiteResult:
     errors: int
     skipped: int
     results: List[E2ETestResult]
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
     
     @property
     def pass_rate(self) -> float:
@@ -144,10 +146,7 @@ class E2ESuiteResult:
     
     @property
     def avg_latency_ms(self) -> float:
-        latencies = [r.total_latency_ms for r in self.results if r.total_latency_ms > 0]
-        if not latencies:
-            return 0.0
-        return sum(latencies) / len(latencies)
+        return self.latency.mean_ms
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -161,6 +160,7 @@ class E2ESuiteResult:
             "skipped": self.skipped,
             "pass_rate": round(self.pass_rate, 4),
             "avg_latency_ms": round(self.avg_latency_ms, 2),
+            "latency": self.latency.summary(),
             "failed_test_ids": [r.test_id for r in self.results if r.status == E2ETestStatus.FAILED],
         }
 
@@ -633,6 +633,7 @@ class E2ETestSuite:
         )
         
         results = []
+        latency = LatencyHistogram()
         passed = 0
         failed = 0
         errors = 0
@@ -641,6 +642,8 @@ class E2ETestSuite:
         for test_case in self.TEST_CASES:
             result = self.run_test(test_case)
             results.append(result)
+            if result.total_latency_ms > 0:
+                latency.record(result.total_latency_ms)
             
             if result.status == E2ETestStatus.PASSED:
                 passed += 1
@@ -663,6 +666,7 @@ class E2ETestSuite:
             errors=errors,
             skipped=skipped,
             results=results,
+            latency=latency,
         )
         
         logger.info(
@@ -16,6 +16,7 @@ from typing import Any, Dict, List, Optional
 from enum import Enum
 
 from feelwell.shared.utils import hash_pii, configure_pii_salt
+from feelwell.evaluation.metrics.latency import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +77,7 @@ class IntegrationSuiteResult:
     passed: int
     failed: int
     results: List[IntegrationTestResult]
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
     
     @property
     def pass_rate(self) -> float:
@@ -92,6 +94,7 @@ class IntegrationSuiteResult:
             "passed": self.passed,
             "failed": self.failed,
             "pass_rate": round(self.pass_rate, 4),
+            "latency": self.latency.summary(),
         }
 
 
@@ -529,6 +532,7 @@ class IntegrationTestSuite:
         )
         
         results = []
+        latency = LatencyHistogram()
         passed = 0
         failed = 0
         
@@ -541,6 +545,7 @@ class IntegrationTestSuite:
                 result = self.run_contract_test(test_case)  # Default
             
             results.append(result)
+            latency.record(result.latency_ms)
             
             if result.status == IntegrationTestStatus.PASSED:
                 passed += 1
@@ -557,6 +562,7 @@ class IntegrationTestSuite:
             passed=passed,
             failed=failed,
             results=results,
+            latency=latency,
         )
         
         logger.info(
@@ -6,6 +6,7 @@ clinical metrics and safety requirements.
 
 import logging
 import asyncio
+from itertools import islice
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 import json
@@ -15,6 +16,7 @@ from datetime import datetime
 from evaluation.evaluators.gpt4_evaluator import GPT4Evaluator, EvaluationConfig
 from evaluation.metrics.mentalchat_metrics import ClinicalEvaluation
 from evaluation.datasets.mentalchat16k_loader import MentalChat16KLoader
+from evaluation.datasets.streaming import iter_json_array, reservoir_sample
 
 logger = logging.getLogger(__name__)
 
@@ -77,9 +79,8 @@ class MentalChatEvaluationSuite:
             List of TestCase objects
         """
         if self.test_cases_path and Path(self.test_cases_path).exists():
-            # Load from custom file
-            with open(self.test_cases_path, 'r') as f:
-                data = json.load(f)
+            # Load from custom file, reading only the first count cases
+            cases = islice(iter_json_array(Path(self.test_cases_path)), count)
             
             self.test_cases = [
                 TestCase(
@@ -89,23 +90,13 @@ class MentalChatEvaluationSuite:
                     source=case.get("source", "custom"),
                     metadata=case.get("metadata")
                 )
-                for i, case in enumerate(data[:count])
+                for i, case in enumerate(cases)
             ]
         else:
-            # Load from MentalChat16K dataset
+            # Stream MentalChat16K, filtering by topics as rows arrive and
+            # keeping only a uniform sample of count conversations
             loader = MentalChat16KLoader()
-            conversations = loader.load_dataset()
-            
-            # Filter by topics if specified
-            if topics:
-                conversations = loader.filter_by_topics(conversations, topics)
-            
-            # Sample test cases
-            import random
-            sampled = random.sample(
-                conversations,
-                min(count, len(conversations))
-            )
+            sampled = reservoir_sample(loader.iter_dataset(topics=topics), count)
             
             self.test_cases = [
                 TestCase(
@@ -0,0 +1,178 @@
+"""Tests for the memory-mapped dataset store."""
+import json
+import os
+
+import pytest
+
+from feelwell.evaluation.datasets.dataset_loader import (
+    DatasetConfig,
+    DatasetLoader,
+    DatasetSample,
+    DatasetSource,
+)
+from feelwell.evaluation.datasets.dataset_store import (
+    DatasetStore,
+    convert_json_to_store,
+    write_dataset_store,
+)
+
+
+SAMPLES = [
+    DatasetSample(
+        sample_id="s1", text="I want to end it all", category="depression",
+        triage_level="crisis", severity_score=0.9, source_dataset="test",
+        original_label="suicidal", context=["hi", "how are you"],
+        phq9_score=22, metadata={"item9_score": 3},
+    ),
+    DatasetSample(
+        sample_id="s2", text="Exams are stressing me out 😩", category="anxiety",
+        triage_level="caution", gad7_score=11, source_dataset="test",
+    ),
+    DatasetSample(
+        sample_id="s3", text="Had a good day at practice", category="general_support",
+        triage_level="safe", source_dataset="test",
+    ),
+    DatasetSample(
+        sample_id="s4", text="Nothing feels worth it", category="depression",
+        triage_level="caution", severity_score=0.5, source_dataset="test", phq9_score=12,
+    ),
+]
+
+
+class StubLoader(DatasetLoader):
+    def __init__(self, config, samples):
+        super().__init__(config)
+        self.raw = samples
+        self.processed = 0
+
+    def download(self):
+        return True
+
+    def process(self):
+        self.processed += 1
+        return list(self.raw)
+
+    def _is_downloaded(self):
+        return True
+
+
+def make_config(tmp_path, **overrides):
+    return DatasetConfig(
+        name="stub",
+        source=DatasetSource.LOCAL,
+        source_url="",
+        cache_dir=tmp_path / "cache",
+        processed_dir=tmp_path / "processed",
+        **overrides,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = write_dataset_store(tmp_path / "test_processed.fwds", SAMPLES, dataset="test")
+    with DatasetStore(path) as store:
+        yield store
+
+
+class TestDatasetStore:
+    def test_round_trip_preserves_every_field(self, store):
+        assert len(store) == len(SAMPLES)
+        assert list(store) == SAMPLES
+        assert store[-1] == SAMPLES[-1]
+        assert store[1:3] == SAMPLES[1:3]
+
+    def test_out_of_range_row(self, store):
+        with pytest.raises(IndexError):
+            store[len(SAMPLES)]
+
+    def test_indexes_match_linear_filters(self, store):
+        for level in ("safe", "caution", "crisis", "unknown"):
+            assert store.get_by_triage(level) == [s for s in SAMPLES if s.triage_level == level]
+        for category in ("depression", "anxiety", "unknown"):
+            assert store.get_by_category(category) == [s for s in SAMPLES if s.category == category]
+        assert store.rows(category="depression", triage_level="caution") == [3]
+
+    def test_stats_without_reading_rows(self, store):
+        stats = store.stats()
+
+        assert stats.total_samples == 4
+        assert stats.samples_by_triage == {"caution": 2, "crisis": 1, "safe": 1}
+        assert stats.samples_by_category == {"anxiety": 1, "depression": 2, "general_support": 1}
+        assert stats.avg_text_length == sum(len(s.text) for s in SAMPLES) / 4
+        assert stats.has_severity_scores and stats.has_clinical_scores
+
+    def test_field_access_without_materializing(self, store):
+        assert store.field(1, "text") == SAMPLES[1].text
+        assert store.field(0, "triage_level") == "crisis"
+
+    def test_empty_store(self, tmp_path):
+        path = write_dataset_store(tmp_path / "empty.fwds", [], dataset="empty")
+
+        with DatasetStore(path) as store:
+            assert len(store) == 0
+            assert list(store) == []
+            assert store.get_by_triage("crisis") == []
+            assert store.stats().avg_text_length == 0
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "bogus.fwds"
+        path.write_bytes(b"not a dataset store")
+
+        with pytest.raises(ValueError):
+            DatasetStore(path)
+
+    def test_convert_json(self, tmp_path):
+        json_path = tmp_path / "test_processed.json"
+        json_path.write_text(json.dumps({
+            "dataset": "test",
+            "version": "2.0.0",
+            "samples": [s.to_dict() for s in SAMPLES],
+        }))
+
+        store_path = convert_json_to_store(json_path)
+
+        assert store_path == tmp_path / "test_processed.fwds"
+        with DatasetStore(store_path) as store:
+            assert store.version == "2.0.0"
+            assert [s.to_dict() for s in store] == [s.to_dict() for s in SAMPLES]
+
+
+class TestLoaderWithStore:
+    def test_processed_samples_are_served_from_store(self, tmp_path):
+        loader = StubLoader(make_config(tmp_path), SAMPLES)
+
+        samples = loader.load()
+
+        assert isinstance(samples, DatasetStore)
+        assert list(samples) == SAMPLES
+        assert (tmp_path / "processed" / "stub_processed.fwds").exists()
+        assert loader.get_by_triage("caution") == [SAMPLES[1], SAMPLES[3]]
+        assert loader.get_by_category("depression") == [SAMPLES[0], SAMPLES[3]]
+        assert loader.get_stats().total_samples == 4
+
+        reloaded = StubLoader(make_config(tmp_path), SAMPLES)
+        assert list(reloaded.load()) == SAMPLES
+        assert reloaded.processed == 0
+
+    def test_processed_json_is_converted_and_refreshed(self, tmp_path):
+        config = make_config(tmp_path)
+        json_path = config.processed_dir / "stub_processed.json"
+        json_path.write_text(json.dumps({"samples": [s.to_dict() for s in SAMPLES[:2]]}))
+
+        loader = StubLoader(config, SAMPLES)
+        assert [s.sample_id for s in loader.load()] == ["s1", "s2"]
+        assert loader.processed == 0
+
+        json_path.write_text(json.dumps({"samples": [s.to_dict() for s in SAMPLES]}))
+        store_mtime = (config.processed_dir / "stub_processed.fwds").stat().st_mtime
+        os.utime(json_path, (store_mtime + 10, store_mtime + 10))
+
+        assert len(StubLoader(config, SAMPLES).load()) == 4
+
+    def test_split_and_max_samples(self, tmp_path):
+        loader = StubLoader(make_config(tmp_path, max_samples=3), SAMPLES)
+
+        train, test = loader.split_train_test()
+
+        assert len(loader.samples) == 3
+        assert len(train) + len(test) == 3
@@ -0,0 +1,208 @@
+"""Tests for streaming dataset loading."""
+import json
+import random
+import sys
+import types
+from itertools import islice
+
+import pytest
+
+from feelwell.evaluation.datasets.dataset_loader import (
+    DatasetConfig,
+    DatasetLoader,
+    DatasetSample,
+    DatasetSource,
+    DatasetStatsBuilder,
+)
+from feelwell.evaluation.datasets.mentalchat16k_loader import DatasetType, MentalChat16KLoader
+from feelwell.evaluation.datasets.streaming import (
+    iter_json_array,
+    reservoir_sample,
+    write_json_array,
+)
+from feelwell.evaluation.parallel import iter_dataset_shards
+
+
+def make_sample(i):
+    return DatasetSample(
+        sample_id=f"s{i}",
+        text=f"message {i}",
+        category="depression" if i % 2 else "anxiety",
+        triage_level=("safe", "caution", "crisis")[i % 3],
+    )
+
+
+class StreamingLoader(DatasetLoader):
+    """Parses count samples lazily, counting how many were parsed."""
+
+    def __init__(self, config, count):
+        super().__init__(config)
+        self.count = count
+        self.parsed = 0
+
+    def download(self):
+        return True
+
+    def _is_downloaded(self):
+        return True
+
+    def process(self):
+        return list(self.iter_process())
+
+    def iter_process(self):
+        for i in range(self.count):
+            self.parsed += 1
+            yield make_sample(i)
+
+
+def make_loader(tmp_path, count=30, **overrides):
+    config = DatasetConfig(
+        name="streaming",
+        source=DatasetSource.LOCAL,
+        source_url="",
+        cache_dir=tmp_path / "cache",
+        processed_dir=tmp_path / "processed",
+        **overrides,
+    )
+    return StreamingLoader(config, count)
+
+
+class TestJsonArrayStreaming:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 16])
+    def test_round_trip(self, tmp_path, chunk_size):
+        items = [{"input": "a, b ] c", "n": 12345}, -1.5e3, None, [1, [2]], "é" * 100]
+        path = tmp_path / "items.json"
+        path.write_text(json.dumps(items, indent=2))
+
+        assert list(iter_json_array(path, chunk_size)) == items
+
+        assert write_json_array(path, items) == len(items)
+        assert json.loads(path.read_text()) == items
+        assert list(iter_json_array(path, chunk_size)) == items
+
+    def test_empty_array(self, tmp_path):
+        path = tmp_path / "empty.json"
+        write_json_array(path, [])
+
+        assert list(iter_json_array(path)) == []
+
+    @pytest.mark.parametrize("text", ['{"a": 1}', "[1, 2", "[1 2]", "[1,]", ""])
+    def test_malformed(self, tmp_path, text):
+        path = tmp_path / "bad.json"
+        path.write_text(text)
+
+        with pytest.raises(ValueError):
+            list(iter_json_array(path, chunk_size=2))
+
+
+class TestReservoirSample:
+    def test_small_stream_is_kept_whole(self):
+        assert sorted(reservoir_sample(range(5), 10, random.Random(0))) == list(range(5))
+
+    def test_seeded_and_bounded(self):
+        first = reservoir_sample(iter(range(10_000)), 20, random.Random(7))
+
+        assert first == reservoir_sample(iter(range(10_000)), 20, random.Random(7))
+        assert len(set(first)) == 20
+
+    def test_roughly_uniform(self):
+        rng = random.Random(1)
+        hits = [0] * 10
+        for _ in range(2000):
+            for item in reservoir_sample(range(10), 3, rng):
+                hits[item] += 1
+
+        assert all(500 < count < 700 for count in hits)
+
+
+class TestLoaderStreaming:
+    def test_raw_stream_is_lazy_and_filtered(self, tmp_path):
+        loader = make_loader(tmp_path)
+
+        crisis = loader.iter_samples(triage_level="crisis")
+        first = next(crisis)
+
+        assert first.sample_id == "s2"
+        assert loader.parsed == 3
+        assert [s.sample_id for s in crisis] == [f"s{i}" for i in range(5, 30, 3)]
+        assert not (tmp_path / "processed" / "streaming_processed.fwds").exists()
+
+    def test_raw_stream_applies_max_samples(self, tmp_path):
+        streamed = list(make_loader(tmp_path, max_samples=5).iter_samples())
+        loaded = list(make_loader(tmp_path, max_samples=5).load())
+
+        assert len(streamed) == 5
+        assert streamed == loaded
+
+    def test_cached_stream_uses_store_indexes(self, tmp_path):
+        make_loader(tmp_path).load()
+        loader = make_loader(tmp_path)
+
+        samples = list(loader.iter_samples(triage_level="caution", category="depression"))
+
+        assert loader.parsed == 0
+        assert samples == [make_sample(i) for i in range(30) if i % 3 == 1 and i % 2]
+
+    def test_stats_over_stream(self, tmp_path):
+        loader = make_loader(tmp_path)
+        stats = DatasetStatsBuilder()
+
+        for _ in stats.track(loader.iter_samples()):
+            pass
+
+        assert stats.build().to_dict() == make_loader(tmp_path).get_stats().to_dict()
+
+
+class TestShardStreaming:
+    def test_shards_are_built_as_the_stream_is_read(self, tmp_path):
+        loader = make_loader(tmp_path, count=25)
+
+        shards = iter_dataset_shards("streaming", loader.iter_samples(), shard_size=10)
+        first = next(shards)
+
+        assert len(first.samples) == 10
+        assert loader.parsed == 10
+        assert [len(s.samples) for s in shards] == [10, 5]
+
+    def test_empty_stream_yields_one_empty_shard(self):
+        shards = list(iter_dataset_shards("empty", iter([]), shard_size=10))
+
+        assert [(s.index, s.samples) for s in shards] == [(0, ())]
+
+
+class TestMentalChatStreaming:
+    ROWS = [
+        {"instruction": "", "input": "I feel so anxious and worried", "output": "ok"},
+        {"instruction": "", "input": None, "output": "I hear your grief and loss"},
+        {"instruction": "", "input": "Things with my partner are bad", "output": "ok"},
+    ]
+
+    @pytest.fixture
+    def hub(self, monkeypatch):
+        calls = []
+
+        def load_dataset(name, split, cache_dir, streaming):
+            calls.append({"split": split, "streaming": streaming})
+            return iter(self.ROWS)
+
+        monkeypatch.setitem(sys.modules, "datasets", types.SimpleNamespace(load_dataset=load_dataset))
+        return calls
+
+    def test_iter_dataset_streams_and_filters(self, tmp_path, hub):
+        loader = MentalChat16KLoader(cache_dir=str(tmp_path))
+
+        conversations = list(loader.iter_dataset(topics=["grief", "relationships"]))
+
+        assert hub == [{"split": "train", "streaming": True}]
+        assert [c.output for c in conversations] == ["I hear your grief and loss", "ok"]
+        assert all(c.source == DatasetType.INTERVIEW for c in conversations)
+        assert list(loader.iter_dataset(source=DatasetType.SYNTHETIC)) == []
+
+    def test_load_dataset_is_built_on_the_stream(self, tmp_path, hub):
+        loader = MentalChat16KLoader(cache_dir=str(tmp_path))
+
+        conversations = loader.load_dataset()
+
+        assert hub == [{"split": "train", "streaming": False}]
+        assert len(conversations) == 3
+        assert list(islice(loader.iter_dataset(), 1))[0].input == self.ROWS[0]["input"]
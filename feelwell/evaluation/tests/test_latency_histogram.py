@@ -0,0 +1,104 @@
+"""Tests for the mergeable latency histogram."""
+import json
+import math
+import random
+
+import pytest
+
+from feelwell.evaluation.metrics.latency import LatencyHistogram, merge_histograms
+
+
+def exact_percentile(values, q):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+def lognormal_latencies(n, seed=7):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(0.5, 1.2) for _ in range(n)]
+
+
+class TestLatencyHistogram:
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        assert histogram.count == 0
+        assert histogram.percentile(0.99) == 0.0
+        assert histogram.mean_ms == 0.0
+
+    @pytest.mark.parametrize("q", [0.5, 0.95, 0.99, 0.999])
+    def test_percentiles_within_relative_error(self, q):
+        values = lognormal_latencies(20000)
+        histogram = LatencyHistogram()
+        histogram.record_many(values)
+
+        expected = exact_percentile(values, q)
+
+        assert histogram.percentile(q) == pytest.approx(expected, rel=0.01, abs=0.001)
+
+    def test_mean_min_max_are_exact(self):
+        values = lognormal_latencies(1000)
+        histogram = LatencyHistogram()
+        histogram.record_many(values)
+
+        assert histogram.mean_ms == pytest.approx(sum(values) / len(values))
+        assert histogram.min_ms == min(values)
+        assert histogram.max_ms == max(values)
+
+    def test_merge_matches_single_histogram(self):
+        values = lognormal_latencies(5000)
+        whole = LatencyHistogram()
+        whole.record_many(values)
+        parts = []
+        for start in range(0, len(values), 1000):
+            part = LatencyHistogram()
+            part.record_many(values[start:start + 1000])
+            parts.append(part)
+
+        merged = merge_histograms(reversed(parts))
+
+        assert merged.count == whole.count
+        assert merged.to_dict()["buckets"] == whole.to_dict()["buckets"]
+        for q in (0.5, 0.99):
+            assert merged.percentile(q) == whole.percentile(q)
+
+    def test_memory_bounded_by_spread_not_count(self):
+        histogram = LatencyHistogram()
+        histogram.record_many(lognormal_latencies(50000))
+
+        assert len(histogram.to_dict()["buckets"]) < 1500
+
+    def test_round_trip_through_json(self):
+        histogram = LatencyHistogram()
+        histogram.record_many(lognormal_latencies(500))
+
+        restored = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+
+        assert restored == histogram
+        assert restored.summary() == histogram.summary()
+
+    def test_merge_rejects_different_precision(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram().merge(LatencyHistogram(precision_bits=5))
+
+
+class TestTriageMetricsLatency:
+    def test_aggregate_merges_suite_histograms(self):
+        from feelwell.evaluation.triage.immediate_triage import (
+            ImmediateTriageEvaluator,
+            ImmediateTriageMetrics,
+        )
+
+        suites = {}
+        values = lognormal_latencies(3000)
+        for i, name in enumerate(("a", "b", "c")):
+            metrics = ImmediateTriageMetrics(total_cases=1000)
+            metrics.latency.record_many(values[i * 1000:(i + 1) * 1000])
+            suites[name] = type("SuiteResult", (), {"metrics": metrics})()
+
+        aggregate = ImmediateTriageEvaluator().get_aggregate_metrics(suites)
+        result = aggregate.to_dict()
+
+        assert aggregate.latency.count == 3000
+        assert result["latency_p99_ms"] == pytest.approx(exact_percentile(values, 0.99), rel=0.01)
+        assert LatencyHistogram.from_dict(result["latency_histogram"]) == aggregate.latency
@@ -293,8 +293,8 @@ class TestMentalChatEvaluationSuite:
         suite = MentalChatEvaluationSuite(gpt4_api_key="test-key")
         
         # Mock the dataset loading
-        with patch.object(MentalChat16KLoader, 'load_dataset') as mock_load:
-            mock_load.return_value = [
+        with patch.object(MentalChat16KLoader, 'iter_dataset') as mock_iter:
+            mock_iter.return_value = iter([
                 MentalHealthConversation(
                     instruction="",
                     input="Test question",
@@ -302,7 +302,7 @@ class TestMentalChatEvaluationSuite:
                     source=DatasetType.SYNTHETIC,
                     topics=["anxiety"]
                 )
-            ]
+            ])
             
             test_cases = suite.load_test_cases(count=1)
             
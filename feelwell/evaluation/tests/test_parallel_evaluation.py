@@ -0,0 +1,189 @@
+"""Tests for sharded and multi-process evaluation runs."""
+import random
+from dataclasses import dataclass
+
+import pytest
+
+from feelwell.evaluation.metrics.latency import LatencyHistogram, merge_histograms
+from feelwell.evaluation.parallel import (
+    BENCHMARK,
+    DATASET,
+    Shard,
+    ShardResult,
+    build_dataset_shards,
+    evaluate_shard,
+    merge_shard_results,
+)
+from feelwell.evaluation.runner import EvaluationConfig, EvaluationRunner
+from feelwell.shared.utils import configure_pii_salt
+
+
+@dataclass
+class Sample:
+    sample_id: str
+    text: str
+    triage_level: str
+
+
+class _Risk:
+    def __init__(self, value):
+        self.value = value
+
+
+class _ScanResult:
+    def __init__(self, value):
+        self.risk_level = _Risk(value)
+
+
+class KeywordScanner:
+    """Picklable stand-in scanner: 'die' is crisis, 'sad' caution."""
+
+    def scan(self, message_id, text, student_id):
+        if "boom" in text:
+            raise RuntimeError("scanner failure")
+        if "die" in text:
+            return _ScanResult("crisis")
+        if "sad" in text:
+            return _ScanResult("caution")
+        return _ScanResult("safe")
+
+
+def make_samples(n):
+    texts = [("I want to die", "crisis"), ("feeling sad", "caution"),
+             ("nice day", "safe"), ("sad but ok", "safe")]
+    return [Sample(f"s{i}", *texts[i % len(texts)]) for i in range(n)]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pii_salt():
+    configure_pii_salt("evaluation_test_salt_32_chars_long!")
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Dataset loaders cache relative to the working directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestShards:
+    def test_dataset_split_into_ordered_shards(self):
+        shards = build_dataset_shards("phq9", make_samples(25), shard_size=10)
+
+        assert [len(s.samples) for s in shards] == [10, 10, 5]
+        assert [s.index for s in shards] == [0, 1, 2]
+        assert shards[2].samples[0][0] == "s20"
+
+    def test_empty_dataset_still_reported(self):
+        shards = build_dataset_shards("phq9", [], shard_size=10)
+
+        assert len(shards) == 1
+        assert evaluate_shard(KeywordScanner(), shards[0]).total == 0
+
+    def test_evaluate_shard_counts_correct_and_errors(self):
+        samples = make_samples(8) + [Sample("bad", "boom", "safe")]
+        shard = build_dataset_shards("ds", samples, shard_size=100)[0]
+
+        result = evaluate_shard(KeywordScanner(), shard)
+
+        assert result.total == 9
+        assert result.correct == 6
+        assert result.errors == 1
+        assert result.latency.count == 8
+
+    def test_merge_is_independent_of_completion_order(self):
+        scanner = KeywordScanner()
+        shards = build_dataset_shards("ds", make_samples(100), shard_size=7)
+        results = [evaluate_shard(scanner, shard) for shard in shards]
+        shuffled = list(results)
+        random.Random(3).shuffle(shuffled)
+
+        in_order = merge_shard_results(results)["ds"]
+        reordered = merge_shard_results(shuffled)["ds"]
+
+        assert (reordered.total, reordered.correct) == (in_order.total, in_order.correct) == (100, 75)
+        assert reordered.latency == in_order.latency
+
+    def test_benchmark_and_dataset_keys_do_not_collide(self):
+        merged = merge_shard_results([
+            ShardResult(kind=BENCHMARK, name="crisis_detection", total=3),
+            ShardResult(kind=DATASET, name="crisis_detection", total=5),
+        ])
+
+        assert merged["benchmark_crisis_detection"].total == 3
+        assert merged["crisis_detection"].total == 5
+
+    def test_benchmark_shard_runs_suite(self):
+        from feelwell.services.safety_service.scanner import SafetyScanner
+
+        result = evaluate_shard(SafetyScanner(), Shard(kind=BENCHMARK, name="crisis_detection"))
+
+        assert result.error is None
+        assert result.total > 0
+        assert result.latency.count == result.total
+
+
+def run_evaluation(tmp_path, workers, **overrides):
+    from feelwell.services.safety_service.scanner import SafetyScanner
+
+    config = EvaluationConfig(
+        run_triage_evaluation=False,
+        run_test_suites=False,
+        save_detailed_results=False,
+        generate_report=False,
+        output_dir=tmp_path,
+        workers=workers,
+        shard_size=8,
+        **overrides,
+    )
+    return EvaluationRunner(config=config, scanner=SafetyScanner()).run()
+
+
+class TestParallelRunner:
+    def test_workers_match_sequential_metrics(self, workdir):
+        sequential = run_evaluation(workdir, workers=1)
+        parallel = run_evaluation(workdir, workers=2)
+
+        def counts(result):
+            return {
+                name: (m.get("total"), m.get("correct"), m.get("crisis_fn"), m["latency"]["count"])
+                for name, m in result.metrics_by_dataset.items()
+            }
+
+        assert counts(parallel) == counts(sequential)
+        assert parallel.total_samples_evaluated == sequential.total_samples_evaluated > 0
+        assert parallel.crisis_recall == sequential.crisis_recall
+        assert parallel.safety_issues == sequential.safety_issues
+        assert parallel.p99_latency_ms > 0
+
+    def test_results_carry_mergeable_histogram(self, workdir):
+        result = run_evaluation(workdir, workers=2).to_dict()
+
+        merged = LatencyHistogram.from_dict(result["latency_histogram"])
+        per_dataset = [
+            LatencyHistogram.from_dict(m["latency_histogram"])
+            for m in result["metrics_by_dataset"].values()
+        ]
+
+        assert merged == merge_histograms(per_dataset)
+        assert result["latency"]["p99_ms"] == round(merged.percentile(0.99), 3)
+
+    def test_custom_scanner_factory_used_in_workers(self, workdir):
+        config = EvaluationConfig(
+            run_internal_benchmarks=False,
+            run_triage_evaluation=False,
+            run_test_suites=False,
+            save_detailed_results=False,
+            generate_report=False,
+            output_dir=workdir,
+            datasets_to_include=["phq9_depression"],
+            workers=2,
+            shard_size=4,
+        )
+
+        result = EvaluationRunner(config=config, scanner_factory=KeywordScanner).run()
+        metrics = result.metrics_by_dataset["phq9_depression"]
+
+        assert metrics["total"] > 0
+        assert metrics["scan_errors"] == 0
+        assert metrics["latency"]["count"] == metrics["total"]
@@ -0,0 +1,185 @@
+"""Tests for the incremental evaluation result cache."""
+from dataclasses import dataclass, replace
+
+import pytest
+
+from feelwell.evaluation.parallel import build_dataset_shards, evaluate_shard
+from feelwell.evaluation.result_cache import (
+    CachingScanner,
+    EvalResultCache,
+    metric_changes,
+    scanner_fingerprint,
+)
+from feelwell.evaluation.runner import EvaluationConfig, EvaluationRunner
+from feelwell.services.safety_service.config import SafetyConfig
+from feelwell.services.safety_service.scanner import SafetyScanner
+from feelwell.shared.utils import configure_pii_salt
+
+
+@dataclass
+class Sample:
+    sample_id: str
+    text: str
+    triage_level: str
+
+
+class CountingScanner(SafetyScanner):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scans = 0
+
+    def scan(self, message_id, text, student_id):
+        self.scans += 1
+        return super().scan(message_id=message_id, text=text, student_id=student_id)
+
+
+SAMPLES = [
+    Sample("s1", "I want to kill myself", "crisis"),
+    Sample("s2", "I have a math test tomorrow", "safe"),
+    Sample("s3", "I feel so hopeless lately", "caution"),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pii_salt():
+    configure_pii_salt("evaluation_test_salt_32_chars_long!")
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def scan_with_cache(path, scanner, samples):
+    with EvalResultCache.for_scanner(path, scanner) as cache:
+        caching = CachingScanner(scanner, cache.load())
+        result = evaluate_shard(caching, build_dataset_shards("ds", samples)[0])
+        cache.store(result.new_outcomes)
+    return result
+
+
+class TestEvalResultCache:
+    def test_unchanged_samples_are_not_rescanned(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        scan_with_cache(path, CountingScanner(), SAMPLES)
+        scanner = CountingScanner()
+
+        result = scan_with_cache(path, scanner, SAMPLES)
+
+        assert scanner.scans == 0
+        assert result.cache_hits == 3
+        assert result.latency.count == 0
+
+    def test_only_changed_sample_is_scanned(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        first = scan_with_cache(path, CountingScanner(), SAMPLES)
+        edited = SAMPLES[:2] + [Sample("s3", "I feel fine today", "safe")]
+        scanner = CountingScanner()
+
+        second = scan_with_cache(path, scanner, edited)
+
+        assert scanner.scans == 1
+        assert second.cache_hits == 2
+        assert second.correct == first.correct
+
+    def test_label_change_needs_no_rescan(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        first = scan_with_cache(path, CountingScanner(), SAMPLES)
+        relabeled = [replace(SAMPLES[0], triage_level="safe")] + SAMPLES[1:]
+        scanner = CountingScanner()
+
+        second = scan_with_cache(path, scanner, relabeled)
+
+        assert scanner.scans == 0
+        assert second.correct == first.correct - 1
+
+    def test_pattern_version_bump_invalidates(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        scan_with_cache(path, CountingScanner(), SAMPLES)
+        scanner = CountingScanner(config=SafetyConfig(pattern_version="2099.01.01"))
+
+        scan_with_cache(path, scanner, SAMPLES)
+
+        assert scanner.scans == 3
+
+    def test_fingerprint_tracks_config(self):
+        base = scanner_fingerprint(SafetyScanner())
+
+        assert scanner_fingerprint(SafetyScanner()) == base
+        assert scanner_fingerprint(SafetyScanner(enable_semantic=False))[1] != base[1]
+
+    def test_prune_drops_other_versions(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        scan_with_cache(path, SafetyScanner(config=SafetyConfig(pattern_version="old")), SAMPLES)
+
+        with EvalResultCache.for_scanner(path, SafetyScanner()) as cache:
+            assert cache.prune() == 3
+
+
+class TestMetricChanges:
+    def test_reports_only_moved_metrics(self):
+        previous = {"ds": {"total": 10, "accuracy": 0.8, "crisis_recall": 1.0}}
+        current = {
+            "ds": {"total": 10, "accuracy": 0.9, "crisis_recall": 1.0, "stats": {}},
+            "new_ds": {"total": 5, "correct": 5},
+            "broken": {"error": "missing"},
+        }
+
+        changes = metric_changes(previous, current)
+
+        assert changes == {
+            "ds": {"accuracy": {"before": 0.8, "after": 0.9}},
+            "new_ds": {
+                "total": {"before": None, "after": 5},
+                "correct": {"before": None, "after": 5},
+            },
+        }
+
+
+def run_incremental(workdir, scanner, workers=1):
+    config = EvaluationConfig(
+        run_triage_evaluation=False,
+        run_test_suites=False,
+        save_detailed_results=False,
+        generate_report=False,
+        output_dir=workdir,
+        workers=workers,
+        result_cache_path=workdir / "scan_cache.sqlite3",
+    )
+    return EvaluationRunner(config=config, scanner=scanner).run()
+
+
+class TestIncrementalRunner:
+    def test_second_run_reuses_every_outcome(self, workdir):
+        first = run_incremental(workdir, CountingScanner())
+        scanner = CountingScanner()
+
+        second = run_incremental(workdir, scanner)
+
+        # Repeated texts within a run are scanned once
+        assert 0 < first.samples_scanned <= first.total_samples_evaluated
+        assert scanner.scans == 0
+        assert second.cache_hits == second.total_samples_evaluated
+        assert second.samples_scanned == 0
+        assert second.overall_accuracy == first.overall_accuracy
+        assert second.crisis_recall == first.crisis_recall
+        assert second.metric_changes == {}
+        assert "overall" in first.metric_changes
+
+    def test_parallel_workers_use_cache(self, workdir):
+        first = run_incremental(workdir, SafetyScanner(), workers=2)
+        second = run_incremental(workdir, SafetyScanner(), workers=2)
+
+        assert second.cache_hits == second.total_samples_evaluated
+        assert second.overall_accuracy == first.overall_accuracy
+
+    def test_scanner_change_reports_moved_metrics(self, workdir):
+        first = run_incremental(workdir, SafetyScanner())
+
+        changed = run_incremental(workdir, SafetyScanner(enable_semantic=False))
+
+        # Only repeats within the run itself are reused
+        assert changed.cache_hits == first.cache_hits
+        assert changed.metric_changes
+        assert changed.to_dict()["incremental"]["metric_changes"] == changed.metric_changes
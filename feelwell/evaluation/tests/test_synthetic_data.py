@@ -0,0 +1,233 @@
+"""Tests for seeded, vectorized synthetic data generation."""
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from feelwell.evaluation.datasets.phq9_dataset import (
+    PHQ9_SEVERITY,
+    PHQ9Config,
+    PHQ9DatasetLoader,
+)
+from feelwell.evaluation.datasets.phq9_longitudinal import (
+    PHQ9LongitudinalConfig,
+    PHQ9LongitudinalLoader,
+)
+from feelwell.evaluation.datasets.synthetic import (
+    TRAJECTORY_PATTERNS,
+    band_targets,
+    iter_phq9_batches,
+    iter_trajectory_batches,
+    phq9_item_scores,
+    phq9_text,
+    phq9_trajectories,
+)
+from feelwell.evaluation.triage.longitudinal_triage import (
+    LongitudinalPattern,
+    LongitudinalTriageEvaluator,
+)
+from feelwell.shared.utils import configure_pii_salt
+
+
+def rng(seed=7):
+    return np.random.default_rng(seed)
+
+
+class TestPHQ9ItemScores:
+    def test_same_seed_same_scores(self):
+        targets = rng(0).integers(0, 28, 1000)
+
+        first = phq9_item_scores(rng(), targets)
+
+        assert np.array_equal(first, phq9_item_scores(rng(), targets))
+        assert not np.array_equal(first, phq9_item_scores(rng(8), targets))
+
+    def test_items_1_to_8_sum_to_target(self):
+        targets = np.arange(28).repeat(50)
+
+        scores = phq9_item_scores(rng(), targets)
+
+        assert scores.shape == (len(targets), 9)
+        assert scores.min() >= 0 and scores.max() <= 3
+        assert np.array_equal(scores[:, :8].sum(axis=1), np.minimum(targets, 24))
+
+    def test_item9_only_for_high_totals(self):
+        targets = np.arange(28).repeat(200)
+
+        item9 = phq9_item_scores(rng(), targets)[:, 8]
+
+        assert not item9[targets < 15].any()
+        assert set(item9[(targets >= 15) & (targets < 20)]) == {0, 1}
+        assert set(item9[targets >= 20]) == {0, 1, 2, 3}
+
+    def test_band_targets(self):
+        targets, labels = band_targets(rng(), PHQ9_SEVERITY, 20)
+
+        assert len(targets) == len(labels) == 100
+        for target, label in zip(targets, labels):
+            low, high = PHQ9_SEVERITY[label]
+            assert low <= target <= high
+
+    def test_batches_are_reproducible(self):
+        first = [b.item_scores for b in iter_phq9_batches(rng(), 2500, batch_size=1000)]
+        second = [b.item_scores for b in iter_phq9_batches(rng(), 2500, batch_size=1000)]
+
+        assert [len(b) for b in first] == [1000, 1000, 500]
+        assert all(np.array_equal(a, b) for a, b in zip(first, second))
+
+    def test_text_is_rendered_on_demand(self):
+        batch = next(iter_phq9_batches(rng(), 10))
+
+        for row in range(len(batch)):
+            scores = batch.scores(row)
+            assert sum(scores.values()) == batch.totals[row]
+            assert batch.text(row) == phq9_text(list(scores.values()), batch.totals[row])
+
+
+class TestPHQ9Text:
+    def test_first_three_statements_with_prefix(self):
+        text = phq9_text([0, 3, 2, 1, 1, 0, 0, 0, 0], 21)
+
+        assert text == (
+            "I've been really struggling lately. "
+            "I experience feeling down, depressed, or hopeless nearly every day. "
+            "I often have trouble falling or staying asleep, or sleeping too much. "
+            "Sometimes I have feeling tired or having little energy."
+        )
+
+    def test_without_positive_items(self):
+        assert phq9_text([0] * 9, 0) == "I've been feeling okay lately. No major concerns."
+        assert phq9_text([0] * 9, 6).startswith("I've noticed I'm not feeling quite like myself")
+
+
+class TestTrajectories:
+    def test_same_seed_same_trajectories(self):
+        codes = np.arange(700) % len(TRAJECTORY_PATTERNS)
+
+        first, second = phq9_trajectories(rng(), codes), phq9_trajectories(rng(), codes)
+
+        assert np.array_equal(first.daily_scores, second.daily_scores)
+        assert np.array_equal(first.ages, second.ages)
+        assert np.array_equal(first.sexes, second.sexes)
+
+    def test_pattern_shapes(self):
+        batch = phq9_trajectories(rng(), np.arange(7000) % len(TRAJECTORY_PATTERNS))
+        by_pattern = {
+            pattern: batch.daily_scores[batch.pattern_codes == code]
+            for code, pattern in enumerate(TRAJECTORY_PATTERNS)
+        }
+
+        assert batch.daily_scores.shape == (7000, 14)
+        assert batch.daily_scores.min() >= 0 and batch.daily_scores.max() <= 1
+        assert 18 <= batch.ages.min() and batch.ages.max() <= 65
+        assert set(batch.sexes) == {"M", "F"}
+        assert np.all(np.abs(by_pattern[LongitudinalPattern.STABLE_HEALTHY] - 0.1) <= 0.05)
+        acute = by_pattern[LongitudinalPattern.ACUTE_CRISIS]
+        assert acute[:, 10:].min() >= 0.8 and acute[:, :9].max() <= 0.3
+        decline = by_pattern[LongitudinalPattern.GRADUAL_DECLINE]
+        assert np.all(decline[:, -1] > decline[:, 0])
+        recovery = by_pattern[LongitudinalPattern.RECOVERY]
+        assert np.all(recovery[:, -1] < recovery[:, 0])
+
+    def test_batches_cycle_patterns(self):
+        batches = list(iter_trajectory_batches(rng(), 30, batch_size=8))
+
+        codes = np.concatenate([b.pattern_codes for b in batches])
+
+        assert [len(b) for b in batches] == [8, 8, 8, 6]
+        assert np.array_equal(codes, np.arange(30) % len(TRAJECTORY_PATTERNS))
+
+
+class TestLoaders:
+    def test_phq9_synthetic_file_is_reproducible(self, tmp_path):
+        outputs = []
+        for run in ("a", "b"):
+            loader = PHQ9DatasetLoader(PHQ9Config(cache_dir=tmp_path / run))
+            loader._create_synthetic_data()
+            outputs.append((tmp_path / run / "phq9_depression" / "phq9_synthetic.json").read_text())
+
+        items = json.loads(outputs[0])
+        assert outputs[0] == outputs[1]
+        assert len(items) == 250
+        assert items[0]["id"] == "phq9_minimal_0"
+        assert all(
+            sum(item["item_scores"].values()) == item["total_score"] for item in items
+        )
+
+    def test_phq9_synthetic_samples_keep_item9(self, tmp_path):
+        loader = PHQ9DatasetLoader(PHQ9Config(cache_dir=tmp_path))
+        loader._create_synthetic_data()
+
+        samples = list(loader.iter_process())
+
+        assert any(s.metadata["item9_score"] > 0 for s in samples)
+        assert all(s.triage_level == "crisis" for s in samples if s.metadata["item9_score"] > 0)
+        assert all(isinstance(item, int) for item in samples[0].metadata["item_scores"])
+
+    def test_longitudinal_samples_are_reproducible(self):
+        config = PHQ9LongitudinalConfig(max_samples=50, random_seed=3)
+
+        first = PHQ9LongitudinalLoader(config)._generate_synthetic_samples()
+        second = PHQ9LongitudinalLoader(config)._generate_synthetic_samples()
+
+        assert first == second
+        assert [s.participant_id for s in first[:2]] == ["phq9_synth_0", "phq9_synth_1"]
+        assert [s.inferred_pattern for s in first[:7]] == list(LongitudinalPattern)
+        assert first[0].days == list(range(1, 15))
+
+    def test_longitudinal_samples_are_lazy(self):
+        loader = PHQ9LongitudinalLoader(PHQ9LongitudinalConfig(random_seed=3))
+
+        samples = loader.iter_synthetic_samples(10_000_000, batch_size=100)
+
+        assert next(samples).participant_id == "phq9_synth_0"
+
+
+class TestSyntheticHistories:
+    @pytest.fixture(autouse=True)
+    def pii_salt(self):
+        configure_pii_salt("test-salt-for-synthetic-history-generation")
+
+    END = datetime(2026, 1, 31)
+
+    def test_same_seed_same_histories(self):
+        first = LongitudinalTriageEvaluator(random_seed=5).generate_synthetic_histories(
+            LongitudinalPattern.CYCLICAL, 100, risk_noise=0.05, end_time=self.END,
+        )
+        second = LongitudinalTriageEvaluator(random_seed=5).generate_synthetic_histories(
+            LongitudinalPattern.CYCLICAL, 100, risk_noise=0.05, end_time=self.END,
+        )
+
+        assert np.array_equal(first.risk, second.risk)
+        assert np.array_equal(first.student_ids, second.student_ids)
+        assert first.history(3) == second.history(3)
+        assert len(set(first.student_ids)) == 100
+
+    def test_schedule_and_risk(self):
+        evaluator = LongitudinalTriageEvaluator(random_seed=5)
+
+        batch = evaluator.generate_synthetic_histories(
+            LongitudinalPattern.ACUTE_CRISIS, 4, duration_days=28, end_time=self.END,
+        )
+        history = batch.history(0)
+
+        assert batch.risk.shape == (4, 10)
+        assert history.first_session == datetime(2026, 1, 3)
+        assert [s["timestamp"].day for s in history.sessions[:3]] == [3, 5, 8]
+        assert history.risk_trajectory[-2:] == [0.9, 0.9]
+        assert history.crisis_count == 2 == batch.crisis_counts[3]
+        assert history.total_messages == sum(5 + i for i in range(10))
+        assert history.known_pattern == LongitudinalPattern.ACUTE_CRISIS
+
+    def test_single_history_matches_batch(self):
+        history = LongitudinalTriageEvaluator(random_seed=5).generate_synthetic_history(
+            LongitudinalPattern.RECOVERY,
+        )
+
+        assert history.session_count == 10
+        assert history.risk_trajectory[0] == pytest.approx(0.7)
+        assert history.risk_trajectory[-1] == pytest.approx(0.2)
+        assert history.student_id_hash == LongitudinalTriageEvaluator(
+            random_seed=5
+        ).generate_synthetic_history(LongitudinalPattern.RECOVERY).student_id_hash
@@ -0,0 +1,137 @@
+"""Tests for the matrix-backed vector store."""
+import numpy as np
+import pytest
+
+from feelwell.evaluation.rag import vector_store as vs
+from feelwell.evaluation.rag.vector_store import VectorStore
+
+DIM = 16
+
+
+def cosine(a, b):
+    a, b = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    norms = np.linalg.norm(a) * np.linalg.norm(b)
+    return 0.0 if norms == 0 else float(a @ b / norms)
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).normal(size=(300, DIM)).astype(np.float32)
+
+
+@pytest.fixture
+def store(vectors):
+    store = VectorStore(embedding_dim=DIM)
+    store.add_documents(
+        [f"session {i}" for i in range(len(vectors))],
+        [{"student_id_hash": f"student_{i % 7}", "session_id": f"s{i}"} for i in range(len(vectors))],
+        vectors,
+    )
+    return store
+
+
+def brute_force(vectors, query, rows, top_k):
+    scored = sorted(((cosine(vectors[r], query), r) for r in rows), key=lambda x: -x[0])
+    return [r for _, r in scored[:top_k]]
+
+
+class TestSearch:
+    def test_matches_brute_force_cosine(self, store, vectors):
+        query = np.random.default_rng(1).normal(size=DIM)
+
+        results = store.search_embeddings(query[np.newaxis, :], top_k=10)[0]
+
+        expected = brute_force(vectors, query, range(len(vectors)), 10)
+        assert [int(r.document.session_id[1:]) for r in results] == expected
+        assert [r.rank for r in results] == list(range(1, 11))
+        for r in results:
+            row = int(r.document.session_id[1:])
+            assert r.similarity_score == pytest.approx(cosine(vectors[row], query), abs=1e-5)
+
+    def test_student_filter_uses_only_their_rows(self, store, vectors):
+        query = np.random.default_rng(2).normal(size=DIM)
+
+        results = store.search_embeddings(query[np.newaxis, :], student_id_hash="student_3", top_k=5)[0]
+
+        assert {r.document.student_id_hash for r in results} == {"student_3"}
+        expected = brute_force(vectors, query, range(3, len(vectors), 7), 5)
+        assert [int(r.document.session_id[1:]) for r in results] == expected
+
+    def test_batch_matches_single_queries(self, store, monkeypatch):
+        queries = np.random.default_rng(3).normal(size=(20, DIM))
+        monkeypatch.setattr(vs, "MAX_SCORE_ELEMENTS", 1000)  # several query chunks
+
+        batched = store.search_embeddings(queries, top_k=4)
+
+        singles = [store.search_embeddings(q[np.newaxis, :], top_k=4)[0] for q in queries]
+        assert [[r.document.doc_id for r in rs] for rs in batched] == [
+            [r.document.doc_id for r in rs] for rs in singles
+        ]
+
+    def test_min_similarity_and_top_k_bounds(self, store):
+        query = np.random.default_rng(4).normal(size=(1, DIM))
+
+        results = store.search_embeddings(query, top_k=1000, min_similarity=0.3)[0]
+
+        assert 0 < len(results) < 300
+        assert all(r.similarity_score >= 0.3 for r in results)
+        scores = [r.similarity_score for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_unknown_student_and_empty_store(self, store):
+        assert store.search("hello", student_id_hash="nobody") == []
+        assert VectorStore(embedding_dim=DIM).search("hello") == []
+        assert store.search_batch([]) == []
+
+    def test_text_search_finds_identical_content(self, store):
+        doc = store.add_document("I can't sleep before exams", {"student_id_hash": "student_x"})
+
+        results = store.search_batch(["I can't sleep before exams", "unrelated"], top_k=1)
+
+        assert results[0][0].document is doc
+        assert results[0][0].similarity_score == pytest.approx(1.0)
+
+
+class TestStorage:
+    def test_matrix_grows_past_initial_capacity(self, monkeypatch):
+        monkeypatch.setattr(vs, "INITIAL_CAPACITY", 4)
+        store = VectorStore(embedding_dim=DIM)
+        vectors = np.random.default_rng(5).normal(size=(10, DIM))
+
+        docs = [store.add_document(f"d{i}", {"student_id_hash": "s"}, v) for i, v in enumerate(vectors)]
+
+        assert store.document_count == 10
+        for doc, vector in zip(docs, vectors):
+            assert np.allclose(store.get_embedding(doc.doc_id), vector / np.linalg.norm(vector), atol=1e-6)
+        assert [d.doc_id for d in store.get_student_history("s", limit=3)] == [d.doc_id for d in docs[:3]]
+
+    def test_zero_vector_scores_zero(self):
+        store = VectorStore(embedding_dim=DIM)
+        store.add_document("empty", {}, [0.0] * DIM)
+
+        result = store.search_embeddings(np.ones((1, DIM)))[0]
+
+        assert result[0].similarity_score == 0.0
+
+    def test_rejects_wrong_dimension(self, store):
+        with pytest.raises(ValueError):
+            store.add_document("short", {}, [1.0, 2.0])
+        with pytest.raises(ValueError):
+            store.search_embeddings(np.ones((1, DIM + 1)))
+        with pytest.raises(ValueError):
+            store.add_documents(["a", "b"], [{}])
+
+    def test_student_rows_refresh_after_add(self, store):
+        store.search("query", student_id_hash="student_0")
+        doc = store.add_document("new", {"student_id_hash": "student_0"})
+
+        results = store.search("new", student_id_hash="student_0", top_k=1)
+
+        assert results[0].document is doc
+
+    def test_clear(self, store):
+        store.clear()
+
+        assert store.document_count == 0
+        assert store.student_count == 0
+        assert store.search("session 1") == []
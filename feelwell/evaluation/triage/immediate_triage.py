@@ -14,10 +14,10 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-import statistics
 
 from feelwell.shared.models import RiskLevel
 from feelwell.evaluation.benchmarks import BenchmarkCase, BenchmarkLoader, BenchmarkResult
+from feelwell.evaluation.metrics.latency import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
@@ -42,8 +42,8 @@ class ImmediateTriageMetrics:
     caution_cases: int = 0
     caution_correct: int = 0
     
-    # Latency metrics
-    latencies_ms: List[float] = field(default_factory=list)
+    # Latency metrics (mergeable across suites and workers)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
     
     @property
     def crisis_recall(self) -> float:
@@ -84,18 +84,22 @@ class ImmediateTriageMetrics:
     @property
     def latency_p50(self) -> float:
         """Median latency in ms."""
-        if not self.latencies_ms:
-            return 0.0
-        return statistics.median(self.latencies_ms)
+        return self.latency.percentile(0.50)
+    
+    @property
+    def latency_p95(self) -> float:
+        """95th percentile latency in ms."""
+        return self.latency.percentile(0.95)
     
     @property
     def latency_p99(self) -> float:
         """99th percentile latency in ms."""
-        if not self.latencies_ms:
-            return 0.0
-        sorted_latencies = sorted(self.latencies_ms)
-        idx = int(len(sorted_latencies) * 0.99)
-        return sorted_latencies[min(idx, len(sorted_latencies) - 1)]
+        return self.latency.percentile(0.99)
+    
+    @property
+    def latency_p999(self) -> float:
+        """99.9th percentile latency in ms."""
+        return self.latency.percentile(0.999)
     
     @property
     def passes_safety_threshold(self) -> bool:
@@ -116,7 +120,10 @@ class ImmediateTriageMetrics:
             "false_positive_rate": round(self.false_positive_rate, 4),
             "overall_accuracy": round(self.overall_accuracy, 4),
             "latency_p50_ms": round(self.latency_p50, 2),
+            "latency_p95_ms": round(self.latency_p95, 2),
             "latency_p99_ms": round(self.latency_p99, 2),
+            "latency_p999_ms": round(self.latency_p999, 2),
+            "latency_histogram": self.latency.to_dict(),
             "passes_safety_threshold": self.passes_safety_threshold,
             "crisis_cases": self.crisis_cases,
             "crisis_detected": self.crisis_detected,
@@ -217,6 +224,7 @@ class ImmediateTriageEvaluator:
                 risk_score=scan_result.risk_score,
                 matched_keywords=scan_result.matched_keywords,
                 latency_ms=latency_ms,
+                cached=getattr(scan_result, "cached", False),
             )
             
         except Exception as e:
@@ -269,7 +277,8 @@ class ImmediateTriageEvaluator:
             result = self.evaluate_case(case)
             results.append(result)
             metrics.total_cases += 1
-            metrics.latencies_ms.append(result.latency_ms)
+            if not result.cached:
+                metrics.latency.record(result.latency_ms)
             
             # Track by expected risk level
             if case.expected_risk_level.value == "crisis":
@@ -374,6 +383,6 @@ class ImmediateTriageEvaluator:
             aggregate.false_alarms += m.false_alarms
             aggregate.caution_cases += m.caution_cases
             aggregate.caution_correct += m.caution_correct
-            aggregate.latencies_ms.extend(m.latencies_ms)
+            aggregate.latency.merge(m.latency)
         
         return aggregate
@@ -17,10 +17,17 @@ from enum import Enum
 import uuid
 import statistics
 
+import numpy as np
+
 from feelwell.shared.utils import hash_pii
 
 logger = logging.getLogger(__name__)
 
+# Sessions at or above this risk count as crisis events
+CRISIS_RISK_THRESHOLD = 0.8
+
+MICROSECONDS_PER_DAY = 86_400_000_000
+
 
 class LongitudinalPattern(Enum):
     """Known longitudinal risk patterns."""
@@ -55,6 +62,63 @@ class StudentHistory:
         return len(self.sessions)
 
 
+@dataclass(frozen=True)
+class SyntheticHistoryBatch:
+    """Synthetic histories for many students sharing one pattern and schedule.
+
+    Risk scores and session timestamps are held as arrays; a
+    StudentHistory is only built when a student is read.
+    """
+    pattern: LongitudinalPattern
+    student_ids: np.ndarray  # (n,) uint64, rendered as hex in the hashed id
+    timestamps: np.ndarray  # (sessions,) datetime64[us], shared by every student
+    risk: np.ndarray  # (n, sessions), in [0, 1]
+    message_counts: np.ndarray  # (sessions,), shared by every student
+    first_session: datetime
+
+    def __len__(self) -> int:
+        return len(self.student_ids)
+
+    def __iter__(self):
+        return (self.history(row) for row in range(len(self)))
+
+    @property
+    def crisis_counts(self) -> np.ndarray:
+        return (self.risk >= CRISIS_RISK_THRESHOLD).sum(axis=1)
+
+    def history(self, row: int) -> StudentHistory:
+        """Build one student's StudentHistory."""
+        risk_trajectory = self.risk[row].tolist()
+        timestamps = self.timestamps.tolist()
+        message_counts = self.message_counts.tolist()
+        
+        sessions = [
+            {
+                "session_id": f"sess_{i}",
+                "timestamp": timestamp,
+                "risk_score": risk_score,
+                "message_count": msg_count,
+                "phq9_score": int(risk_score * 20),
+                "counselor_flag": risk_score > 0.6,
+            }
+            for i, (timestamp, risk_score, msg_count) in enumerate(
+                zip(timestamps, risk_trajectory, message_counts)
+            )
+        ]
+        
+        return StudentHistory(
+            student_id_hash=hash_pii(f"synthetic_{int(self.student_ids[row]):016x}"),
+            sessions=sessions,
+            first_session=self.first_session,
+            last_session=timestamps[-1] if timestamps else self.first_session,
+            total_messages=sum(message_counts),
+            crisis_count=int(self.crisis_counts[row]),
+            avg_risk_score=statistics.mean(risk_trajectory) if risk_trajectory else 0.0,
+            risk_trajectory=risk_trajectory,
+            known_pattern=self.pattern,
+        )
+
+
 @dataclass
 class PatternPrediction:
     """Prediction of longitudinal pattern."""
@@ -155,15 +219,18 @@ class LongitudinalTriageEvaluator:
         self,
         vector_store=None,
         pattern_analyzer=None,
+        random_seed: Optional[int] = None,
     ):
         """Initialize evaluator.
         
         Args:
             vector_store: Vector store for RAG retrieval
             pattern_analyzer: Pattern analysis component
+            random_seed: Seed for synthetic histories; None for a fresh draw
         """
         self.vector_store = vector_store
         self.pattern_analyzer = pattern_analyzer
+        self.rng = np.random.default_rng(random_seed)
         
         logger.info("LONGITUDINAL_TRIAGE_EVALUATOR_INITIALIZED")
     
@@ -183,66 +250,74 @@ class LongitudinalTriageEvaluator:
         Returns:
             StudentHistory with simulated data
         """
-        student_id_hash = hash_pii(f"synthetic_{uuid.uuid4().hex[:8]}")
+        batch = self.generate_synthetic_histories(
+            pattern,
+            count=1,
+            duration_days=duration_days,
+            sessions_per_week=sessions_per_week,
+        )
+        return batch.history(0)
+    
+    def generate_synthetic_histories(
+        self,
+        pattern: LongitudinalPattern,
+        count: int,
+        duration_days: int = 30,
+        sessions_per_week: float = 2.5,
+        risk_noise: float = 0.0,
+        end_time: Optional[datetime] = None,
+    ) -> SyntheticHistoryBatch:
+        """Generate synthetic histories for many students at once.
+        
+        Every student follows the pattern's risk curve over the same
+        evenly spaced sessions. With risk_noise, each session's risk is
+        perturbed by Gaussian noise so students differ.
         
+        Args:
+            pattern: The pattern to simulate
+            count: Number of students
+            duration_days: Duration of each history
+            sessions_per_week: Average sessions per week
+            risk_noise: Standard deviation of per-session risk noise
+            end_time: When the histories end (default: now)
+            
+        Returns:
+            SyntheticHistoryBatch with arrays for all students
+        """
         num_sessions = int((duration_days / 7) * sessions_per_week)
-        sessions = []
-        risk_trajectory = []
         
-        base_time = datetime.utcnow() - timedelta(days=duration_days)
-        crisis_count = 0
-        total_messages = 0
+        base_time = (end_time or datetime.utcnow()) - timedelta(days=duration_days)
+        offsets = np.arange(num_sessions) * (duration_days * MICROSECONDS_PER_DAY / max(num_sessions, 1))
+        timestamps = np.datetime64(base_time, "us") + offsets.astype("timedelta64[us]")
         
-        for i in range(num_sessions):
-            session_time = base_time + timedelta(days=(i * duration_days / num_sessions))
-            
-            # Generate risk score based on pattern
-            risk_score = self._generate_risk_for_pattern(pattern, i, num_sessions)
-            risk_trajectory.append(risk_score)
-            
-            if risk_score >= 0.8:
-                crisis_count += 1
-            
-            msg_count = 5 + (i % 10)  # Varying message counts
-            total_messages += msg_count
-            
-            sessions.append({
-                "session_id": f"sess_{i}",
-                "timestamp": session_time,
-                "risk_score": risk_score,
-                "message_count": msg_count,
-                "phq9_score": int(risk_score * 20),
-                "counselor_flag": risk_score > 0.6,
-            })
+        risk = np.broadcast_to(self._risk_curve(pattern, num_sessions), (count, num_sessions))
+        if risk_noise > 0:
+            risk = np.clip(risk + self.rng.normal(0.0, risk_noise, risk.shape), 0.0, 1.0)
         
-        return StudentHistory(
-            student_id_hash=student_id_hash,
-            sessions=sessions,
+        return SyntheticHistoryBatch(
+            pattern=pattern,
+            student_ids=self.rng.integers(0, 2**64, count, dtype=np.uint64),
+            timestamps=timestamps,
+            risk=risk,
+            message_counts=5 + np.arange(num_sessions) % 10,  # Varying message counts
             first_session=base_time,
-            last_session=sessions[-1]["timestamp"] if sessions else base_time,
-            total_messages=total_messages,
-            crisis_count=crisis_count,
-            avg_risk_score=statistics.mean(risk_trajectory) if risk_trajectory else 0.0,
-            risk_trajectory=risk_trajectory,
-            known_pattern=pattern,
         )
     
-    def _generate_risk_for_pattern(
+    def _risk_curve(
         self,
         pattern: LongitudinalPattern,
-        session_idx: int,
         total_sessions: int,
-    ) -> float:
-        """Generate risk score based on pattern type.
+    ) -> np.ndarray:
+        """Generate risk scores for every session based on pattern type.
         
         Args:
             pattern: Pattern to simulate
-            session_idx: Current session index
             total_sessions: Total number of sessions
             
         Returns:
-            Risk score between 0 and 1
+            Risk score between 0 and 1 per session
         """
+        session_idx = np.arange(total_sessions)
         progress = session_idx / max(total_sessions - 1, 1)
         
         if pattern == LongitudinalPattern.STABLE_HEALTHY:
@@ -255,22 +330,20 @@ class LongitudinalTriageEvaluator:
             return 0.2 + (0.6 * progress)  # Linear increase
         
         elif pattern == LongitudinalPattern.ACUTE_CRISIS:
-            if progress > 0.8:
-                return 0.9  # Sudden spike at end
-            return 0.2 + (0.1 * (session_idx % 4) / 4)
+            # Sudden spike at end
+            return np.where(progress > 0.8, 0.9, 0.2 + (0.1 * (session_idx % 4) / 4))
         
         elif pattern == LongitudinalPattern.CYCLICAL:
-            import math
-            return 0.3 + 0.3 * math.sin(progress * 4 * math.pi)  # Oscillating
+            return 0.3 + 0.3 * np.sin(progress * 4 * np.pi)  # Oscillating
         
         elif pattern == LongitudinalPattern.RECOVERY:
             return 0.7 - (0.5 * progress)  # Decreasing
         
         elif pattern == LongitudinalPattern.SEASONAL:
             # Higher in winter months (simulated)
-            return 0.3 + (0.3 if session_idx % 4 < 2 else 0.0)
+            return 0.3 + np.where(session_idx % 4 < 2, 0.3, 0.0)
         
-        return 0.3  # Default
+        return np.full(total_sessions, 0.3)  # Default
     
     def analyze_history(self, history: StudentHistory) -> PatternPrediction:
         """Analyze student history to predict pattern.
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Benchmark analytics query latency: in-memory vs PostgreSQL backend.
+
+Loads N session summaries into both AnalyticsHandler backends and
+reports median latency of the dashboard queries. The PostgreSQL backend
+drops and recreates the analytics tables, so point it at a scratch
+database.
+
+Usage:
+    python scripts/benchmark_analytics_backends.py --summaries 200000 \\
+        --db-host localhost --db-port 5432 --db-user postgres
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from feelwell.shared.database import ConnectionManager, DatabaseConfig
+from feelwell.services.analytics_service.analytics_repository import AnalyticsRepository
+from feelwell.services.analytics_service.handler import (
+    AnalyticsConfig,
+    AnalyticsHandler,
+    FlaggedSession,
+)
+
+GRADES = ["9th", "10th", "11th", "12th"]
+
+# Rows per INSERT batch when loading PostgreSQL
+LOAD_BATCH_SIZE = 10000
+
+
+def generate_summaries(count: int, schools: int, now: datetime):
+    span_seconds = 90 * 24 * 3600
+    for i in range(count):
+        yield {
+            "session_id": f"sess_{i}",
+            "student_id_hash": f"{(i * 7919) % (count // 10 + 1):016x}",
+            "school_id": f"school_{i % schools:03d}",
+            "grade_level": GRADES[i % len(GRADES)],
+            "end_risk_score": (i * 37 % 100) / 100,
+            "counselor_flag": i % 17 == 0,
+            "timestamp": now - timedelta(seconds=span_seconds - i * span_seconds // count),
+        }
+
+
+def flagged_from(summary):
+    return FlaggedSession(
+        session_id=summary["session_id"],
+        student_id_hash=summary["student_id_hash"],
+        school_id=summary["school_id"],
+        end_risk_score=summary["end_risk_score"],
+        risk_trajectory="stable",
+        phq9_score=None,
+        gad7_score=None,
+        counselor_flag_reason="elevated_risk",
+        session_end=summary["timestamp"],
+        message_count=10,
+    )
+
+
+def bulk_load_postgres(manager, summaries):
+    """Load with multi-row INSERTs; per-row inserts would dominate the run."""
+    from psycopg2.extras import execute_values
+    import json
+
+    with manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            batch, flagged = [], []
+            for s in summaries:
+                batch.append((
+                    s["session_id"], s["school_id"], s["student_id_hash"], s["timestamp"],
+                    s["end_risk_score"], s["counselor_flag"],
+                    json.dumps({"school_id": s["school_id"], "grade_level": s["grade_level"],
+                                "counselor_flag": str(s["counselor_flag"])}),
+                ))
+                if s["counselor_flag"]:
+                    f = flagged_from(s)
+                    flagged.append((
+                        f.session_id, f.student_id_hash, f.school_id, f.end_risk_score,
+                        f.risk_trajectory, f.phq9_score, f.gad7_score,
+                        f.counselor_flag_reason, f.session_end, f.message_count,
+                    ))
+                if len(batch) >= LOAD_BATCH_SIZE:
+                    _flush(cur, execute_values, batch, flagged)
+                    batch, flagged = [], []
+            _flush(cur, execute_values, batch, flagged)
+            cur.execute("ANALYZE analytics_session_summaries")
+            cur.execute("ANALYZE analytics_flagged_sessions")
+        conn.commit()
+
+
+def _flush(cur, execute_values, batch, flagged):
+    if batch:
+        execute_values(
+            cur,
+            "INSERT INTO analytics_session_summaries (session_id, school_id, "
+            "student_id_hash, timestamp, end_risk_score, counselor_flag, dimensions) "
+            "VALUES %s",
+            batch,
+        )
+    if flagged:
+        execute_values(
+            cur,
+            "INSERT INTO analytics_flagged_sessions (session_id, student_id_hash, "
+            "school_id, end_risk_score, risk_trajectory, phq9_score, gad7_score, "
+            "counselor_flag_reason, session_end, message_count) VALUES %s",
+            flagged,
+        )
+
+
+def timed(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--summaries", type=int, default=200000)
+    parser.add_argument("--schools", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--db-host", default="localhost")
+    parser.add_argument("--db-port", type=int, default=5432)
+    parser.add_argument("--db-name", default="postgres")
+    parser.add_argument("--db-user", default="postgres")
+    parser.add_argument("--db-password", default="")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    now = datetime.utcnow()
+
+    manager = ConnectionManager(DatabaseConfig(
+        host=args.db_host,
+        port=args.db_port,
+        database=args.db_name,
+        username=args.db_user,
+        password=args.db_password,
+        min_connections=1,
+        max_connections=2,
+        ssl_mode="disable",
+    ))
+    with manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "DROP TABLE IF EXISTS analytics_session_summaries, "
+                "analytics_flagged_sessions CASCADE"
+            )
+        conn.commit()
+    repository = AnalyticsRepository(manager)
+    repository.ensure_schema()
+
+    config = AnalyticsConfig(result_cache_ttl_seconds=0)
+    memory = AnalyticsHandler(config=config)
+    postgres = AnalyticsHandler(config=config, repository=repository)
+
+    started = time.perf_counter()
+    for summary in generate_summaries(args.summaries, args.schools, now):
+        memory.add_session_summary(summary)
+        if summary["counselor_flag"]:
+            memory.add_flagged_session(flagged_from(summary))
+    memory_load = time.perf_counter() - started
+
+    started = time.perf_counter()
+    bulk_load_postgres(manager, generate_summaries(args.summaries, args.schools, now))
+    postgres_load = time.perf_counter() - started
+
+    print(f"{args.summaries} summaries, {args.schools} schools")
+    print(f"load: memory {memory_load:.1f}s, postgres (bulk) {postgres_load:.1f}s")
+    print(f"{'query':<28} {'memory ms':>10} {'postgres ms':>12}")
+    queries = [
+        ("mood_trends 7d", lambda h: h.get_mood_trends("school_001", "grade_level", 7)),
+        ("mood_trends 90d", lambda h: h.get_mood_trends("school_001", "grade_level", 90)),
+        ("school_overview 7d", lambda h: h.get_school_overview("school_001", 7)),
+        ("school_overview 90d", lambda h: h.get_school_overview("school_001", 90)),
+        ("flagged_sessions 90d top50", lambda h: h.get_flagged_sessions("school_001", 90, 50)),
+        ("mood_cube 4 weeks", lambda h: h.get_mood_cube(["school_id", "grade_level"], weeks=4)),
+    ]
+    for name, query in queries:
+        # Warm-up also fills the in-memory cube cache, as in steady state
+        query(memory)
+        query(postgres)
+        print(
+            f"{name:<28} {timed(lambda: query(memory), args.repeat):>10.2f} "
+            f"{timed(lambda: query(postgres), args.repeat):>12.2f}"
+        )
+    manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark analytics storage: list of dicts vs columnar store.
+
+Loads N session summaries into both representations and reports memory
+per summary plus dashboard query latency (mood trends and school
+overview over a 7-day window).
+
+Usage:
+    python scripts/benchmark_analytics_store.py --summaries 1000000
+"""
+
+import argparse
+import logging
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from feelwell.services.analytics_service.handler import AnalyticsHandler
+
+GRADES = ["9th", "10th", "11th", "12th"]
+
+
+def generate_summaries(count: int, schools: int, now: datetime):
+    span_seconds = 90 * 24 * 3600
+    for i in range(count):
+        yield {
+            "session_id": f"sess_{i}",
+            "student_id_hash": f"{(i * 7919) % (count // 10 + 1):016x}",
+            "school_id": f"school_{i % schools:03d}",
+            "grade_level": GRADES[i % len(GRADES)],
+            "end_risk_score": (i * 37 % 100) / 100,
+            "counselor_flag": i % 17 == 0,
+            "timestamp": now - timedelta(seconds=span_seconds - i * span_seconds // count),
+        }
+
+
+def scan_mood_trends(summaries, school_id, cutoff):
+    groups = {}
+    for s in summaries:
+        if s.get("school_id") == school_id and s.get("timestamp", datetime.min) >= cutoff:
+            groups.setdefault(str(s.get("grade_level", "unknown")), []).append(
+                float(s["end_risk_score"])
+            )
+    return {k: sum(v) / len(v) for k, v in groups.items()}
+
+
+def scan_school_overview(summaries, school_id, cutoff):
+    filtered = [
+        s for s in summaries
+        if s.get("school_id") == school_id and s.get("timestamp", datetime.min) >= cutoff
+    ]
+    return len(set(s.get("student_id_hash") for s in filtered)), len(filtered)
+
+
+def timed(fn, repeat: int = 5):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--summaries", type=int, default=1_000_000)
+    parser.add_argument("--schools", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    now = datetime.utcnow()
+    cutoff = now - timedelta(days=7)
+
+    tracemalloc.start()
+    summaries = list(generate_summaries(args.summaries, args.schools, now))
+    list_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    handler = AnalyticsHandler()
+    tracemalloc.start()
+    for summary in generate_summaries(args.summaries, args.schools, now):
+        handler.add_session_summary(summary)
+    columnar_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    school = "school_000"
+    rows = [
+        ("list scan", list_bytes,
+         timed(lambda: scan_mood_trends(summaries, school, cutoff)),
+         timed(lambda: scan_school_overview(summaries, school, cutoff))),
+        ("columnar", columnar_bytes,
+         timed(lambda: handler.get_mood_trends(school, "grade_level", 7)),
+         timed(lambda: handler.get_school_overview(school, 7))),
+    ]
+
+    print(f"{args.summaries:,} summaries across {args.schools} schools, 7-day window")
+    print(f"{'store':<10} {'bytes/summary':>14} {'mood-trends ms':>15} {'overview ms':>12}")
+    for name, nbytes, trends_ms, overview_ms in rows:
+        print(
+            f"{name:<10} {nbytes / args.summaries:>14.1f} "
+            f"{trends_ms:>15.2f} {overview_ms:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
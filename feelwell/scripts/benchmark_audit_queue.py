@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark response latency with inline vs queued audit logging.
+
+Replays the generate_response flow (LLM call, then audit write) with a
+simulated LLM and a synchronous audit store of fixed write latency, and
+reports student-facing latency for both modes under concurrent load.
+
+Usage:
+    python scripts/benchmark_audit_queue.py --requests 500 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from feelwell.services.llm_service.audit_queue import AuditWriteQueue
+
+
+def make_audit_store(write_ms: float):
+    """Synchronous audit writer with fixed latency (e.g. a DB round trip)."""
+    def write(record):
+        time.sleep(write_ms / 1000)
+    return write
+
+
+async def handle_request(index: int, llm_ms: float, audit_write, queue):
+    started = time.perf_counter()
+    await asyncio.sleep(llm_ms / 1000)  # LLM inference
+    record = {"session_id": f"session_{index}", "risk_level": "safe"}
+    if queue is None:
+        audit_write(record)  # Inline: blocks the event loop
+    else:
+        await queue.submit(record)
+    return (time.perf_counter() - started) * 1000
+
+
+async def run_mode(args, queued: bool):
+    audit_write = make_audit_store(args.audit_ms)
+    queue = AuditWriteQueue(writer=audit_write, max_size=args.queue_size) if queued else None
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(index):
+        async with semaphore:
+            return await handle_request(index, args.llm_ms, audit_write, queue)
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(bounded(i) for i in range(args.requests)))
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    drain_ms = 0.0
+    if queue is not None:
+        drain_started = time.perf_counter()
+        await queue.close()
+        drain_ms = (time.perf_counter() - drain_started) * 1000
+
+    latencies = sorted(latencies)
+    return {
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "max": latencies[-1],
+        "wall": wall_ms,
+        "drain": drain_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--llm-ms", type=float, default=50.0)
+    parser.add_argument("--audit-ms", type=float, default=5.0)
+    parser.add_argument("--queue-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"LLM {args.llm_ms}ms, audit write {args.audit_ms}ms"
+    )
+    print(f"{'mode':<8} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'wall ms':>10} {'drain ms':>10}")
+    for name, queued in (("inline", False), ("queued", True)):
+        result = asyncio.run(run_mode(args, queued))
+        print(
+            f"{name:<8} {result['p50']:>9.1f} {result['p95']:>9.1f} {result['max']:>9.1f} "
+            f"{result['wall']:>10.1f} {result['drain']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark prompt size and build latency over long chat sessions.
+
+Replays synthetic sessions turn by turn and compares, per turn number:
+- full history: every prior turn concatenated into the prompt
+- budgeted: ContextBuilder with a per-session key (delta tokenization)
+- budgeted, uncached: ContextBuilder without a session key
+
+Usage:
+    python scripts/benchmark_context_builder.py --sessions 20 --turns 50
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from feelwell.services.llm_service.context_builder import (
+    ContextBuilder,
+    ContextBuilderConfig,
+    simple_tokenize,
+)
+
+SYSTEM_PROMPT = (
+    "You are a helpful and empathetic mental health support assistant for "
+    "students. Listen actively, validate feelings and encourage speaking "
+    "with school counselors. Never give medical advice or diagnoses."
+)
+
+WORDS = ("school exams friends tired sleep stressed parents lonely homework "
+         "test practice team coach weekend phone worried class teacher").split()
+
+# Turn numbers reported in the table
+REPORT_TURNS = (1, 10, 25, 50)
+
+
+def make_turn(rng: random.Random, role: str):
+    length = rng.randint(15, 60) if role == "user" else rng.randint(40, 120)
+    return {"role": role, "content": " ".join(rng.choice(WORDS) for _ in range(length)) + "."}
+
+
+def full_history_prompt(history, message):
+    lines = [f"{t['role']}: {t['content']}" for t in history]
+    return "\n".join(lines + [f"user: {message}"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--max-context-tokens", type=int, default=1024)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(42)
+    config = ContextBuilderConfig(max_context_tokens=args.max_context_tokens)
+    cached = ContextBuilder(config)
+    uncached = ContextBuilder(config)
+
+    rows = {turn: {"full_tokens": [], "full_chars": [], "tokens": [], "chars": [],
+                   "cached_us": [], "uncached_us": []} for turn in REPORT_TURNS}
+
+    for session in range(args.sessions):
+        history = []
+        for turn in range(1, args.turns + 1):
+            message = make_turn(rng, "user")["content"]
+
+            started = time.perf_counter()
+            context = cached.build(SYSTEM_PROMPT, message, history, f"session_{session}")
+            cached_us = (time.perf_counter() - started) * 1e6
+
+            started = time.perf_counter()
+            uncached.build(SYSTEM_PROMPT, message, history)
+            uncached_us = (time.perf_counter() - started) * 1e6
+
+            if turn in rows:
+                full = full_history_prompt(history, message)
+                row = rows[turn]
+                row["full_tokens"].append(
+                    len(simple_tokenize(SYSTEM_PROMPT)) + len(simple_tokenize(full))
+                )
+                row["full_chars"].append(len(full))
+                row["tokens"].append(context.total_tokens)
+                row["chars"].append(len(context.prompt))
+                row["cached_us"].append(cached_us)
+                row["uncached_us"].append(uncached_us)
+
+            history.append({"role": "user", "content": message})
+            history.append(make_turn(rng, "assistant"))
+
+    print(f"{args.sessions} sessions, budget {args.max_context_tokens} tokens "
+          f"(medians; a turn is one student message and one reply)")
+    print(f"{'turn':>5} {'full tok':>9} {'full chars':>11} {'budget tok':>11} "
+          f"{'budget chars':>13} {'cached us':>10} {'uncached us':>12}")
+    for turn, row in rows.items():
+        if not row["tokens"]:
+            continue
+        med = {key: statistics.median(values) for key, values in row.items()}
+        print(f"{turn:>5} {med['full_tokens']:>9.0f} {med['full_chars']:>11.0f} "
+              f"{med['tokens']:>11.0f} {med['chars']:>13.0f} "
+              f"{med['cached_us']:>10.1f} {med['uncached_us']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Compare processed JSON datasets with memory-mapped dataset stores.
+
+Builds a synthetic dataset, writes it both as `<name>_processed.json`
+(the old format) and as a DatasetStore, then times from a cold start:
+- load: json.load plus building every DatasetSample, vs opening the store
+- load + filter: get_by_triage("crisis") as a list scan, vs the
+  prebuilt index (only matching rows are built)
+- load + iterate: reading every sample's text
+
+With --convert, converts every *_processed.json in a directory instead.
+
+Usage:
+    python scripts/benchmark_dataset_store.py --samples 100000
+    python scripts/benchmark_dataset_store.py --convert evaluation/datasets/processed
+"""
+
+import argparse
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from feelwell.evaluation.datasets.dataset_loader import DatasetSample
+from feelwell.evaluation.datasets.dataset_store import (
+    DatasetStore,
+    convert_json_to_store,
+    write_dataset_store,
+)
+
+WORDS = ("school exams friends tired sleep stressed parents lonely homework "
+         "test practice team coach weekend phone worried class teacher").split()
+CATEGORIES = ("depression", "anxiety", "stress", "relationships", "general_support")
+TRIAGE_LEVELS = ("safe", "safe", "safe", "caution", "crisis")
+
+
+def make_samples(count: int, rng: random.Random):
+    for i in range(count):
+        yield DatasetSample(
+            sample_id=f"synthetic_{i}",
+            text=" ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 80))),
+            category=rng.choice(CATEGORIES),
+            triage_level=rng.choice(TRIAGE_LEVELS),
+            severity_score=rng.random(),
+            source_dataset="synthetic",
+            phq9_score=rng.randint(0, 27),
+        )
+
+
+def timed(fn):
+    started = time.perf_counter()
+    value = fn()
+    return value, (time.perf_counter() - started) * 1000
+
+
+def convert(directory: Path) -> None:
+    for json_path in sorted(directory.glob("*_processed.json")):
+        store_path, elapsed_ms = timed(lambda: convert_json_to_store(json_path))
+        print(f"{json_path.name} -> {store_path.name} "
+              f"({json_path.stat().st_size:,} -> {store_path.stat().st_size:,} bytes, "
+              f"{elapsed_ms:.0f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--samples", type=int, default=100_000)
+    parser.add_argument("--convert", type=Path, help="Convert processed JSON files in this directory")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    if args.convert:
+        convert(args.convert)
+        return
+
+    samples = list(make_samples(args.samples, random.Random(42)))
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "synthetic_processed.json"
+        store_path = Path(tmp) / "synthetic_processed.fwds"
+        with open(json_path, "w") as f:
+            json.dump({"dataset": "synthetic", "samples": [s.to_dict() for s in samples]}, f, indent=2)
+        write_dataset_store(store_path, samples, dataset="synthetic")
+        del samples
+
+        def load_json():
+            with open(json_path) as f:
+                data = json.load(f)
+            return [DatasetSample.from_dict(item) for item in data["samples"]]
+
+        loaded, json_load_ms = timed(load_json)
+        store, store_load_ms = timed(lambda: DatasetStore(store_path))
+        _, json_filter_ms = timed(lambda: [s for s in loaded if s.triage_level == "crisis"])
+        _, store_filter_ms = timed(lambda: store.get_by_triage("crisis"))
+        _, json_iter_ms = timed(lambda: sum(len(s.text) for s in loaded))
+        _, store_iter_ms = timed(lambda: sum(len(s.text) for s in store))
+
+        print(f"{args.samples:,} samples: JSON {json_path.stat().st_size:,} bytes, "
+              f"store {store_path.stat().st_size:,} bytes")
+        print(f"{'':>15} {'json ms':>10} {'store ms':>10}")
+        print(f"{'load':>15} {json_load_ms:>10.1f} {store_load_ms:>10.1f}")
+        print(f"{'load + filter':>15} {json_load_ms + json_filter_ms:>10.1f} "
+              f"{store_load_ms + store_filter_ms:>10.1f}")
+        print(f"{'load + iterate':>15} {json_load_ms + json_iter_ms:>10.1f} "
+              f"{store_load_ms + store_iter_ms:>10.1f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
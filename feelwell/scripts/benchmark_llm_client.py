@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark LLM client latency: session per call vs pooled session.
+
+Starts a local stub of the HuggingFace inference API with fixed
+inference latency and drives it with HuggingFaceLLM under concurrent
+load. The per-call mode opens a new aiohttp session for every request
+(the previous behavior); the pooled mode reuses the instance's session.
+Also compares unbounded vs bounded generate_batch.
+
+Usage:
+    python scripts/benchmark_llm_client.py --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import aiohttp
+from aiohttp import web
+
+from feelwell.services.llm_service.base_llm import HuggingFaceLLM, LLMConfig, LLMProvider
+
+
+class PerCallSessionLLM(HuggingFaceLLM):
+    """Opens and closes a client session around every request."""
+
+    def _get_session(self):
+        return aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
+        )
+
+    async def generate(self, prompt, system_prompt=None, **kwargs):
+        started = time.perf_counter()
+        async with self._get_session() as session:
+            async with session.post(self.endpoint, json={"inputs": prompt}) as response:
+                response.raise_for_status()
+                result = await response.json()
+        return result, (time.perf_counter() - started) * 1000
+
+
+async def start_stub(delay_ms: float):
+    async def handle(request):
+        payload = await request.json()
+        await asyncio.sleep(delay_ms / 1000)
+        return web.json_response([{"generated_text": payload["inputs"][:32]}])
+
+    app = web.Application()
+    app.router.add_post("/generate", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/generate"
+
+
+def make_config(endpoint, args):
+    return LLMConfig(
+        provider=LLMProvider.HUGGINGFACE,
+        model_name="stub-model",
+        endpoint=endpoint,
+        max_connections=args.connections,
+        max_batch_concurrency=args.batch_concurrency,
+    )
+
+
+async def run_load(llm, args, per_call: bool):
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(i):
+        async with semaphore:
+            if per_call:
+                _, latency = await llm.generate(f"prompt {i}")
+                return latency
+            response = await llm.generate(f"prompt {i}")
+            return response.latency_ms
+
+    started = time.perf_counter()
+    latencies = sorted(await asyncio.gather(*(one(i) for i in range(args.requests))))
+    wall = time.perf_counter() - started
+    return {
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "rps": args.requests / wall,
+    }
+
+
+async def main_async(args):
+    runner, endpoint = await start_stub(args.server_ms)
+    try:
+        print(
+            f"{args.requests} requests, concurrency {args.concurrency}, "
+            f"stub latency {args.server_ms}ms, pool {args.connections} connections"
+        )
+        print(f"{'mode':<22} {'p50 ms':>8} {'p95 ms':>8} {'req/s':>9}")
+        for name, cls, per_call in (
+            ("session per call", PerCallSessionLLM, True),
+            ("pooled session", HuggingFaceLLM, False),
+        ):
+            llm = cls(make_config(endpoint, args))
+            result = await run_load(llm, args, per_call)
+            await llm.close()
+            print(f"{name:<22} {result['p50']:>8.2f} {result['p95']:>8.2f} {result['rps']:>9.0f}")
+
+        prompts = [f"prompt {i}" for i in range(args.batch_size)]
+        for name, limit in (("batch unbounded", args.batch_size), ("batch bounded", args.batch_concurrency)):
+            config = make_config(endpoint, args)
+            config.max_batch_concurrency = limit
+            config.max_connections = 0  # No pool limit; only the batch bound applies
+            llm = HuggingFaceLLM(config)
+            started = time.perf_counter()
+            responses = await llm.generate_batch(prompts)
+            wall_ms = (time.perf_counter() - started) * 1000
+            await llm.close()
+            latencies = sorted(r.latency_ms for r in responses)
+            print(
+                f"{name:<22} {statistics.median(latencies):>8.2f} "
+                f"{latencies[int(len(latencies) * 0.95) - 1]:>8.2f} "
+                f"{len(prompts) / wall_ms * 1000:>9.0f}"
+            )
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--server-ms", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--batch-concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark LLM response validation latency as the phrase set grows.
+
+Compares the compiled ResponseValidator against the per-phrase substring
+loop it replaced, on a typical-length response, for increasing numbers
+of blocked phrases. "scan" is the automaton alone; "validate" adds
+TextNormalizer normalization, a fixed cost per response.
+
+Usage:
+    python scripts/benchmark_response_validator.py --sizes 10 100 1000 5000
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from feelwell.services.llm_service.response_validator import ResponseValidator
+
+RESPONSE = (
+    "It sounds like you've had a really hard week, and it makes sense that "
+    "you're feeling worn down. Exams, friends and sleep all pile up. Would it "
+    "help to talk through what's been the hardest part? Your school counselor "
+    "is also a great person to check in with if things keep feeling heavy. "
+) * 3
+
+
+def generate_phrases(count: int, rng: random.Random):
+    words = ["you", "should", "take", "never", "always", "your", "pills", "hurt",
+             "dose", "stop", "tell", "anyone", "secret", "nobody", "worthless"]
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(2, 5))) + f" {i:x}z"
+            for i in range(count)]
+
+
+def timed(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(7)
+
+    print(f"response length {len(RESPONSE)} chars")
+    print(f"{'phrases':>8} {'substring us':>13} {'scan us':>9} {'validate us':>12} {'build ms':>9}")
+    for size in args.sizes:
+        phrases = generate_phrases(size, rng)
+
+        def substring_loop():
+            lowered = RESPONSE.lower()
+            return [p for p in phrases if p in lowered]
+
+        started = time.perf_counter()
+        validator = ResponseValidator({"generated": phrases}, version="bench")
+        build_ms = (time.perf_counter() - started) * 1000
+        normalized = validator.normalizer.normalize(RESPONSE)
+
+        print(
+            f"{size:>8} {timed(substring_loop, args.repeat):>13.1f} "
+            f"{timed(lambda: validator.scan(normalized), args.repeat):>9.1f} "
+            f"{timed(lambda: validator.validate(RESPONSE), args.repeat):>12.1f} "
+            f"{build_ms:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark VectorStore memory and search latency.
+
+For each corpus size, fills a store with random embeddings spread
+over many students, then reports:
+- build: add_documents time and embedding matrix memory, against the
+  previous per-document List[float] storage (measured on a sample)
+- search: one query over every document, a batch of queries (per
+  query), and one query filtered to a single student
+- legacy: the previous Python cosine loop, timed on --legacy-docs
+  documents and scaled linearly to the corpus size
+
+Usage:
+    python scripts/benchmark_vector_store.py
+    python scripts/benchmark_vector_store.py --docs 100000 1000000 --dim 384
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from feelwell.evaluation.rag.vector_store import VectorStore
+
+# Documents added per add_documents call while building
+BUILD_CHUNK = 100_000
+
+
+def timed_ms(fn, repeat=1):
+    """Median wall time of fn in milliseconds, and its last value."""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = fn()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times), value
+
+
+def legacy_cosine(vec1, vec2):
+    dot_product = sum(a * b for a, b in zip(vec1, vec2))
+    norm1 = sum(a * a for a in vec1) ** 0.5
+    norm2 = sum(b * b for b in vec2) ** 0.5
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+    return dot_product / (norm1 * norm2)
+
+
+def legacy_bytes_per_document(dim, rng, sample=1000):
+    """Bytes per document of embeddings stored as List[float]."""
+    tracemalloc.start()
+    lists = [rng.normal(size=dim).tolist() for _ in range(sample)]
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del lists
+    return used / sample
+
+
+def legacy_search_ms_per_document(dim, rng, docs):
+    embeddings = [rng.normal(size=dim).tolist() for _ in range(docs)]
+    query = rng.normal(size=dim).tolist()
+
+    def search():
+        results = [(i, legacy_cosine(query, e)) for i, e in enumerate(embeddings)]
+        results.sort(key=lambda x: x[1], reverse=True)
+        return results[:5]
+
+    elapsed_ms, _ = timed_ms(search)
+    return elapsed_ms / docs
+
+
+def build_store(docs, dim, students, rng):
+    store = VectorStore(embedding_dim=dim)
+    for start in range(0, docs, BUILD_CHUNK):
+        count = min(BUILD_CHUNK, docs - start)
+        store.add_documents(
+            [f"session {i}" for i in range(start, start + count)],
+            [{"student_id_hash": f"student_{i % students}"} for i in range(start, start + count)],
+            rng.normal(size=(count, dim)).astype(np.float32),
+        )
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--docs", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--students", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, default=64, help="Queries per batched search")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--legacy-docs", type=int, default=5_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = np.random.default_rng(42)
+
+    legacy_bytes = legacy_bytes_per_document(args.dim, rng)
+    legacy_ms_per_doc = legacy_search_ms_per_document(args.dim, rng, args.legacy_docs)
+
+    for docs in args.docs:
+        build_ms, store = timed_ms(lambda: build_store(docs, args.dim, args.students, rng))
+        queries = rng.normal(size=(args.batch, args.dim)).astype(np.float32)
+
+        single_ms, _ = timed_ms(lambda: store.search_embeddings(queries[:1], top_k=args.top_k), repeat=5)
+        batch_ms, _ = timed_ms(lambda: store.search_embeddings(queries, top_k=args.top_k), repeat=3)
+        student_ms, _ = timed_ms(
+            lambda: store.search_embeddings(queries[:1], student_id_hash="student_7", top_k=args.top_k),
+            repeat=20,
+        )
+
+        print(f"{docs:,} documents x {args.dim} dims, {args.students:,} students")
+        print(f"  build          {build_ms:>10.0f} ms")
+        print(f"  matrix memory  {store.memory_bytes / 2**20:>10.0f} MiB "
+              f"(List[float] embeddings: {legacy_bytes * docs / 2**20:,.0f} MiB)")
+        print(f"  search, 1      {single_ms:>10.2f} ms "
+              f"(legacy loop, scaled: {legacy_ms_per_doc * docs:,.0f} ms)")
+        print(f"  search, {args.batch:<6} {batch_ms / args.batch:>10.2f} ms/query")
+        print(f"  search, student{student_ms:>10.3f} ms")
+        del store
+
+
+if __name__ == "__main__":
+    main()
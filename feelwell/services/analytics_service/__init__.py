@@ -16,6 +16,7 @@ Endpoints:
 - GET /flagged-sessions - Get sessions flagged for counselor review
 - GET /mood-trends - Aggregate mood trends by time period
 - GET /school-overview - School-level risk overview
+- GET /mood-cube - District drill-down by school, grade and week
 - POST /sessions - Add session summary
 """
 
@@ -0,0 +1,389 @@
+"""PostgreSQL storage for analytics session data.
+
+Persistent backend for AnalyticsHandler. Filtering, grouping and counting
+run in SQL on covering indexes; only aggregates leave the database:
+
+- Summaries: (school_id, timestamp) index covering the columns that
+  mood trends and the school overview aggregate
+- Flagged sessions: (school_id, end_risk_score DESC, session_end DESC)
+  index, so the top-N query reads N index entries
+- Aggregates below k come back as counts only: the averages and
+  distributions of small groups are nulled in SQL before the k-anonymity
+  enforcer marks them suppressed (ADR-006)
+
+Group-by fields are kept in a JSONB dimensions column, so new summary
+fields need no migration. Every write also bumps a per-school version
+counter that dashboard result caches in each worker key on.
+"""
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from feelwell.shared.database import ConnectionManager, RepositoryError
+from .columnar_store import NON_DIMENSION_FIELDS, UNKNOWN_LABEL, to_micros
+from .cube import ALL, CUBE_DIMENSIONS, CellKey, CubeCell, cuboid_groupings
+from .rolling_aggregates import HIGH_RISK_THRESHOLD, MEDIUM_RISK_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+ANALYTICS_SCHEMA_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS analytics_session_summaries (
+        id BIGSERIAL PRIMARY KEY,
+        session_id TEXT NOT NULL,
+        school_id TEXT NOT NULL,
+        student_id_hash TEXT NOT NULL,
+        timestamp TIMESTAMP NOT NULL,
+        end_risk_score DOUBLE PRECISION,
+        counselor_flag BOOLEAN NOT NULL DEFAULT FALSE,
+        dimensions JSONB NOT NULL DEFAULT '{}'::jsonb
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS analytics_flagged_sessions (
+        id BIGSERIAL PRIMARY KEY,
+        session_id TEXT NOT NULL,
+        student_id_hash TEXT NOT NULL,
+        school_id TEXT NOT NULL,
+        end_risk_score DOUBLE PRECISION NOT NULL,
+        risk_trajectory TEXT NOT NULL,
+        phq9_score INTEGER,
+        gad7_score INTEGER,
+        counselor_flag_reason TEXT NOT NULL,
+        session_end TIMESTAMP NOT NULL,
+        message_count INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS analytics_school_versions (
+        school_id TEXT PRIMARY KEY,
+        version BIGINT NOT NULL
+    )
+    """,
+)
+
+ANALYTICS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_analytics_summaries_school_time "
+    "ON analytics_session_summaries (school_id, timestamp) "
+    "INCLUDE (student_id_hash, end_risk_score, counselor_flag)",
+    "CREATE INDEX IF NOT EXISTS idx_analytics_summaries_time "
+    "ON analytics_session_summaries (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_analytics_flagged_school_risk "
+    "ON analytics_flagged_sessions (school_id, end_risk_score DESC, session_end DESC, id)",
+    "CREATE INDEX IF NOT EXISTS idx_analytics_flagged_school_end "
+    "ON analytics_flagged_sessions (school_id, session_end)",
+)
+
+# Run in the same transaction as every write, so a result cache keyed on
+# the version (shared by all workers) sees the write and its data together
+BUMP_SCHOOL_VERSION_SQL = (
+    "INSERT INTO analytics_school_versions (school_id, version) VALUES (%s, 1) "
+    "ON CONFLICT (school_id) DO UPDATE "
+    "SET version = analytics_school_versions.version + 1"
+)
+
+FLAGGED_COLUMNS = (
+    "session_id, student_id_hash, school_id, end_risk_score, risk_trajectory, "
+    "phq9_score, gad7_score, counselor_flag_reason, session_end, message_count"
+)
+
+
+@dataclass
+class SchoolTotals:
+    """School-level aggregates over a window.
+
+    Only unique_students is set when the school is below k.
+
+    Attributes:
+        unique_students: Distinct students (the k-anonymity group size)
+        unique_students_exact: False if the count is an estimate
+        session_count: Summaries counted
+        flagged_count: Summaries with counselor_flag set
+        risk_sum: Sum of end_risk_score, missing scores as 0
+        risk_histogram: Counts per band [low, medium, high], missing as low
+    """
+    unique_students: int
+    unique_students_exact: bool = True
+    session_count: int = 0
+    flagged_count: int = 0
+    risk_sum: float = 0.0
+    risk_histogram: List[int] = field(default_factory=lambda: [0, 0, 0])
+
+
+def _to_timestamp(value: Any) -> datetime:
+    """Naive UTC datetime for a summary timestamp (see to_micros)."""
+    return _EPOCH + timedelta(microseconds=to_micros(value))
+
+
+class AnalyticsRepository:
+    """PostgreSQL repository for session summaries and flagged sessions."""
+
+    def __init__(self, connection_manager: ConnectionManager):
+        """Initialize repository.
+
+        Args:
+            connection_manager: PostgreSQL connection manager
+        """
+        self.connection_manager = connection_manager
+
+        logger.info("ANALYTICS_REPOSITORY_INITIALIZED")
+
+    def ensure_schema(self) -> None:
+        """Create tables and indexes. Idempotent.
+
+        Raises:
+            RepositoryError: If DDL fails
+        """
+        statements = list(ANALYTICS_SCHEMA_DDL) + list(ANALYTICS_INDEXES)
+        self._execute(statements)
+        logger.info("ANALYTICS_SCHEMA_ENSURED", extra={"statement_count": len(statements)})
+
+    def add_session_summary(self, summary: Dict[str, Any]) -> None:
+        """Insert a session summary and bump its school's version.
+
+        Args:
+            summary: Summary dict (same fields as the in-memory store)
+
+        Raises:
+            RepositoryError: If the insert fails
+        """
+        risk_score = summary.get("end_risk_score")
+        dimensions = {
+            name: str(value)
+            for name, value in summary.items()
+            if name not in NON_DIMENSION_FIELDS
+        }
+        school_id = str(summary.get("school_id"))
+        self._execute([(
+            "INSERT INTO analytics_session_summaries "
+            "(session_id, school_id, student_id_hash, timestamp, end_risk_score, "
+            "counselor_flag, dimensions) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+            (
+                str(summary.get("session_id")),
+                school_id,
+                str(summary.get("student_id_hash")),
+                _to_timestamp(summary.get("timestamp")),
+                None if risk_score is None else float(risk_score),
+                bool(summary.get("counselor_flag", False)),
+                json.dumps(dimensions),
+            ),
+        ), (BUMP_SCHOOL_VERSION_SQL, (school_id,))])
+
+    def add_flagged_session(self, session: Any) -> None:
+        """Insert a flagged session and bump its school's version.
+
+        Args:
+            session: FlaggedSession to add
+
+        Raises:
+            RepositoryError: If the insert fails
+        """
+        self._execute([(
+            f"INSERT INTO analytics_flagged_sessions ({FLAGGED_COLUMNS}) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+            (
+                session.session_id,
+                session.student_id_hash,
+                session.school_id,
+                float(session.end_risk_score),
+                session.risk_trajectory,
+                session.phq9_score,
+                session.gad7_score,
+                session.counselor_flag_reason,
+                _to_timestamp(session.session_end),
+                session.message_count,
+            ),
+        ), (BUMP_SCHOOL_VERSION_SQL, (session.school_id,))])
+
+    def school_version(self, school_id: str) -> int:
+        """Current data version of a school (0 before its first write).
+
+        Raises:
+            RepositoryError: If the query fails
+        """
+        (rows,) = self._fetch([(
+            "SELECT version FROM analytics_school_versions WHERE school_id = %s",
+            (school_id,),
+        )])
+        return rows[0][0] if rows else 0
+
+    def top_flagged(
+        self,
+        school_id: str,
+        since: datetime,
+        limit: int,
+    ) -> Tuple[int, List[tuple]]:
+        """Highest-risk flagged sessions with session_end >= since.
+
+        Returns:
+            Tuple of (total sessions in window, up to limit rows in
+            FLAGGED_COLUMNS order, by risk descending, ties most recent
+            first)
+        """
+        rows = self._fetch([
+            (
+                "SELECT COUNT(*) FROM analytics_flagged_sessions "
+                "WHERE school_id = %s AND session_end >= %s",
+                (school_id, since),
+            ),
+            (
+                f"SELECT {FLAGGED_COLUMNS} FROM analytics_flagged_sessions "
+                "WHERE school_id = %s AND session_end >= %s "
+                "ORDER BY end_risk_score DESC, session_end DESC, id "
+                "LIMIT %s",
+                (school_id, since, max(limit, 0)),
+            ),
+        ])
+        return rows[0][0][0], rows[1]
+
+    def risk_by_group(
+        self,
+        school_id: str,
+        since: datetime,
+        group_by: str,
+        k_threshold: int,
+    ) -> Dict[str, Tuple[Optional[float], int]]:
+        """Average end_risk_score per group over scored summaries.
+
+        Returns:
+            Group value -> (average, or None if the group is below k;
+            number of scored summaries)
+        """
+        rows = self._fetch([(
+            "SELECT COALESCE(dimensions ->> %s, %s) AS group_key, "
+            "COUNT(*) AS group_size, "
+            "CASE WHEN COUNT(*) >= %s THEN AVG(end_risk_score) END "
+            "FROM analytics_session_summaries "
+            "WHERE school_id = %s AND timestamp >= %s AND end_risk_score IS NOT NULL "
+            "GROUP BY group_key",
+            (group_by, UNKNOWN_LABEL, k_threshold, school_id, since),
+        )])[0]
+        return {key: (average, size) for key, size, average in rows}
+
+    def school_totals(
+        self,
+        school_id: str,
+        since: datetime,
+        k_threshold: int,
+    ) -> SchoolTotals:
+        """School overview aggregates; only the student count below k."""
+        rows = self._fetch([(
+            "SELECT students, "
+            "CASE WHEN students >= %(k)s THEN sessions END, "
+            "CASE WHEN students >= %(k)s THEN flagged END, "
+            "CASE WHEN students >= %(k)s THEN risk_sum END, "
+            "CASE WHEN students >= %(k)s THEN low END, "
+            "CASE WHEN students >= %(k)s THEN medium END, "
+            "CASE WHEN students >= %(k)s THEN high END "
+            "FROM ("
+            "  SELECT COUNT(DISTINCT student_id_hash) AS students, "
+            "  COUNT(*) AS sessions, "
+            "  COUNT(*) FILTER (WHERE counselor_flag) AS flagged, "
+            "  COALESCE(SUM(end_risk_score), 0) AS risk_sum, "
+            "  COUNT(*) FILTER (WHERE COALESCE(end_risk_score, 0) < %(medium)s) AS low, "
+            "  COUNT(*) FILTER (WHERE end_risk_score >= %(medium)s "
+            "    AND end_risk_score < %(high)s) AS medium, "
+            "  COUNT(*) FILTER (WHERE end_risk_score >= %(high)s) AS high "
+            "  FROM analytics_session_summaries "
+            "  WHERE school_id = %(school_id)s AND timestamp >= %(since)s"
+            ") totals",
+            {
+                "k": k_threshold,
+                "medium": MEDIUM_RISK_THRESHOLD,
+                "high": HIGH_RISK_THRESHOLD,
+                "school_id": school_id,
+                "since": since,
+            },
+        )])[0]
+        students, sessions, flagged, risk_sum, low, medium, high = rows[0]
+        if sessions is None:
+            return SchoolTotals(unique_students=students)
+        return SchoolTotals(
+            unique_students=students,
+            session_count=sessions,
+            flagged_count=flagged,
+            risk_sum=risk_sum,
+            risk_histogram=[low, medium, high],
+        )
+
+    def cube_cells(self, since: datetime) -> Dict[Tuple[str, ...], Dict[CellKey, CubeCell]]:
+        """Unsuppressed cells of every school x grade x week rollup.
+
+        One GROUP BY CUBE query; suppression is applied by the caller
+        because complementary suppression needs the whole cube.
+        """
+        rows = self._fetch([(
+            "SELECT school_id, grade_level, week, "
+            "GROUPING(school_id, grade_level, week), "
+            "COUNT(*), COUNT(DISTINCT student_id_hash), COUNT(end_risk_score), "
+            "COALESCE(SUM(end_risk_score), 0) "
+            "FROM ("
+            "  SELECT school_id, student_id_hash, end_risk_score, "
+            "  COALESCE(dimensions ->> 'grade_level', %s) AS grade_level, "
+            "  to_char(date_trunc('week', timestamp), 'YYYY-MM-DD') AS week "
+            "  FROM analytics_session_summaries WHERE timestamp >= %s"
+            ") s "
+            "GROUP BY CUBE (school_id, grade_level, week)",
+            (UNKNOWN_LABEL, since),
+        )])[0]
+
+        cuboids: Dict[Tuple[str, ...], Dict[CellKey, CubeCell]] = {
+            grouped: {} for grouped in cuboid_groupings()
+        }
+        width = len(CUBE_DIMENSIONS)
+        for *values, rolled_up, sessions, students, scored, risk_sum in rows:
+            if sessions == 0:
+                continue
+            # GROUPING() sets the bit of each rolled-up column, first column highest
+            grouped = tuple(
+                dimension
+                for position, dimension in enumerate(CUBE_DIMENSIONS)
+                if not rolled_up & (1 << (width - 1 - position))
+            )
+            key = tuple(
+                str(value) if dimension in grouped else ALL
+                for dimension, value in zip(CUBE_DIMENSIONS, values)
+            )
+            cuboids[grouped][key] = CubeCell(
+                key=key,
+                session_count=sessions,
+                unique_students=students,
+                scored_count=scored,
+                risk_sum=float(risk_sum),
+            )
+        return cuboids
+
+    def _execute(self, statements: List[Any]) -> None:
+        """Run statements (SQL or (SQL, params)) in one transaction."""
+        self._run(statements, fetch=False)
+
+    def _fetch(self, statements: List[Tuple[str, Any]]) -> List[List[tuple]]:
+        """Run queries in one transaction and return each one's rows."""
+        return self._run(statements, fetch=True)
+
+    def _run(self, statements: List[Any], fetch: bool) -> List[List[tuple]]:
+        results = []
+        try:
+            with self.connection_manager.get_connection() as conn:
+                try:
+                    with conn.cursor() as cur:
+                        for statement in statements:
+                            if isinstance(statement, tuple):
+                                cur.execute(*statement)
+                            else:
+                                cur.execute(statement)
+                            if fetch:
+                                results.append(cur.fetchall())
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+        except Exception as e:
+            logger.error("ANALYTICS_QUERY_FAILED", extra={"error": str(e)})
+            raise RepositoryError(f"Analytics query failed: {e}")
+        return results
@@ -0,0 +1,335 @@
+"""Columnar in-memory storage for analytics session data.
+
+Session summaries arrive as dicts with a handful of fields. Holding them
+as Python dicts costs ~1KB each and every dashboard query rescans all of
+them. This module stores them column-wise instead:
+
+- Partitioned by school_id, so a query only touches one school
+- Ordered by timestamp, so a lookback window is a binary search
+- Fixed-width NumPy columns (int64 timestamps, float64 scores, bool
+  flags), so aggregates are vectorized reductions
+- Strings dictionary-encoded to int32 codes (students, group-by fields)
+
+A summary costs a few dozen bytes instead of a dict per record.
+Free-text fields with unique values per session should not be sent as
+summary fields, since every distinct value is kept in a dictionary.
+"""
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Initial rows per partition; capacity doubles when full
+INITIAL_CAPACITY = 1024
+
+# Code for a missing group-by field (matches the "unknown" group key)
+UNKNOWN_CODE = 0
+UNKNOWN_LABEL = "unknown"
+
+# High-cardinality summary fields never dictionary-encoded as group-by
+# dimensions (students and scores have dedicated columns)
+NON_DIMENSION_FIELDS = frozenset({
+    "session_id",
+    "student_id_hash",
+    "timestamp",
+    "end_risk_score",
+})
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_micros(value: Any) -> int:
+    """Convert a timestamp to int64 microseconds since the Unix epoch.
+
+    Accepts naive UTC datetimes (the service convention), aware datetimes
+    and ISO-8601 strings. Missing timestamps sort before every window.
+    """
+    if value is None:
+        value = datetime.min
+    elif isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+class _Dictionary:
+    """Dense int32 encoding of string values, in first-seen order."""
+
+    def __init__(self, reserve_unknown: bool = False):
+        self._codes: Dict[str, int] = {}
+        self.labels: List[str] = []
+        if reserve_unknown:
+            self.encode(UNKNOWN_LABEL)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def encode(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.labels)
+            self._codes[value] = code
+            self.labels.append(value)
+        return code
+
+
+@dataclass(frozen=True)
+class EncodedSummary:
+    """A summary row as stored: micros timestamp and dictionary codes."""
+    timestamp: int
+    risk_score: float
+    flag: bool
+    student: int
+    dimension_codes: Dict[str, int]
+
+
+@dataclass
+class SummaryWindow:
+    """Array views over one school's summaries inside a time window.
+
+    Views share memory with the store; callers must not modify them.
+
+    Attributes:
+        timestamps: int64 microseconds since epoch, ascending
+        risk_scores: float64 end_risk_score, NaN where missing
+        flags: bool counselor_flag
+        students: int32 student codes
+        dimensions: int32 codes per group-by field present in the school
+    """
+    timestamps: np.ndarray
+    risk_scores: np.ndarray
+    flags: np.ndarray
+    students: np.ndarray
+    dimensions: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+class _SummaryPartition:
+    """Growable column set for one school."""
+
+    def __init__(self):
+        self.size = 0
+        self.capacity = INITIAL_CAPACITY
+        self.timestamps = np.empty(self.capacity, dtype=np.int64)
+        self.risk_scores = np.empty(self.capacity, dtype=np.float64)
+        self.flags = np.empty(self.capacity, dtype=np.bool_)
+        self.students = np.empty(self.capacity, dtype=np.int32)
+        self.dimensions: Dict[str, np.ndarray] = {}
+        self.is_sorted = True
+
+    def _grow(self) -> None:
+        self.capacity *= 2
+        self.timestamps = _resized(self.timestamps, self.capacity)
+        self.risk_scores = _resized(self.risk_scores, self.capacity)
+        self.flags = _resized(self.flags, self.capacity)
+        self.students = _resized(self.students, self.capacity)
+        for name, column in self.dimensions.items():
+            self.dimensions[name] = _resized(column, self.capacity, UNKNOWN_CODE)
+
+    def append(
+        self,
+        timestamp: int,
+        risk_score: float,
+        flag: bool,
+        student: int,
+        dimension_codes: Dict[str, int],
+    ) -> None:
+        if self.size == self.capacity:
+            self._grow()
+
+        row = self.size
+        if row and timestamp < self.timestamps[row - 1]:
+            self.is_sorted = False
+        self.timestamps[row] = timestamp
+        self.risk_scores[row] = risk_score
+        self.flags[row] = flag
+        self.students[row] = student
+
+        for name, code in dimension_codes.items():
+            column = self.dimensions.get(name)
+            if column is None:
+                column = np.full(self.capacity, UNKNOWN_CODE, dtype=np.int32)
+                self.dimensions[name] = column
+            column[row] = code
+        for name, column in self.dimensions.items():
+            if name not in dimension_codes:
+                column[row] = UNKNOWN_CODE
+
+        self.size += 1
+
+    def ensure_sorted(self) -> None:
+        """Restore timestamp order after out-of-order appends."""
+        if self.is_sorted:
+            return
+        order = np.argsort(self.timestamps[:self.size], kind="stable")
+        self.timestamps = _reordered(self.timestamps, order)
+        self.risk_scores = _reordered(self.risk_scores, order)
+        self.flags = _reordered(self.flags, order)
+        self.students = _reordered(self.students, order)
+        for name, column in self.dimensions.items():
+            self.dimensions[name] = _reordered(column, order)
+        self.is_sorted = True
+
+    def window(self, since: int, until: Optional[int] = None) -> SummaryWindow:
+        start = int(np.searchsorted(self.timestamps[:self.size], since, side="left"))
+        stop = self.size
+        if until is not None:
+            stop = int(np.searchsorted(self.timestamps[:self.size], until, side="left"))
+        return SummaryWindow(
+            timestamps=self.timestamps[start:stop],
+            risk_scores=self.risk_scores[start:stop],
+            flags=self.flags[start:stop],
+            students=self.students[start:stop],
+            dimensions={
+                name: column[start:stop]
+                for name, column in self.dimensions.items()
+            },
+        )
+
+    def nbytes(self) -> int:
+        total = (
+            self.timestamps.nbytes + self.risk_scores.nbytes
+            + self.flags.nbytes + self.students.nbytes
+        )
+        return total + sum(column.nbytes for column in self.dimensions.values())
+
+
+def _resized(column: np.ndarray, capacity: int, fill: Any = None) -> np.ndarray:
+    if fill is None:
+        grown = np.empty(capacity, dtype=column.dtype)
+    else:
+        grown = np.full(capacity, fill, dtype=column.dtype)
+    grown[:len(column)] = column
+    return grown
+
+
+def _reordered(column: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Copy of column with its first len(order) rows permuted.
+
+    Sorting into a new buffer keeps previously returned windows intact.
+    """
+    reordered = column.copy()
+    reordered[:len(order)] = column[:len(order)][order]
+    return reordered
+
+
+class ColumnarSummaryStore:
+    """Session summaries in per-school, time-ordered columns.
+
+    Thread-safe for concurrent appends and reads. Windows returned by
+    window() are snapshots: later appends do not change them.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._partitions: Dict[str, _SummaryPartition] = {}
+        self._students = _Dictionary()
+        self._dimensions: Dict[str, _Dictionary] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(p.size for p in self._partitions.values())
+
+    def add(self, summary: Dict[str, Any]) -> EncodedSummary:
+        """Append a session summary.
+
+        Args:
+            summary: Summary dict with school_id, student_id_hash,
+                timestamp, end_risk_score, counselor_flag and any
+                group-by fields (e.g. grade_level)
+
+        Returns:
+            The row as encoded into the columns
+        """
+        risk_score = summary.get("end_risk_score")
+        with self._lock:
+            partition = self._partitions.get(summary.get("school_id"))
+            if partition is None:
+                partition = _SummaryPartition()
+                self._partitions[summary.get("school_id")] = partition
+
+            dimension_codes = {}
+            for name, value in summary.items():
+                if name in NON_DIMENSION_FIELDS:
+                    continue
+                dictionary = self._dimensions.get(name)
+                if dictionary is None:
+                    dictionary = _Dictionary(reserve_unknown=True)
+                    self._dimensions[name] = dictionary
+                dimension_codes[name] = dictionary.encode(str(value))
+
+            row = EncodedSummary(
+                timestamp=to_micros(summary.get("timestamp")),
+                risk_score=np.nan if risk_score is None else float(risk_score),
+                flag=bool(summary.get("counselor_flag", False)),
+                student=self._students.encode(str(summary.get("student_id_hash"))),
+                dimension_codes=dimension_codes,
+            )
+            partition.append(
+                timestamp=row.timestamp,
+                risk_score=row.risk_score,
+                flag=row.flag,
+                student=row.student,
+                dimension_codes=row.dimension_codes,
+            )
+        return row
+
+    def window(
+        self,
+        school_id: str,
+        since: Any,
+        until: Any = None,
+    ) -> Optional[SummaryWindow]:
+        """Summaries for a school with since <= timestamp < until.
+
+        Args:
+            school_id: School identifier
+            since: Inclusive lower bound (datetime or epoch micros)
+            until: Exclusive upper bound (datetime or epoch micros);
+                None for no upper bound
+
+        Returns:
+            SummaryWindow, or None if the school has no summaries
+        """
+        since = since if isinstance(since, int) else to_micros(since)
+        if until is not None and not isinstance(until, int):
+            until = to_micros(until)
+        with self._lock:
+            partition = self._partitions.get(school_id)
+            if partition is None:
+                return None
+            partition.ensure_sorted()
+            return partition.window(since, until)
+
+    def school_ids(self) -> List[str]:
+        """Schools with at least one summary."""
+        with self._lock:
+            return list(self._partitions)
+
+    def dimension_labels(self, name: str) -> List[str]:
+        """Labels for a group-by field's codes (index = code)."""
+        with self._lock:
+            dictionary = self._dimensions.get(name)
+            return list(dictionary.labels) if dictionary else [UNKNOWN_LABEL]
+
+    def group_codes(self, window: SummaryWindow, group_by: str) -> np.ndarray:
+        """Group-by codes for a window; UNKNOWN_CODE where field is absent."""
+        codes = window.dimensions.get(group_by)
+        if codes is None:
+            return np.full(len(window), UNKNOWN_CODE, dtype=np.int32)
+        return codes
+
+    def nbytes(self) -> int:
+        """Approximate bytes held by column buffers."""
+        with self._lock:
+            return sum(p.nbytes() for p in self._partitions.values())
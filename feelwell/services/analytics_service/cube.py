@@ -0,0 +1,334 @@
+"""K-anonymous mood cube over session summaries.
+
+District dashboards slice session summaries by school, grade and week.
+The cube precomputes every rollup of those dimensions once (2^3
+cuboids, "ALL" standing for a rolled-up dimension), so a slice or
+drill-down is a lookup instead of a re-aggregation.
+
+Per ADR-006 every cell is k-anonymous on distinct students:
+- Primary suppression: cells with fewer than k students
+- Complementary suppression: a published parent minus its published
+  children would reveal a lone suppressed child, so a second child
+  (the smallest) is suppressed too; if no sibling can be, the parent is
+  suppressed. Repeated until no rollup relation exposes a cell.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .columnar_store import ColumnarSummaryStore, to_micros
+from .k_anonymity import KAnonymityEnforcer
+
+logger = logging.getLogger(__name__)
+
+
+# Cube dimensions, in key order
+CUBE_DIMENSIONS = ("school_id", "grade_level", "week")
+
+# Key value for a rolled-up dimension
+ALL = "ALL"
+
+MICROS_PER_DAY = 24 * 3600 * 1_000_000
+
+# 1970-01-01 was a Thursday; shifting by 3 days aligns weeks to Monday
+_EPOCH_WEEKDAY_OFFSET = 3
+_EPOCH_DATE = date(1970, 1, 1)
+
+COMPLEMENTARY_REASON = (
+    "Complementary suppression: value would reveal a suppressed cell "
+    "through rollup totals"
+)
+
+CellKey = Tuple[str, str, str]
+
+
+@dataclass
+class CubeCell:
+    """Aggregates for one (school_id, grade_level, week) cell.
+
+    Attributes:
+        key: Dimension values in CUBE_DIMENSIONS order; ALL if rolled up
+        session_count: Sessions in the cell
+        unique_students: Distinct students (the k-anonymity group size)
+        scored_count: Sessions with an end_risk_score
+        risk_sum: Sum of end_risk_score over scored sessions
+        suppressed: True if the cell must not be published
+        suppression_reason: Why the cell is suppressed
+    """
+    key: CellKey
+    session_count: int
+    unique_students: int
+    scored_count: int
+    risk_sum: float
+    suppressed: bool = False
+    suppression_reason: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = dict(zip(CUBE_DIMENSIONS, self.key))
+        result["suppressed"] = self.suppressed
+        if self.suppressed:
+            result["reason"] = self.suppression_reason
+            return result
+        result["session_count"] = self.session_count
+        result["unique_students"] = self.unique_students
+        result["avg_risk_score"] = (
+            round(self.risk_sum / self.scored_count, 3) if self.scored_count else None
+        )
+        return result
+
+
+def cuboid_groupings() -> List[Tuple[str, ...]]:
+    """Every subset of CUBE_DIMENSIONS, in dimension order."""
+    return [
+        grouped
+        for size in range(len(CUBE_DIMENSIONS) + 1)
+        for grouped in combinations(CUBE_DIMENSIONS, size)
+    ]
+
+
+def week_label(week: int) -> str:
+    """ISO date of the Monday starting a week number."""
+    return (_EPOCH_DATE + timedelta(days=week * 7 - _EPOCH_WEEKDAY_OFFSET)).isoformat()
+
+
+def week_of(timestamp: datetime) -> str:
+    """Label of the week containing a timestamp."""
+    day = to_micros(timestamp) // MICROS_PER_DAY
+    return week_label((day + _EPOCH_WEEKDAY_OFFSET) // 7)
+
+
+class MoodCube:
+    """Precomputed k-anonymous rollups of session summaries."""
+
+    def __init__(self, cells: Dict[Tuple[str, ...], Dict[CellKey, CubeCell]]):
+        """Wrap built cuboids; use MoodCube.build to construct.
+
+        Args:
+            cells: Cuboid (tuple of grouped dimensions) -> key -> cell
+        """
+        self._cuboids = cells
+
+    @property
+    def cell_count(self) -> int:
+        return sum(len(cells) for cells in self._cuboids.values())
+
+    @classmethod
+    def build(
+        cls,
+        summaries: ColumnarSummaryStore,
+        since: datetime,
+        k_enforcer: KAnonymityEnforcer,
+    ) -> "MoodCube":
+        """Aggregate summaries with timestamp >= since into all cuboids."""
+        columns = _collect_columns(summaries, since)
+        cuboids = {
+            grouped: _aggregate_cuboid(columns, grouped)
+            for grouped in cuboid_groupings()
+        }
+        return cls.from_cuboids(cuboids, k_enforcer)
+
+    @classmethod
+    def from_cuboids(
+        cls,
+        cuboids: Dict[Tuple[str, ...], Dict[CellKey, CubeCell]],
+        k_enforcer: KAnonymityEnforcer,
+    ) -> "MoodCube":
+        """Apply primary and complementary suppression to aggregated cells.
+
+        Args:
+            cuboids: Unsuppressed cells for every grouping in
+                cuboid_groupings() (aggregated here or by the database)
+            k_enforcer: Supplies the k threshold
+
+        Logs:
+            - MOOD_CUBE_BUILT: Cell and suppression counts
+        """
+        primary = 0
+        for cells in cuboids.values():
+            for cell in cells.values():
+                if cell.unique_students < k_enforcer.k_threshold:
+                    cell.suppressed = True
+                    cell.suppression_reason = (
+                        f"Group size ({cell.unique_students}) below k-anonymity "
+                        f"threshold ({k_enforcer.k_threshold})"
+                    )
+                    primary += 1
+
+        complementary = _complementary_suppression(cuboids)
+
+        total = cuboids[()].get((ALL, ALL, ALL))
+        logger.info(
+            "MOOD_CUBE_BUILT",
+            extra={
+                "sessions": total.session_count if total else 0,
+                "cells": sum(len(c) for c in cuboids.values()),
+                "primary_suppressed": primary,
+                "complementary_suppressed": complementary,
+                "k_threshold": k_enforcer.k_threshold,
+            }
+        )
+        return cls(cuboids)
+
+    def slice(
+        self,
+        group_by: Sequence[str],
+        filters: Optional[Dict[str, str]] = None,
+    ) -> List[CubeCell]:
+        """Cells grouped by some dimensions, with others fixed or rolled up.
+
+        Drill down by adding a dimension to group_by while filtering on
+        the parent cell's values.
+
+        Args:
+            group_by: Dimensions to break out
+            filters: Dimension -> value; filtered dimensions are grouped
+                implicitly so the filter applies to their cells
+
+        Returns:
+            Matching cells sorted by key
+
+        Raises:
+            ValueError: If a dimension is not in CUBE_DIMENSIONS
+        """
+        filters = filters or {}
+        unknown = (set(group_by) | set(filters)) - set(CUBE_DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown cube dimensions: {sorted(unknown)}")
+
+        grouped = tuple(d for d in CUBE_DIMENSIONS if d in group_by or d in filters)
+        positions = {d: CUBE_DIMENSIONS.index(d) for d in filters}
+        return [
+            cell
+            for key, cell in sorted(self._cuboids[grouped].items())
+            if all(key[positions[d]] == str(v) for d, v in filters.items())
+        ]
+
+
+def _collect_columns(summaries: ColumnarSummaryStore, since: datetime) -> Dict[str, np.ndarray]:
+    """Concatenate per-school windows into label columns."""
+    schools, grades, weeks, students, scores = [], [], [], [], []
+    grade_labels = np.array(summaries.dimension_labels("grade_level"), dtype=object)
+    for school_id in summaries.school_ids():
+        window = summaries.window(school_id, since)
+        if window is None or len(window) == 0:
+            continue
+        days = window.timestamps // MICROS_PER_DAY
+        schools.append(np.full(len(window), str(school_id), dtype=object))
+        grades.append(grade_labels[summaries.group_codes(window, "grade_level")])
+        weeks.append((days + _EPOCH_WEEKDAY_OFFSET) // 7)
+        students.append(window.students)
+        scores.append(window.risk_scores)
+
+    if not students:
+        empty = np.empty(0, dtype=object)
+        return {
+            "school_id": empty, "grade_level": empty, "week": empty,
+            "student": np.empty(0, dtype=np.int32), "score": np.empty(0),
+        }
+
+    week_numbers = np.concatenate(weeks)
+    unique_weeks, week_codes = np.unique(week_numbers, return_inverse=True)
+    week_labels = np.array([week_label(int(w)) for w in unique_weeks], dtype=object)
+    return {
+        "school_id": np.concatenate(schools),
+        "grade_level": np.concatenate(grades),
+        "week": week_labels[week_codes],
+        "student": np.concatenate(students),
+        "score": np.concatenate(scores),
+    }
+
+
+def _aggregate_cuboid(
+    columns: Dict[str, np.ndarray],
+    grouped: Tuple[str, ...],
+) -> Dict[CellKey, CubeCell]:
+    rows = len(columns["student"])
+    if rows == 0:
+        return {}
+
+    # Encode the grouped label columns to one integer key per row
+    key_codes = np.zeros(rows, dtype=np.int64)
+    key_labels: List[np.ndarray] = []
+    for dimension in grouped:
+        labels, codes = np.unique(columns[dimension], return_inverse=True)
+        key_codes = key_codes * len(labels) + codes
+        key_labels.append(labels)
+    cell_ids, row_cells = np.unique(key_codes, return_inverse=True)
+
+    scores = columns["score"]
+    scored = ~np.isnan(scores)
+    cell_count = len(cell_ids)
+    sessions = np.bincount(row_cells, minlength=cell_count)
+    scored_counts = np.bincount(row_cells[scored], minlength=cell_count)
+    risk_sums = np.bincount(row_cells[scored], weights=scores[scored], minlength=cell_count)
+
+    # Distinct (cell, student) pairs, counted per cell
+    student_span = int(columns["student"].max()) + 1
+    pairs = np.unique(row_cells.astype(np.int64) * student_span + columns["student"])
+    students = np.bincount(pairs // student_span, minlength=cell_count)
+
+    cells: Dict[CellKey, CubeCell] = {}
+    for cell_index, cell_id in enumerate(cell_ids):
+        values = {}
+        remainder = int(cell_id)
+        for dimension, labels in zip(reversed(grouped), reversed(key_labels)):
+            remainder, code = divmod(remainder, len(labels))
+            values[dimension] = str(labels[code])
+        key = tuple(values.get(d, ALL) for d in CUBE_DIMENSIONS)
+        cells[key] = CubeCell(
+            key=key,
+            session_count=int(sessions[cell_index]),
+            unique_students=int(students[cell_index]),
+            scored_count=int(scored_counts[cell_index]),
+            risk_sum=float(risk_sums[cell_index]),
+        )
+    return cells
+
+
+def _complementary_suppression(
+    cuboids: Dict[Tuple[str, ...], Dict[CellKey, CubeCell]],
+) -> int:
+    """Suppress extra cells until no rollup exposes a suppressed cell.
+
+    For every dimension d and every published parent cell (d = ALL), the
+    children along d must not contain exactly one suppressed cell.
+
+    Returns:
+        Number of cells suppressed by this pass
+    """
+    # (parent cell, children) for every rollup relation in the cube
+    relations: List[Tuple[CubeCell, List[CubeCell]]] = []
+    for grouped, cells in cuboids.items():
+        for dimension in grouped:
+            position = CUBE_DIMENSIONS.index(dimension)
+            parent_cells = cuboids[tuple(d for d in grouped if d != dimension)]
+            children: Dict[CellKey, List[CubeCell]] = {}
+            for key, cell in cells.items():
+                parent_key = key[:position] + (ALL,) + key[position + 1:]
+                children.setdefault(parent_key, []).append(cell)
+            for parent_key, siblings in children.items():
+                relations.append((parent_cells[parent_key], siblings))
+
+    suppressed = 0
+    changed = True
+    while changed:
+        changed = False
+        for parent, siblings in relations:
+            if parent.suppressed:
+                continue
+            hidden = [c for c in siblings if c.suppressed]
+            if len(hidden) != 1:
+                continue
+            visible = [c for c in siblings if not c.suppressed]
+            target = parent
+            if visible:
+                target = min(visible, key=lambda c: (c.session_count, c.key))
+            target.suppressed = True
+            target.suppression_reason = COMPLEMENTARY_REASON
+            suppressed += 1
+            changed = True
+    return suppressed
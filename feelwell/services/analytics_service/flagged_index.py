@@ -0,0 +1,161 @@
+"""Top-K index over flagged sessions.
+
+Counselors ask for "the N riskiest flagged sessions in the last D days".
+Flagged sessions are bucketed per school and per day of session_end; each
+bucket is kept sorted by (risk descending, session_end descending). A
+query k-way merges the D buckets with a heap and stops after N sessions,
+so it costs O(D + N log D) instead of filtering and sorting every
+flagged session. Only the oldest bucket, which the cutoff may split,
+is filtered by time.
+
+Buckets older than the maximum lookback are evicted; they can never be
+returned again.
+"""
+import bisect
+import heapq
+import itertools
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from .columnar_store import to_micros
+
+if TYPE_CHECKING:
+    from .handler import FlaggedSession
+
+logger = logging.getLogger(__name__)
+
+
+MICROS_PER_DAY = 24 * 3600 * 1_000_000
+
+# (-risk, -session_end micros, insertion sequence, session); the sequence
+# keeps comparisons away from the session object
+_RankedEntry = Tuple[float, int, int, "FlaggedSession"]
+
+
+class _DayBucket:
+    """Flagged sessions of one school and day."""
+
+    __slots__ = ("by_risk", "session_ends")
+
+    def __init__(self):
+        self.by_risk: List[_RankedEntry] = []
+        self.session_ends: List[int] = []
+
+
+class FlaggedSessionIndex:
+    """Per-school top-K index on (end_risk_score, session_end)."""
+
+    def __init__(self, max_lookback_days: int):
+        """Initialize an empty index.
+
+        Args:
+            max_lookback_days: Longest window served; older sessions
+                are evicted
+        """
+        self._max_lookback_days = max_lookback_days
+        self._schools: Dict[str, Dict[int, _DayBucket]] = {}
+        self._sequence = itertools.count()
+        self._swept_horizon: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(
+                len(bucket.session_ends)
+                for days in self._schools.values()
+                for bucket in days.values()
+            )
+
+    def _horizon_day(self, now: datetime) -> int:
+        return to_micros(now - timedelta(days=self._max_lookback_days)) // MICROS_PER_DAY
+
+    def add(self, session: "FlaggedSession", now: Optional[datetime] = None) -> None:
+        """Index a flagged session.
+
+        Args:
+            session: FlaggedSession to add
+            now: Current time for eviction (defaults to utcnow)
+        """
+        session_end = to_micros(session.session_end)
+        day = session_end // MICROS_PER_DAY
+        entry = (-float(session.end_risk_score), -session_end, next(self._sequence), session)
+
+        now = now or datetime.utcnow()
+        with self._lock:
+            self._evict_expired(now)
+            if day < self._horizon_day(now):
+                return
+
+            days = self._schools.setdefault(session.school_id, {})
+            bucket = days.get(day)
+            if bucket is None:
+                bucket = _DayBucket()
+                days[day] = bucket
+            bisect.insort(bucket.by_risk, entry)
+            bisect.insort(bucket.session_ends, session_end)
+
+    def _evict_expired(self, now: datetime) -> None:
+        horizon = self._horizon_day(now)
+        # Buckets only expire when the horizon crosses a day boundary
+        if self._swept_horizon is not None and horizon <= self._swept_horizon:
+            return
+        self._swept_horizon = horizon
+        evicted = 0
+        for days in self._schools.values():
+            for day in [d for d in days if d < horizon]:
+                evicted += len(days.pop(day).session_ends)
+        if evicted:
+            logger.info(
+                "FLAGGED_SESSIONS_EVICTED",
+                extra={"evicted": evicted, "max_lookback_days": self._max_lookback_days}
+            )
+
+    def top_by_risk(
+        self,
+        school_id: str,
+        since: datetime,
+        limit: int,
+        now: Optional[datetime] = None,
+    ) -> Tuple[int, List["FlaggedSession"]]:
+        """Highest-risk sessions for a school with session_end >= since.
+
+        Windows reaching past the maximum lookback only see retained
+        sessions.
+
+        Args:
+            school_id: School identifier
+            since: Earliest session_end to include
+            limit: Maximum sessions to return
+            now: Current time for eviction (defaults to utcnow)
+
+        Returns:
+            Tuple of (total sessions in window, up to limit sessions
+            ordered by risk descending, ties most recent first)
+        """
+        since_micros = to_micros(since)
+        first_day = since_micros // MICROS_PER_DAY
+
+        with self._lock:
+            self._evict_expired(now or datetime.utcnow())
+            days = self._schools.get(school_id, {})
+
+            total = 0
+            runs: List[Iterator[_RankedEntry]] = []
+            for day in sorted(d for d in days if d >= first_day):
+                bucket = days[day]
+                if day == first_day:
+                    start = bisect.bisect_left(bucket.session_ends, since_micros)
+                    total += len(bucket.session_ends) - start
+                    runs.append(e for e in bucket.by_risk if -e[1] >= since_micros)
+                else:
+                    total += len(bucket.session_ends)
+                    runs.append(iter(bucket.by_risk))
+
+            top = [
+                entry[3]
+                for entry in itertools.islice(heapq.merge(*runs), max(limit, 0))
+            ]
+
+        return total, top
@@ -9,17 +9,26 @@ Endpoints:
 - GET /flagged-sessions - Get sessions flagged for counselor review
 - GET /mood-trends - Aggregate mood trends by time period
 - GET /school-overview - School-level risk overview
+- GET /mood-cube - District drill-down by school, grade and week
 """
 import json
 import logging
 import os
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from flask import Flask, request, jsonify
+from typing import Any, Dict, List, Optional, Tuple
 
+from flask import Flask, Response, request, jsonify
+
+from feelwell.shared.database import get_connection_manager
 from feelwell.shared.utils import hash_pii
+from .analytics_repository import AnalyticsRepository, SchoolTotals
+from .columnar_store import ColumnarSummaryStore
+from .cube import CUBE_DIMENSIONS, MoodCube, week_of
+from .flagged_index import FlaggedSessionIndex
 from .k_anonymity import KAnonymityEnforcer, AggregateResult
+from .result_cache import DEFAULT_TTL_SECONDS, ResultCache
+from .rolling_aggregates import DEFAULT_EXACT_DISTINCT_CAP, RollingAggregates
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +56,18 @@ class AnalyticsConfig:
     k_anonymity_threshold: int = 5
     default_lookback_days: int = 7
     max_lookback_days: int = 90
+    exact_distinct_cap: int = DEFAULT_EXACT_DISTINCT_CAP
+    result_cache_ttl_seconds: float = DEFAULT_TTL_SECONDS
+    storage_backend: str = "memory"  # "memory" or "postgres"
+    
+    @classmethod
+    def from_env(cls) -> "AnalyticsConfig":
+        """Create config from environment variables.
+        
+        Environment variables:
+            ANALYTICS_STORAGE_BACKEND: memory (default) or postgres
+        """
+        return cls(storage_backend=os.getenv("ANALYTICS_STORAGE_BACKEND", "memory"))
 
 
 class AnalyticsHandler:
@@ -56,27 +77,57 @@ class AnalyticsHandler:
         self,
         config: Optional[AnalyticsConfig] = None,
         k_enforcer: Optional[KAnonymityEnforcer] = None,
+        repository: Optional[AnalyticsRepository] = None,
     ):
         """Initialize handler with dependencies.
         
         Args:
             config: Analytics configuration
             k_enforcer: K-anonymity enforcer (injected for testing)
+            repository: PostgreSQL storage; None keeps data in memory
         """
         self.config = config or AnalyticsConfig()
         self.k_enforcer = k_enforcer or KAnonymityEnforcer(
             k_threshold=self.config.k_anonymity_threshold
         )
         
-        # In-memory storage for prototype (replace with DB in production)
-        self._flagged_sessions: List[FlaggedSession] = []
-        self._session_summaries: List[Dict[str, Any]] = []
+        # PostgreSQL when a repository is given; aggregation runs in SQL
+        self.repository = repository
+        
+        # In-memory columnar storage otherwise (development, single process)
+        self._flagged_sessions = FlaggedSessionIndex(
+            max_lookback_days=self.config.max_lookback_days
+        )
+        self._session_summaries = ColumnarSummaryStore()
+        
+        # Serialized endpoint results, invalidated per school on writes.
+        # With PostgreSQL other processes write too, so versions come
+        # from the shared per-school counter (one indexed read per lookup)
+        self.result_cache = ResultCache(
+            ttl_seconds=self.config.result_cache_ttl_seconds,
+            version_source=repository.school_version if repository is not None else None,
+        )
+        
+        # Built on demand per weeks value; rebuilt after new summaries
+        self._summary_version = 0
+        self._cubes: Dict[int, Tuple[int, MoodCube]] = {}
+        
+        # Day buckets updated on insert; the cap never drops below k so
+        # distinct-student counts near the threshold are always exact
+        self._daily_aggregates = RollingAggregates(
+            self._session_summaries,
+            distinct_cap=max(
+                self.config.exact_distinct_cap,
+                self.config.k_anonymity_threshold,
+            ),
+        )
         
         logger.info(
             "ANALYTICS_HANDLER_INITIALIZED",
             extra={
                 "k_threshold": self.config.k_anonymity_threshold,
                 "default_lookback_days": self.config.default_lookback_days,
+                "storage_backend": "postgres" if repository else "memory",
             }
         )
     
@@ -86,7 +137,11 @@ class AnalyticsHandler:
         Args:
             session: FlaggedSession to add
         """
-        self._flagged_sessions.append(session)
+        if self.repository is not None:
+            self.repository.add_flagged_session(session)
+        else:
+            self._flagged_sessions.add(session)
+        self.result_cache.invalidate(session.school_id)
         logger.info(
             "FLAGGED_SESSION_ADDED",
             extra={
@@ -103,7 +158,13 @@ class AnalyticsHandler:
         Args:
             summary: Session summary dictionary
         """
-        self._session_summaries.append(summary)
+        if self.repository is not None:
+            self.repository.add_session_summary(summary)
+        else:
+            row = self._session_summaries.add(summary)
+            self._daily_aggregates.add(summary.get("school_id"), row)
+        self._summary_version += 1
+        self.result_cache.invalidate(summary.get("school_id"))
     
     def get_flagged_sessions(
         self,
@@ -123,24 +184,25 @@ class AnalyticsHandler:
         """
         cutoff = datetime.utcnow() - timedelta(days=days)
         
-        # Filter sessions for school and time period
-        filtered = [
-            s for s in self._flagged_sessions
-            if s.school_id == school_id and s.session_end >= cutoff
-        ]
-        
-        # Sort by risk score descending
-        filtered.sort(key=lambda s: s.end_risk_score, reverse=True)
-        
-        # Apply limit
-        limited = filtered[:limit]
+        if self.repository is not None:
+            # Same retention as the in-memory index
+            horizon = datetime.utcnow() - timedelta(days=self.config.max_lookback_days)
+            total_found, rows = self.repository.top_flagged(
+                school_id, max(cutoff, horizon), limit
+            )
+            limited = [FlaggedSession(*row) for row in rows]
+        else:
+            # Heap merge of per-day risk-sorted buckets; stops after limit
+            total_found, limited = self._flagged_sessions.top_by_risk(
+                school_id, cutoff, limit
+            )
         
         logger.info(
             "FLAGGED_SESSIONS_RETRIEVED",
             extra={
                 "school_id": school_id,
                 "days": days,
-                "total_found": len(filtered),
+                "total_found": total_found,
                 "returned": len(limited),
             }
         )
@@ -148,7 +210,7 @@ class AnalyticsHandler:
         return {
             "school_id": school_id,
             "period_days": days,
-            "total_flagged": len(filtered),
+            "total_flagged": total_found,
             "sessions": [
                 {
                     "session_id": s.session_id,
@@ -183,20 +245,8 @@ class AnalyticsHandler:
         """
         cutoff = datetime.utcnow() - timedelta(days=days)
         
-        # Filter summaries for school and time period
-        filtered = [
-            s for s in self._session_summaries
-            if s.get("school_id") == school_id
-            and s.get("timestamp", datetime.min) >= cutoff
-        ]
-        
         # Aggregate with k-anonymity
-        results = self.k_enforcer.aggregate_with_anonymity(
-            records=filtered,
-            group_by=group_by,
-            aggregate_field="end_risk_score",
-            aggregation="avg",
-        )
+        results = self._aggregate_risk_by(school_id, cutoff, group_by)
         
         # Format response
         trends = {}
@@ -232,6 +282,44 @@ class AnalyticsHandler:
             "trends": trends,
         }
     
+    def _aggregate_risk_by(
+        self,
+        school_id: str,
+        cutoff: datetime,
+        group_by: str,
+    ) -> Dict[str, AggregateResult]:
+        """Average end_risk_score per group with k-anonymity.
+        
+        Merges the school's day buckets for the window, or groups in SQL
+        with averages of groups below k nulled in the database. Sessions
+        without a risk score do not count toward a group.
+        
+        Args:
+            school_id: School identifier
+            cutoff: Earliest summary timestamp to include
+            group_by: Summary field to group by
+            
+        Returns:
+            Dictionary mapping group values to AggregateResult
+        """
+        if self.repository is not None:
+            groups = self.repository.risk_by_group(
+                school_id, cutoff, group_by, self.config.k_anonymity_threshold
+            )
+        else:
+            aggregate = self._daily_aggregates.window(school_id, cutoff)
+            labels = self._session_summaries.dimension_labels(group_by)
+            groups = {
+                labels[code]: (total / group_size, group_size)
+                for code, (group_size, total) in aggregate.group_totals(group_by).items()
+                if group_size > 0
+            }
+        
+        return self.k_enforcer.suppress_groups(
+            groups,
+            context=f"avg(end_risk_score) by {group_by}",
+        )
+    
     def get_school_overview(self, school_id: str, days: int = 7) -> Dict[str, Any]:
         """Get school-level risk overview with k-anonymity.
         
@@ -244,25 +332,16 @@ class AnalyticsHandler:
         """
         cutoff = datetime.utcnow() - timedelta(days=days)
         
-        # Filter summaries for school
-        filtered = [
-            s for s in self._session_summaries
-            if s.get("school_id") == school_id
-            and s.get("timestamp", datetime.min) >= cutoff
-        ]
-        
-        # Count unique students
-        unique_students = set(s.get("student_id_hash") for s in filtered)
-        student_count = len(unique_students)
+        totals = self._school_totals(school_id, cutoff)
+        session_count = totals.session_count
+        student_count = totals.unique_students
         
         # Check k-anonymity for school-level stats
         result = self.k_enforcer.check_and_suppress(
             data={
-                "total_sessions": len(filtered),
+                "total_sessions": session_count,
                 "unique_students": student_count,
-                "flagged_sessions": sum(
-                    1 for s in filtered if s.get("counselor_flag", False)
-                ),
+                "flagged_sessions": totals.flagged_count,
             },
             group_size=student_count,
             context=f"school_overview:{school_id}",
@@ -284,13 +363,9 @@ class AnalyticsHandler:
                 "reason": result.suppression_reason,
             }
         
-        # Calculate risk distribution
-        risk_scores = [s.get("end_risk_score", 0) for s in filtered]
-        avg_risk = sum(risk_scores) / len(risk_scores) if risk_scores else 0
-        
-        high_risk_count = sum(1 for r in risk_scores if r >= 0.7)
-        medium_risk_count = sum(1 for r in risk_scores if 0.4 <= r < 0.7)
-        low_risk_count = sum(1 for r in risk_scores if r < 0.4)
+        # Calculate risk distribution (missing scores count as 0)
+        avg_risk = totals.risk_sum / session_count if session_count else 0
+        low_risk_count, medium_risk_count, high_risk_count = totals.risk_histogram
         
         logger.info(
             "SCHOOL_OVERVIEW_RETRIEVED",
@@ -298,7 +373,7 @@ class AnalyticsHandler:
                 "school_id": school_id,
                 "days": days,
                 "student_count": student_count,
-                "session_count": len(filtered),
+                "session_count": session_count,
             }
         )
         
@@ -307,8 +382,9 @@ class AnalyticsHandler:
             "period_days": days,
             "suppressed": False,
             "overview": {
-                "total_sessions": len(filtered),
+                "total_sessions": session_count,
                 "unique_students": student_count,
+                "unique_students_exact": totals.unique_students_exact,
                 "flagged_sessions": result.data["flagged_sessions"],
                 "avg_risk_score": round(avg_risk, 3),
                 "risk_distribution": {
@@ -318,6 +394,98 @@ class AnalyticsHandler:
                 },
             },
         }
+    
+    def _school_totals(self, school_id: str, cutoff: datetime) -> SchoolTotals:
+        """School-level aggregates for the overview.
+        
+        Args:
+            school_id: School identifier
+            cutoff: Earliest summary timestamp to include
+            
+        Returns:
+            SchoolTotals (from SQL, or merged day buckets in memory)
+        """
+        if self.repository is not None:
+            return self.repository.school_totals(
+                school_id, cutoff, self.config.k_anonymity_threshold
+            )
+        
+        aggregate = self._daily_aggregates.window(school_id, cutoff)
+        return SchoolTotals(
+            # Exact whenever it is near k
+            unique_students=aggregate.students.count(),
+            unique_students_exact=aggregate.students.is_exact,
+            session_count=aggregate.session_count,
+            flagged_count=aggregate.flagged_count,
+            risk_sum=aggregate.risk_sum,
+            risk_histogram=list(aggregate.risk_histogram),
+        )
+    
+    def get_mood_cube(
+        self,
+        group_by: List[str],
+        filters: Optional[Dict[str, str]] = None,
+        weeks: int = 4,
+    ) -> Dict[str, Any]:
+        """Slice the k-anonymous school x grade x week cube.
+        
+        Every cell of the cube is checked against k, with complementary
+        suppression so rollup totals cannot reveal a suppressed cell.
+        
+        Args:
+            group_by: Dimensions to break out (school_id, grade_level, week)
+            filters: Dimension values to drill into
+            weeks: Calendar weeks covered, including the current one
+            
+        Returns:
+            Dictionary with cells (suppressed if k < 5)
+            
+        Raises:
+            ValueError: If a dimension is not a cube dimension
+        """
+        weeks = max(1, min(weeks, self.config.max_lookback_days // 7))
+        cube = self._mood_cube(weeks)
+        cells = cube.slice(group_by, filters)
+        
+        logger.info(
+            "MOOD_CUBE_RETRIEVED",
+            extra={
+                "group_by": list(group_by),
+                "filters": sorted(filters or {}),
+                "weeks": weeks,
+                "cells_returned": len(cells),
+            }
+        )
+        
+        return {
+            "group_by": [d for d in CUBE_DIMENSIONS if d in group_by],
+            "filters": dict(filters or {}),
+            "period_weeks": weeks,
+            "k_anonymity_threshold": self.config.k_anonymity_threshold,
+            "cells": [cell.to_dict() for cell in cells],
+        }
+    
+    def _mood_cube(self, weeks: int) -> MoodCube:
+        """Cube over whole weeks, rebuilt only after new summaries.
+        
+        With PostgreSQL the cube is aggregated in one GROUP BY CUBE query
+        on every call, since other processes may have written.
+        """
+        current_week = datetime.fromisoformat(week_of(datetime.utcnow()))
+        since = current_week - timedelta(weeks=weeks - 1)
+        if self.repository is not None:
+            return MoodCube.from_cuboids(
+                self.repository.cube_cells(since), self.k_enforcer
+            )
+        
+        version = self._summary_version
+        cached = self._cubes.get(weeks)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        cube = MoodCube.build(self._session_summaries, since, self.k_enforcer)
+        self._cubes[weeks] = (version, cube)
+        return cube
 
 
 # Global handler instance
@@ -328,7 +496,12 @@ def get_handler() -> AnalyticsHandler:
     """Get or create the global handler instance."""
     global _handler
     if _handler is None:
-        _handler = AnalyticsHandler()
+        config = AnalyticsConfig.from_env()
+        repository = None
+        if config.storage_backend == "postgres":
+            repository = AnalyticsRepository(get_connection_manager())
+            repository.ensure_schema()
+        _handler = AnalyticsHandler(config=config, repository=repository)
     return _handler
 
 
@@ -338,11 +511,50 @@ def set_handler(handler: AnalyticsHandler) -> None:
     _handler = handler
 
 
+def _cached_json(
+    endpoint: str,
+    school_id: str,
+    params: Dict[str, Any],
+    compute,
+) -> Response:
+    """Serve a result from the handler's cache with ETag revalidation.
+    
+    Args:
+        endpoint: Endpoint name for the cache key
+        school_id: School the result belongs to
+        params: Other query parameters for the cache key
+        compute: Callable returning the result dict on a miss
+        
+    Returns:
+        200 with the JSON body, or 304 if If-None-Match matches
+    """
+    cache = get_handler().result_cache
+    entry = cache.get_or_compute(
+        endpoint,
+        school_id,
+        params,
+        lambda: app.json.dumps(compute()).encode("utf-8"),
+    )
+    
+    if request.if_none_match.contains(entry.etag):
+        cache.record_not_modified()
+        response = Response(status=304)
+    else:
+        response = Response(entry.body, mimetype=app.json.mimetype)
+    response.set_etag(entry.etag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
 # Flask routes
 @app.route("/health", methods=["GET"])
 def health():
     """Health check endpoint."""
-    return jsonify({"status": "healthy", "service": "analytics-service"})
+    return jsonify({
+        "status": "healthy",
+        "service": "analytics-service",
+        "result_cache": get_handler().result_cache.stats.to_dict(),
+    })
 
 
 @app.route("/ready", methods=["GET"])
@@ -367,10 +579,12 @@ def flagged_sessions():
     days = int(request.args.get("days", 7))
     limit = int(request.args.get("limit", 50))
     
-    handler = get_handler()
-    result = handler.get_flagged_sessions(school_id, days, limit)
-    
-    return jsonify(result)
+    return _cached_json(
+        "flagged-sessions",
+        school_id,
+        {"days": days, "limit": limit},
+        lambda: get_handler().get_flagged_sessions(school_id, days, limit),
+    )
 
 
 @app.route("/mood-trends", methods=["GET"])
@@ -389,10 +603,12 @@ def mood_trends():
     group_by = request.args.get("group_by", "grade_level")
     days = int(request.args.get("days", 7))
     
-    handler = get_handler()
-    result = handler.get_mood_trends(school_id, group_by, days)
-    
-    return jsonify(result)
+    return _cached_json(
+        "mood-trends",
+        school_id,
+        {"group_by": group_by, "days": days},
+        lambda: get_handler().get_mood_trends(school_id, group_by, days),
+    )
 
 
 @app.route("/school-overview", methods=["GET"])
@@ -409,8 +625,32 @@ def school_overview():
     
     days = int(request.args.get("days", 7))
     
+    return _cached_json(
+        "school-overview",
+        school_id,
+        {"days": days},
+        lambda: get_handler().get_school_overview(school_id, days),
+    )
+
+
+@app.route("/mood-cube", methods=["GET"])
+def mood_cube():
+    """Drill down into k-anonymous mood aggregates.
+    
+    Query params:
+        group_by: Optional - Comma-separated dimensions (default school_id)
+        school_id, grade_level, week: Optional - Drill-down filters
+        weeks: Optional - Calendar weeks covered (default 4)
+    """
+    group_by = [d for d in request.args.get("group_by", "school_id").split(",") if d]
+    filters = {d: request.args[d] for d in CUBE_DIMENSIONS if d in request.args}
+    weeks = int(request.args.get("weeks", 4))
+    
     handler = get_handler()
-    result = handler.get_school_overview(school_id, days)
+    try:
+        result = handler.get_mood_cube(group_by, filters, weeks)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     
     return jsonify(result)
 
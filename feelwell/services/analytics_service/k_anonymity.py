@@ -5,13 +5,18 @@ individual student data from aggregated reports.
 """
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, TypeVar, Generic
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Generic
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 # Minimum group size for k-anonymity
 K_ANONYMITY_THRESHOLD = 5
 
+# Supported aggregation types
+AGGREGATIONS = ("avg", "count", "sum", "median", "percentile", "stddev")
+
 T = TypeVar('T')
 
 
@@ -105,55 +110,186 @@ class KAnonymityEnforcer:
             suppressed=False,
         )
     
+    def suppress_groups(
+        self,
+        groups: Dict[str, Tuple[Any, int]],
+        context: Optional[str] = None,
+    ) -> Dict[str, AggregateResult]:
+        """Apply k-anonymity to many groups at once.
+        
+        Same decision as check_and_suppress per group, but emits a single
+        summary log for the whole call instead of one per group.
+        
+        Args:
+            groups: Group key -> (aggregated data, group size)
+            context: Description of the query for logging
+            
+        Returns:
+            Dictionary mapping group keys to AggregateResult
+            
+        Logs:
+            - K_ANONYMITY_GROUPS_CHECKED: Group and suppression counts
+        """
+        results: Dict[str, AggregateResult] = {}
+        suppressed = 0
+        for key, (data, group_size) in groups.items():
+            if group_size < self.k_threshold:
+                suppressed += 1
+                results[key] = AggregateResult(
+                    data=None,
+                    group_size=group_size,
+                    suppressed=True,
+                    suppression_reason=(
+                        f"Group size ({group_size}) below k-anonymity "
+                        f"threshold ({self.k_threshold})"
+                    ),
+                )
+            else:
+                results[key] = AggregateResult(
+                    data=data,
+                    group_size=group_size,
+                    suppressed=False,
+                )
+        
+        log = logger.warning if suppressed else logger.info
+        log(
+            "K_ANONYMITY_GROUPS_CHECKED",
+            extra={
+                "groups": len(results),
+                "suppressed_groups": suppressed,
+                "k_threshold": self.k_threshold,
+                "context": context,
+            }
+        )
+        return results
+    
     def aggregate_with_anonymity(
         self,
         records: List[Dict[str, Any]],
         group_by: str,
         aggregate_field: str,
         aggregation: str = "avg",
+        percentile: float = 50.0,
     ) -> Dict[str, AggregateResult]:
         """Aggregate records with k-anonymity enforcement.
         
+        Records are extracted into columns in one pass and aggregated with
+        aggregate_columns. Records without the aggregate field are skipped.
+        
         Args:
             records: List of records to aggregate
             group_by: Field to group by (e.g., "grade_level")
             aggregate_field: Field to aggregate (e.g., "risk_score")
-            aggregation: Aggregation type ("avg", "count", "sum")
+            aggregation: Aggregation type (one of AGGREGATIONS)
+            percentile: Percentile (0-100) for "percentile" aggregation
             
         Returns:
-            Dictionary mapping group values to AggregateResult
+            Dictionary mapping group values to AggregateResult, in
+            first-seen group order
         """
-        # Group records
-        groups: Dict[str, List[float]] = {}
+        # Dictionary-encode group keys in first-seen order
+        key_codes: Dict[str, int] = {}
+        codes: List[int] = []
+        values: List[float] = []
         for record in records:
-            key = str(record.get(group_by, "unknown"))
             value = record.get(aggregate_field)
             if value is not None:
-                if key not in groups:
-                    groups[key] = []
-                groups[key].append(float(value))
+                key = str(record.get(group_by, "unknown"))
+                codes.append(key_codes.setdefault(key, len(key_codes)))
+                values.append(float(value))
         
-        # Aggregate with k-anonymity check
-        results: Dict[str, AggregateResult] = {}
-        for key, values in groups.items():
-            group_size = len(values)
-            
-            if aggregation == "avg":
-                agg_value = sum(values) / len(values) if values else 0
-            elif aggregation == "count":
-                agg_value = len(values)
-            elif aggregation == "sum":
-                agg_value = sum(values)
-            else:
-                agg_value = sum(values) / len(values) if values else 0
+        return self.aggregate_columns(
+            codes=np.asarray(codes, dtype=np.int64),
+            values=np.asarray(values, dtype=np.float64),
+            labels=list(key_codes),
+            aggregation=aggregation,
+            percentile=percentile,
+            context=f"{aggregation}({aggregate_field}) by {group_by}",
+        )
+    
+    def aggregate_columns(
+        self,
+        codes: np.ndarray,
+        values: np.ndarray,
+        labels: List[str],
+        aggregation: str = "avg",
+        percentile: float = 50.0,
+        context: Optional[str] = None,
+    ) -> Dict[str, AggregateResult]:
+        """Grouped aggregation over columnar input with k-anonymity.
+        
+        Sums accumulate in input order (bincount), so avg/sum equal the
+        sequential Python sums exactly. Group size is the number of
+        values in the group.
+        
+        Args:
+            codes: Group code per value (index into labels)
+            values: float64 values to aggregate
+            labels: Group key for each code
+            aggregation: "avg", "count", "sum", "median", "percentile"
+                or "stddev" (population); unknown types fall back to avg
+            percentile: Percentile (0-100) for "percentile" aggregation
+            context: Description of the query for logging
             
-            results[key] = self.check_and_suppress(
-                data=agg_value,
-                group_size=group_size,
-                context=f"{aggregation}({aggregate_field}) by {group_by}={key}",
-            )
+        Returns:
+            Dictionary mapping group keys to AggregateResult for every
+            group with at least one value, in code order
+        """
+        counts = np.bincount(codes, minlength=len(labels))
+        present = np.flatnonzero(counts)
+        if present.size == 0:
+            return self.suppress_groups({}, context)
         
-        return results
+        sums = np.bincount(codes, weights=values, minlength=len(labels))
+        
+        if aggregation == "count":
+            aggregated = counts
+        elif aggregation == "sum":
+            aggregated = sums
+        elif aggregation == "median":
+            aggregated = _grouped_percentile(codes, values, counts, 50.0)
+        elif aggregation == "percentile":
+            aggregated = _grouped_percentile(codes, values, counts, percentile)
+        elif aggregation == "stddev":
+            means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+            squared = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=len(labels))
+            aggregated = np.sqrt(np.divide(squared, counts, out=np.zeros_like(squared), where=counts > 0))
+        else:
+            aggregated = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+        
+        return self.suppress_groups(
+            {
+                labels[code]: (aggregated[code].item(), int(counts[code]))
+                for code in present
+            },
+            context,
+        )
+
+
+def _grouped_percentile(
+    codes: np.ndarray,
+    values: np.ndarray,
+    counts: np.ndarray,
+    percentile: float,
+) -> np.ndarray:
+    """Per-group percentile with linear interpolation (numpy default).
+    
+    One lexsort orders values within groups; each group's percentile is
+    then read at its offset in the sorted array.
+    """
+    order = np.lexsort((values, codes))
+    ordered = values[order]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    
+    result = np.zeros(len(counts), dtype=np.float64)
+    present = counts > 0
+    position = (percentile / 100.0) * (counts[present] - 1)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    low_values = ordered[starts[present] + lower]
+    high_values = ordered[starts[present] + upper]
+    result[present] = low_values + (high_values - low_values) * (position - lower)
+    return result
 
 
 def enforce_k_anonymity(
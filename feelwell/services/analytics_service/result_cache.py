@@ -0,0 +1,186 @@
+"""Versioned result cache for dashboard endpoints.
+
+Counselor dashboards poll the same endpoints every few seconds, while new
+summaries for a school arrive far less often. Results are cached per
+(endpoint, school_id, params) as serialized JSON together with an ETag:
+
+- Every school has a version, bumped whenever its summaries or flagged
+  sessions change; entries from an older version are never served
+- Versions are kept in process by default. With a shared store written
+  by several worker processes they come from a version_source instead
+  (a per-school counter bumped in the write's transaction), read on
+  every lookup, so no worker serves a result older than the last
+  committed write
+- Entries also expire after a TTL, since lookback windows slide with
+  the clock even when no data arrives
+- A poll presenting the current ETag gets 304 Not Modified without
+  recomputation or re-serialization
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Seconds a cached result stays fresh without invalidation
+DEFAULT_TTL_SECONDS = 30.0
+
+# Entries kept before least-recently-used ones are dropped
+DEFAULT_MAX_ENTRIES = 10_000
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, Hashable], ...]]
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """A serialized endpoint result.
+
+    Attributes:
+        body: JSON response body
+        etag: Strong entity tag for the body
+        version: School version the result was computed at
+        expires_at: Monotonic time after which the entry is stale
+    """
+    body: bytes
+    etag: str
+    version: int
+    expires_at: float
+
+
+@dataclass
+class ResultCacheStats:
+    """Counters for cache effectiveness."""
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class ResultCache:
+    """Per-school versioned cache of serialized endpoint results.
+
+    Thread-safe. Results are computed outside the lock; a result whose
+    school changed while it was computed is returned but not cached
+    (with a version_source it is cached under the version read before
+    computing, which no later lookup matches).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+        version_source: Optional[Callable[[str], int]] = None,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: Freshness of an entry; 0 disables caching
+            max_entries: LRU capacity
+            clock: Monotonic time source (injected for testing)
+            version_source: Returns a school's current version from
+                shared storage; None keeps versions in process, bumped
+                by invalidate()
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._version_source = version_source
+        self._entries: "OrderedDict[CacheKey, CachedResult]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._stats = ResultCacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> ResultCacheStats:
+        with self._lock:
+            return ResultCacheStats(**vars(self._stats))
+
+    def invalidate(self, school_id: str) -> None:
+        """Mark every cached result for a school as stale.
+
+        Only needed for in-process versions; a version_source already
+        reflects the write.
+        """
+        with self._lock:
+            self._versions[school_id] = self._versions.get(school_id, 0) + 1
+            self._stats.invalidations += 1
+
+    def get_or_compute(
+        self,
+        endpoint: str,
+        school_id: str,
+        params: Dict[str, Hashable],
+        compute: Callable[[], bytes],
+    ) -> CachedResult:
+        """Return the cached result, computing and storing it on a miss.
+
+        Args:
+            endpoint: Endpoint name
+            school_id: School the result belongs to
+            params: Remaining query parameters
+            compute: Produces the serialized JSON body
+
+        Returns:
+            CachedResult for the current school version
+        """
+        key = (endpoint, school_id, tuple(sorted(params.items())))
+        shared_version = (
+            self._version_source(school_id) if self._version_source is not None else None
+        )
+        with self._lock:
+            version = self._current_version(school_id, shared_version)
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.version == version
+                and entry.expires_at > self._clock()
+            ):
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry
+            self._stats.misses += 1
+
+        body = compute()
+        entry = CachedResult(
+            body=body,
+            etag=hashlib.sha256(body).hexdigest()[:32],
+            version=version,
+            expires_at=self._clock() + self.ttl_seconds,
+        )
+
+        with self._lock:
+            if self.ttl_seconds > 0 and self._current_version(school_id, shared_version) == version:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._stats.evictions += 1
+        return entry
+
+    def _current_version(self, school_id: str, shared_version: Optional[int]) -> int:
+        if shared_version is not None:
+            return shared_version
+        return self._versions.get(school_id, 0)
+
+    def record_not_modified(self) -> None:
+        """Count a request answered with 304."""
+        with self._lock:
+            self._stats.not_modified += 1
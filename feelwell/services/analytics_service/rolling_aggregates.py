@@ -0,0 +1,353 @@
+"""Incremental per-school, per-day aggregates for dashboard queries.
+
+Dashboards poll the same lookback windows constantly. Instead of
+rescanning summaries on every request, each summary updates its day's
+bucket on arrival (counts, sums, risk histogram, distinct students,
+per-group counts). An N-day query merges N buckets, plus a scan of the
+part of the oldest day that falls inside the window, so results match a
+full scan exactly.
+
+Distinct students are counted with an exact set until a bucket passes
+a size cap, then with a HyperLogLog sketch. The cap is never below the
+k-anonymity threshold, so any approximate count is already well above k
+and suppression decisions (count < k) stay exact.
+"""
+import logging
+import math
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .columnar_store import (
+    UNKNOWN_CODE,
+    ColumnarSummaryStore,
+    EncodedSummary,
+    SummaryWindow,
+    to_micros,
+)
+
+logger = logging.getLogger(__name__)
+
+
+MICROS_PER_DAY = 24 * 3600 * 1_000_000
+
+# Exact distinct-student set size before a bucket switches to HyperLogLog
+DEFAULT_EXACT_DISTINCT_CAP = 4096
+
+# HyperLogLog precision: 2^12 registers, ~1.6% standard error
+HLL_PRECISION = 12
+HLL_REGISTERS = 1 << HLL_PRECISION
+
+# Risk distribution bands (same as the school overview)
+HIGH_RISK_THRESHOLD = 0.7
+MEDIUM_RISK_THRESHOLD = 0.4
+
+# Buffered adds folded into the sorted exact array at this size
+PENDING_COMPACT_SIZE = 64
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer: spreads small integer codes over 64 bits."""
+    with np.errstate(over="ignore"):
+        values = values.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+        values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return values ^ (values >> np.uint64(31))
+
+
+class DistinctCounter:
+    """Mergeable distinct count: exact set under a cap, HyperLogLog above.
+
+    The exact set is a sorted int32 array (4 bytes per student rather than
+    a Python set entry). Once any counter holds more than cap distinct
+    items, it and every union containing it report an estimate; the true
+    count is then known to exceed cap.
+    """
+
+    def __init__(self, cap: int = DEFAULT_EXACT_DISTINCT_CAP):
+        """Initialize an empty counter.
+
+        Args:
+            cap: Maximum exact set size before switching to a sketch
+        """
+        self._cap = cap
+        self._items: Optional[np.ndarray] = np.empty(0, dtype=np.int32)
+        self._pending: List[int] = []
+        self._registers: Optional[np.ndarray] = None
+
+    @property
+    def is_exact(self) -> bool:
+        return self._registers is None
+
+    def add(self, item: int) -> None:
+        """Count one item (a dictionary-encoded student code)."""
+        self._pending.append(item)
+        if len(self._pending) >= PENDING_COMPACT_SIZE:
+            self._compact()
+
+    def update(self, items: np.ndarray) -> None:
+        """Count an array of items."""
+        if self._items is not None:
+            self._items = np.union1d(self._items, items).astype(np.int32)
+            self._check_cap()
+        else:
+            self._add_to_sketch(items)
+
+    def merge_from(self, other: "DistinctCounter") -> None:
+        """Union another counter into this one."""
+        other._compact()
+        if other._items is not None:
+            self._compact()
+            self.update(other._items)
+            return
+        self._compact()
+        if self._registers is None:
+            self._to_sketch()
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def count(self) -> int:
+        """Exact count, or the HyperLogLog estimate when not exact."""
+        self._compact()
+        if self._items is not None:
+            return int(self._items.size)
+
+        m = HLL_REGISTERS
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / float(np.sum(np.exp2(-self._registers.astype(np.float64))))
+        zeros = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        # A sketch only exists once more than cap items were seen
+        return max(int(round(estimate)), self._cap + 1)
+
+    def _compact(self) -> None:
+        if not self._pending:
+            return
+        pending = np.asarray(self._pending, dtype=np.int32)
+        self._pending = []
+        self.update(pending)
+
+    def _check_cap(self) -> None:
+        if self._items.size > self._cap:
+            self._to_sketch()
+
+    def _to_sketch(self) -> None:
+        items = self._items
+        self._items = None
+        self._registers = np.zeros(HLL_REGISTERS, dtype=np.uint8)
+        self._add_to_sketch(items)
+
+    def _add_to_sketch(self, items: np.ndarray) -> None:
+        if items.size == 0:
+            return
+        hashed = _mix64(items)
+        index = (hashed >> np.uint64(64 - HLL_PRECISION)).astype(np.intp)
+        remainder = hashed << np.uint64(HLL_PRECISION)
+        # Rank = leading zeros of the remaining bits + 1
+        rank = np.where(
+            remainder != 0,
+            65 - _bit_length(remainder),
+            64 - HLL_PRECISION + 1,
+        ).astype(np.uint8)
+        np.maximum.at(self._registers, index, rank)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Exact bit length of uint64 values (binary search over shifts)."""
+    values = values.copy()
+    lengths = np.zeros(values.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        wide = values >= (np.uint64(1) << np.uint64(shift))
+        lengths[wide] += shift
+        values[wide] >>= np.uint64(shift)
+    return lengths + (values > 0)
+
+
+def _risk_band(score: float) -> int:
+    """0 = low, 1 = medium, 2 = high."""
+    if score >= HIGH_RISK_THRESHOLD:
+        return 2
+    if score >= MEDIUM_RISK_THRESHOLD:
+        return 1
+    return 0
+
+
+@dataclass
+class DailyAggregate:
+    """Mergeable aggregates over a set of session summaries.
+
+    Attributes:
+        session_count: Summaries counted
+        flagged_count: Summaries with counselor_flag set
+        risk_sum: Sum of end_risk_score, missing scores as 0
+        risk_histogram: Counts per band [low, medium, high], missing as low
+        scored_count: Summaries with an end_risk_score
+        scored_sum: Sum of end_risk_score over scored summaries
+        groups: Per group-by field: code -> [scored count, scored sum]
+        students: Distinct students
+    """
+    session_count: int = 0
+    flagged_count: int = 0
+    risk_sum: float = 0.0
+    risk_histogram: List[int] = field(default_factory=lambda: [0, 0, 0])
+    scored_count: int = 0
+    scored_sum: float = 0.0
+    groups: Dict[str, Dict[int, List[float]]] = field(default_factory=dict)
+    students: DistinctCounter = field(default_factory=DistinctCounter)
+
+    def add(self, row: EncodedSummary) -> None:
+        """Fold one summary into the aggregate."""
+        self.session_count += 1
+        self.flagged_count += int(row.flag)
+        self.students.add(row.student)
+
+        if math.isnan(row.risk_score):
+            self.risk_histogram[0] += 1
+            return
+
+        self.risk_sum += row.risk_score
+        self.risk_histogram[_risk_band(row.risk_score)] += 1
+        self.scored_count += 1
+        self.scored_sum += row.risk_score
+        for name, code in row.dimension_codes.items():
+            totals = self.groups.setdefault(name, {}).setdefault(code, [0, 0.0])
+            totals[0] += 1
+            totals[1] += row.risk_score
+
+    def merge_from(self, other: "DailyAggregate") -> None:
+        """Add another aggregate's totals into this one."""
+        self.session_count += other.session_count
+        self.flagged_count += other.flagged_count
+        self.risk_sum += other.risk_sum
+        for band in range(3):
+            self.risk_histogram[band] += other.risk_histogram[band]
+        self.students.merge_from(other.students)
+
+        # Rows without a field count as unknown; materialize them before
+        # adding the scored totals so the remainder stays per-aggregate
+        for name in set(self.groups) | set(other.groups):
+            mine = self._groups_with_unknown(name)
+            for code, (count, total) in other._groups_with_unknown(name).items():
+                totals = mine.setdefault(code, [0, 0.0])
+                totals[0] += count
+                totals[1] += total
+            self.groups[name] = mine
+        self.scored_count += other.scored_count
+        self.scored_sum += other.scored_sum
+
+    def _groups_with_unknown(self, name: str) -> Dict[int, List[float]]:
+        groups = {code: list(totals) for code, totals in self.groups.get(name, {}).items()}
+        missing = self.scored_count - sum(int(t[0]) for t in groups.values())
+        if missing:
+            totals = groups.setdefault(UNKNOWN_CODE, [0, 0.0])
+            totals[0] += missing
+            totals[1] += self.scored_sum - sum(t[1] for t in self.groups.get(name, {}).values())
+        return groups
+
+    def group_totals(self, name: str) -> Dict[int, Tuple[int, float]]:
+        """Scored count and score sum per code of a group-by field."""
+        return {
+            code: (int(count), total)
+            for code, (count, total) in self._groups_with_unknown(name).items()
+        }
+
+    @classmethod
+    def from_window(cls, window: SummaryWindow, distinct_cap: int) -> "DailyAggregate":
+        """Aggregate a column window with vectorized reductions."""
+        aggregate = cls(students=DistinctCounter(distinct_cap))
+        if window is None or len(window) == 0:
+            return aggregate
+
+        scores = window.risk_scores
+        scored = ~np.isnan(scores)
+        zero_filled = np.where(scored, scores, 0.0)
+
+        aggregate.session_count = len(window)
+        aggregate.flagged_count = int(np.count_nonzero(window.flags))
+        aggregate.risk_sum = float(zero_filled.sum())
+        aggregate.risk_histogram = [
+            int(np.count_nonzero(zero_filled < MEDIUM_RISK_THRESHOLD)),
+            int(np.count_nonzero(
+                (zero_filled >= MEDIUM_RISK_THRESHOLD) & (zero_filled < HIGH_RISK_THRESHOLD)
+            )),
+            int(np.count_nonzero(zero_filled >= HIGH_RISK_THRESHOLD)),
+        ]
+        aggregate.scored_count = int(np.count_nonzero(scored))
+        aggregate.scored_sum = float(scores[scored].sum())
+        aggregate.students.update(window.students)
+
+        for name, codes in window.dimensions.items():
+            codes = codes[scored]
+            counts = np.bincount(codes)
+            sums = np.bincount(codes, weights=scores[scored])
+            aggregate.groups[name] = {
+                int(code): [int(counts[code]), float(sums[code])]
+                for code in np.flatnonzero(counts)
+            }
+        return aggregate
+
+
+class RollingAggregates:
+    """Day buckets per school, updated as summaries arrive."""
+
+    def __init__(
+        self,
+        summaries: ColumnarSummaryStore,
+        distinct_cap: int = DEFAULT_EXACT_DISTINCT_CAP,
+    ):
+        """Initialize empty buckets.
+
+        Args:
+            summaries: Column store holding the same summaries; scanned
+                for the partial first day of a window
+            distinct_cap: Exact distinct-student set size per bucket;
+                must be at least the k-anonymity threshold
+        """
+        self._summaries = summaries
+        self._distinct_cap = distinct_cap
+        self._buckets: Dict[str, Dict[int, DailyAggregate]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, school_id: str, row: EncodedSummary) -> None:
+        """Fold a stored summary into its school's day bucket."""
+        day = row.timestamp // MICROS_PER_DAY
+        with self._lock:
+            days = self._buckets.setdefault(school_id, {})
+            bucket = days.get(day)
+            if bucket is None:
+                bucket = DailyAggregate(students=DistinctCounter(self._distinct_cap))
+                days[day] = bucket
+            bucket.add(row)
+
+    def window(self, school_id: str, since: datetime) -> DailyAggregate:
+        """Aggregates for summaries with timestamp >= since.
+
+        Whole days after since's day come from buckets; the rest of
+        since's own day is scanned from the column store.
+        """
+        since_micros = to_micros(since)
+        first_full_day = since_micros // MICROS_PER_DAY + 1
+
+        partial = self._summaries.window(
+            school_id, since_micros, first_full_day * MICROS_PER_DAY
+        )
+        merged = DailyAggregate.from_window(partial, self._distinct_cap)
+
+        with self._lock:
+            days = self._buckets.get(school_id, {})
+            full_days = sorted(day for day in days if day >= first_full_day)
+            for day in full_days:
+                merged.merge_from(days[day])
+
+        logger.debug(
+            "ROLLING_AGGREGATE_MERGED",
+            extra={
+                "school_id": school_id,
+                "buckets_merged": len(full_days),
+                "partial_rows": len(partial) if partial is not None else 0,
+            }
+        )
+        return merged
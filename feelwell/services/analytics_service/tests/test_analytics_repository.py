@@ -0,0 +1,229 @@
+"""Tests for the PostgreSQL analytics backend.
+
+The tests run against a local server when FEELWELL_TEST_DB_HOST is set
+(e.g. FEELWELL_TEST_DB_HOST=localhost FEELWELL_TEST_DB_PORT=5432
+FEELWELL_TEST_DB_USER=postgres). They drop and recreate the analytics
+tables in the target database, so never point them at a shared database.
+"""
+import os
+import random
+import pytest
+from datetime import datetime, timedelta
+
+from feelwell.shared.database import ConnectionManager, DatabaseConfig
+from feelwell.shared.utils import configure_pii_salt
+from feelwell.services.analytics_service.analytics_repository import AnalyticsRepository
+from feelwell.services.analytics_service.handler import (
+    AnalyticsConfig,
+    AnalyticsHandler,
+    FlaggedSession,
+)
+
+
+TEST_DB_HOST = os.getenv("FEELWELL_TEST_DB_HOST")
+
+requires_postgres = pytest.mark.skipif(
+    TEST_DB_HOST is None,
+    reason="FEELWELL_TEST_DB_HOST not set; local PostgreSQL tests skipped",
+)
+
+
+@pytest.fixture(autouse=True)
+def setup_pii_salt():
+    configure_pii_salt("test_salt_that_is_at_least_32_characters_long")
+
+
+@pytest.fixture
+def connection_manager():
+    config = DatabaseConfig(
+        host=TEST_DB_HOST or "localhost",
+        port=int(os.getenv("FEELWELL_TEST_DB_PORT", "5432")),
+        database=os.getenv("FEELWELL_TEST_DB_NAME", "postgres"),
+        username=os.getenv("FEELWELL_TEST_DB_USER", "postgres"),
+        password=os.getenv("FEELWELL_TEST_DB_PASSWORD", ""),
+        min_connections=1,
+        max_connections=4,
+        ssl_mode="disable",
+    )
+    manager = ConnectionManager(config)
+    with manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "DROP TABLE IF EXISTS analytics_session_summaries, "
+                "analytics_flagged_sessions, analytics_school_versions CASCADE"
+            )
+        conn.commit()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def handlers(connection_manager):
+    """In-memory and PostgreSQL handlers loaded with the same data."""
+    repository = AnalyticsRepository(connection_manager)
+    repository.ensure_schema()
+    config = AnalyticsConfig(k_anonymity_threshold=5)
+    memory = AnalyticsHandler(config=config)
+    postgres = AnalyticsHandler(config=config, repository=repository)
+
+    rng = random.Random(11)
+    now = datetime.utcnow()
+    for i in range(400):
+        school_id = rng.choice(["school_001", "school_002", "school_003"])
+        summary = {
+            "session_id": f"sess_{i}",
+            "student_id_hash": f"hash_{rng.randrange(60)}",
+            "school_id": school_id,
+            "grade_level": rng.choice(["9th", "10th", "11th", "12th"]),
+            "end_risk_score": round(rng.random(), 2),
+            "counselor_flag": rng.random() < 0.15,
+            "timestamp": now - timedelta(minutes=rng.randrange(20 * 24 * 60)),
+        }
+        if i % 9 == 0:
+            del summary["grade_level"]
+        if i % 13 == 0:
+            del summary["end_risk_score"]
+        for handler in (memory, postgres):
+            handler.add_session_summary(dict(summary))
+        if summary["counselor_flag"]:
+            flagged = FlaggedSession(
+                session_id=summary["session_id"],
+                student_id_hash=summary["student_id_hash"],
+                school_id=school_id,
+                end_risk_score=summary.get("end_risk_score", 0.0),
+                risk_trajectory="stable",
+                phq9_score=None,
+                gad7_score=rng.choice([None, 7]),
+                counselor_flag_reason="elevated_risk",
+                session_end=summary["timestamp"],
+                message_count=rng.randrange(20),
+            )
+            for handler in (memory, postgres):
+                handler.add_flagged_session(flagged)
+    return memory, postgres
+
+
+def assert_same(expected, actual):
+    """Compare results; averages may differ in the last float bits."""
+    if isinstance(expected, dict):
+        assert expected.keys() == actual.keys()
+        for key in expected:
+            assert_same(expected[key], actual[key])
+    elif isinstance(expected, list):
+        assert len(expected) == len(actual)
+        for e, a in zip(expected, actual):
+            assert_same(e, a)
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, abs=1e-3)
+    else:
+        assert expected == actual
+
+
+class TestBackendSwitch:
+    def test_defaults_to_memory(self, monkeypatch):
+        monkeypatch.delenv("ANALYTICS_STORAGE_BACKEND", raising=False)
+
+        assert AnalyticsConfig.from_env().storage_backend == "memory"
+
+    def test_postgres_from_env(self, monkeypatch):
+        monkeypatch.setenv("ANALYTICS_STORAGE_BACKEND", "postgres")
+
+        assert AnalyticsConfig.from_env().storage_backend == "postgres"
+
+
+@requires_postgres
+class TestPostgresParity:
+    """The PostgreSQL backend answers exactly like the in-memory one."""
+
+    def test_mood_trends(self, handlers):
+        memory, postgres = handlers
+        for school_id in ("school_001", "school_002", "school_404"):
+            for days in (1, 3, 7, 30):
+                assert_same(
+                    memory.get_mood_trends(school_id, "grade_level", days),
+                    postgres.get_mood_trends(school_id, "grade_level", days),
+                )
+
+    def test_school_overview(self, handlers):
+        memory, postgres = handlers
+        for school_id in ("school_001", "school_003", "school_404"):
+            for days in (1, 7, 30):
+                assert_same(
+                    memory.get_school_overview(school_id, days),
+                    postgres.get_school_overview(school_id, days),
+                )
+
+    def test_flagged_sessions(self, handlers):
+        memory, postgres = handlers
+        for days, limit in ((7, 5), (30, 100), (1, 0)):
+            assert_same(
+                memory.get_flagged_sessions("school_002", days, limit),
+                postgres.get_flagged_sessions("school_002", days, limit),
+            )
+
+    def test_mood_cube(self, handlers):
+        memory, postgres = handlers
+        for group_by in (["school_id"], ["grade_level", "week"], ["school_id", "grade_level"]):
+            assert_same(
+                memory.get_mood_cube(group_by, weeks=3),
+                postgres.get_mood_cube(group_by, weeks=3),
+            )
+
+
+@requires_postgres
+class TestSharedResultCache:
+    """Handlers in different processes share one database."""
+
+    def test_write_through_one_handler_invalidates_the_other(self, connection_manager):
+        repository = AnalyticsRepository(connection_manager)
+        repository.ensure_schema()
+        config = AnalyticsConfig(k_anonymity_threshold=1)
+        reader = AnalyticsHandler(config=config, repository=repository)
+        writer = AnalyticsHandler(config=config, repository=AnalyticsRepository(connection_manager))
+
+        def overview():
+            return reader.result_cache.get_or_compute(
+                "school-overview", "school_001", {"days": 7},
+                lambda: repr(reader.get_school_overview("school_001", 7)).encode(),
+            )
+
+        before = overview()
+        writer.add_session_summary({
+            "session_id": "sess_1",
+            "student_id_hash": "hash_1",
+            "school_id": "school_001",
+            "end_risk_score": 0.4,
+            "timestamp": datetime.utcnow(),
+        })
+        after = overview()
+
+        assert repository.school_version("school_001") == 1
+        assert after.version == 1 and after.etag != before.etag
+        assert overview() is after
+
+
+@requires_postgres
+class TestPostgresSuppression:
+    """Aggregates of groups below k never leave the database."""
+
+    def test_small_group_average_not_returned(self, connection_manager):
+        repository = AnalyticsRepository(connection_manager)
+        repository.ensure_schema()
+        now = datetime.utcnow()
+        for i in range(3):
+            repository.add_session_summary({
+                "session_id": f"sess_{i}",
+                "student_id_hash": f"hash_{i}",
+                "school_id": "school_001",
+                "grade_level": "9th",
+                "end_risk_score": 0.9,
+                "timestamp": now,
+            })
+
+        groups = repository.risk_by_group("school_001", now - timedelta(days=1), "grade_level", 5)
+        totals = repository.school_totals("school_001", now - timedelta(days=1), 5)
+
+        assert groups == {"9th": (None, 3)}
+        assert totals.unique_students == 3
+        assert totals.session_count == 0
+        assert totals.risk_histogram == [0, 0, 0]
@@ -0,0 +1,113 @@
+"""Tests for columnar analytics storage."""
+import numpy as np
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from feelwell.services.analytics_service.columnar_store import (
+    INITIAL_CAPACITY,
+    UNKNOWN_CODE,
+    ColumnarSummaryStore,
+    to_micros,
+)
+
+
+NOW = datetime(2026, 3, 10, 12, 0, 0)
+
+
+def summary(i: int, school_id: str = "school_001", hours_ago: int = 0, **fields):
+    record = {
+        "session_id": f"sess_{i}",
+        "student_id_hash": f"hash_{i % 4}",
+        "school_id": school_id,
+        "end_risk_score": 0.1 * (i % 10),
+        "counselor_flag": i % 3 == 0,
+        "timestamp": NOW - timedelta(hours=hours_ago),
+    }
+    record.update(fields)
+    return record
+
+
+class TestToMicros:
+    def test_naive_aware_and_string_agree(self):
+        naive = datetime(2026, 3, 10, 12, 0, 0)
+        aware = naive.replace(tzinfo=timezone.utc)
+
+        assert to_micros(naive) == to_micros(aware) == to_micros("2026-03-10T12:00:00Z")
+
+    def test_missing_sorts_first(self):
+        assert to_micros(None) < to_micros(datetime(1900, 1, 1))
+
+
+class TestColumnarSummaryStore:
+    def test_window_is_binary_search_on_time(self):
+        store = ColumnarSummaryStore()
+        for i in range(48):
+            store.add(summary(i, hours_ago=47 - i))
+
+        window = store.window("school_001", NOW - timedelta(hours=10))
+
+        assert len(window) == 11
+        assert np.all(np.diff(window.timestamps) >= 0)
+
+    def test_out_of_order_appends_are_sorted(self):
+        store = ColumnarSummaryStore()
+        for i, hours_ago in enumerate([1, 5, 3, 0, 4]):
+            store.add(summary(i, hours_ago=hours_ago))
+
+        window = store.window("school_001", NOW - timedelta(hours=3))
+
+        assert len(window) == 3
+        assert list(window.risk_scores) == pytest.approx([0.2, 0.0, 0.3])
+
+    def test_partitions_by_school(self):
+        store = ColumnarSummaryStore()
+        store.add(summary(1, school_id="school_001"))
+        store.add(summary(2, school_id="school_002"))
+
+        assert len(store.window("school_001", NOW - timedelta(days=1))) == 1
+        assert store.window("school_999", NOW - timedelta(days=1)) is None
+
+    def test_growth_past_initial_capacity(self):
+        store = ColumnarSummaryStore()
+        for i in range(INITIAL_CAPACITY * 2 + 5):
+            store.add(summary(i, grade_level="9th" if i % 2 else "10th"))
+
+        window = store.window("school_001", NOW - timedelta(days=1))
+        codes = store.group_codes(window, "grade_level")
+        labels = store.dimension_labels("grade_level")
+
+        assert len(window) == INITIAL_CAPACITY * 2 + 5
+        assert {labels[c] for c in np.unique(codes)} == {"9th", "10th"}
+
+    def test_missing_dimension_is_unknown(self):
+        store = ColumnarSummaryStore()
+        store.add(summary(1))
+        store.add(summary(2, grade_level="9th"))
+
+        window = store.window("school_001", NOW - timedelta(days=1))
+        codes = store.group_codes(window, "grade_level")
+
+        assert codes[0] == UNKNOWN_CODE
+        assert store.dimension_labels("grade_level")[codes[1]] == "9th"
+
+    def test_missing_score_is_nan(self):
+        store = ColumnarSummaryStore()
+        record = summary(1)
+        del record["end_risk_score"]
+        store.add(record)
+
+        window = store.window("school_001", NOW - timedelta(days=1))
+
+        assert np.isnan(window.risk_scores[0])
+
+    def test_earlier_window_unchanged_by_resort(self):
+        store = ColumnarSummaryStore()
+        store.add(summary(1, hours_ago=2))
+        store.add(summary(2, hours_ago=1))
+        before = store.window("school_001", NOW - timedelta(days=1))
+        snapshot = before.timestamps.copy()
+
+        store.add(summary(3, hours_ago=5))
+        store.window("school_001", NOW - timedelta(days=1))
+
+        assert np.array_equal(before.timestamps, snapshot)
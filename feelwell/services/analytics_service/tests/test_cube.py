@@ -0,0 +1,172 @@
+"""Tests for the k-anonymous school x grade x week mood cube."""
+import random
+import pytest
+from datetime import datetime, timedelta
+from itertools import combinations
+
+from feelwell.services.analytics_service.columnar_store import ColumnarSummaryStore
+from feelwell.services.analytics_service.cube import (
+    ALL,
+    COMPLEMENTARY_REASON,
+    CUBE_DIMENSIONS,
+    MoodCube,
+    week_of,
+)
+from feelwell.services.analytics_service.k_anonymity import KAnonymityEnforcer
+
+
+# A Wednesday; its week starts Monday 2026-03-09
+NOW = datetime(2026, 3, 11, 12, 0, 0)
+SINCE = datetime(2026, 2, 1)
+
+
+def add_students(store, school_id, grade, count, first=0, timestamp=NOW, risk=0.5):
+    for i in range(first, first + count):
+        store.add({
+            "session_id": f"{school_id}_{grade}_{i}",
+            "student_id_hash": f"{school_id}_{grade}_hash_{i}",
+            "school_id": school_id,
+            "grade_level": grade,
+            "end_risk_score": risk,
+            "timestamp": timestamp,
+        })
+
+
+def build(store, k=5):
+    return MoodCube.build(store, SINCE, KAnonymityEnforcer(k_threshold=k))
+
+
+def cells_by_key(cube, group_by, filters=None):
+    return {cell.key: cell for cell in cube.slice(group_by, filters)}
+
+
+class TestWeeks:
+    """Tests for Monday-aligned week labels."""
+
+    def test_week_starts_on_monday(self):
+        assert week_of(datetime(2026, 3, 9, 0, 0)) == "2026-03-09"
+        assert week_of(datetime(2026, 3, 15, 23, 59)) == "2026-03-09"
+        assert week_of(datetime(2026, 3, 16)) == "2026-03-16"
+
+    def test_epoch_week(self):
+        assert week_of(datetime(1970, 1, 1)) == "1969-12-29"
+
+
+class TestCubeAggregation:
+    """Tests for cuboid aggregates."""
+
+    def test_rollups_match_children(self):
+        store = ColumnarSummaryStore()
+        add_students(store, "school_001", "9th", 6, risk=0.2)
+        add_students(store, "school_001", "10th", 8, risk=0.6)
+        add_students(store, "school_002", "9th", 7, timestamp=NOW - timedelta(days=7))
+
+        cube = build(store)
+        total = cube.slice([])[0]
+        schools = cells_by_key(cube, ["school_id"])
+
+        assert total.key == (ALL, ALL, ALL)
+        assert total.session_count == 21
+        assert total.unique_students == 21
+        assert schools[("school_001", ALL, ALL)].session_count == 14
+        assert schools[("school_001", ALL, ALL)].to_dict()["avg_risk_score"] == pytest.approx(
+            (6 * 0.2 + 8 * 0.6) / 14, abs=1e-3
+        )
+        weeks = cells_by_key(cube, ["week"])
+        assert set(k[2] for k in weeks) == {"2026-03-02", "2026-03-09"}
+
+    def test_counts_distinct_students(self):
+        store = ColumnarSummaryStore()
+        for _ in range(3):
+            add_students(store, "school_001", "9th", 5)
+
+        cell = build(store).slice(["grade_level"])[0]
+
+        assert cell.session_count == 15
+        assert cell.unique_students == 5
+
+    def test_excludes_summaries_before_since(self):
+        store = ColumnarSummaryStore()
+        add_students(store, "school_001", "9th", 6, timestamp=SINCE - timedelta(days=1))
+
+        assert build(store).slice([]) == []
+
+    def test_rejects_unknown_dimension(self):
+        store = ColumnarSummaryStore()
+        add_students(store, "school_001", "9th", 6)
+
+        with pytest.raises(ValueError):
+            build(store).slice(["student_id_hash"])
+
+
+class TestCubeSuppression:
+    """Tests for primary and complementary suppression."""
+
+    def test_primary_suppression_below_k(self):
+        store = ColumnarSummaryStore()
+        add_students(store, "school_001", "9th", 3)
+
+        cell = build(store).slice([])[0]
+
+        assert cell.suppressed
+        assert "below k-anonymity" in cell.suppression_reason
+        assert "session_count" not in cell.to_dict()
+
+    def test_lone_suppressed_child_forces_sibling(self):
+        store = ColumnarSummaryStore()
+        add_students(store, "school_001", "9th", 2)
+        add_students(store, "school_001", "10th", 6)
+        add_students(store, "school_001", "11th", 9)
+
+        grades = cells_by_key(build(store), ["grade_level"])
+
+        assert grades[(ALL, "9th", ALL)].suppressed
+        # School total minus 11th would reveal 9th, so 10th goes too
+        assert grades[(ALL, "10th", ALL)].suppressed
+        assert grades[(ALL, "10th", ALL)].suppression_reason == COMPLEMENTARY_REASON
+        assert not grades[(ALL, "11th", ALL)].suppressed
+
+    def test_two_suppressed_children_need_no_complement(self):
+        store = ColumnarSummaryStore()
+        add_students(store, "school_001", "9th", 3)
+        add_students(store, "school_001", "10th", 4)
+        add_students(store, "school_001", "11th", 9)
+
+        grades = cells_by_key(build(store), ["grade_level"])
+
+        assert grades[(ALL, "9th", ALL)].suppressed
+        assert grades[(ALL, "10th", ALL)].suppressed
+        assert not grades[(ALL, "11th", ALL)].suppressed
+
+    def test_no_published_rollup_reveals_a_suppressed_cell(self):
+        rng = random.Random(3)
+        store = ColumnarSummaryStore()
+        for school in ("school_001", "school_002", "school_003"):
+            for grade in ("9th", "10th", "11th", "12th"):
+                for week in range(4):
+                    add_students(
+                        store, school, grade, rng.randrange(0, 9),
+                        first=week * 100,
+                        timestamp=NOW - timedelta(weeks=week),
+                        risk=round(rng.random(), 2),
+                    )
+
+        cube = build(store, k=5)
+
+        # For every published parent, children along any dimension must
+        # hide either zero or at least two cells
+        for size in range(len(CUBE_DIMENSIONS) + 1):
+            for grouped in combinations(CUBE_DIMENSIONS, size):
+                for parent in cube.slice(list(grouped)):
+                    if parent.suppressed:
+                        continue
+                    for dimension in CUBE_DIMENSIONS:
+                        if dimension in grouped:
+                            continue
+                        filters = {
+                            d: v for d, v in zip(CUBE_DIMENSIONS, parent.key) if v != ALL
+                        }
+                        children = cube.slice([dimension], filters)
+                        hidden = [c for c in children if c.suppressed]
+                        assert len(hidden) != 1, (parent.key, dimension)
+                    assert parent.unique_students >= 5
@@ -0,0 +1,97 @@
+"""Tests for the top-K flagged-session index."""
+import random
+from datetime import datetime, timedelta
+
+from feelwell.services.analytics_service.flagged_index import FlaggedSessionIndex
+from feelwell.services.analytics_service.handler import FlaggedSession
+
+
+NOW = datetime(2026, 3, 10, 12, 0, 0)
+
+
+def flagged(i: int, risk: float, hours_ago: float, school_id: str = "school_001"):
+    return FlaggedSession(
+        session_id=f"sess_{i}",
+        student_id_hash=f"hash_{i}",
+        school_id=school_id,
+        end_risk_score=risk,
+        risk_trajectory="stable",
+        phq9_score=None,
+        gad7_score=None,
+        counselor_flag_reason="test",
+        session_end=NOW - timedelta(hours=hours_ago),
+        message_count=5,
+    )
+
+
+class TestFlaggedSessionIndex:
+    def test_top_by_risk_within_window(self):
+        index = FlaggedSessionIndex(max_lookback_days=90)
+        index.add(flagged(1, 0.5, hours_ago=1), now=NOW)
+        index.add(flagged(2, 0.99, hours_ago=200), now=NOW)
+        index.add(flagged(3, 0.9, hours_ago=2), now=NOW)
+        index.add(flagged(4, 0.7, hours_ago=3), now=NOW)
+
+        total, sessions = index.top_by_risk(
+            "school_001", NOW - timedelta(days=7), limit=2, now=NOW
+        )
+
+        assert total == 3
+        assert [s.session_id for s in sessions] == ["sess_3", "sess_4"]
+
+    def test_matches_filter_and_sort(self):
+        rng = random.Random(3)
+        index = FlaggedSessionIndex(max_lookback_days=90)
+        sessions = [
+            flagged(i, round(rng.random(), 2), hours_ago=rng.uniform(0, 60 * 24))
+            for i in range(500)
+        ]
+        for session in sessions:
+            index.add(session, now=NOW)
+
+        for days in (1, 7, 30):
+            since = NOW - timedelta(days=days)
+            expected = sorted(
+                (s for s in sessions if s.session_end >= since),
+                key=lambda s: (s.end_risk_score, s.session_end),
+                reverse=True,
+            )
+
+            total, top = index.top_by_risk("school_001", since, limit=25, now=NOW)
+
+            assert total == len(expected)
+            assert top == expected[:25]
+
+    def test_ties_most_recent_first(self):
+        index = FlaggedSessionIndex(max_lookback_days=90)
+        index.add(flagged(1, 0.8, hours_ago=5), now=NOW)
+        index.add(flagged(2, 0.8, hours_ago=1), now=NOW)
+
+        _, sessions = index.top_by_risk("school_001", NOW - timedelta(days=1), 10, now=NOW)
+
+        assert [s.session_id for s in sessions] == ["sess_2", "sess_1"]
+
+    def test_schools_are_isolated(self):
+        index = FlaggedSessionIndex(max_lookback_days=90)
+        index.add(flagged(1, 0.8, hours_ago=1, school_id="school_002"), now=NOW)
+
+        assert index.top_by_risk("school_001", NOW - timedelta(days=1), 10, now=NOW) == (0, [])
+
+    def test_expired_sessions_are_evicted(self):
+        index = FlaggedSessionIndex(max_lookback_days=7)
+        index.add(flagged(1, 0.9, hours_ago=24 * 6), now=NOW)
+        index.add(flagged(2, 0.5, hours_ago=1), now=NOW)
+        assert len(index) == 2
+
+        later = NOW + timedelta(days=3)
+        total, sessions = index.top_by_risk("school_001", later - timedelta(days=30), 10, now=later)
+
+        assert total == 1
+        assert [s.session_id for s in sessions] == ["sess_2"]
+        assert len(index) == 1
+
+    def test_sessions_older_than_lookback_are_not_indexed(self):
+        index = FlaggedSessionIndex(max_lookback_days=7)
+        index.add(flagged(1, 0.9, hours_ago=24 * 30), now=NOW)
+
+        assert len(index) == 0
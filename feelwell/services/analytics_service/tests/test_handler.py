@@ -263,6 +263,27 @@ class TestSchoolOverviewEndpoint:
         assert data["overview"]["flagged_sessions"] == 2
         assert "avg_risk_score" in data["overview"]
         assert "risk_distribution" in data["overview"]
+    
+    def test_overview_spans_day_buckets(self, client, handler):
+        # 6 students spread over 5 days; 2 sessions fall outside 3 days
+        now = datetime.utcnow()
+        for i in range(6):
+            handler.add_session_summary({
+                "session_id": f"sess_{i}",
+                "student_id_hash": f"hash_{i}",
+                "school_id": "school_001",
+                "end_risk_score": 0.8 if i % 2 else 0.2,
+                "counselor_flag": False,
+                "timestamp": now - timedelta(days=i, minutes=1),
+            })
+        
+        wide = client.get("/school-overview?school_id=school_001&days=7").get_json()
+        narrow = client.get("/school-overview?school_id=school_001&days=3").get_json()
+        
+        assert wide["overview"]["unique_students"] == 6
+        assert wide["overview"]["unique_students_exact"] is True
+        assert wide["overview"]["risk_distribution"] == {"high": 3, "medium": 0, "low": 3}
+        assert narrow["suppressed"] is True
 
 
 class TestAddSessionEndpoint:
@@ -356,3 +377,131 @@ class TestKAnonymityIntegration:
         data = response.get_json()
         assert data["trends"]["9th"]["suppressed"] is True
         assert data["trends"]["10th"]["suppressed"] is False
+
+
+class TestMoodCubeEndpoint:
+    """Tests for /mood-cube endpoint."""
+    
+    def test_rejects_unknown_dimension(self, client, handler):
+        response = client.get("/mood-cube?group_by=student_id_hash")
+        
+        assert response.status_code == 400
+    
+    def test_drills_down_from_school_to_grade(self, client, handler):
+        for grade, count in (("9th", 6), ("10th", 7)):
+            for i in range(count):
+                handler.add_session_summary({
+                    "session_id": f"sess_{grade}_{i}",
+                    "student_id_hash": f"hash_{grade}_{i}",
+                    "school_id": "school_001",
+                    "grade_level": grade,
+                    "end_risk_score": 0.5,
+                    "timestamp": datetime.utcnow(),
+                })
+        
+        schools = client.get("/mood-cube?group_by=school_id").get_json()
+        grades = client.get(
+            "/mood-cube?group_by=grade_level&school_id=school_001&weeks=2"
+        ).get_json()
+        
+        assert schools["cells"][0]["school_id"] == "school_001"
+        assert schools["cells"][0]["session_count"] == 13
+        assert {c["grade_level"]: c["unique_students"] for c in grades["cells"]} == {
+            "10th": 7, "9th": 6,
+        }
+    
+    def test_cube_reflects_new_summaries(self, client, handler):
+        def add(i):
+            handler.add_session_summary({
+                "session_id": f"sess_{i}",
+                "student_id_hash": f"hash_{i}",
+                "school_id": "school_001",
+                "end_risk_score": 0.5,
+                "timestamp": datetime.utcnow(),
+            })
+        
+        for i in range(4):
+            add(i)
+        before = client.get("/mood-cube").get_json()
+        add(4)
+        after = client.get("/mood-cube").get_json()
+        
+        assert before["cells"][0]["suppressed"] is True
+        assert after["cells"][0]["suppressed"] is False
+
+
+class TestResultCaching:
+    """Tests for cached dashboard responses."""
+    
+    def _add(self, handler, i, school_id="school_001"):
+        handler.add_session_summary({
+            "session_id": f"sess_{school_id}_{i}",
+            "student_id_hash": f"hash_{i}",
+            "school_id": school_id,
+            "end_risk_score": 0.5,
+            "timestamp": datetime.utcnow(),
+        })
+    
+    def test_revalidation_returns_304(self, client, handler):
+        for i in range(6):
+            self._add(handler, i)
+        
+        first = client.get("/school-overview?school_id=school_001")
+        second = client.get(
+            "/school-overview?school_id=school_001",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+        
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert handler.result_cache.stats.not_modified == 1
+    
+    def test_new_summary_invalidates_school(self, client, handler):
+        for i in range(6):
+            self._add(handler, i)
+        first = client.get("/school-overview?school_id=school_001")
+        
+        self._add(handler, 6)
+        second = client.get(
+            "/school-overview?school_id=school_001",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+        
+        assert second.status_code == 200
+        assert second.get_json()["overview"]["total_sessions"] == 7
+    
+    def test_other_school_writes_keep_cache(self, client, handler):
+        client.get("/mood-trends?school_id=school_001")
+        self._add(handler, 0, school_id="school_002")
+        client.get("/mood-trends?school_id=school_001")
+        
+        assert handler.result_cache.stats.hits == 1
+    
+    def test_flagged_session_invalidates_school(self, client, handler):
+        client.get("/flagged-sessions?school_id=school_001")
+        handler.add_flagged_session(FlaggedSession(
+            session_id="sess_1",
+            student_id_hash="hash_1",
+            school_id="school_001",
+            end_risk_score=0.9,
+            risk_trajectory="escalating",
+            phq9_score=None,
+            gad7_score=None,
+            counselor_flag_reason="elevated_risk",
+            session_end=datetime.utcnow(),
+            message_count=3,
+        ))
+        
+        data = client.get("/flagged-sessions?school_id=school_001").get_json()
+        
+        assert data["total_flagged"] == 1
+    
+    def test_health_reports_hit_rate(self, client, handler):
+        client.get("/school-overview?school_id=school_001")
+        client.get("/school-overview?school_id=school_001")
+        
+        stats = client.get("/health").get_json()["result_cache"]
+        
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 0.5
@@ -1,4 +1,8 @@
 """Tests for k-anonymity enforcement per ADR-006."""
+import logging
+import random
+
+import numpy as np
 import pytest
 
 from feelwell.shared.utils import configure_pii_salt
@@ -233,3 +237,105 @@ class TestEnforceKAnonymityFunction:
         )
         
         assert result.suppressed is True
+
+
+def legacy_aggregate(records, group_by, aggregate_field, aggregation, k_threshold):
+    """Reference per-record implementation the vectorized path must match."""
+    groups = {}
+    for record in records:
+        key = str(record.get(group_by, "unknown"))
+        value = record.get(aggregate_field)
+        if value is not None:
+            groups.setdefault(key, []).append(float(value))
+    results = {}
+    for key, values in groups.items():
+        if aggregation == "count":
+            value = len(values)
+        elif aggregation == "sum":
+            value = sum(values)
+        else:
+            value = sum(values) / len(values)
+        suppressed = len(values) < k_threshold
+        results[key] = (None if suppressed else value, len(values), suppressed)
+    return results
+
+
+class TestVectorizedAggregation:
+    """Tests for the columnar aggregation path."""
+    
+    @pytest.fixture
+    def records(self):
+        rng = random.Random(11)
+        records = []
+        for _ in range(5000):
+            record = {"grade": f"g{rng.randrange(60)}", "score": rng.random()}
+            if rng.random() < 0.05:
+                del record["score"]
+            if rng.random() < 0.02:
+                del record["grade"]
+            records.append(record)
+        return records
+    
+    @pytest.mark.parametrize("aggregation", ["avg", "count", "sum"])
+    def test_matches_per_record_path_exactly(self, records, aggregation):
+        enforcer = KAnonymityEnforcer(k_threshold=80)
+        
+        results = enforcer.aggregate_with_anonymity(
+            records, group_by="grade", aggregate_field="score", aggregation=aggregation
+        )
+        expected = legacy_aggregate(records, "grade", "score", aggregation, 80)
+        
+        assert list(results) == list(expected)
+        assert any(r.suppressed for r in results.values())
+        for key, (data, size, suppressed) in expected.items():
+            assert results[key].data == data
+            assert type(results[key].data) is type(data)
+            assert results[key].group_size == size
+            assert results[key].suppressed is suppressed
+    
+    @pytest.mark.parametrize("aggregation,percentile,reference", [
+        ("median", 50.0, lambda v: np.median(v)),
+        ("percentile", 90.0, lambda v: np.percentile(v, 90)),
+        ("stddev", 50.0, lambda v: np.std(v)),
+    ])
+    def test_distribution_aggregations(self, records, aggregation, percentile, reference):
+        enforcer = KAnonymityEnforcer(k_threshold=1)
+        
+        results = enforcer.aggregate_with_anonymity(
+            records,
+            group_by="grade",
+            aggregate_field="score",
+            aggregation=aggregation,
+            percentile=percentile,
+        )
+        
+        groups = {}
+        for record in records:
+            if "score" in record:
+                groups.setdefault(str(record.get("grade", "unknown")), []).append(record["score"])
+        for key, values in groups.items():
+            assert results[key].data == pytest.approx(reference(values), abs=1e-12)
+    
+    def test_single_value_groups(self):
+        enforcer = KAnonymityEnforcer(k_threshold=1)
+        
+        results = enforcer.aggregate_with_anonymity(
+            [{"grade": "9th", "score": 0.4}], "grade", "score", aggregation="stddev"
+        )
+        
+        assert results["9th"].data == 0.0
+    
+    def test_empty_input(self):
+        enforcer = KAnonymityEnforcer()
+        
+        assert enforcer.aggregate_with_anonymity([], "grade", "score") == {}
+    
+    def test_one_summary_log_per_call(self, records, caplog):
+        enforcer = KAnonymityEnforcer(k_threshold=80)
+        
+        with caplog.at_level(logging.INFO):
+            enforcer.aggregate_with_anonymity(records, "grade", "score")
+        
+        messages = [r.getMessage() for r in caplog.records]
+        assert messages == ["K_ANONYMITY_GROUPS_CHECKED"]
+        assert caplog.records[0].suppressed_groups > 0
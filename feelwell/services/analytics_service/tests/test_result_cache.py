@@ -0,0 +1,129 @@
+"""Tests for the versioned dashboard result cache."""
+import pytest
+
+from feelwell.services.analytics_service.result_cache import ResultCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def counting_compute(body=b'{"a": 1}'):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return body
+    return compute, calls
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    def test_hit_skips_compute(self, clock):
+        cache = ResultCache(ttl_seconds=30, clock=clock)
+        compute, calls = counting_compute()
+
+        first = cache.get_or_compute("overview", "school_001", {"days": 7}, compute)
+        second = cache.get_or_compute("overview", "school_001", {"days": 7}, compute)
+
+        assert len(calls) == 1
+        assert second is first
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_params_and_endpoint_are_part_of_key(self, clock):
+        cache = ResultCache(ttl_seconds=30, clock=clock)
+        compute, calls = counting_compute()
+
+        cache.get_or_compute("overview", "school_001", {"days": 7}, compute)
+        cache.get_or_compute("overview", "school_001", {"days": 30}, compute)
+        cache.get_or_compute("trends", "school_001", {"days": 7}, compute)
+
+        assert len(calls) == 3
+
+    def test_invalidation_is_per_school(self, clock):
+        cache = ResultCache(ttl_seconds=30, clock=clock)
+        compute, calls = counting_compute()
+        cache.get_or_compute("overview", "school_001", {}, compute)
+        cache.get_or_compute("overview", "school_002", {}, compute)
+
+        cache.invalidate("school_001")
+        cache.get_or_compute("overview", "school_001", {}, compute)
+        cache.get_or_compute("overview", "school_002", {}, compute)
+
+        assert len(calls) == 3
+        assert cache.stats.invalidations == 1
+
+    def test_entries_expire_after_ttl(self, clock):
+        cache = ResultCache(ttl_seconds=30, clock=clock)
+        compute, calls = counting_compute()
+        cache.get_or_compute("overview", "school_001", {}, compute)
+
+        clock.now = 31
+        cache.get_or_compute("overview", "school_001", {}, compute)
+
+        assert len(calls) == 2
+
+    def test_etag_tracks_content(self, clock):
+        cache = ResultCache(ttl_seconds=0, clock=clock)
+
+        same_a = cache.get_or_compute("o", "s", {}, lambda: b"{}")
+        same_b = cache.get_or_compute("o", "s", {}, lambda: b"{}")
+        other = cache.get_or_compute("o", "s", {}, lambda: b"[]")
+
+        assert same_a.etag == same_b.etag
+        assert other.etag != same_a.etag
+
+    def test_result_invalidated_during_compute_is_not_stored(self, clock):
+        cache = ResultCache(ttl_seconds=30, clock=clock)
+
+        def racing_compute():
+            cache.invalidate("school_001")
+            return b"{}"
+
+        cache.get_or_compute("overview", "school_001", {}, racing_compute)
+        compute, calls = counting_compute()
+        cache.get_or_compute("overview", "school_001", {}, compute)
+
+        assert len(calls) == 1
+
+    def test_evicts_least_recently_used(self, clock):
+        cache = ResultCache(ttl_seconds=30, max_entries=2, clock=clock)
+        compute, calls = counting_compute()
+        for days in (1, 2, 1, 3):
+            cache.get_or_compute("overview", "school_001", {"days": days}, compute)
+
+        cache.get_or_compute("overview", "school_001", {"days": 1}, compute)
+        cache.get_or_compute("overview", "school_001", {"days": 2}, compute)
+
+        assert cache.stats.evictions >= 1
+        assert len(calls) == 4
+
+    def test_shared_version_source_spans_caches(self, clock):
+        # Two workers' caches over one store; a write from either bumps
+        # the shared version, so neither serves the old result
+        versions = {}
+        worker_a = ResultCache(ttl_seconds=30, clock=clock, version_source=lambda s: versions.get(s, 0))
+        worker_b = ResultCache(ttl_seconds=30, clock=clock, version_source=lambda s: versions.get(s, 0))
+        compute, calls = counting_compute()
+        first = worker_a.get_or_compute("overview", "school_001", {}, compute)
+        assert worker_a.get_or_compute("overview", "school_001", {}, compute) is first
+
+        versions["school_001"] = 1  # Written through worker B's store
+        worker_a.get_or_compute("overview", "school_001", {}, compute)
+        worker_b.get_or_compute("overview", "school_001", {}, compute)
+
+        assert len(calls) == 3
+        assert worker_a.get_or_compute("overview", "school_001", {}, compute).version == 1
+        assert len(calls) == 3
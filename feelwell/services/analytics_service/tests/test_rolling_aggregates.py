@@ -0,0 +1,155 @@
+"""Tests for incremental per-day analytics aggregates."""
+import random
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+
+from feelwell.services.analytics_service.columnar_store import ColumnarSummaryStore
+from feelwell.services.analytics_service.rolling_aggregates import (
+    DistinctCounter,
+    RollingAggregates,
+)
+
+
+NOW = datetime(2026, 3, 10, 15, 30, 0)
+GRADES = ["9th", "10th", "11th"]
+
+
+def random_summaries(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    for i in range(count):
+        summary = {
+            "session_id": f"sess_{i}",
+            "student_id_hash": f"hash_{rng.randrange(40)}",
+            "school_id": "school_001",
+            "end_risk_score": round(rng.random(), 2),
+            "counselor_flag": rng.random() < 0.2,
+            "timestamp": NOW - timedelta(minutes=rng.randrange(14 * 24 * 60)),
+        }
+        if i % 5:
+            summary["grade_level"] = rng.choice(GRADES)
+        if i % 11 == 0:
+            del summary["end_risk_score"]
+        yield summary
+
+
+def load(summaries, distinct_cap=4096):
+    store = ColumnarSummaryStore()
+    aggregates = RollingAggregates(store, distinct_cap=distinct_cap)
+    for summary in summaries:
+        aggregates.add(summary["school_id"], store.add(summary))
+    return store, aggregates
+
+
+def brute_force(summaries, since):
+    window = [s for s in summaries if s["timestamp"] >= since]
+    scores = [s.get("end_risk_score", 0) for s in window]
+    groups = {}
+    for s in window:
+        if s.get("end_risk_score") is not None:
+            groups.setdefault(str(s.get("grade_level", "unknown")), []).append(s["end_risk_score"])
+    return {
+        "sessions": len(window),
+        "students": len({s["student_id_hash"] for s in window}),
+        "flagged": sum(1 for s in window if s["counselor_flag"]),
+        "risk_sum": sum(scores),
+        "histogram": [
+            sum(1 for r in scores if r < 0.4),
+            sum(1 for r in scores if 0.4 <= r < 0.7),
+            sum(1 for r in scores if r >= 0.7),
+        ],
+        "groups": {k: (len(v), sum(v)) for k, v in groups.items()},
+    }
+
+
+class TestRollingAggregates:
+    @pytest.mark.parametrize("days", [1, 3, 7, 30])
+    def test_matches_full_scan(self, days):
+        summaries = list(random_summaries(600))
+        store, aggregates = load(summaries)
+        since = NOW - timedelta(days=days)
+
+        merged = aggregates.window("school_001", since)
+        expected = brute_force(summaries, since)
+        labels = store.dimension_labels("grade_level")
+        groups = {
+            labels[code]: totals
+            for code, totals in merged.group_totals("grade_level").items()
+            if totals[0]
+        }
+
+        assert merged.session_count == expected["sessions"]
+        assert merged.students.count() == expected["students"]
+        assert merged.students.is_exact
+        assert merged.flagged_count == expected["flagged"]
+        assert merged.risk_sum == pytest.approx(expected["risk_sum"])
+        assert merged.risk_histogram == expected["histogram"]
+        assert set(groups) == set(expected["groups"])
+        for key, (count, total) in expected["groups"].items():
+            assert groups[key][0] == count
+            assert groups[key][1] == pytest.approx(total)
+
+    def test_unknown_school_is_empty(self):
+        _, aggregates = load(random_summaries(10))
+
+        merged = aggregates.window("school_999", NOW - timedelta(days=7))
+
+        assert merged.session_count == 0
+        assert merged.students.count() == 0
+
+    def test_dimension_introduced_later_counts_earlier_rows_as_unknown(self):
+        summaries = [
+            {"student_id_hash": "a", "school_id": "s", "end_risk_score": 0.5,
+             "timestamp": NOW - timedelta(days=3)},
+            {"student_id_hash": "b", "school_id": "s", "end_risk_score": 0.7,
+             "timestamp": NOW - timedelta(days=1), "grade_level": "9th"},
+        ]
+        store, aggregates = load(summaries)
+
+        totals = aggregates.window("s", NOW - timedelta(days=5)).group_totals("grade_level")
+        labels = store.dimension_labels("grade_level")
+
+        assert {labels[c]: t[0] for c, t in totals.items()} == {"unknown": 1, "9th": 1}
+
+
+class TestDistinctCounter:
+    def test_exact_under_cap(self):
+        counter = DistinctCounter(cap=100)
+        counter.update(np.arange(500) % 60)
+
+        assert counter.is_exact
+        assert counter.count() == 60
+
+    def test_sketch_above_cap_is_close(self):
+        counter = DistinctCounter(cap=100)
+        counter.update(np.arange(20000))
+
+        assert not counter.is_exact
+        assert counter.count() == pytest.approx(20000, rel=0.05)
+
+    def test_single_adds_are_buffered(self):
+        counter = DistinctCounter(cap=1000)
+        for i in range(300):
+            counter.add(i % 150)
+
+        assert counter.count() == 150
+
+    def test_merge_of_exact_sets_stays_exact(self):
+        first, second = DistinctCounter(cap=100), DistinctCounter(cap=100)
+        first.update(np.arange(30))
+        second.update(np.arange(20, 50))
+
+        first.merge_from(second)
+
+        assert first.is_exact
+        assert first.count() == 50
+
+    def test_merge_with_sketch_never_reports_at_or_below_cap(self):
+        exact, sketch = DistinctCounter(cap=100), DistinctCounter(cap=100)
+        exact.update(np.arange(5))
+        sketch.update(np.arange(101))
+
+        exact.merge_from(sketch)
+
+        assert not exact.is_exact
+        assert exact.count() > 100
@@ -18,10 +18,18 @@ Endpoints:
 """
 
 from .audit_logger import AuditLogger, AuditAction, AuditEntity, AuditEntry
+from .chain_verification import (
+    CheckpointSigner,
+    VerificationCheckpoint,
+    ChainSegmentResult,
+)
 
 __all__ = [
     "AuditLogger",
     "AuditAction",
     "AuditEntity",
     "AuditEntry",
+    "CheckpointSigner",
+    "VerificationCheckpoint",
+    "ChainSegmentResult",
 ]
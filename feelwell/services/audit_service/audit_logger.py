@@ -8,9 +8,26 @@ import logging
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from itertools import islice
+from typing import Any, Dict, List, Optional
 import uuid
 
+from .audit_query import (
+    DEFAULT_PAGE_SIZE,
+    AuditPage,
+    AuditQuery,
+    InMemoryAuditIndex,
+    QueryCursor,
+)
+from .chain_verification import (
+    DEFAULT_CHECKPOINT_INTERVAL,
+    GENESIS_HASH,
+    CheckpointSigner,
+    VerificationCheckpoint,
+    periodic_checkpointer,
+    verify_segment,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +45,9 @@ class AuditAction(Enum):
     UPDATE_CONSENT = "update_consent"
     DELETE_DATA = "delete_data"
     
+    # Conversation
+    LLM_INTERACTION = "llm_interaction"
+    
     # Crisis events
     CRISIS_DETECTED = "crisis_detected"
     CRISIS_ACKNOWLEDGED = "crisis_acknowledged"
@@ -94,15 +114,34 @@ class AuditLogger:
     """Logs audit entries to immutable storage.
     
     In production, this writes to QLDB or PostgreSQL with WORM.
-    Maintains hash chain for cryptographic verification.
+    Maintains hash chain for cryptographic verification. When a
+    checkpoint signer is configured, verification resumes from the
+    latest signed checkpoint instead of rehashing from genesis.
     """
     
-    def __init__(self):
-        """Initialize audit logger."""
+    def __init__(
+        self,
+        checkpoint_signer: Optional[CheckpointSigner] = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ):
+        """Initialize audit logger.
+        
+        Args:
+            checkpoint_signer: Signs verification checkpoints; None disables
+                checkpointing so every verification starts at genesis
+            checkpoint_interval: Entries between recorded checkpoints
+        """
         self._entries: list = []  # In-memory for dev; QLDB in prod
-        self._last_hash: str = "genesis"
+        self._index = InMemoryAuditIndex()
+        self._last_hash: str = GENESIS_HASH
+        self._checkpoint_signer = checkpoint_signer
+        self._checkpoint_interval = checkpoint_interval
+        self._checkpoints: List[VerificationCheckpoint] = []
         
-        logger.info("AUDIT_LOGGER_INITIALIZED")
+        logger.info(
+            "AUDIT_LOGGER_INITIALIZED",
+            extra={"checkpointing": checkpoint_signer is not None}
+        )
     
     def log(
         self,
@@ -162,6 +201,7 @@ class AuditLogger:
         
         # Store entry
         self._entries.append(entry)
+        self._index.add(entry)
         self._last_hash = entry_hash
         
         logger.info(
@@ -251,48 +291,102 @@ class AuditLogger:
             details=entry_details,
         )
     
-    def verify_chain(self) -> bool:
+    def verify_chain(self, full: bool = False) -> bool:
         """Verify integrity of audit chain.
         
+        Only entries after the latest trusted checkpoint are rehashed,
+        unless full is set or checkpointing is disabled.
+        
+        Args:
+            full: Re-verify from genesis, ignoring checkpoints
+        
         Returns:
             True if chain is valid, False if tampered
+            
+        Logs:
+            - AUDIT_CHAIN_VERIFIED: Chain verified, with entries rehashed
         """
         if not self._entries:
             return True
         
-        expected_prev = "genesis"
-        for entry in self._entries:
-            if entry.previous_hash != expected_prev:
-                logger.critical(
-                    "AUDIT_CHAIN_VERIFICATION_FAILED",
-                    extra={
-                        "entry_id": entry.entry_id,
-                        "expected_prev": expected_prev[:16],
-                        "actual_prev": entry.previous_hash[:16],
-                    }
-                )
-                return False
-            
-            computed = entry.compute_hash()
-            if computed != entry.entry_hash:
-                logger.critical(
-                    "AUDIT_ENTRY_HASH_MISMATCH",
-                    extra={
-                        "entry_id": entry.entry_id,
-                        "computed": computed[:16],
-                        "stored": entry.entry_hash[:16],
-                    }
-                )
+        checkpoint = None if full else self._latest_trusted_checkpoint()
+        start_count = 0
+        expected_prev = GENESIS_HASH
+        if checkpoint is not None:
+            if not self._checkpoint_matches_entries(checkpoint):
                 return False
-            
-            expected_prev = entry.entry_hash
+            start_count = checkpoint.entry_count
+            expected_prev = checkpoint.entry_hash
+        
+        on_entry_verified = None
+        if self._checkpoint_signer is not None:
+            on_entry_verified = periodic_checkpointer(
+                signer=self._checkpoint_signer,
+                interval=self._checkpoint_interval,
+                base_count=start_count,
+                store=self._store_checkpoint,
+            )
+        
+        result = verify_segment(
+            islice(self._entries, start_count, None),
+            expected_prev=expected_prev,
+            on_entry_verified=on_entry_verified,
+        )
+        if not result.valid:
+            return False
         
         logger.info(
             "AUDIT_CHAIN_VERIFIED",
-            extra={"entry_count": len(self._entries)}
+            extra={
+                "entry_count": len(self._entries),
+                "entries_rehashed": result.entry_count,
+                "resumed_from_checkpoint": checkpoint is not None,
+            }
         )
         return True
     
+    @property
+    def checkpoints(self) -> List[VerificationCheckpoint]:
+        """Recorded verification checkpoints, oldest first."""
+        return list(self._checkpoints)
+    
+    def _store_checkpoint(self, checkpoint: VerificationCheckpoint) -> None:
+        """Record a checkpoint if it advances past the latest one."""
+        if self._checkpoints and self._checkpoints[-1].entry_count >= checkpoint.entry_count:
+            return
+        self._checkpoints.append(checkpoint)
+    
+    def _latest_trusted_checkpoint(self) -> Optional[VerificationCheckpoint]:
+        """Return newest checkpoint with a valid signature, if any."""
+        if self._checkpoint_signer is None:
+            return None
+        
+        for checkpoint in reversed(self._checkpoints):
+            if self._checkpoint_signer.is_trusted(checkpoint):
+                return checkpoint
+        return None
+    
+    def _checkpoint_matches_entries(self, checkpoint: VerificationCheckpoint) -> bool:
+        """Check the checkpointed entry is still where the checkpoint says.
+        
+        Logs:
+            - AUDIT_CHECKPOINT_MISMATCH: Stored entries were rewritten
+        """
+        position = checkpoint.entry_count - 1
+        if position < len(self._entries):
+            entry = self._entries[position]
+            if entry.entry_id == checkpoint.entry_id and entry.entry_hash == checkpoint.entry_hash:
+                return True
+        
+        logger.critical(
+            "AUDIT_CHECKPOINT_MISMATCH",
+            extra={
+                "entry_id": checkpoint.entry_id,
+                "entry_count": checkpoint.entry_count,
+            }
+        )
+        return False
+    
     def query(
         self,
         entity_type: Optional[AuditEntity] = None,
@@ -303,6 +397,8 @@ class AuditLogger:
     ) -> list:
         """Query audit entries.
         
+        Served from secondary indexes rather than a scan of every entry.
+        
         Args:
             entity_type: Filter by entity type
             entity_id: Filter by entity ID
@@ -311,19 +407,31 @@ class AuditLogger:
             end_date: Filter by end date
             
         Returns:
-            List of matching AuditEntry objects
+            List of matching AuditEntry objects, oldest first
         """
-        results = self._entries
-        
-        if entity_type:
-            results = [e for e in results if e.entity_type == entity_type]
-        if entity_id:
-            results = [e for e in results if e.entity_id == entity_id]
-        if action:
-            results = [e for e in results if e.action == action]
-        if start_date:
-            results = [e for e in results if e.timestamp >= start_date]
-        if end_date:
-            results = [e for e in results if e.timestamp <= end_date]
+        audit_query = AuditQuery(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            action=action,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return list(self._index.scan(audit_query, descending=False))
+    
+    def query_page(
+        self,
+        query: AuditQuery,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[QueryCursor] = None,
+    ) -> AuditPage:
+        """Return one page of matching entries, newest first.
         
-        return results
+        Args:
+            query: Filters to apply
+            limit: Maximum entries in the page
+            cursor: Position after the previous page (None for first page)
+            
+        Returns:
+            AuditPage with entries and the cursor for the next page
+        """
+        return self._index.page(query, limit=limit, cursor=cursor)
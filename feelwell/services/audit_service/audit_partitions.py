@@ -0,0 +1,530 @@
+"""Monthly partitioning and cold archival for the audit_entries table.
+
+Per ADR-005 the audit table is append-only, so without partitioning it
+grows without bound and every query and verification touches the whole
+heap. This module manages:
+
+- Schema: audit_entries as a table range-partitioned by month on
+  timestamp, plus the checkpoint and archive manifest tables
+- Rollover: creating the current and upcoming monthly partitions
+- Archival: exporting a cold partition to a gzip-compressed JSONL file in
+  chain order, recording its boundary hashes (first previous_hash, last
+  entry_hash) in audit_archives, then detaching and dropping it
+
+Archived files keep the hash chain verifiable: each archive is rehashed
+independently and stitched to its neighbours and to the first live entry
+using the recorded boundary hashes.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+
+from feelwell.shared.database import ConnectionManager, RepositoryError
+from .audit_logger import AuditAction, AuditEntity, AuditEntry
+from .audit_query import AUDIT_QUERY_INDEXES
+from .audit_repository import CHECKPOINT_TABLE_DDL, ENTRY_COLUMNS, row_to_entry
+from .chain_verification import (
+    GENESIS_HASH,
+    ChainSegmentResult,
+    verify_chunks,
+    verify_segment,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Parent table and naming scheme for monthly partitions
+PARENT_TABLE = "audit_entries"
+PARTITION_NAME_PATTERN = re.compile(r"^audit_entries_y(\d{4})m(\d{2})$")
+
+# Partitions created ahead of the current month so inserts never miss one
+DEFAULT_MONTHS_AHEAD = 1
+
+# Live months kept in PostgreSQL before a partition is archived
+DEFAULT_RETAIN_MONTHS = 3
+
+# Rows fetched per round trip when exporting a partition
+EXPORT_BATCH_SIZE = 5000
+
+ARCHIVE_FILE_SUFFIX = ".jsonl.gz"
+
+AUDIT_SCHEMA_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS audit_entries (
+        entry_id TEXT NOT NULL,
+        timestamp TIMESTAMP NOT NULL,
+        action TEXT NOT NULL,
+        entity_type TEXT NOT NULL,
+        entity_id TEXT NOT NULL,
+        actor_id TEXT NOT NULL,
+        actor_role TEXT NOT NULL,
+        school_id TEXT,
+        details JSONB NOT NULL DEFAULT '{}'::jsonb,
+        previous_hash TEXT NOT NULL,
+        entry_hash TEXT NOT NULL,
+        PRIMARY KEY (timestamp, entry_id)
+    ) PARTITION BY RANGE (timestamp)
+    """,
+    CHECKPOINT_TABLE_DDL,
+    """
+    CREATE TABLE IF NOT EXISTS audit_archives (
+        partition_name TEXT PRIMARY KEY,
+        range_start TIMESTAMP NOT NULL,
+        range_end TIMESTAMP NOT NULL,
+        entry_count BIGINT NOT NULL,
+        first_entry_id TEXT,
+        first_previous_hash TEXT,
+        last_entry_id TEXT,
+        last_hash TEXT,
+        last_timestamp TIMESTAMP,
+        file_path TEXT NOT NULL,
+        file_sha256 TEXT NOT NULL,
+        archived_at TIMESTAMP NOT NULL
+    )
+    """,
+)
+
+
+@dataclass(frozen=True)
+class ArchivedPartition:
+    """Manifest of an exported monthly partition.
+
+    The boundary hashes let the archive be stitched into the chain
+    without reloading it into PostgreSQL.
+    """
+    partition_name: str
+    range_start: datetime
+    range_end: datetime
+    entry_count: int
+    first_entry_id: Optional[str]
+    first_previous_hash: Optional[str]
+    last_entry_id: Optional[str]
+    last_hash: Optional[str]
+    last_timestamp: Optional[datetime]
+    file_path: str
+    file_sha256: str
+    archived_at: datetime
+
+
+def month_start(value: datetime) -> datetime:
+    """First instant of the month containing value."""
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months."""
+    month_index = value.year * 12 + (value.month - 1) + months
+    return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Partition table name for a month, e.g. audit_entries_y2026m01."""
+    return f"{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def parse_partition_name(name: str) -> Optional[datetime]:
+    """Month start encoded in a partition name, None if not a partition."""
+    match = PARTITION_NAME_PATTERN.match(name)
+    if match is None:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+
+def entry_to_archive_record(entry: AuditEntry) -> dict:
+    """Serialize an entry for an archive file (one JSON line)."""
+    return {
+        "entry_id": entry.entry_id,
+        "timestamp": entry.timestamp.isoformat(),
+        "action": entry.action.value,
+        "entity_type": entry.entity_type.value,
+        "entity_id": entry.entity_id,
+        "actor_id": entry.actor_id,
+        "actor_role": entry.actor_role,
+        "school_id": entry.school_id,
+        "details": entry.details,
+        "previous_hash": entry.previous_hash,
+        "entry_hash": entry.entry_hash,
+    }
+
+
+def entry_from_archive_record(record: dict) -> AuditEntry:
+    """Rebuild an entry from an archive record."""
+    return AuditEntry(
+        entry_id=record["entry_id"],
+        timestamp=datetime.fromisoformat(record["timestamp"]),
+        action=AuditAction(record["action"]),
+        entity_type=AuditEntity(record["entity_type"]),
+        entity_id=record["entity_id"],
+        actor_id=record["actor_id"],
+        actor_role=record["actor_role"],
+        school_id=record["school_id"],
+        details=record["details"] or {},
+        previous_hash=record["previous_hash"],
+        entry_hash=record["entry_hash"],
+    )
+
+
+def read_archive(file_path: str) -> Iterator[AuditEntry]:
+    """Stream entries from an archive file in chain order."""
+    with gzip.open(file_path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield entry_from_archive_record(json.loads(line))
+
+
+def file_sha256(file_path: str) -> str:
+    """SHA-256 of a file's bytes, read in blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class AuditPartitionManager:
+    """Manages monthly partitions and archives of audit_entries.
+
+    PostgreSQL only; the in-memory and QLDB backends are not partitioned.
+    """
+
+    def __init__(
+        self,
+        connection_manager: ConnectionManager,
+        archive_dir: str,
+        months_ahead: int = DEFAULT_MONTHS_AHEAD,
+    ):
+        """Initialize partition manager.
+
+        Args:
+            connection_manager: PostgreSQL connection manager
+            archive_dir: Directory for exported archive files (synced to
+                S3 Glacier by the deployment)
+            months_ahead: Future monthly partitions to keep created
+        """
+        self.connection_manager = connection_manager
+        self.archive_dir = archive_dir
+        self.months_ahead = months_ahead
+
+        logger.info(
+            "AUDIT_PARTITION_MANAGER_INITIALIZED",
+            extra={"archive_dir": archive_dir, "months_ahead": months_ahead}
+        )
+
+    def ensure_schema(self) -> None:
+        """Create the partitioned table, support tables and indexes.
+
+        Idempotent. Indexes declared on the parent are created on every
+        partition automatically.
+
+        Raises:
+            RepositoryError: If DDL fails
+        """
+        statements = list(AUDIT_SCHEMA_DDL) + list(AUDIT_QUERY_INDEXES)
+        self._execute_ddl(statements)
+        logger.info("AUDIT_SCHEMA_ENSURED", extra={"statement_count": len(statements)})
+
+    def ensure_partitions(self, now: Optional[datetime] = None) -> List[str]:
+        """Create partitions for the current month and months_ahead after.
+
+        Call on startup and from a daily job so the next month's partition
+        exists before the first insert lands in it.
+
+        Args:
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            Names of the partitions ensured
+
+        Raises:
+            RepositoryError: If DDL fails
+        """
+        current = month_start(now or datetime.utcnow())
+        names = []
+        statements = []
+        for offset in range(self.months_ahead + 1):
+            start = add_months(current, offset)
+            end = add_months(start, 1)
+            name = partition_name(start)
+            names.append(name)
+            statements.append(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+
+        self._execute_ddl(statements)
+        logger.info("AUDIT_PARTITIONS_ENSURED", extra={"partitions": names})
+        return names
+
+    def list_partitions(self) -> List[datetime]:
+        """Month starts of attached live partitions, oldest first."""
+        query = """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+        """
+        with self.connection_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (PARENT_TABLE,))
+                rows = cur.fetchall()
+
+        months = []
+        for row in rows:
+            month = parse_partition_name(row[0])
+            if month is not None:
+                months.append(month)
+        return sorted(months)
+
+    def list_archives(self) -> List[ArchivedPartition]:
+        """Archive manifests in chain order (oldest first)."""
+        query = """
+            SELECT partition_name, range_start, range_end, entry_count,
+                   first_entry_id, first_previous_hash, last_entry_id,
+                   last_hash, last_timestamp, file_path, file_sha256,
+                   archived_at
+            FROM audit_archives
+            ORDER BY range_start ASC
+        """
+        with self.connection_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query)
+                rows = cur.fetchall()
+
+        archives = []
+        for row in rows:
+            archives.append(ArchivedPartition(*row))
+        return archives
+
+    def archived_through(self) -> Optional[datetime]:
+        """Exclusive upper bound of archived time, None if nothing archived."""
+        archives = self.list_archives()
+        if not archives:
+            return None
+        return archives[-1].range_end
+
+    def archive_cold_partitions(
+        self,
+        now: Optional[datetime] = None,
+        retain_months: int = DEFAULT_RETAIN_MONTHS,
+    ) -> List[ArchivedPartition]:
+        """Archive every partition older than the retention window.
+
+        Partitions are archived oldest first so each archive links to the
+        previous one.
+
+        Args:
+            now: Reference time (defaults to utcnow)
+            retain_months: Live months to keep, including the current one
+
+        Returns:
+            Manifests of the partitions archived by this call
+        """
+        cutoff = add_months(month_start(now or datetime.utcnow()), -(retain_months - 1))
+        archived = []
+        for month in self.list_partitions():
+            if month >= cutoff:
+                break
+            archived.append(self.archive_partition(month))
+        return archived
+
+    def archive_partition(self, month: datetime, drop: bool = True) -> ArchivedPartition:
+        """Export one monthly partition and (optionally) drop it.
+
+        The partition is streamed in chain order, rehashed while it is
+        written, and must link to the previous archive. The file is
+        re-read and checksummed before anything is dropped.
+
+        Args:
+            month: Any time within the month to archive
+            drop: Detach and drop the partition after a successful export
+
+        Returns:
+            ArchivedPartition manifest
+
+        Raises:
+            RepositoryError: If the partition fails verification, does not
+                link to the previous archive, or the export fails
+
+        Logs:
+            - AUDIT_PARTITION_ARCHIVE_STARTED / AUDIT_PARTITION_ARCHIVED
+            - AUDIT_PARTITION_ARCHIVE_FAILED: Export aborted
+        """
+        start = month_start(month)
+        end = add_months(start, 1)
+        name = partition_name(start)
+        logger.info("AUDIT_PARTITION_ARCHIVE_STARTED", extra={"partition": name})
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        final_path = os.path.join(self.archive_dir, name + ARCHIVE_FILE_SUFFIX)
+        temp_path = final_path + ".tmp"
+
+        with gzip.open(temp_path, "wt", encoding="utf-8") as handle:
+            def write_through(entries: Iterable[AuditEntry]) -> Iterator[AuditEntry]:
+                for entry in entries:
+                    handle.write(json.dumps(entry_to_archive_record(entry), sort_keys=True))
+                    handle.write("\n")
+                    yield entry
+
+            segment = verify_segment(write_through(self._stream_partition(name)))
+
+        previous_archives = self.list_archives()
+        expected_prev = previous_archives[-1].last_hash if previous_archives else GENESIS_HASH
+        failure = None
+        if not segment.valid:
+            failure = f"entry {segment.failed_entry_id} failed verification"
+        elif segment.entry_count and segment.first_previous_hash != expected_prev:
+            failure = "first entry does not link to the previous archive"
+
+        if failure is not None:
+            os.remove(temp_path)
+            logger.critical(
+                "AUDIT_PARTITION_ARCHIVE_FAILED",
+                extra={"partition": name, "reason": failure}
+            )
+            raise RepositoryError(f"Refusing to archive {name}: {failure}")
+
+        os.replace(temp_path, final_path)
+        checksum = file_sha256(final_path)
+        reread = verify_segment(read_archive(final_path), expected_prev=segment.first_previous_hash)
+        if reread.entry_count != segment.entry_count or reread.last_hash != segment.last_hash:
+            logger.critical(
+                "AUDIT_PARTITION_ARCHIVE_FAILED",
+                extra={"partition": name, "reason": "archive re-read mismatch"}
+            )
+            raise RepositoryError(f"Archive file for {name} does not match partition")
+
+        archive = ArchivedPartition(
+            partition_name=name,
+            range_start=start,
+            range_end=end,
+            entry_count=segment.entry_count,
+            first_entry_id=segment.first_entry_id,
+            first_previous_hash=segment.first_previous_hash,
+            last_entry_id=segment.last_entry_id,
+            last_hash=segment.last_hash,
+            last_timestamp=segment.last_timestamp,
+            file_path=final_path,
+            file_sha256=checksum,
+            archived_at=datetime.utcnow(),
+        )
+        self._write_manifest(archive, drop)
+
+        logger.info(
+            "AUDIT_PARTITION_ARCHIVED",
+            extra={
+                "partition": name,
+                "entry_count": archive.entry_count,
+                "last_hash": (archive.last_hash or "")[:16],
+                "dropped": drop,
+            }
+        )
+        return archive
+
+    def verify_archives(self, max_workers: int = 4) -> ChainSegmentResult:
+        """Rehash every archive file and stitch them from genesis.
+
+        Each file's checksum is compared with its manifest first.
+
+        Returns:
+            Combined ChainSegmentResult; last_hash is the anchor for the
+            first live entry
+        """
+        archives = self.list_archives()
+        loaders = []
+        for archive in archives:
+            if file_sha256(archive.file_path) != archive.file_sha256:
+                logger.critical(
+                    "AUDIT_ARCHIVE_CHECKSUM_MISMATCH",
+                    extra={"partition": archive.partition_name}
+                )
+                return ChainSegmentResult(
+                    valid=False,
+                    entry_count=0,
+                    failed_entry_id=archive.first_entry_id,
+                )
+            loaders.append(lambda path=archive.file_path: read_archive(path))
+
+        return verify_chunks(loaders, anchor_hash=GENESIS_HASH, max_workers=max_workers)
+
+    def _stream_partition(self, name: str) -> Iterator[AuditEntry]:
+        """Stream a partition's rows in chain order via a named cursor."""
+        query = f"SELECT {ENTRY_COLUMNS} FROM {name} ORDER BY timestamp ASC, entry_id ASC"
+        with self.connection_manager.get_connection() as conn:
+            try:
+                with conn.cursor(name=f"audit_export_{uuid.uuid4().hex[:12]}") as cur:
+                    cur.itersize = EXPORT_BATCH_SIZE
+                    cur.execute(query)
+                    for row in cur:
+                        yield row_to_entry(row)
+            finally:
+                conn.rollback()
+
+    def _write_manifest(self, archive: ArchivedPartition, drop: bool) -> None:
+        """Record the archive and drop the partition in one transaction."""
+        insert = """
+            INSERT INTO audit_archives (
+                partition_name, range_start, range_end, entry_count,
+                first_entry_id, first_previous_hash, last_entry_id,
+                last_hash, last_timestamp, file_path, file_sha256,
+                archived_at
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """
+        params = (
+            archive.partition_name,
+            archive.range_start,
+            archive.range_end,
+            archive.entry_count,
+            archive.first_entry_id,
+            archive.first_previous_hash,
+            archive.last_entry_id,
+            archive.last_hash,
+            archive.last_timestamp,
+            archive.file_path,
+            archive.file_sha256,
+            archive.archived_at,
+        )
+
+        try:
+            with self.connection_manager.get_connection() as conn:
+                try:
+                    with conn.cursor() as cur:
+                        cur.execute(insert, params)
+                        if drop:
+                            cur.execute(
+                                f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {archive.partition_name}"
+                            )
+                            cur.execute(f"DROP TABLE {archive.partition_name}")
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+        except Exception as e:
+            logger.error(
+                "AUDIT_ARCHIVE_MANIFEST_FAILED",
+                extra={"partition": archive.partition_name, "error": str(e)}
+            )
+            raise RepositoryError(f"Failed to record archive {archive.partition_name}: {e}")
+
+    def _execute_ddl(self, statements: List[str]) -> None:
+        """Run DDL statements in one transaction."""
+        try:
+            with self.connection_manager.get_connection() as conn:
+                try:
+                    with conn.cursor() as cur:
+                        for statement in statements:
+                            cur.execute(statement)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+        except Exception as e:
+            logger.error("AUDIT_SCHEMA_DDL_FAILED", extra={"error": str(e)})
+            raise RepositoryError(f"Audit schema operation failed: {e}")
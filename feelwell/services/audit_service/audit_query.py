@@ -0,0 +1,315 @@
+"""Index-backed audit query planning with keyset pagination.
+
+Audit reads follow a few access patterns (FERPA "who touched this
+student", "what did this counselor access", school reports over a time
+range). Each pattern gets a plan served by an index ordered on
+(timestamp, entry_id), so a page is a range lookup instead of a filter
+over the whole table:
+
+- PostgreSQL: composite B-tree indexes in AUDIT_QUERY_INDEXES
+- In-memory (dev/test, QLDB fallback): InMemoryAuditIndex
+
+Pagination is keyset-based on (timestamp, entry_id): the cursor is the
+last row of the previous page, so deep pages cost the same as the first.
+"""
+import base64
+import bisect
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .audit_logger import AuditAction, AuditEntity, AuditEntry
+
+logger = logging.getLogger(__name__)
+
+
+# Default and maximum entries returned per page
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Composite indexes backing each QueryPlan on the audit_entries table
+AUDIT_QUERY_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_audit_entity_time "
+    "ON audit_entries (entity_id, timestamp DESC, entry_id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_audit_actor_time "
+    "ON audit_entries (actor_id, timestamp DESC, entry_id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_audit_school_time "
+    "ON audit_entries (school_id, timestamp DESC, entry_id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_audit_time "
+    "ON audit_entries (timestamp DESC, entry_id DESC)",
+)
+
+
+class QueryPlan(Enum):
+    """Index used to answer a query, most selective first."""
+    BY_ENTITY = "by_entity"
+    BY_ACTOR = "by_actor"
+    BY_SCHOOL_TIME = "by_school_time"
+    BY_TIME = "by_time"
+
+
+class InvalidCursorError(ValueError):
+    """Pagination cursor token could not be decoded."""
+    pass
+
+
+@dataclass(frozen=True)
+class AuditQuery:
+    """Filters for an audit query. All set filters must match."""
+    entity_type: Optional["AuditEntity"] = None
+    entity_id: Optional[str] = None
+    action: Optional["AuditAction"] = None
+    actor_id: Optional[str] = None
+    school_id: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+    def matches(self, entry: "AuditEntry") -> bool:
+        """Check entry against every filter (residual predicate)."""
+        if self.entity_type and entry.entity_type != self.entity_type:
+            return False
+        if self.entity_id and entry.entity_id != self.entity_id:
+            return False
+        if self.action and entry.action != self.action:
+            return False
+        if self.actor_id and entry.actor_id != self.actor_id:
+            return False
+        if self.school_id and entry.school_id != self.school_id:
+            return False
+        if self.start_date and entry.timestamp < self.start_date:
+            return False
+        if self.end_date and entry.timestamp > self.end_date:
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class QueryCursor:
+    """Keyset position: the (timestamp, entry_id) of the last row returned."""
+    timestamp: datetime
+    entry_id: str
+
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe token for API clients."""
+        raw = f"{self.timestamp.isoformat()}|{self.entry_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "QueryCursor":
+        """Decode a token produced by encode().
+
+        Raises:
+            InvalidCursorError: If the token is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token.encode()).decode()
+            timestamp_str, entry_id = raw.split("|", 1)
+            return cls(timestamp=datetime.fromisoformat(timestamp_str), entry_id=entry_id)
+        except (ValueError, UnicodeDecodeError) as e:
+            logger.warning("AUDIT_QUERY_CURSOR_INVALID", extra={"error": str(e)})
+            raise InvalidCursorError(f"Invalid pagination cursor: {e}")
+
+    @classmethod
+    def after_entry(cls, entry: "AuditEntry") -> "QueryCursor":
+        """Cursor positioned at an entry."""
+        return cls(timestamp=entry.timestamp, entry_id=entry.entry_id)
+
+
+@dataclass
+class AuditPage:
+    """One page of query results.
+
+    Attributes:
+        entries: Entries in this page, newest first
+        next_cursor: Cursor for the next page, None when exhausted
+        plan: Index plan that served the query
+    """
+    entries: List["AuditEntry"] = field(default_factory=list)
+    next_cursor: Optional[QueryCursor] = None
+    plan: QueryPlan = QueryPlan.BY_TIME
+
+
+def plan_query(query: AuditQuery) -> QueryPlan:
+    """Choose the most selective index for a query.
+
+    Equality on entity_id or actor_id narrows to a handful of rows;
+    school_id narrows to one tenant; otherwise scan by time.
+    """
+    if query.entity_id:
+        return QueryPlan.BY_ENTITY
+    if query.actor_id:
+        return QueryPlan.BY_ACTOR
+    if query.school_id:
+        return QueryPlan.BY_SCHOOL_TIME
+    return QueryPlan.BY_TIME
+
+
+def build_postgres_query(
+    query: AuditQuery,
+    columns: str,
+    limit: int,
+    cursor: Optional[QueryCursor] = None,
+) -> Tuple[str, List]:
+    """Build a keyset-paginated SELECT for audit_entries.
+
+    Equality filters come first so the planner can use the composite
+    (column, timestamp DESC, entry_id DESC) index for the chosen plan.
+
+    Returns:
+        Tuple of (SQL text, parameters)
+    """
+    clauses: List[str] = []
+    params: List = []
+
+    if query.entity_id:
+        clauses.append("entity_id = %s")
+        params.append(query.entity_id)
+    if query.actor_id:
+        clauses.append("actor_id = %s")
+        params.append(query.actor_id)
+    if query.school_id:
+        clauses.append("school_id = %s")
+        params.append(query.school_id)
+    if query.entity_type:
+        clauses.append("entity_type = %s")
+        params.append(query.entity_type.value)
+    if query.action:
+        clauses.append("action = %s")
+        params.append(query.action.value)
+    if query.start_date:
+        clauses.append("timestamp >= %s")
+        params.append(query.start_date)
+    if query.end_date:
+        clauses.append("timestamp <= %s")
+        params.append(query.end_date)
+    if cursor is not None:
+        # Plain timestamp bound lets the planner prune monthly partitions;
+        # the row comparison alone is not used for pruning
+        clauses.append("timestamp <= %s")
+        params.append(cursor.timestamp)
+        clauses.append("(timestamp, entry_id) < (%s, %s)")
+        params.extend([cursor.timestamp, cursor.entry_id])
+
+    sql = f"SELECT {columns} FROM audit_entries"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY timestamp DESC, entry_id DESC LIMIT %s"
+    params.append(limit)
+
+    return sql, params
+
+
+def _sort_key(entry: "AuditEntry") -> Tuple[datetime, str]:
+    return (entry.timestamp, entry.entry_id)
+
+
+def _timestamp_key(entry: "AuditEntry") -> datetime:
+    return entry.timestamp
+
+
+class InMemoryAuditIndex:
+    """Secondary indexes over in-memory audit entries.
+
+    Every index is a list sorted ascending on (timestamp, entry_id), so a
+    time window or cursor is a binary search and results come out in
+    order without sorting. Appends are O(1) when entries arrive in time
+    order (the normal case) and O(log n) + shift otherwise.
+    """
+
+    def __init__(self):
+        """Initialize empty indexes."""
+        self._by_time: List["AuditEntry"] = []
+        self._by_entity: Dict[str, List["AuditEntry"]] = {}
+        self._by_actor: Dict[str, List["AuditEntry"]] = {}
+        self._by_school: Dict[str, List["AuditEntry"]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_time)
+
+    def add(self, entry: "AuditEntry") -> None:
+        """Index a newly stored entry."""
+        self._insert(self._by_time, entry)
+        self._insert(self._by_entity.setdefault(entry.entity_id, []), entry)
+        self._insert(self._by_actor.setdefault(entry.actor_id, []), entry)
+        if entry.school_id is not None:
+            self._insert(self._by_school.setdefault(entry.school_id, []), entry)
+
+    @staticmethod
+    def _insert(bucket: List["AuditEntry"], entry: "AuditEntry") -> None:
+        if not bucket or _sort_key(bucket[-1]) <= _sort_key(entry):
+            bucket.append(entry)
+        else:
+            bisect.insort(bucket, entry, key=_sort_key)
+
+    def _bucket_for(self, query: AuditQuery, plan: QueryPlan) -> List["AuditEntry"]:
+        if plan == QueryPlan.BY_ENTITY:
+            return self._by_entity.get(query.entity_id, [])
+        if plan == QueryPlan.BY_ACTOR:
+            return self._by_actor.get(query.actor_id, [])
+        if plan == QueryPlan.BY_SCHOOL_TIME:
+            return self._by_school.get(query.school_id, [])
+        return self._by_time
+
+    def scan(
+        self,
+        query: AuditQuery,
+        cursor: Optional[QueryCursor] = None,
+        descending: bool = True,
+    ) -> Iterator["AuditEntry"]:
+        """Yield matching entries in (timestamp, entry_id) order.
+
+        Args:
+            query: Filters to apply
+            cursor: Resume strictly after this position
+            descending: Newest first (default) or oldest first
+
+        Yields:
+            Matching AuditEntry objects, lazily
+        """
+        plan = plan_query(query)
+        bucket = self._bucket_for(query, plan)
+
+        low = 0
+        high = len(bucket)
+        if query.start_date:
+            low = bisect.bisect_left(bucket, query.start_date, key=_timestamp_key)
+        if query.end_date:
+            high = bisect.bisect_right(bucket, query.end_date, key=_timestamp_key)
+        if cursor is not None:
+            position = (cursor.timestamp, cursor.entry_id)
+            if descending:
+                high = min(high, bisect.bisect_left(bucket, position, key=_sort_key))
+            else:
+                low = max(low, bisect.bisect_right(bucket, position, key=_sort_key))
+
+        if descending:
+            positions = range(high - 1, low - 1, -1)
+        else:
+            positions = range(low, high)
+
+        for position in positions:
+            entry = bucket[position]
+            if query.matches(entry):
+                yield entry
+
+    def page(
+        self,
+        query: AuditQuery,
+        limit: int,
+        cursor: Optional[QueryCursor] = None,
+    ) -> AuditPage:
+        """Return one page of matches, newest first."""
+        entries: List["AuditEntry"] = []
+        for entry in self.scan(query, cursor=cursor, descending=True):
+            entries.append(entry)
+            if len(entries) == limit:
+                break
+
+        next_cursor = None
+        if len(entries) == limit:
+            next_cursor = QueryCursor.after_entry(entries[-1])
+
+        return AuditPage(entries=entries, next_cursor=next_cursor, plan=plan_query(query))
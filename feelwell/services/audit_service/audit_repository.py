@@ -9,19 +9,97 @@ In production, this integrates with:
 """
 import json
 import logging
-from dataclasses import asdict
+import uuid
+from dataclasses import asdict, replace
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from feelwell.shared.database import (
     ConnectionManager,
     RepositoryError,
 )
 from .audit_logger import AuditEntry, AuditAction, AuditEntity
+from .audit_query import (
+    AUDIT_QUERY_INDEXES,
+    DEFAULT_PAGE_SIZE,
+    AuditPage,
+    AuditQuery,
+    InMemoryAuditIndex,
+    QueryCursor,
+    build_postgres_query,
+    plan_query,
+)
+from .chain_verification import (
+    DEFAULT_CHECKPOINT_INTERVAL,
+    GENESIS_HASH,
+    ChainSegmentResult,
+    CheckpointSigner,
+    VerificationCheckpoint,
+    periodic_checkpointer,
+    verify_chunks,
+    verify_segment,
+)
+
+if TYPE_CHECKING:
+    from .audit_partitions import AuditPartitionManager
 
 logger = logging.getLogger(__name__)
 
 
+# Explicit column order for audit_entries reads (matches row_to_entry)
+ENTRY_COLUMNS = (
+    "entry_id, timestamp, action, entity_type, entity_id, "
+    "actor_id, actor_role, school_id, details, previous_hash, entry_hash"
+)
+
+# Rows fetched per round trip by the server-side verification cursor
+VERIFY_STREAM_BATCH_SIZE = 5000
+
+# Entries per chunk for parallel full re-verification
+DEFAULT_VERIFY_CHUNK_SIZE = 50000
+
+# Newest checkpoints inspected when looking for a trusted one
+CHECKPOINT_LOOKBACK = 10
+
+# Checkpointed entry lookup; the timestamp predicate prunes the scan to
+# the entry's monthly partition
+CHECKPOINT_ENTRY_SQL = (
+    "SELECT entry_hash FROM audit_entries WHERE entry_id = %s AND timestamp = %s"
+)
+
+CHECKPOINT_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS audit_checkpoints (
+        entry_count BIGINT PRIMARY KEY,
+        entry_id TEXT NOT NULL,
+        entry_hash TEXT NOT NULL,
+        entry_timestamp TIMESTAMP NOT NULL,
+        created_at TIMESTAMP NOT NULL,
+        signature TEXT NOT NULL
+    )
+"""
+
+
+def row_to_entry(row: tuple) -> AuditEntry:
+    """Convert an audit_entries row (ENTRY_COLUMNS order) to AuditEntry."""
+    details = row[8]
+    if isinstance(details, str):
+        details = json.loads(details)
+    
+    return AuditEntry(
+        entry_id=row[0],
+        timestamp=row[1],
+        action=AuditAction(row[2]),
+        entity_type=AuditEntity(row[3]),
+        entity_id=row[4],
+        actor_id=row[5],
+        actor_role=row[6],
+        school_id=row[7],
+        details=details or {},
+        previous_hash=row[9],
+        entry_hash=row[10],
+    )
+
+
 class AuditRepository:
     """Repository for immutable audit entries.
     
@@ -34,6 +112,9 @@ class AuditRepository:
         connection_manager: Optional[ConnectionManager] = None,
         qldb_ledger: Optional[str] = None,
         use_qldb: bool = False,
+        checkpoint_signer: Optional[CheckpointSigner] = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        partition_manager: Optional["AuditPartitionManager"] = None,
     ):
         """Initialize audit repository.
         
@@ -41,14 +122,25 @@ class AuditRepository:
             connection_manager: PostgreSQL connection manager
             qldb_ledger: QLDB ledger name (if using QLDB)
             use_qldb: Whether to use QLDB instead of PostgreSQL
+            checkpoint_signer: Signs verification checkpoints; None disables
+                checkpointing so every verification starts at genesis
+            checkpoint_interval: Entries between recorded checkpoints
+            partition_manager: Monthly partition/archive manager; when set,
+                verification covers archived partitions before live rows
         """
         self.connection_manager = connection_manager
         self.qldb_ledger = qldb_ledger
         self.use_qldb = use_qldb
         self._qldb_driver = None
+        self._checkpoint_signer = checkpoint_signer
+        self._checkpoint_interval = checkpoint_interval
+        self._checkpoint_table_ready = False
+        self.partition_manager = partition_manager
         
         # In-memory fallback for development
         self._memory_store: List[AuditEntry] = []
+        self._memory_index = InMemoryAuditIndex()
+        self._memory_checkpoints: List[VerificationCheckpoint] = []
         
         logger.info(
             "AUDIT_REPOSITORY_INITIALIZED",
@@ -174,6 +266,7 @@ class AuditRepository:
     def _append_memory(self, entry: AuditEntry) -> bool:
         """Append to in-memory store (development only)."""
         self._memory_store.append(entry)
+        self._memory_index.add(entry)
         
         logger.debug(
             "AUDIT_ENTRY_STORED_MEMORY",
@@ -208,110 +301,165 @@ class AuditRepository:
             limit: Maximum entries to return
             
         Returns:
-            List of matching AuditEntry objects
+            List of matching AuditEntry objects, newest first
+        """
+        audit_query = AuditQuery(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            action=action,
+            actor_id=actor_id,
+            school_id=school_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return self.query_page(audit_query, limit=limit).entries
+    
+    def query_page(
+        self,
+        query: AuditQuery,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[QueryCursor] = None,
+    ) -> AuditPage:
+        """Return one page of matching entries, newest first.
+        
+        Args:
+            query: Filters to apply
+            limit: Maximum entries in the page
+            cursor: Position after the previous page (None for first page)
+            
+        Returns:
+            AuditPage with entries and the cursor for the next page
         """
         if self.use_qldb:
-            return self._query_qldb(
-                entity_type, entity_id, action, actor_id,
-                school_id, start_date, end_date, limit
-            )
+            return self._query_qldb(query, limit, cursor)
         elif self.connection_manager:
-            return self._query_postgres(
-                entity_type, entity_id, action, actor_id,
-                school_id, start_date, end_date, limit
-            )
+            return self._query_postgres(query, limit, cursor)
         else:
-            return self._query_memory(
-                entity_type, entity_id, action, actor_id,
-                school_id, start_date, end_date, limit
+            return self._query_memory(query, limit, cursor)
+    
+    def iter_query(
+        self,
+        query: AuditQuery,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[AuditEntry]:
+        """Stream every matching entry, newest first.
+        
+        Pages are fetched lazily with keyset pagination, so at most one
+        page is held in memory regardless of result size.
+        
+        Args:
+            query: Filters to apply
+            page_size: Entries fetched per round trip
+            
+        Yields:
+            Matching AuditEntry objects
+        """
+        if not self.use_qldb and not self.connection_manager:
+            yield from self._memory_index.scan(query)
+            return
+        
+        cursor: Optional[QueryCursor] = None
+        while True:
+            page = self.query_page(query, limit=page_size, cursor=cursor)
+            yield from page.entries
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+    
+    def ensure_query_indexes(self) -> None:
+        """Create the composite indexes backing each query plan.
+        
+        Idempotent; call during deployment or service startup.
+        
+        Raises:
+            RepositoryError: If index creation fails
+        """
+        if not self.connection_manager or self.use_qldb:
+            return
+        
+        try:
+            with self.connection_manager.get_connection() as conn:
+                with conn.cursor() as cur:
+                    for statement in AUDIT_QUERY_INDEXES:
+                        cur.execute(statement)
+                    conn.commit()
+        except Exception as e:
+            logger.error(
+                "AUDIT_QUERY_INDEX_CREATE_FAILED",
+                extra={"error": str(e)}
             )
+            raise RepositoryError(f"Failed to create audit query indexes: {e}")
+        
+        logger.info(
+            "AUDIT_QUERY_INDEXES_ENSURED",
+            extra={"index_count": len(AUDIT_QUERY_INDEXES)}
+        )
+    
+    def ensure_checkpoint_table(self) -> None:
+        """Create the audit_checkpoints table if it does not exist.
+        
+        Idempotent; also run before the first checkpoint read or write.
+        
+        Raises:
+            RepositoryError: If table creation fails
+        """
+        if not self.connection_manager or self.use_qldb or self._checkpoint_table_ready:
+            return
+        
+        try:
+            with self.connection_manager.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(CHECKPOINT_TABLE_DDL)
+                    conn.commit()
+        except Exception as e:
+            logger.error(
+                "AUDIT_CHECKPOINT_TABLE_CREATE_FAILED",
+                extra={"error": str(e)}
+            )
+            raise RepositoryError(f"Failed to create audit checkpoint table: {e}")
+        
+        self._checkpoint_table_ready = True
     
     def _query_postgres(
         self,
-        entity_type: Optional[AuditEntity],
-        entity_id: Optional[str],
-        action: Optional[AuditAction],
-        actor_id: Optional[str],
-        school_id: Optional[str],
-        start_date: Optional[datetime],
-        end_date: Optional[datetime],
+        query: AuditQuery,
         limit: int,
-    ) -> List[AuditEntry]:
-        """Query PostgreSQL audit table."""
-        query = "SELECT * FROM audit_entries WHERE 1=1"
-        params = []
-        
-        if entity_type:
-            query += " AND entity_type = %s"
-            params.append(entity_type.value)
-        if entity_id:
-            query += " AND entity_id = %s"
-            params.append(entity_id)
-        if action:
-            query += " AND action = %s"
-            params.append(action.value)
-        if actor_id:
-            query += " AND actor_id = %s"
-            params.append(actor_id)
-        if school_id:
-            query += " AND school_id = %s"
-            params.append(school_id)
-        if start_date:
-            query += " AND timestamp >= %s"
-            params.append(start_date)
-        if end_date:
-            query += " AND timestamp <= %s"
-            params.append(end_date)
-        
-        query += " ORDER BY timestamp DESC LIMIT %s"
-        params.append(limit)
+        cursor: Optional[QueryCursor],
+    ) -> AuditPage:
+        """Query PostgreSQL audit table with keyset pagination."""
+        sql, params = build_postgres_query(query, ENTRY_COLUMNS, limit, cursor)
         
         with self.connection_manager.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, params)
+                cur.execute(sql, params)
                 rows = cur.fetchall()
-                
-                return [self._row_to_entry(row) for row in rows]
+        
+        entries = [self._row_to_entry(row) for row in rows]
+        next_cursor = None
+        if len(entries) == limit:
+            next_cursor = QueryCursor.after_entry(entries[-1])
+        
+        return AuditPage(entries=entries, next_cursor=next_cursor, plan=plan_query(query))
     
-    def _query_qldb(self, *args, **kwargs) -> List[AuditEntry]:
+    def _query_qldb(
+        self,
+        query: AuditQuery,
+        limit: int,
+        cursor: Optional[QueryCursor],
+    ) -> AuditPage:
         """Query QLDB ledger."""
         # QLDB query implementation would go here
-        # For now, fall back to memory
-        return self._query_memory(*args, **kwargs)
+        # For now, fall back to the indexed in-memory store
+        return self._query_memory(query, limit, cursor)
     
     def _query_memory(
         self,
-        entity_type: Optional[AuditEntity],
-        entity_id: Optional[str],
-        action: Optional[AuditAction],
-        actor_id: Optional[str],
-        school_id: Optional[str],
-        start_date: Optional[datetime],
-        end_date: Optional[datetime],
+        query: AuditQuery,
         limit: int,
-    ) -> List[AuditEntry]:
-        """Query in-memory store."""
-        results = self._memory_store
-        
-        if entity_type:
-            results = [e for e in results if e.entity_type == entity_type]
-        if entity_id:
-            results = [e for e in results if e.entity_id == entity_id]
-        if action:
-            results = [e for e in results if e.action == action]
-        if actor_id:
-            results = [e for e in results if e.actor_id == actor_id]
-        if school_id:
-            results = [e for e in results if e.school_id == school_id]
-        if start_date:
-            results = [e for e in results if e.timestamp >= start_date]
-        if end_date:
-            results = [e for e in results if e.timestamp <= end_date]
-        
-        # Sort by timestamp descending
-        results = sorted(results, key=lambda e: e.timestamp, reverse=True)
-        
-        return results[:limit]
+        cursor: Optional[QueryCursor],
+    ) -> AuditPage:
+        """Query in-memory store through its secondary indexes."""
+        return self._memory_index.page(query, limit=limit, cursor=cursor)
     
     def _entry_to_document(self, entry: AuditEntry) -> Dict[str, Any]:
         """Convert AuditEntry to QLDB document."""
@@ -331,71 +479,355 @@ class AuditRepository:
     
     def _row_to_entry(self, row: tuple) -> AuditEntry:
         """Convert PostgreSQL row to AuditEntry."""
-        details = row[8]
-        if isinstance(details, str):
-            details = json.loads(details)
-        
-        return AuditEntry(
-            entry_id=row[0],
-            timestamp=row[1],
-            action=AuditAction(row[2]),
-            entity_type=AuditEntity(row[3]),
-            entity_id=row[4],
-            actor_id=row[5],
-            actor_role=row[6],
-            school_id=row[7],
-            details=details or {},
-            previous_hash=row[9],
-            entry_hash=row[10],
-        )
+        return row_to_entry(row)
     
-    def verify_chain(self, entries: Optional[List[AuditEntry]] = None) -> bool:
+    def verify_chain(
+        self,
+        entries: Optional[List[AuditEntry]] = None,
+        full: bool = False,
+    ) -> bool:
         """Verify integrity of audit chain.
         
+        Without explicit entries, rows are streamed in chain order and only
+        entries after the latest trusted checkpoint are rehashed, unless
+        full is set or checkpointing is disabled.
+        
         Args:
-            entries: Entries to verify (defaults to all)
+            entries: Entries to verify from genesis (defaults to stored chain)
+            full: Re-verify stored chain from genesis, ignoring checkpoints
             
         Returns:
             True if chain is valid
+            
+        Logs:
+            - AUDIT_CHAIN_VERIFIED: Chain verified, with entries rehashed
         """
-        if entries is None:
-            entries = self.query(limit=10000)
-        
-        if not entries:
-            return True
-        
-        # Sort by timestamp ascending for chain verification
-        entries = sorted(entries, key=lambda e: e.timestamp)
-        
-        expected_prev = "genesis"
-        for entry in entries:
-            if entry.previous_hash != expected_prev:
-                logger.critical(
-                    "AUDIT_CHAIN_BROKEN",
-                    extra={
-                        "entry_id": entry.entry_id,
-                        "expected": expected_prev[:16],
-                        "actual": entry.previous_hash[:16],
-                    }
+        if entries is not None:
+            # Sort by timestamp ascending for chain verification
+            ordered = sorted(entries, key=lambda e: e.timestamp)
+            result = verify_segment(ordered, expected_prev=GENESIS_HASH)
+            if result.valid:
+                logger.info(
+                    "AUDIT_CHAIN_VERIFIED",
+                    extra={"entry_count": result.entry_count}
                 )
+            return result.valid
+        
+        checkpoint = None if full else self._latest_live_checkpoint()
+        if checkpoint is not None:
+            if not self._checkpoint_matches_entries(checkpoint):
                 return False
-            
-            computed = entry.compute_hash()
-            if computed != entry.entry_hash:
-                logger.critical(
-                    "AUDIT_ENTRY_TAMPERED",
-                    extra={
-                        "entry_id": entry.entry_id,
-                        "computed": computed[:16],
-                        "stored": entry.entry_hash[:16],
-                    }
-                )
+            start_count = checkpoint.entry_count
+            expected_prev = checkpoint.entry_hash
+        else:
+            archived = self._verify_archives()
+            if not archived.valid:
                 return False
-            
-            expected_prev = entry.entry_hash
+            start_count = archived.entry_count
+            expected_prev = archived.last_hash or GENESIS_HASH
+        
+        on_entry_verified = None
+        if self._checkpoint_signer is not None:
+            on_entry_verified = periodic_checkpointer(
+                signer=self._checkpoint_signer,
+                interval=self._checkpoint_interval,
+                base_count=start_count,
+                store=self._store_checkpoint,
+            )
+        
+        result = verify_segment(
+            self._stream_entries(after=checkpoint),
+            expected_prev=expected_prev,
+            on_entry_verified=on_entry_verified,
+        )
+        if not result.valid:
+            return False
         
         logger.info(
             "AUDIT_CHAIN_VERIFIED",
-            extra={"entry_count": len(entries)}
+            extra={
+                "entry_count": start_count + result.entry_count,
+                "entries_rehashed": result.entry_count,
+                "resumed_from_checkpoint": checkpoint is not None,
+            }
         )
         return True
+    
+    def verify_chain_parallel(
+        self,
+        chunk_size: int = DEFAULT_VERIFY_CHUNK_SIZE,
+        max_workers: int = 4,
+    ) -> ChainSegmentResult:
+        """Fully re-verify the stored chain in concurrently checked chunks.
+        
+        Each chunk is streamed and rehashed independently, then chunk
+        boundaries are stitched by checking links between neighbours.
+        Archived partitions are verified first and anchor the live chain.
+        Checkpoints are not consulted or recorded.
+        
+        Args:
+            chunk_size: Entries per chunk
+            max_workers: Concurrent chunk verifications
+            
+        Returns:
+            ChainSegmentResult for the whole chain
+        """
+        archived = self._verify_archives(max_workers=max_workers)
+        if not archived.valid:
+            return archived
+        
+        if self.connection_manager and not self.use_qldb:
+            loaders = self._postgres_chunk_loaders(chunk_size)
+        else:
+            loaders = self._memory_chunk_loaders(chunk_size)
+        
+        live = verify_chunks(
+            loaders,
+            anchor_hash=archived.last_hash or GENESIS_HASH,
+            max_workers=max_workers,
+        )
+        result = replace(live, entry_count=archived.entry_count + live.entry_count)
+        
+        logger.info(
+            "AUDIT_CHAIN_PARALLEL_VERIFICATION_COMPLETE",
+            extra={
+                "valid": result.valid,
+                "entry_count": result.entry_count,
+                "chunk_count": len(loaders),
+            }
+        )
+        return result
+    
+    def list_checkpoints(self) -> List[VerificationCheckpoint]:
+        """Return stored verification checkpoints, newest first."""
+        if self.connection_manager and not self.use_qldb:
+            return self._load_checkpoints_postgres(limit=CHECKPOINT_LOOKBACK)
+        return list(reversed(self._memory_checkpoints))
+    
+    def _latest_live_checkpoint(self) -> Optional[VerificationCheckpoint]:
+        """Return newest trusted checkpoint whose entry is still live.
+        
+        Checkpoints inside archived partitions cannot anchor a live
+        stream; verification then resumes from the archive boundary.
+        """
+        checkpoint = self._latest_trusted_checkpoint()
+        if checkpoint is None or self.partition_manager is None:
+            return checkpoint
+        
+        archived_through = self.partition_manager.archived_through()
+        if archived_through is not None and checkpoint.entry_timestamp < archived_through:
+            return None
+        return checkpoint
+    
+    def _verify_archives(self, max_workers: int = 4) -> ChainSegmentResult:
+        """Verify archived partitions, or an empty valid result if none."""
+        if self.partition_manager is None:
+            return ChainSegmentResult(valid=True, entry_count=0)
+        return self.partition_manager.verify_archives(max_workers=max_workers)
+    
+    def _latest_trusted_checkpoint(self) -> Optional[VerificationCheckpoint]:
+        """Return newest checkpoint with a valid signature, if any."""
+        if self._checkpoint_signer is None:
+            return None
+        
+        for checkpoint in self.list_checkpoints():
+            if self._checkpoint_signer.is_trusted(checkpoint):
+                return checkpoint
+        return None
+    
+    def _store_checkpoint(self, checkpoint: VerificationCheckpoint) -> None:
+        """Persist a signed checkpoint."""
+        if self.connection_manager and not self.use_qldb:
+            self._store_checkpoint_postgres(checkpoint)
+            return
+        
+        if self._memory_checkpoints and self._memory_checkpoints[-1].entry_count >= checkpoint.entry_count:
+            return
+        self._memory_checkpoints.append(checkpoint)
+    
+    def _store_checkpoint_postgres(self, checkpoint: VerificationCheckpoint) -> None:
+        """Insert checkpoint into the append-only checkpoint table."""
+        self.ensure_checkpoint_table()
+        query = """
+            INSERT INTO audit_checkpoints (
+                entry_id, entry_hash, entry_count, entry_timestamp,
+                created_at, signature
+            ) VALUES (%s, %s, %s, %s, %s, %s)
+            ON CONFLICT (entry_count) DO NOTHING
+        """
+        params = (
+            checkpoint.entry_id,
+            checkpoint.entry_hash,
+            checkpoint.entry_count,
+            checkpoint.entry_timestamp,
+            checkpoint.created_at,
+            checkpoint.signature,
+        )
+        
+        try:
+            with self.connection_manager.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, params)
+                    conn.commit()
+        except Exception as e:
+            logger.error(
+                "POSTGRES_CHECKPOINT_STORE_FAILED",
+                extra={"entry_id": checkpoint.entry_id, "error": str(e)}
+            )
+            raise RepositoryError(f"Failed to store audit checkpoint: {e}")
+    
+    def _load_checkpoints_postgres(self, limit: int) -> List[VerificationCheckpoint]:
+        """Load newest checkpoints from PostgreSQL."""
+        self.ensure_checkpoint_table()
+        query = """
+            SELECT entry_id, entry_hash, entry_count, entry_timestamp,
+                   created_at, signature
+            FROM audit_checkpoints
+            ORDER BY entry_count DESC
+            LIMIT %s
+        """
+        with self.connection_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (limit,))
+                rows = cur.fetchall()
+        
+        checkpoints = []
+        for row in rows:
+            checkpoints.append(VerificationCheckpoint(
+                entry_id=row[0],
+                entry_hash=row[1],
+                entry_count=row[2],
+                entry_timestamp=row[3],
+                created_at=row[4],
+                signature=row[5],
+            ))
+        return checkpoints
+    
+    def _checkpoint_matches_entries(self, checkpoint: VerificationCheckpoint) -> bool:
+        """Check the checkpointed entry is still stored with the same hash.
+        
+        Logs:
+            - AUDIT_CHECKPOINT_MISMATCH: Stored entries were rewritten
+        """
+        stored_hash = None
+        if self.connection_manager and not self.use_qldb:
+            with self.connection_manager.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        CHECKPOINT_ENTRY_SQL,
+                        (checkpoint.entry_id, checkpoint.entry_timestamp)
+                    )
+                    row = cur.fetchone()
+                    stored_hash = row[0] if row else None
+        else:
+            position = checkpoint.entry_count - 1
+            if position < len(self._memory_store):
+                entry = self._memory_store[position]
+                if entry.entry_id == checkpoint.entry_id:
+                    stored_hash = entry.entry_hash
+        
+        if stored_hash == checkpoint.entry_hash:
+            return True
+        
+        logger.critical(
+            "AUDIT_CHECKPOINT_MISMATCH",
+            extra={
+                "entry_id": checkpoint.entry_id,
+                "entry_count": checkpoint.entry_count,
+            }
+        )
+        return False
+    
+    def _stream_entries(
+        self,
+        after: Optional[VerificationCheckpoint] = None,
+    ) -> Iterator[AuditEntry]:
+        """Yield stored entries in chain order, optionally after a checkpoint."""
+        if self.connection_manager and not self.use_qldb:
+            where = ""
+            params: tuple = ()
+            if after is not None:
+                # Plain timestamp bound lets the planner prune partitions
+                where = "WHERE timestamp >= %s AND (timestamp, entry_id) > (%s, %s)"
+                params = (after.entry_timestamp, after.entry_timestamp, after.entry_id)
+            return self._stream_postgres(where, params)
+        
+        start = after.entry_count if after is not None else 0
+        return iter(self._memory_store[start:])
+    
+    def _stream_postgres(self, where: str, params: tuple) -> Iterator[AuditEntry]:
+        """Stream entries through a server-side (named) cursor.
+        
+        Rows arrive in batches of VERIFY_STREAM_BATCH_SIZE so memory stays
+        flat regardless of table size.
+        """
+        query = (
+            f"SELECT {ENTRY_COLUMNS} FROM audit_entries {where} "
+            "ORDER BY timestamp ASC, entry_id ASC"
+        )
+        cursor_name = f"audit_verify_{uuid.uuid4().hex[:12]}"
+        
+        with self.connection_manager.get_connection() as conn:
+            try:
+                with conn.cursor(name=cursor_name) as cur:
+                    cur.itersize = VERIFY_STREAM_BATCH_SIZE
+                    cur.execute(query, params)
+                    for row in cur:
+                        yield self._row_to_entry(row)
+            finally:
+                # End the read transaction holding the named cursor
+                conn.rollback()
+    
+    def _memory_chunk_loaders(
+        self,
+        chunk_size: int,
+    ) -> List[Callable[[], Iterable[AuditEntry]]]:
+        """Split the in-memory chain into chunk loaders."""
+        snapshot = list(self._memory_store)
+        loaders = []
+        for start in range(0, len(snapshot), chunk_size):
+            chunk = snapshot[start:start + chunk_size]
+            loaders.append(lambda chunk=chunk: chunk)
+        return loaders
+    
+    def _postgres_chunk_loaders(
+        self,
+        chunk_size: int,
+    ) -> List[Callable[[], Iterable[AuditEntry]]]:
+        """Split the PostgreSQL chain into keyset ranges, one per chunk.
+        
+        Chunk boundaries are every chunk_size-th (timestamp, entry_id) in
+        chain order; each loader streams its own range on its own
+        connection.
+        """
+        boundary_query = """
+            SELECT timestamp, entry_id FROM (
+                SELECT timestamp, entry_id,
+                       row_number() OVER (ORDER BY timestamp, entry_id) AS rn
+                FROM audit_entries
+            ) numbered
+            WHERE (rn - 1) %% %s = 0
+            ORDER BY timestamp, entry_id
+        """
+        with self.connection_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(boundary_query, (chunk_size,))
+                boundaries = cur.fetchall()
+        
+        loaders = []
+        for index, lower in enumerate(boundaries):
+            if index + 1 < len(boundaries):
+                upper = boundaries[index + 1]
+                where = (
+                    "WHERE timestamp BETWEEN %s AND %s "
+                    "AND (timestamp, entry_id) >= (%s, %s) "
+                    "AND (timestamp, entry_id) < (%s, %s)"
+                )
+                params = (lower[0], upper[0], lower[0], lower[1], upper[0], upper[1])
+            else:
+                where = "WHERE timestamp >= %s AND (timestamp, entry_id) >= (%s, %s)"
+                params = (lower[0], lower[0], lower[1])
+            loaders.append(
+                lambda where=where, params=params: self._stream_postgres(where, params)
+            )
+        return loaders
@@ -0,0 +1,398 @@
+"""Incremental audit chain verification with signed checkpoints.
+
+Per ADR-005: the audit chain must be cryptographically verifiable.
+Rehashing the full chain from genesis on every check grows linearly with
+audit volume, so verification is anchored on signed checkpoints instead:
+
+- A checkpoint records (entry_id, entry_hash, entry_count) of an entry that
+  has already been verified, signed with HMAC-SHA256 so it cannot be forged
+  by anyone able to write to the checkpoint store.
+- Routine verification starts at the latest trusted checkpoint and only
+  rehashes entries appended after it.
+- Full re-verification splits the chain into chunks that are verified
+  independently (optionally in parallel) and stitched together by checking
+  that each chunk's first previous_hash equals the prior chunk's last hash.
+
+All verification functions consume iterables so callers can stream entries
+from a server-side cursor without holding the chain in memory.
+"""
+import hashlib
+import hmac
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .audit_logger import AuditEntry
+
+logger = logging.getLogger(__name__)
+
+
+# previous_hash of the first entry in every audit chain
+GENESIS_HASH = "genesis"
+
+# Entries verified between two persisted checkpoints
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+
+# HMAC keys shorter than this are rejected (matches PII salt policy)
+MIN_SIGNING_KEY_LENGTH = 32
+
+
+@dataclass(frozen=True)
+class VerificationCheckpoint:
+    """Signed marker that the chain up to an entry has been verified.
+
+    Attributes:
+        entry_id: Last verified entry
+        entry_hash: Hash of that entry (anchor for the next verification)
+        entry_count: Number of entries in the chain up to and including it
+        entry_timestamp: Timestamp of that entry (resume point for queries)
+        created_at: When the checkpoint was recorded
+        signature: HMAC-SHA256 over all fields above
+    """
+    entry_id: str
+    entry_hash: str
+    entry_count: int
+    entry_timestamp: datetime
+    created_at: datetime
+    signature: str = ""
+
+    def signing_payload(self) -> bytes:
+        """Canonical byte string covered by the signature."""
+        parts = [
+            self.entry_id,
+            self.entry_hash,
+            str(self.entry_count),
+            self.entry_timestamp.isoformat(),
+            self.created_at.isoformat(),
+        ]
+        return "|".join(parts).encode()
+
+
+class CheckpointSigner:
+    """Signs and verifies checkpoints with a secret HMAC key.
+
+    The key should be loaded from AWS Secrets Manager in production and must
+    not be readable by the role that writes audit entries.
+    """
+
+    def __init__(self, signing_key: str):
+        """Initialize signer.
+
+        Args:
+            signing_key: Secret key, at least 32 characters
+
+        Raises:
+            ValueError: If key is empty or too short
+        """
+        if not signing_key or len(signing_key) < MIN_SIGNING_KEY_LENGTH:
+            logger.critical(
+                "CHECKPOINT_SIGNER_CONFIGURATION_FAILED",
+                extra={"reason": "Key too short or empty", "min_length": MIN_SIGNING_KEY_LENGTH}
+            )
+            raise ValueError(
+                f"Checkpoint signing key must be at least {MIN_SIGNING_KEY_LENGTH} characters"
+            )
+        self._key = signing_key.encode()
+
+    def _compute_signature(self, checkpoint: VerificationCheckpoint) -> str:
+        return hmac.new(self._key, checkpoint.signing_payload(), hashlib.sha256).hexdigest()
+
+    def sign(self, checkpoint: VerificationCheckpoint) -> VerificationCheckpoint:
+        """Return a copy of the checkpoint with its signature set."""
+        return replace(checkpoint, signature=self._compute_signature(checkpoint))
+
+    def is_trusted(self, checkpoint: VerificationCheckpoint) -> bool:
+        """Check checkpoint signature.
+
+        Returns:
+            True if signature matches, False if forged or altered
+
+        Logs:
+            - AUDIT_CHECKPOINT_SIGNATURE_INVALID: Signature mismatch
+        """
+        expected = self._compute_signature(checkpoint)
+        if hmac.compare_digest(expected, checkpoint.signature):
+            return True
+
+        logger.critical(
+            "AUDIT_CHECKPOINT_SIGNATURE_INVALID",
+            extra={
+                "entry_id": checkpoint.entry_id,
+                "entry_count": checkpoint.entry_count,
+            }
+        )
+        return False
+
+
+@dataclass(frozen=True)
+class ChainSegmentResult:
+    """Outcome of verifying a contiguous run of chain entries.
+
+    Attributes:
+        valid: True if every entry's hash and link inside the segment held
+        entry_count: Entries verified (up to and including a failure)
+        first_entry_id: First entry in the segment
+        first_previous_hash: previous_hash of the first entry, used to
+            stitch this segment onto the one before it
+        last_entry_id: Last entry verified successfully
+        last_hash: Hash of the last entry verified successfully
+        last_timestamp: Timestamp of the last entry verified successfully
+        failed_entry_id: Entry where verification failed, if any
+    """
+    valid: bool
+    entry_count: int
+    first_entry_id: Optional[str] = None
+    first_previous_hash: Optional[str] = None
+    last_entry_id: Optional[str] = None
+    last_hash: Optional[str] = None
+    last_timestamp: Optional[datetime] = None
+    failed_entry_id: Optional[str] = None
+
+
+def verify_segment(
+    entries: Iterable["AuditEntry"],
+    expected_prev: Optional[str] = None,
+    on_entry_verified: Optional[Callable[["AuditEntry", int], None]] = None,
+) -> ChainSegmentResult:
+    """Verify hashes and links of a contiguous run of entries.
+
+    Consumes the iterable once and keeps only the running hash, so it is
+    safe to pass a server-side cursor over millions of rows.
+
+    Args:
+        entries: Entries in chain order
+        expected_prev: Hash the first entry must link to. None accepts
+            whatever the first entry links to (used for parallel chunks,
+            whose links are checked later by stitch_segments)
+        on_entry_verified: Called with (entry, position_in_segment) after
+            each entry passes; used to emit periodic checkpoints
+
+    Returns:
+        ChainSegmentResult describing the segment
+
+    Logs:
+        - AUDIT_CHAIN_BROKEN: Entry does not link to its predecessor
+        - AUDIT_ENTRY_TAMPERED: Entry content does not match its hash
+    """
+    count = 0
+    first_entry_id: Optional[str] = None
+    first_previous_hash: Optional[str] = None
+    last_entry = None
+
+    for entry in entries:
+        if count == 0:
+            first_entry_id = entry.entry_id
+            first_previous_hash = entry.previous_hash
+            if expected_prev is None:
+                expected_prev = entry.previous_hash
+
+        if entry.previous_hash != expected_prev:
+            logger.critical(
+                "AUDIT_CHAIN_BROKEN",
+                extra={
+                    "entry_id": entry.entry_id,
+                    "expected": expected_prev[:16],
+                    "actual": entry.previous_hash[:16],
+                }
+            )
+            return _failed_result(
+                count + 1, first_entry_id, first_previous_hash, last_entry, entry.entry_id
+            )
+
+        computed = entry.compute_hash()
+        if computed != entry.entry_hash:
+            logger.critical(
+                "AUDIT_ENTRY_TAMPERED",
+                extra={
+                    "entry_id": entry.entry_id,
+                    "computed": computed[:16],
+                    "stored": entry.entry_hash[:16],
+                }
+            )
+            return _failed_result(
+                count + 1, first_entry_id, first_previous_hash, last_entry, entry.entry_id
+            )
+
+        count += 1
+        expected_prev = entry.entry_hash
+        last_entry = entry
+
+        if on_entry_verified is not None:
+            on_entry_verified(entry, count)
+
+    return ChainSegmentResult(
+        valid=True,
+        entry_count=count,
+        first_entry_id=first_entry_id,
+        first_previous_hash=first_previous_hash,
+        last_entry_id=last_entry.entry_id if last_entry else None,
+        last_hash=last_entry.entry_hash if last_entry else None,
+        last_timestamp=last_entry.timestamp if last_entry else None,
+    )
+
+
+def _failed_result(
+    count: int,
+    first_entry_id: Optional[str],
+    first_previous_hash: Optional[str],
+    last_entry: Optional["AuditEntry"],
+    failed_entry_id: str,
+) -> ChainSegmentResult:
+    """Build a failed segment result keeping the last good position."""
+    return ChainSegmentResult(
+        valid=False,
+        entry_count=count,
+        first_entry_id=first_entry_id,
+        first_previous_hash=first_previous_hash,
+        last_entry_id=last_entry.entry_id if last_entry else None,
+        last_hash=last_entry.entry_hash if last_entry else None,
+        last_timestamp=last_entry.timestamp if last_entry else None,
+        failed_entry_id=failed_entry_id,
+    )
+
+
+def stitch_segments(
+    segments: Sequence[ChainSegmentResult],
+    anchor_hash: str = GENESIS_HASH,
+) -> ChainSegmentResult:
+    """Join independently verified chunks into one chain result.
+
+    Each segment must be internally valid and its first entry must link to
+    the last hash of the previous non-empty segment (or to anchor_hash for
+    the first one).
+
+    Args:
+        segments: Segment results in chain order
+        anchor_hash: Hash the first segment must link to
+
+    Returns:
+        Combined ChainSegmentResult
+
+    Logs:
+        - AUDIT_CHAIN_BROKEN: Chunk boundary does not link up
+    """
+    expected_prev = anchor_hash
+    total = 0
+    last: Optional[ChainSegmentResult] = None
+
+    for segment in segments:
+        if segment.entry_count == 0:
+            continue
+
+        if segment.first_previous_hash != expected_prev:
+            logger.critical(
+                "AUDIT_CHAIN_BROKEN",
+                extra={
+                    "entry_id": segment.first_entry_id,
+                    "expected": expected_prev[:16],
+                    "actual": (segment.first_previous_hash or "")[:16],
+                }
+            )
+            return ChainSegmentResult(
+                valid=False,
+                entry_count=total + 1,
+                last_entry_id=last.last_entry_id if last else None,
+                last_hash=last.last_hash if last else None,
+                last_timestamp=last.last_timestamp if last else None,
+                failed_entry_id=segment.first_entry_id,
+            )
+
+        total += segment.entry_count
+        if not segment.valid:
+            return replace(segment, entry_count=total)
+
+        expected_prev = segment.last_hash
+        last = segment
+
+    if last is None:
+        return ChainSegmentResult(valid=True, entry_count=0)
+
+    first = next(segment for segment in segments if segment.entry_count > 0)
+    return replace(
+        last,
+        entry_count=total,
+        first_entry_id=first.first_entry_id,
+        first_previous_hash=anchor_hash,
+    )
+
+
+def verify_chunks(
+    chunk_loaders: Sequence[Callable[[], Iterable["AuditEntry"]]],
+    anchor_hash: str = GENESIS_HASH,
+    max_workers: int = 4,
+    executor: Optional[Executor] = None,
+) -> ChainSegmentResult:
+    """Verify chain chunks concurrently and stitch their boundaries.
+
+    Each loader returns an iterable over one contiguous chunk, so chunks can
+    be streamed from separate database connections.
+
+    Args:
+        chunk_loaders: One zero-argument callable per chunk, in chain order
+        anchor_hash: Hash the first chunk must link to
+        max_workers: Worker threads when no executor is supplied
+        executor: Optional executor to run chunk verification on
+
+    Returns:
+        Combined ChainSegmentResult
+    """
+    def run_chunk(loader: Callable[[], Iterable["AuditEntry"]]) -> ChainSegmentResult:
+        return verify_segment(loader())
+
+    if executor is not None:
+        segments: List[ChainSegmentResult] = list(executor.map(run_chunk, chunk_loaders))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            segments = list(pool.map(run_chunk, chunk_loaders))
+
+    logger.info(
+        "AUDIT_CHAIN_CHUNKS_VERIFIED",
+        extra={"chunk_count": len(segments)}
+    )
+    return stitch_segments(segments, anchor_hash=anchor_hash)
+
+
+def periodic_checkpointer(
+    signer: CheckpointSigner,
+    interval: int,
+    base_count: int,
+    store: Callable[[VerificationCheckpoint], None],
+) -> Callable[["AuditEntry", int], None]:
+    """Build an on_entry_verified callback that records checkpoints.
+
+    Args:
+        signer: Signs each checkpoint before it is stored
+        interval: Record a checkpoint every `interval` entries of the chain
+        base_count: Chain position of the entry before the segment start
+        store: Persists a signed checkpoint
+
+    Returns:
+        Callback for verify_segment
+    """
+    def on_entry_verified(entry: "AuditEntry", position: int) -> None:
+        chain_count = base_count + position
+        if chain_count % interval != 0:
+            return
+
+        checkpoint = signer.sign(VerificationCheckpoint(
+            entry_id=entry.entry_id,
+            entry_hash=entry.entry_hash,
+            entry_count=chain_count,
+            entry_timestamp=entry.timestamp,
+            created_at=datetime.utcnow(),
+        ))
+        store(checkpoint)
+
+        logger.info(
+            "AUDIT_CHECKPOINT_RECORDED",
+            extra={
+                "entry_id": entry.entry_id,
+                "entry_count": chain_count,
+                "entry_hash": entry.entry_hash[:16],
+            }
+        )
+
+    return on_entry_verified
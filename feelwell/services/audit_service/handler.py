@@ -11,6 +11,14 @@ from typing import Optional
 
 from feelwell.shared.utils import configure_pii_salt
 from .audit_logger import AuditLogger, AuditAction, AuditEntity
+from .audit_query import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    AuditQuery,
+    InvalidCursorError,
+    QueryCursor,
+)
+from .chain_verification import CheckpointSigner
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +29,13 @@ app = Flask(__name__)
 pii_salt = os.getenv("PII_HASH_SALT", "default_dev_salt_change_in_production_32chars")
 configure_pii_salt(pii_salt)
 
+# Checkpoint signing key (Secrets Manager in production); unset disables
+# checkpoints so every verification rehashes from genesis
+checkpoint_key = os.getenv("AUDIT_CHECKPOINT_KEY")
+checkpoint_signer = CheckpointSigner(checkpoint_key) if checkpoint_key else None
+
 # Initialize audit logger
-audit_logger = AuditLogger()
+audit_logger = AuditLogger(checkpoint_signer=checkpoint_signer)
 
 
 @app.route("/health", methods=["GET"])
@@ -212,14 +225,18 @@ def log_crisis_event():
 
 @app.route("/audit/query", methods=["GET"])
 def query_audit_entries():
-    """Query audit entries.
+    """Query audit entries, newest first, one page at a time.
     
     Query Params:
         entity_type: Filter by entity type
         entity_id: Filter by entity ID
         action: Filter by action
+        actor_id: Filter by actor
+        school_id: Filter by school
         start_date: Filter by start date (ISO format)
         end_date: Filter by end date (ISO format)
+        limit: Page size (default 100, max 1000)
+        cursor: next_cursor from the previous page
     """
     try:
         entity_type = None
@@ -248,16 +265,33 @@ def query_audit_entries():
         if end_str:
             end_date = datetime.fromisoformat(end_str.replace("Z", "+00:00"))
         
-        entries = audit_logger.query(
+        limit = min(request.args.get("limit", DEFAULT_PAGE_SIZE, type=int), MAX_PAGE_SIZE)
+        if limit < 1:
+            return jsonify({"error": "limit must be positive"}), 400
+        
+        cursor = None
+        cursor_token = request.args.get("cursor")
+        if cursor_token:
+            try:
+                cursor = QueryCursor.decode(cursor_token)
+            except InvalidCursorError:
+                return jsonify({"error": "Invalid cursor"}), 400
+        
+        audit_query = AuditQuery(
             entity_type=entity_type,
             entity_id=request.args.get("entity_id"),
             action=action,
+            actor_id=request.args.get("actor_id"),
+            school_id=request.args.get("school_id"),
             start_date=start_date,
             end_date=end_date,
         )
+        page = audit_logger.query_page(audit_query, limit=limit, cursor=cursor)
+        entries = page.entries
         
         return jsonify({
             "count": len(entries),
+            "next_cursor": page.next_cursor.encode() if page.next_cursor else None,
             "entries": [
                 {
                     "entry_id": e.entry_id,
@@ -280,9 +314,14 @@ def query_audit_entries():
 
 @app.route("/audit/verify", methods=["GET"])
 def verify_chain():
-    """Verify integrity of audit chain."""
+    """Verify integrity of audit chain.
+    
+    Query Params:
+        full: "true" to re-verify from genesis, ignoring checkpoints
+    """
     try:
-        is_valid = audit_logger.verify_chain()
+        full = request.args.get("full", "false").lower() == "true"
+        is_valid = audit_logger.verify_chain(full=full)
         
         return jsonify({
             "chain_valid": is_valid,
@@ -0,0 +1,247 @@
+"""Tests for monthly audit partitions and archival export.
+
+The PostgreSQL tests run against a local server when FEELWELL_TEST_DB_HOST
+is set (e.g. FEELWELL_TEST_DB_HOST=localhost FEELWELL_TEST_DB_PORT=5432
+FEELWELL_TEST_DB_USER=postgres). They drop and recreate the audit tables
+in the target database, so never point them at a shared database.
+"""
+import gzip
+import os
+import pytest
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+from feelwell.shared.database import ConnectionManager, DatabaseConfig, RepositoryError
+from feelwell.shared.utils import configure_pii_salt
+from feelwell.services.audit_service.audit_logger import (
+    AuditEntry,
+    AuditAction,
+    AuditEntity,
+)
+from feelwell.services.audit_service.audit_partitions import (
+    AuditPartitionManager,
+    add_months,
+    entry_from_archive_record,
+    entry_to_archive_record,
+    month_start,
+    parse_partition_name,
+    partition_name,
+)
+from feelwell.services.audit_service.audit_query import AuditQuery
+from feelwell.services.audit_service.audit_repository import (
+    CHECKPOINT_ENTRY_SQL,
+    AuditRepository,
+)
+from feelwell.services.audit_service.chain_verification import (
+    GENESIS_HASH,
+    CheckpointSigner,
+)
+
+
+TEST_DB_HOST = os.getenv("FEELWELL_TEST_DB_HOST")
+
+requires_postgres = pytest.mark.skipif(
+    TEST_DB_HOST is None,
+    reason="FEELWELL_TEST_DB_HOST not set; local PostgreSQL tests skipped",
+)
+
+
+@pytest.fixture(autouse=True)
+def setup_pii_salt():
+    configure_pii_salt("test_salt_that_is_at_least_32_characters_long")
+
+
+def build_chain(timestamps: list, previous_hash: str = GENESIS_HASH) -> list:
+    """Build a valid hash chain with the given timestamps."""
+    entries = []
+    for i, timestamp in enumerate(timestamps):
+        entry = AuditEntry(
+            entry_id=f"audit_{timestamp:%Y%m%d%H%M%S}_{i:04d}",
+            timestamp=timestamp,
+            action=AuditAction.VIEW_CONVERSATION,
+            entity_type=AuditEntity.STUDENT,
+            entity_id=f"student_{i % 5}",
+            actor_id="counselor_001",
+            actor_role="counselor",
+            school_id="school_001" if i % 2 else "school_002",
+            details={"justification": "routine_check", "index": i},
+            previous_hash=previous_hash,
+        )
+        entry = replace(entry, entry_hash=entry.compute_hash())
+        entries.append(entry)
+        previous_hash = entry.entry_hash
+    return entries
+
+
+class TestMonthArithmetic:
+    def test_month_start(self):
+        assert month_start(datetime(2026, 2, 17, 13, 5)) == datetime(2026, 2, 1)
+
+    def test_add_months_crosses_year(self):
+        assert add_months(datetime(2025, 11, 1), 3) == datetime(2026, 2, 1)
+        assert add_months(datetime(2026, 1, 1), -1) == datetime(2025, 12, 1)
+
+    def test_partition_name_round_trip(self):
+        name = partition_name(datetime(2026, 3, 1))
+
+        assert name == "audit_entries_y2026m03"
+        assert parse_partition_name(name) == datetime(2026, 3, 1)
+        assert parse_partition_name("audit_checkpoints") is None
+
+
+class TestArchiveRecords:
+    def test_record_round_trip_preserves_hash(self):
+        entry = build_chain([datetime(2026, 1, 5, 9, 30, 0, 123456)])[0]
+
+        restored = entry_from_archive_record(entry_to_archive_record(entry))
+
+        assert restored == entry
+        assert restored.compute_hash() == entry.entry_hash
+
+
+@pytest.fixture
+def connection_manager():
+    config = DatabaseConfig(
+        host=TEST_DB_HOST or "localhost",
+        port=int(os.getenv("FEELWELL_TEST_DB_PORT", "5432")),
+        database=os.getenv("FEELWELL_TEST_DB_NAME", "postgres"),
+        username=os.getenv("FEELWELL_TEST_DB_USER", "postgres"),
+        password=os.getenv("FEELWELL_TEST_DB_PASSWORD", ""),
+        min_connections=1,
+        max_connections=6,
+        ssl_mode="disable",
+    )
+    manager = ConnectionManager(config)
+    with manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "DROP TABLE IF EXISTS audit_entries, audit_checkpoints, audit_archives CASCADE"
+            )
+        conn.commit()
+    yield manager
+    manager.close()
+
+
+@requires_postgres
+class TestPostgresPartitionRollover:
+    def test_rollover_archive_and_verify(self, connection_manager, tmp_path):
+        partitions = AuditPartitionManager(
+            connection_manager,
+            archive_dir=str(tmp_path),
+            months_ahead=1,
+        )
+        partitions.ensure_schema()
+        partitions.ensure_partitions(now=datetime(2026, 1, 15))
+        assert partitions.list_partitions() == [datetime(2026, 1, 1), datetime(2026, 2, 1)]
+
+        # Rollover: a February run creates March ahead of time
+        partitions.ensure_partitions(now=datetime(2026, 2, 20))
+        assert partitions.list_partitions() == [
+            datetime(2026, 1, 1),
+            datetime(2026, 2, 1),
+            datetime(2026, 3, 1),
+        ]
+
+        signer = CheckpointSigner("checkpoint_key_that_is_at_least_32_characters")
+        repository = AuditRepository(
+            connection_manager=connection_manager,
+            checkpoint_signer=signer,
+            checkpoint_interval=4,
+            partition_manager=partitions,
+        )
+        timestamps = []
+        for day in range(0, 75, 5):
+            timestamps.append(datetime(2026, 1, 3, 10) + timedelta(days=day))
+        chain = build_chain(timestamps)
+        for entry in chain:
+            repository.append(entry)
+
+        assert repository.verify_chain() is True
+        assert repository.list_checkpoints()[0].entry_count == 12
+
+        january = [e for e in chain if e.timestamp < datetime(2026, 2, 1)]
+        archived = partitions.archive_cold_partitions(now=datetime(2026, 3, 10), retain_months=2)
+
+        assert [a.partition_name for a in archived] == ["audit_entries_y2026m01"]
+        assert archived[0].entry_count == len(january)
+        assert archived[0].first_previous_hash == GENESIS_HASH
+        assert archived[0].last_hash == january[-1].entry_hash
+        assert partitions.list_partitions() == [datetime(2026, 2, 1), datetime(2026, 3, 1)]
+
+        # Live queries no longer see January; chain still verifies end to end
+        live = list(repository.iter_query(AuditQuery(), page_size=3))
+        assert len(live) == len(chain) - len(january)
+        assert repository.verify_chain(full=True) is True
+        assert repository.verify_chain() is True
+
+        parallel = repository.verify_chain_parallel(chunk_size=3, max_workers=3)
+        assert parallel.valid is True
+        assert parallel.entry_count == len(chain)
+        assert parallel.last_hash == chain[-1].entry_hash
+
+    def test_time_bounded_query_prunes_partitions(self, connection_manager, tmp_path):
+        partitions = AuditPartitionManager(connection_manager, archive_dir=str(tmp_path), months_ahead=2)
+        partitions.ensure_schema()
+        partitions.ensure_partitions(now=datetime(2026, 1, 1))
+
+        with connection_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "EXPLAIN SELECT entry_id FROM audit_entries "
+                    "WHERE timestamp <= %s AND (timestamp, entry_id) < (%s, %s)",
+                    (datetime(2026, 1, 20), datetime(2026, 1, 20), "audit_x"),
+                )
+                plan = " ".join(row[0] for row in cur.fetchall())
+            conn.rollback()
+
+        assert "audit_entries_y2026m01" in plan
+        assert "audit_entries_y2026m03" not in plan
+
+    def test_checkpoint_lookup_prunes_partitions(self, connection_manager, tmp_path):
+        partitions = AuditPartitionManager(connection_manager, archive_dir=str(tmp_path), months_ahead=2)
+        partitions.ensure_schema()
+        partitions.ensure_partitions(now=datetime(2026, 1, 1))
+
+        with connection_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("EXPLAIN " + CHECKPOINT_ENTRY_SQL, ("audit_x", datetime(2026, 2, 3)))
+                plan = " ".join(row[0] for row in cur.fetchall())
+            conn.rollback()
+
+        assert "audit_entries_y2026m02" in plan
+        assert "audit_entries_y2026m01" not in plan
+        assert "audit_entries_y2026m03" not in plan
+
+    def test_tampered_partition_is_not_archived(self, connection_manager, tmp_path):
+        partitions = AuditPartitionManager(connection_manager, archive_dir=str(tmp_path))
+        partitions.ensure_schema()
+        partitions.ensure_partitions(now=datetime(2026, 1, 1))
+        repository = AuditRepository(connection_manager=connection_manager)
+        chain = build_chain([datetime(2026, 1, 2) + timedelta(hours=h) for h in range(4)])
+        chain[2] = replace(chain[2], entity_id="tampered")
+        for entry in chain:
+            repository.append(entry)
+
+        with pytest.raises(RepositoryError):
+            partitions.archive_partition(datetime(2026, 1, 1))
+
+        assert datetime(2026, 1, 1) in partitions.list_partitions()
+        assert partitions.list_archives() == []
+
+    def test_modified_archive_file_fails_verification(self, connection_manager, tmp_path):
+        partitions = AuditPartitionManager(connection_manager, archive_dir=str(tmp_path))
+        partitions.ensure_schema()
+        partitions.ensure_partitions(now=datetime(2026, 1, 1))
+        repository = AuditRepository(
+            connection_manager=connection_manager,
+            partition_manager=partitions,
+        )
+        for entry in build_chain([datetime(2026, 1, 2) + timedelta(hours=h) for h in range(3)]):
+            repository.append(entry)
+
+        archive = partitions.archive_partition(datetime(2026, 1, 1))
+        with gzip.open(archive.file_path, "at", encoding="utf-8") as handle:
+            handle.write("\n")
+
+        assert partitions.verify_archives().valid is False
+        assert repository.verify_chain(full=True) is False
@@ -0,0 +1,202 @@
+"""Tests for indexed audit queries and keyset pagination."""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from feelwell.shared.utils import configure_pii_salt
+from feelwell.services.audit_service.audit_logger import (
+    AuditEntry,
+    AuditAction,
+    AuditEntity,
+)
+from feelwell.services.audit_service.audit_query import (
+    AuditQuery,
+    InMemoryAuditIndex,
+    InvalidCursorError,
+    QueryCursor,
+    QueryPlan,
+    build_postgres_query,
+    plan_query,
+)
+from feelwell.services.audit_service.audit_repository import AuditRepository
+
+
+BASE_TIME = datetime(2026, 3, 1, 8, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def setup_pii_salt():
+    configure_pii_salt("test_salt_that_is_at_least_32_characters_long")
+
+
+def make_entry(
+    index: int,
+    entity_id: str = "student_1",
+    actor_id: str = "counselor_001",
+    school_id: str = "school_001",
+    action: AuditAction = AuditAction.VIEW_CONVERSATION,
+    minutes: int = None,
+) -> AuditEntry:
+    return AuditEntry(
+        entry_id=f"audit_{index:04d}",
+        timestamp=BASE_TIME + timedelta(minutes=index if minutes is None else minutes),
+        action=action,
+        entity_type=AuditEntity.STUDENT,
+        entity_id=entity_id,
+        actor_id=actor_id,
+        actor_role="counselor",
+        school_id=school_id,
+        previous_hash="genesis",
+        entry_hash=f"hash_{index}",
+    )
+
+
+class TestQueryPlanning:
+    def test_entity_id_is_most_selective(self):
+        query = AuditQuery(entity_id="student_1", actor_id="c1", school_id="s1")
+        assert plan_query(query) == QueryPlan.BY_ENTITY
+
+    def test_actor_before_school(self):
+        assert plan_query(AuditQuery(actor_id="c1", school_id="s1")) == QueryPlan.BY_ACTOR
+
+    def test_school_time_range(self):
+        query = AuditQuery(school_id="s1", start_date=BASE_TIME)
+        assert plan_query(query) == QueryPlan.BY_SCHOOL_TIME
+
+    def test_no_key_filter_scans_by_time(self):
+        assert plan_query(AuditQuery(action=AuditAction.EXPORT_DATA)) == QueryPlan.BY_TIME
+
+
+class TestQueryCursor:
+    def test_round_trip(self):
+        cursor = QueryCursor(timestamp=BASE_TIME, entry_id="audit_0001")
+        assert QueryCursor.decode(cursor.encode()) == cursor
+
+    def test_invalid_token(self):
+        with pytest.raises(InvalidCursorError):
+            QueryCursor.decode("not-a-cursor")
+
+
+class TestInMemoryAuditIndex:
+    def test_time_window_uses_bounds(self):
+        index = InMemoryAuditIndex()
+        for i in range(100):
+            index.add(make_entry(i))
+
+        query = AuditQuery(
+            start_date=BASE_TIME + timedelta(minutes=10),
+            end_date=BASE_TIME + timedelta(minutes=19),
+        )
+        results = list(index.scan(query))
+
+        assert [e.entry_id for e in results] == [f"audit_{i:04d}" for i in range(19, 9, -1)]
+
+    def test_out_of_order_inserts_stay_sorted(self):
+        index = InMemoryAuditIndex()
+        for i in [5, 1, 3, 2, 4]:
+            index.add(make_entry(i))
+
+        results = list(index.scan(AuditQuery(), descending=False))
+
+        assert [e.entry_id for e in results] == [f"audit_{i:04d}" for i in range(1, 6)]
+
+    def test_residual_filters_applied(self):
+        index = InMemoryAuditIndex()
+        index.add(make_entry(1, entity_id="student_1", action=AuditAction.VIEW_CONVERSATION))
+        index.add(make_entry(2, entity_id="student_1", action=AuditAction.EXPORT_DATA))
+        index.add(make_entry(3, entity_id="student_2", action=AuditAction.EXPORT_DATA))
+
+        query = AuditQuery(entity_id="student_1", action=AuditAction.EXPORT_DATA)
+        results = list(index.scan(query))
+
+        assert [e.entry_id for e in results] == ["audit_0002"]
+
+    def test_pages_cover_all_entries_once(self):
+        index = InMemoryAuditIndex()
+        for i in range(25):
+            # Pairs share a timestamp so entry_id breaks ties
+            index.add(make_entry(i, school_id="school_001", minutes=i // 2))
+        index.add(make_entry(99, school_id="school_002"))
+
+        seen = []
+        cursor = None
+        while True:
+            page = index.page(AuditQuery(school_id="school_001"), limit=7, cursor=cursor)
+            seen.extend(e.entry_id for e in page.entries)
+            assert page.plan == QueryPlan.BY_SCHOOL_TIME
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert len(seen) == 25
+        assert len(set(seen)) == 25
+        assert seen[0] == "audit_0024"
+        assert seen[-1] == "audit_0000"
+
+
+class TestBuildPostgresQuery:
+    def test_keyset_predicate_and_order(self):
+        cursor = QueryCursor(timestamp=BASE_TIME, entry_id="audit_0005")
+        sql, params = build_postgres_query(
+            AuditQuery(school_id="school_001", start_date=BASE_TIME - timedelta(days=1)),
+            columns="entry_id",
+            limit=50,
+            cursor=cursor,
+        )
+
+        assert "WHERE 1=1" not in sql
+        assert "school_id = %s" in sql
+        assert "(timestamp, entry_id) < (%s, %s)" in sql
+        assert "timestamp <= %s" in sql
+        assert sql.endswith("ORDER BY timestamp DESC, entry_id DESC LIMIT %s")
+        assert params == [
+            "school_001",
+            BASE_TIME - timedelta(days=1),
+            BASE_TIME,
+            BASE_TIME,
+            "audit_0005",
+            50,
+        ]
+
+    def test_no_filters(self):
+        sql, params = build_postgres_query(AuditQuery(), columns="entry_id", limit=10)
+
+        assert "WHERE" not in sql
+        assert params == [10]
+
+
+class TestRepositoryStreaming:
+    def test_iter_query_streams_all_matches(self):
+        repository = AuditRepository()
+        for i in range(30):
+            repository.append(make_entry(i, actor_id="counselor_001" if i % 3 else "admin_1"))
+
+        results = list(repository.iter_query(AuditQuery(actor_id="admin_1"), page_size=4))
+
+        assert len(results) == 10
+        assert all(e.actor_id == "admin_1" for e in results)
+
+    def test_postgres_pages_follow_cursor(self):
+        rows = []
+        for i in range(3):
+            entry = make_entry(i)
+            rows.append((
+                entry.entry_id, entry.timestamp, entry.action.value,
+                entry.entity_type.value, entry.entity_id, entry.actor_id,
+                entry.actor_role, entry.school_id, "{}",
+                entry.previous_hash, entry.entry_hash,
+            ))
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+        cursor.fetchall.side_effect = [rows[:2], rows[2:]]
+        connection = MagicMock()
+        connection.cursor.return_value = cursor
+        manager = MagicMock()
+        manager.get_connection.return_value.__enter__.return_value = connection
+
+        repository = AuditRepository(connection_manager=manager)
+        results = list(repository.iter_query(AuditQuery(entity_id="student_1"), page_size=2))
+
+        assert [e.entry_id for e in results] == ["audit_0000", "audit_0001", "audit_0002"]
+        second_params = cursor.execute.call_args_list[1][0][1]
+        assert second_params[-3:] == [rows[1][1], "audit_0001", 2]
@@ -0,0 +1,352 @@
+"""Tests for checkpointed, incremental audit chain verification."""
+import pytest
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+from feelwell.shared.utils import configure_pii_salt
+from feelwell.services.audit_service.audit_logger import (
+    AuditLogger,
+    AuditEntry,
+    AuditAction,
+    AuditEntity,
+)
+from feelwell.services.audit_service.audit_repository import AuditRepository
+from feelwell.services.audit_service.chain_verification import (
+    GENESIS_HASH,
+    CheckpointSigner,
+    VerificationCheckpoint,
+    stitch_segments,
+    verify_chunks,
+    verify_segment,
+)
+
+
+SIGNING_KEY = "checkpoint_key_that_is_at_least_32_characters"
+
+
+@pytest.fixture(autouse=True)
+def setup_pii_salt():
+    configure_pii_salt("test_salt_that_is_at_least_32_characters_long")
+
+
+@pytest.fixture
+def signer():
+    return CheckpointSigner(SIGNING_KEY)
+
+
+def build_chain(count: int) -> list:
+    """Build a valid hash chain of entries with increasing timestamps."""
+    base_time = datetime(2026, 1, 1)
+    entries = []
+    prev_hash = GENESIS_HASH
+    for i in range(count):
+        entry = AuditEntry(
+            entry_id=f"audit_{i:05d}",
+            timestamp=base_time + timedelta(seconds=i),
+            action=AuditAction.VIEW_CONVERSATION,
+            entity_type=AuditEntity.STUDENT,
+            entity_id=f"student_{i}",
+            actor_id="counselor_001",
+            actor_role="counselor",
+            school_id="school_001",
+            previous_hash=prev_hash,
+        )
+        entry = replace(entry, entry_hash=entry.compute_hash())
+        entries.append(entry)
+        prev_hash = entry.entry_hash
+    return entries
+
+
+def tamper(entry: AuditEntry) -> AuditEntry:
+    """Change entry content without updating its hash."""
+    return replace(entry, entity_id="tampered")
+
+
+class TestCheckpointSigner:
+    def test_rejects_short_key(self):
+        with pytest.raises(ValueError):
+            CheckpointSigner("short")
+
+    def test_signed_checkpoint_is_trusted(self, signer):
+        checkpoint = signer.sign(VerificationCheckpoint(
+            entry_id="audit_1",
+            entry_hash="abc",
+            entry_count=10,
+            entry_timestamp=datetime(2026, 1, 1),
+            created_at=datetime(2026, 1, 2),
+        ))
+
+        assert signer.is_trusted(checkpoint) is True
+
+    def test_altered_checkpoint_is_not_trusted(self, signer):
+        checkpoint = signer.sign(VerificationCheckpoint(
+            entry_id="audit_1",
+            entry_hash="abc",
+            entry_count=10,
+            entry_timestamp=datetime(2026, 1, 1),
+            created_at=datetime(2026, 1, 2),
+        ))
+        forged = replace(checkpoint, entry_count=20)
+
+        assert signer.is_trusted(forged) is False
+
+    def test_other_key_is_not_trusted(self, signer):
+        checkpoint = signer.sign(VerificationCheckpoint(
+            entry_id="audit_1",
+            entry_hash="abc",
+            entry_count=10,
+            entry_timestamp=datetime(2026, 1, 1),
+            created_at=datetime(2026, 1, 2),
+        ))
+        other = CheckpointSigner("another_key_that_is_at_least_32_characters")
+
+        assert other.is_trusted(checkpoint) is False
+
+
+class TestVerifySegment:
+    def test_valid_chain(self):
+        result = verify_segment(iter(build_chain(5)), expected_prev=GENESIS_HASH)
+
+        assert result.valid is True
+        assert result.entry_count == 5
+        assert result.last_entry_id == "audit_00004"
+
+    def test_detects_tampered_entry(self):
+        chain = build_chain(5)
+        chain[3] = tamper(chain[3])
+
+        result = verify_segment(chain, expected_prev=GENESIS_HASH)
+
+        assert result.valid is False
+        assert result.failed_entry_id == "audit_00003"
+        assert result.last_entry_id == "audit_00002"
+
+    def test_detects_wrong_anchor(self):
+        result = verify_segment(build_chain(3), expected_prev="not_genesis")
+
+        assert result.valid is False
+        assert result.failed_entry_id == "audit_00000"
+
+
+class TestParallelChunks:
+    def test_stitched_chunks_match_sequential(self):
+        chain = build_chain(100)
+        loaders = [
+            (lambda chunk=chain[i:i + 17]: chunk)
+            for i in range(0, 100, 17)
+        ]
+
+        result = verify_chunks(loaders, max_workers=3)
+
+        assert result.valid is True
+        assert result.entry_count == 100
+        assert result.last_hash == chain[-1].entry_hash
+
+    def test_detects_missing_entry_at_chunk_boundary(self):
+        chain = build_chain(40)
+        del chain[20]
+        loaders = [lambda: chain[:20], lambda: chain[20:]]
+
+        result = verify_chunks(loaders, max_workers=2)
+
+        assert result.valid is False
+        assert result.failed_entry_id == "audit_00021"
+
+    def test_detects_tamper_inside_chunk(self):
+        chain = build_chain(40)
+        chain[35] = tamper(chain[35])
+        segments = [verify_segment(chain[:20]), verify_segment(chain[20:])]
+
+        result = stitch_segments(segments)
+
+        assert result.valid is False
+        assert result.failed_entry_id == "audit_00035"
+
+
+class TestAuditLoggerCheckpoints:
+    def test_records_checkpoints_at_interval(self, signer):
+        audit_logger = AuditLogger(checkpoint_signer=signer, checkpoint_interval=3)
+        for i in range(7):
+            audit_logger.log(
+                action=AuditAction.VIEW_CONVERSATION,
+                entity_type=AuditEntity.STUDENT,
+                entity_id=f"hash_{i}",
+                actor_id="counselor_123",
+                actor_role="counselor",
+            )
+
+        assert audit_logger.verify_chain() is True
+        counts = [checkpoint.entry_count for checkpoint in audit_logger.checkpoints]
+        assert counts == [3, 6]
+
+    def test_incremental_verification_skips_checkpointed_prefix(self, signer):
+        audit_logger = AuditLogger(checkpoint_signer=signer, checkpoint_interval=2)
+        for i in range(4):
+            audit_logger.log(
+                action=AuditAction.VIEW_CONVERSATION,
+                entity_type=AuditEntity.STUDENT,
+                entity_id=f"hash_{i}",
+                actor_id="counselor_123",
+                actor_role="counselor",
+            )
+        assert audit_logger.verify_chain() is True
+
+        # Content change behind the checkpoint is only caught by full mode
+        audit_logger._entries[0] = tamper(audit_logger._entries[0])
+
+        assert audit_logger.verify_chain() is True
+        assert audit_logger.verify_chain(full=True) is False
+
+    def test_new_entries_after_checkpoint_are_verified(self, signer):
+        audit_logger = AuditLogger(checkpoint_signer=signer, checkpoint_interval=2)
+        for i in range(2):
+            audit_logger.log(
+                action=AuditAction.VIEW_CONVERSATION,
+                entity_type=AuditEntity.STUDENT,
+                entity_id=f"hash_{i}",
+                actor_id="counselor_123",
+                actor_role="counselor",
+            )
+        assert audit_logger.verify_chain() is True
+
+        audit_logger.log(
+            action=AuditAction.EXPORT_DATA,
+            entity_type=AuditEntity.STUDENT,
+            entity_id="hash_new",
+            actor_id="admin_1",
+            actor_role="admin",
+        )
+        audit_logger._entries[2] = tamper(audit_logger._entries[2])
+
+        assert audit_logger.verify_chain() is False
+
+    def test_rewritten_checkpoint_entry_fails(self, signer):
+        audit_logger = AuditLogger(checkpoint_signer=signer, checkpoint_interval=2)
+        for i in range(2):
+            audit_logger.log(
+                action=AuditAction.VIEW_CONVERSATION,
+                entity_type=AuditEntity.STUDENT,
+                entity_id=f"hash_{i}",
+                actor_id="counselor_123",
+                actor_role="counselor",
+            )
+        assert audit_logger.verify_chain() is True
+
+        audit_logger._entries[1] = replace(audit_logger._entries[1], entry_hash="forged")
+
+        assert audit_logger.verify_chain() is False
+
+
+class TestAuditRepositoryCheckpoints:
+    def test_incremental_verification_from_checkpoint(self, signer):
+        repository = AuditRepository(checkpoint_signer=signer, checkpoint_interval=5)
+        for entry in build_chain(12):
+            repository.append(entry)
+
+        assert repository.verify_chain() is True
+        assert [c.entry_count for c in repository.list_checkpoints()] == [10, 5]
+
+        repository._memory_store[2] = tamper(repository._memory_store[2])
+
+        assert repository.verify_chain() is True
+        assert repository.verify_chain(full=True) is False
+
+    def test_forged_checkpoint_is_ignored(self, signer):
+        repository = AuditRepository(checkpoint_signer=signer, checkpoint_interval=5)
+        chain = build_chain(6)
+        chain[1] = tamper(chain[1])
+        for entry in chain:
+            repository.append(entry)
+
+        forged = VerificationCheckpoint(
+            entry_id=chain[4].entry_id,
+            entry_hash=chain[4].entry_hash,
+            entry_count=5,
+            entry_timestamp=chain[4].timestamp,
+            created_at=datetime.utcnow(),
+            signature="0" * 64,
+        )
+        repository._memory_checkpoints.append(forged)
+
+        assert repository.verify_chain() is False
+
+    def test_parallel_verification(self):
+        repository = AuditRepository()
+        for entry in build_chain(250):
+            repository.append(entry)
+
+        result = repository.verify_chain_parallel(chunk_size=40, max_workers=4)
+
+        assert result.valid is True
+        assert result.entry_count == 250
+
+    def test_parallel_verification_detects_tamper(self):
+        repository = AuditRepository()
+        chain = build_chain(250)
+        chain[123] = tamper(chain[123])
+        for entry in chain:
+            repository.append(entry)
+
+        result = repository.verify_chain_parallel(chunk_size=40, max_workers=4)
+
+        assert result.valid is False
+        assert result.failed_entry_id == "audit_00123"
+
+
+class RecordingConnectionManager:
+    """Connection manager stub that records executed SQL."""
+
+    def __init__(self):
+        self.statements = []
+
+    def get_connection(self):
+        manager = self
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, query, params=None):
+                manager.statements.append(" ".join(query.split()))
+
+            def fetchall(self):
+                return []
+
+        class Connection:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def cursor(self):
+                return Cursor()
+
+            def commit(self):
+                pass
+
+        return Connection()
+
+
+class TestPostgresCheckpointTable:
+    def test_table_is_created_before_first_checkpoint_access(self, signer):
+        manager = RecordingConnectionManager()
+        repository = AuditRepository(connection_manager=manager, checkpoint_signer=signer)
+        entry = build_chain(1)[0]
+
+        repository.list_checkpoints()
+        repository._store_checkpoint(signer.sign(VerificationCheckpoint(
+            entry_id=entry.entry_id,
+            entry_hash=entry.entry_hash,
+            entry_count=1,
+            entry_timestamp=entry.timestamp,
+            created_at=datetime.utcnow(),
+        )))
+
+        creates = [s for s in manager.statements if s.startswith("CREATE TABLE IF NOT EXISTS audit_checkpoints")]
+        inserts = [i for i, s in enumerate(manager.statements) if s.startswith("INSERT INTO audit_checkpoints")]
+        assert len(creates) == 1
+        assert manager.statements.index(creates[0]) < inserts[0]
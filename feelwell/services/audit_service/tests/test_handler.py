@@ -170,6 +170,35 @@ class TestQueryAuditEntries:
     def test_query_invalid_entity_type(self, client):
         response = client.get('/audit/query?entity_type=invalid')
         assert response.status_code == 400
+    
+    def test_query_paginates_with_cursor(self, client):
+        for i in range(3):
+            client.post(
+                '/audit/log',
+                json={
+                    'action': 'view_conversation',
+                    'entity_type': 'student',
+                    'entity_id': 'hash_paged',
+                    'actor_id': f'counselor_{i}',
+                    'actor_role': 'counselor',
+                },
+                content_type='application/json',
+            )
+        
+        first = json.loads(client.get('/audit/query?entity_id=hash_paged&limit=2').data)
+        assert first['count'] == 2
+        assert first['next_cursor'] is not None
+        
+        second = json.loads(client.get(
+            f"/audit/query?entity_id=hash_paged&limit=2&cursor={first['next_cursor']}"
+        ).data)
+        first_ids = {e['entry_id'] for e in first['entries']}
+        assert second['count'] >= 1
+        assert all(e['entry_id'] not in first_ids for e in second['entries'])
+    
+    def test_query_invalid_cursor(self, client):
+        response = client.get('/audit/query?cursor=garbage')
+        assert response.status_code == 400
 
 
 class TestVerifyChain:
@@ -0,0 +1,214 @@
+"""Bounded asynchronous audit write queue.
+
+Takes audit persistence off the chat latency path (ADR-005). Requests
+enqueue a record and return; a single background flusher drains the
+queue in batches and hands each record to the synchronous audit writer
+on a worker thread, so the event loop never blocks on storage.
+
+Guarantees:
+- Ordering: one flusher writes records in submission order, so the
+  audit hash chain sees the same sequence as the inline path
+- Back-pressure: submit() waits when the queue is full instead of
+  dropping records, slowing callers to the speed of storage
+- Durability on shutdown: close() drains every pending record before
+  returning
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Maximum records waiting to be written before submit() blocks
+DEFAULT_MAX_QUEUE_SIZE = 1000
+
+# Records drained per flusher wake-up
+DEFAULT_FLUSH_BATCH_SIZE = 50
+
+# Attempts per record before it is reported as failed
+DEFAULT_MAX_WRITE_ATTEMPTS = 3
+
+# Delay between write attempts (seconds)
+WRITE_RETRY_DELAY_SECONDS = 0.05
+
+
+@dataclass
+class AuditQueueStats:
+    """Counters exposed through health checks."""
+    submitted: int = 0
+    written: int = 0
+    failed: int = 0
+    backpressure_waits: int = 0
+    max_depth: int = 0
+    depth: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "failed": self.failed,
+            "backpressure_waits": self.backpressure_waits,
+            "max_depth": self.max_depth,
+            "depth": self.depth,
+        }
+
+
+class AuditWriteQueue:
+    """Bounded queue with a background flusher for audit records.
+
+    The flusher starts lazily on the first submit() inside a running
+    event loop. Call close() on shutdown to flush pending records.
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[Dict[str, Any]], Any],
+        max_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        max_attempts: int = DEFAULT_MAX_WRITE_ATTEMPTS,
+    ):
+        """Initialize the queue.
+
+        Args:
+            writer: Persists one record. Synchronous writers run on a
+                worker thread; coroutine functions are awaited directly.
+                Must raise on failure so the record is retried.
+            max_size: Queue capacity before back-pressure applies
+            batch_size: Records drained per flusher wake-up
+            max_attempts: Write attempts per record before giving up
+
+        Raises:
+            ValueError: If max_size, batch_size or max_attempts < 1
+        """
+        if max_size < 1 or batch_size < 1 or max_attempts < 1:
+            raise ValueError("max_size, batch_size and max_attempts must be >= 1")
+
+        self._writer = writer
+        self._writer_is_async = inspect.iscoroutinefunction(writer)
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._closed = False
+        self._stats = AuditQueueStats()
+
+    @property
+    def stats(self) -> AuditQueueStats:
+        """Current counters (depth refreshed on read)."""
+        self._stats.depth = self._queue.qsize() if self._queue else 0
+        return self._stats
+
+    def _ensure_started(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_size)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, record: Dict[str, Any]) -> None:
+        """Enqueue a record for writing.
+
+        Returns as soon as the record is queued. Waits for space when the
+        queue is full (back-pressure) rather than dropping the record.
+
+        Args:
+            record: Keyword arguments for the writer
+
+        Raises:
+            RuntimeError: If the queue has been closed
+
+        Logs:
+            - AUDIT_QUEUE_BACKPRESSURE: When the queue is full on submit
+        """
+        if self._closed:
+            raise RuntimeError("Audit queue is closed")
+
+        self._ensure_started()
+
+        if self._queue.full():
+            self._stats.backpressure_waits += 1
+            logger.warning(
+                "AUDIT_QUEUE_BACKPRESSURE",
+                extra={"depth": self._queue.qsize(), "max_size": self._max_size}
+            )
+
+        await self._queue.put(record)
+        self._stats.submitted += 1
+        self._stats.max_depth = max(self._stats.max_depth, self._queue.qsize())
+
+    async def _run(self) -> None:
+        """Flusher loop: drain up to batch_size records, write in order."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                for record in batch:
+                    await self._write_with_retry(record)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write_with_retry(self, record: Dict[str, Any]) -> None:
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                if self._writer_is_async:
+                    await self._writer(record)
+                else:
+                    await asyncio.to_thread(self._writer, record)
+                self._stats.written += 1
+                return
+            except Exception as e:
+                if attempt == self._max_attempts:
+                    self._stats.failed += 1
+                    logger.critical(
+                        "AUDIT_QUEUE_WRITE_FAILED",
+                        extra={
+                            "student_id_hash": record.get("student_id_hash"),
+                            "session_id": record.get("session_id"),
+                            "attempts": attempt,
+                            "error": str(e),
+                        }
+                    )
+                    return
+                await asyncio.sleep(WRITE_RETRY_DELAY_SECONDS * attempt)
+
+    async def flush(self) -> None:
+        """Wait until every record submitted so far has been written."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop accepting records, flush pending ones, stop the flusher.
+
+        Logs:
+            - AUDIT_QUEUE_CLOSED: With final counters
+        """
+        self._closed = True
+        started = time.perf_counter()
+
+        if self._queue is not None and self._flusher is not None:
+            if self._flusher.done():
+                # Flusher died (e.g. loop restarted); restart to drain
+                self._flusher = asyncio.get_running_loop().create_task(self._run())
+            await self._queue.join()
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+
+        logger.info(
+            "AUDIT_QUEUE_CLOSED",
+            extra={
+                **self.stats.to_dict(),
+                "drain_ms": (time.perf_counter() - started) * 1000,
+            }
+        )
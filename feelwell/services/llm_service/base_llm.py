@@ -4,9 +4,11 @@ Provides abstract base class and concrete implementations for different
 LLM providers (HuggingFace, OpenAI, AWS Bedrock, etc.).
 """
 
+import asyncio
+import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -33,6 +35,14 @@ class LLMConfig:
     temperature: float = 0.7
     top_p: float = 0.9
     timeout_seconds: int = 30
+    
+    # Connection pooling (one client session per LLM instance)
+    max_connections: int = 32  # Open connections to the endpoint
+    keepalive_timeout_seconds: float = 30.0  # Idle connection lifetime
+    dns_cache_ttl_seconds: int = 300
+    
+    # generate_batch requests in flight at once
+    max_batch_concurrency: int = 8
 
 
 @dataclass
@@ -56,6 +66,8 @@ class BaseLLM(ABC):
             config: LLM configuration
         """
         self.config = config
+        self._batch_semaphore: Optional[asyncio.Semaphore] = None
+        self._batch_loop: Optional[asyncio.AbstractEventLoop] = None
         logger.info(
             "LLM initialized",
             extra={
@@ -106,6 +118,63 @@ class BaseLLM(ABC):
         """
         pass
     
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Generate a response as a stream of text chunks.
+        
+        Providers without streaming support yield the complete response
+        as a single chunk.
+        
+        Args:
+            prompt: User prompt/question
+            system_prompt: Optional system prompt for context
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            Response text chunks in order
+        """
+        response = await self.generate(prompt, system_prompt, **kwargs)
+        yield response.text
+    
+    async def close(self) -> None:
+        """Release pooled connections. The instance must not be used after.
+        
+        Call on service shutdown.
+        """
+    
+    async def __aenter__(self) -> "BaseLLM":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+    
+    async def _generate_bounded(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> List[LLMResponse]:
+        """Run generate for each prompt, at most max_batch_concurrency at once.
+        
+        Results are in prompt order. The limit is shared by concurrent
+        batches on this instance, so they cannot flood the endpoint.
+        """
+        loop = asyncio.get_running_loop()
+        if self._batch_semaphore is None or self._batch_loop is not loop:
+            self._batch_semaphore = asyncio.Semaphore(max(1, self.config.max_batch_concurrency))
+            self._batch_loop = loop
+        semaphore = self._batch_semaphore
+        
+        async def bounded(prompt: str) -> LLMResponse:
+            async with semaphore:
+                return await self.generate(prompt, system_prompt, **kwargs)
+        
+        return await asyncio.gather(*(bounded(prompt) for prompt in prompts))
+    
     def validate_prompt(self, prompt: str) -> bool:
         """Validate prompt before sending to LLM.
         
@@ -148,6 +217,87 @@ class HuggingFaceLLM(BaseLLM):
         
         if config.api_key:
             self.headers["Authorization"] = f"Bearer {config.api_key}"
+        
+        # Created on first use, inside the running event loop
+        self._session = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def _get_session(self):
+        """Shared client session with a keep-alive connection pool."""
+        import aiohttp
+        
+        # A session is bound to the event loop that created it
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            await self.close()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                use_dns_cache=True,
+                ttl_dns_cache=self.config.dns_cache_ttl_seconds,
+                keepalive_timeout=self.config.keepalive_timeout_seconds,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
+            )
+            self._session_loop = loop
+            logger.info(
+                "LLM client session opened",
+                extra={
+                    "model": self.config.model_name,
+                    "max_connections": self.config.max_connections,
+                }
+            )
+        return self._session
+    
+    def _build_payload(self, prompt: str, system_prompt: Optional[str]) -> Dict[str, Any]:
+        """Inference API request body."""
+        # Format prompt with system context
+        full_prompt = prompt
+        if system_prompt:
+            full_prompt = f"{system_prompt}\n\n{prompt}"
+        
+        return {
+            "inputs": full_prompt,
+            "parameters": {
+                "max_new_tokens": self.config.max_tokens,
+                "temperature": self.config.temperature,
+                "top_p": self.config.top_p,
+                "return_full_text": False
+            }
+        }
+    
+    async def close(self) -> None:
+        """Close the client session and its pooled connections.
+        
+        A session opened on another event loop is closed there if that
+        loop is still running, and detached if it is idle. If it has been
+        closed (e.g. by asyncio.run), its transports went with it, so the
+        session is closed here to release the pool.
+        """
+        session, loop = self._session, self._session_loop
+        self._session = None
+        if session is None or session.closed:
+            return
+        
+        if loop is asyncio.get_running_loop() or loop.is_closed():
+            await session.close()
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            session.detach()
+            logger.warning(
+                "LLM client session detached from idle event loop",
+                extra={"model": self.config.model_name}
+            )
+            return
+        
+        logger.info(
+            "LLM client session closed",
+            extra={"model": self.config.model_name}
+        )
     
     async def generate(
         self,
@@ -165,39 +315,20 @@ class HuggingFaceLLM(BaseLLM):
         Returns:
             LLMResponse object
         """
-        import aiohttp
         import time
         
         if not self.validate_prompt(prompt):
             raise ValueError("Invalid prompt")
         
-        # Format prompt with system context
-        full_prompt = prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
-        
-        payload = {
-            "inputs": full_prompt,
-            "parameters": {
-                "max_new_tokens": self.config.max_tokens,
-                "temperature": self.config.temperature,
-                "top_p": self.config.top_p,
-                "return_full_text": False
-            }
-        }
+        payload = self._build_payload(prompt, system_prompt)
         
         start_time = time.time()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.endpoint,
-                    headers=self.headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds)
-                ) as response:
-                    response.raise_for_status()
-                    result = await response.json()
+            session = await self._get_session()
+            async with session.post(self.endpoint, json=payload) as response:
+                response.raise_for_status()
+                result = await response.json()
             
             latency_ms = (time.time() - start_time) * 1000
             
@@ -233,6 +364,53 @@ class HuggingFaceLLM(BaseLLM):
             )
             raise
     
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream tokens from a text-generation-inference endpoint.
+        
+        The endpoint answers with server-sent events, one generated
+        token per "data:" line; special tokens are skipped.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            **kwargs: Additional parameters
+            
+        Yields:
+            Token text in order
+        """
+        if not self.validate_prompt(prompt):
+            raise ValueError("Invalid prompt")
+        
+        payload = self._build_payload(prompt, system_prompt)
+        payload["stream"] = True
+        
+        try:
+            session = await self._get_session()
+            async with session.post(self.endpoint, json=payload) as response:
+                response.raise_for_status()
+                async for line in response.content:
+                    line = line.strip()
+                    if not line.startswith(b"data:"):
+                        continue
+                    event = json.loads(line[len(b"data:"):])
+                    token = event.get("token") or {}
+                    if token.get("text") and not token.get("special"):
+                        yield token["text"]
+        except Exception as e:
+            logger.error(
+                "LLM streaming failed",
+                extra={
+                    "model": self.config.model_name,
+                    "error": str(e)
+                }
+            )
+            raise
+    
     async def generate_batch(
         self,
         prompts: List[str],
@@ -247,16 +425,9 @@ class HuggingFaceLLM(BaseLLM):
             **kwargs: Additional parameters
             
         Returns:
-            List of LLMResponse objects
+            List of LLMResponse objects, in prompt order
         """
-        import asyncio
-        
-        tasks = [
-            self.generate(prompt, system_prompt, **kwargs)
-            for prompt in prompts
-        ]
-        
-        return await asyncio.gather(*tasks)
+        return await self._generate_bounded(prompts, system_prompt, **kwargs)
 
 
 class OpenAILLM(BaseLLM):
@@ -274,11 +445,26 @@ class OpenAILLM(BaseLLM):
             raise ValueError("OpenAI API key required")
         
         try:
+            import httpx
             import openai
-            self.client = openai.AsyncOpenAI(api_key=config.api_key)
+            self.client = openai.AsyncOpenAI(
+                api_key=config.api_key,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=config.max_connections,
+                        max_keepalive_connections=config.max_connections,
+                        keepalive_expiry=config.keepalive_timeout_seconds,
+                    ),
+                    timeout=config.timeout_seconds,
+                ),
+            )
         except ImportError:
             raise ImportError("openai package required: pip install openai")
     
+    async def close(self) -> None:
+        """Close the OpenAI client and its pooled connections."""
+        await self.client.close()
+    
     async def generate(
         self,
         prompt: str,
@@ -349,6 +535,53 @@ class OpenAILLM(BaseLLM):
             )
             raise
     
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream completion deltas from the OpenAI API.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            **kwargs: Additional parameters
+            
+        Yields:
+            Content deltas in order
+        """
+        if not self.validate_prompt(prompt):
+            raise ValueError("Invalid prompt")
+        
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.config.model_name,
+                messages=messages,
+                max_tokens=self.config.max_tokens,
+                temperature=self.config.temperature,
+                top_p=self.config.top_p,
+                timeout=self.config.timeout_seconds,
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error(
+                "OpenAI streaming failed",
+                extra={
+                    "model": self.config.model_name,
+                    "error": str(e)
+                }
+            )
+            raise
+    
     async def generate_batch(
         self,
         prompts: List[str],
@@ -363,16 +596,9 @@ class OpenAILLM(BaseLLM):
             **kwargs: Additional parameters
             
         Returns:
-            List of LLMResponse objects
+            List of LLMResponse objects, in prompt order
         """
-        import asyncio
-        
-        tasks = [
-            self.generate(prompt, system_prompt, **kwargs)
-            for prompt in prompts
-        ]
-        
-        return await asyncio.gather(*tasks)
+        return await self._generate_bounded(prompts, system_prompt, **kwargs)
 
 
 def create_llm(config: LLMConfig) -> BaseLLM:
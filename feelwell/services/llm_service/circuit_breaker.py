@@ -0,0 +1,365 @@
+"""Circuit breaker and request hedging for LLM providers.
+
+When a provider slows down or fails, callers should fall back at once
+instead of each waiting out the full request timeout. CircuitBreakerLLM
+wraps a BaseLLM and tracks a rolling window of recent calls:
+
+- CLOSED: calls pass through. The breaker opens when, over at least
+  min_calls recent calls, the error rate or the slow-call rate reaches
+  its threshold
+- OPEN: calls fail immediately with CircuitOpenError, so SafeLLMService
+  returns its fallback response without touching the provider
+- HALF_OPEN: after open_seconds a few probe calls are let through.
+  Enough successful probes close the breaker; any failure reopens it
+
+Optionally, a call still running after the window's p95 latency is
+hedged with a second identical request and the first to succeed wins.
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+from .base_llm import BaseLLM, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bounds (ms) of the latency histogram buckets in health checks
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000,
+)
+
+
+class CircuitState(Enum):
+    """Breaker state."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose breaker is open."""
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Thresholds for opening and closing the breaker."""
+    window_size: int = 50  # Recent calls considered
+    min_calls: int = 10  # Calls needed before the breaker can open
+    error_rate_threshold: float = 0.5
+    slow_call_ms: float = 5000.0  # Calls slower than this count as slow
+    slow_call_rate_threshold: float = 0.5
+    open_seconds: float = 30.0  # Time open before probing
+    half_open_probes: int = 2  # Successful probes needed to close
+    hedge_requests: bool = False
+    hedge_percentile: float = 0.95
+    hedge_min_delay_ms: float = 250.0  # Never hedge sooner than this
+
+
+class LatencyHistogram:
+    """Cumulative call counts per latency bucket."""
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+
+    def record(self, latency_ms: float) -> None:
+        for index, bound in enumerate(self.bounds):
+            if latency_ms <= bound:
+                self.counts[index] += 1
+                return
+        self.counts[-1] += 1
+
+    def to_dict(self) -> Dict[str, int]:
+        labels = [f"le_{bound:g}" for bound in self.bounds] + ["le_inf"]
+        return dict(zip(labels, self.counts))
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of unsorted values (0.0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class CircuitBreakerLLM(BaseLLM):
+    """BaseLLM wrapper that sheds load from an unhealthy provider.
+
+    Not thread-safe; share one instance per event loop thread.
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        config: Optional[CircuitBreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Wrap a provider.
+
+        Args:
+            llm: Provider client to protect
+            config: Breaker thresholds
+            clock: Monotonic time source in seconds (injected for testing)
+        """
+        super().__init__(llm.config)
+        self.llm = llm
+        self.breaker_config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        # (succeeded, latency_ms) of recent calls
+        self._window: Deque[Tuple[bool, float]] = deque(
+            maxlen=self.breaker_config.window_size
+        )
+        self._histogram = LatencyHistogram()
+        self._counters = {
+            "calls": 0,
+            "failures": 0,
+            "short_circuited": 0,
+            "times_opened": 0,
+            "hedges": 0,
+            "hedge_wins": 0,
+        }
+
+    @property
+    def provider(self) -> str:
+        return self.config.provider.value
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.breaker_config.open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """Generate through the breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+        """
+        probe = self._acquire()
+        started = time.perf_counter()
+        try:
+            if self._should_hedge(probe):
+                response = await self._hedged(prompt, system_prompt, **kwargs)
+            else:
+                response = await self.llm.generate(prompt, system_prompt, **kwargs)
+        except Exception:
+            self._record(False, (time.perf_counter() - started) * 1000, probe)
+            raise
+        except BaseException:
+            # Cancelled: no outcome, but the probe slot must be freed
+            self._abandon(probe)
+            raise
+        self._record(True, (time.perf_counter() - started) * 1000, probe)
+        return response
+
+    async def generate_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> List[LLMResponse]:
+        return await self._generate_bounded(prompts, system_prompt, **kwargs)
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream through the breaker; latency is time to first chunk.
+
+        A stream closed before its end (e.g. a guard cut-over) or
+        cancelled records no outcome.
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+        """
+        probe = self._acquire()
+        started = time.perf_counter()
+        first_chunk_ms = None
+        stream = self.llm.generate_stream(prompt, system_prompt, **kwargs)
+        try:
+            async for chunk in stream:
+                if first_chunk_ms is None:
+                    first_chunk_ms = (time.perf_counter() - started) * 1000
+                yield chunk
+        except Exception:
+            self._record(False, (time.perf_counter() - started) * 1000, probe)
+            raise
+        except BaseException:
+            # GeneratorExit from aclose(), or cancellation
+            self._abandon(probe)
+            raise
+        finally:
+            await stream.aclose()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._record(True, first_chunk_ms if first_chunk_ms is not None else elapsed_ms, probe)
+
+    async def close(self) -> None:
+        await self.llm.close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Breaker state, rolling rates and latency histogram."""
+        latencies = [latency for _, latency in self._window]
+        return {
+            "provider": self.provider,
+            "state": self.state.value,
+            "window_calls": len(self._window),
+            "error_rate": round(self._error_rate(), 4),
+            "slow_call_rate": round(self._slow_rate(), 4),
+            "p50_ms": round(percentile(latencies, 0.50), 1),
+            "p95_ms": round(percentile(latencies, 0.95), 1),
+            **self._counters,
+            "latency_histogram_ms": self._histogram.to_dict(),
+        }
+
+    def _acquire(self) -> bool:
+        """Admit a call; returns True if it is a half-open probe.
+
+        Raises:
+            CircuitOpenError: If the call must not reach the provider
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return False
+        if (
+            state == CircuitState.HALF_OPEN
+            and self._probes_in_flight + self._probe_successes
+            < self.breaker_config.half_open_probes
+        ):
+            self._probes_in_flight += 1
+            return True
+        self._counters["short_circuited"] += 1
+        raise CircuitOpenError(f"circuit open for provider {self.provider}")
+
+    def _record(self, succeeded: bool, latency_ms: float, probe: bool) -> None:
+        self._counters["calls"] += 1
+        if not succeeded:
+            self._counters["failures"] += 1
+        self._histogram.record(latency_ms)
+        self._window.append((succeeded, latency_ms))
+
+        if probe:
+            self._probes_in_flight -= 1
+            if self._state != CircuitState.HALF_OPEN:
+                return
+            if succeeded and latency_ms < self.breaker_config.slow_call_ms:
+                self._probe_successes += 1
+                if self._probe_successes >= self.breaker_config.half_open_probes:
+                    self._window.clear()
+                    self._transition(CircuitState.CLOSED)
+            else:
+                self._transition(CircuitState.OPEN)
+            return
+
+        if self._state == CircuitState.CLOSED and len(self._window) >= self.breaker_config.min_calls:
+            if (
+                self._error_rate() >= self.breaker_config.error_rate_threshold
+                or self._slow_rate() >= self.breaker_config.slow_call_rate_threshold
+            ):
+                self._transition(CircuitState.OPEN)
+
+    def _abandon(self, probe: bool) -> None:
+        """Free a probe slot for a call that ended without an outcome.
+
+        Counted as neither success nor failure; the breaker admits
+        another probe in its place.
+        """
+        if probe:
+            self._probes_in_flight -= 1
+
+    def _transition(self, state: CircuitState) -> None:
+        previous = self._state
+        self._state = state
+        self._probe_successes = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+            self._counters["times_opened"] += 1
+
+        log = logger.warning if state == CircuitState.OPEN else logger.info
+        log(
+            "LLM_CIRCUIT_STATE_CHANGED",
+            extra={
+                "provider": self.provider,
+                "from_state": previous.value,
+                "to_state": state.value,
+                "error_rate": round(self._error_rate(), 4),
+                "slow_call_rate": round(self._slow_rate(), 4),
+            }
+        )
+
+    def _error_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return sum(1 for ok, _ in self._window if not ok) / len(self._window)
+
+    def _slow_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        threshold = self.breaker_config.slow_call_ms
+        return sum(1 for _, latency in self._window if latency >= threshold) / len(self._window)
+
+    def _should_hedge(self, probe: bool) -> bool:
+        # Probes measure the provider alone; hedging needs a stable p95
+        return (
+            self.breaker_config.hedge_requests
+            and not probe
+            and len(self._window) >= self.breaker_config.min_calls
+        )
+
+    def _hedge_delay_seconds(self) -> float:
+        latencies = [latency for ok, latency in self._window if ok]
+        p95 = percentile(latencies, self.breaker_config.hedge_percentile)
+        return max(p95, self.breaker_config.hedge_min_delay_ms) / 1000
+
+    async def _hedged(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        **kwargs
+    ) -> LLMResponse:
+        """Send a second request if the first outlives the p95 delay."""
+        primary = asyncio.ensure_future(self.llm.generate(prompt, system_prompt, **kwargs))
+        pending = {primary}
+        error: Optional[BaseException] = None
+        try:
+            # Cancelling the caller in either wait cancels every request in flight
+            done, _ = await asyncio.wait(pending, timeout=self._hedge_delay_seconds())
+            if done:
+                pending = set()
+                return primary.result()
+
+            self._counters["hedges"] += 1
+            hedge = asyncio.ensure_future(self.llm.generate(prompt, system_prompt, **kwargs))
+            pending.add(hedge)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._counters["hedge_wins"] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
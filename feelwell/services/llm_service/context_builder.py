@@ -0,0 +1,272 @@
+"""Token-budgeted prompt context for multi-turn sessions.
+
+Sending the full conversation history on every turn makes prompts, and
+with them latency and cost, grow without bound until validate_prompt
+rejects them. ContextBuilder keeps each prompt within a token budget:
+
+- The system prompt and the current message are always included
+- The most recent turns are kept verbatim, as many as the budget allows
+- Older turns are folded into a compact extractive summary of what the
+  student said. It is updated incrementally as turns leave the verbatim
+  window and capped at its own budget (oldest lines drop first)
+
+Per-session state caches the token counts of turns already seen, so a
+new turn only tokenizes the delta. History is expected to be
+append-only; if it diverges from the cached prefix the session state is
+rebuilt from scratch.
+"""
+import logging
+import re
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_CONTEXT_TOKENS = 1024
+DEFAULT_SUMMARY_TOKENS = 192
+
+# Words kept from each turn folded into the summary
+DEFAULT_SUMMARY_TURN_WORDS = 20
+
+# Session states kept before the least recently used is dropped
+DEFAULT_MAX_SESSIONS = 10000
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+Tokenizer = Callable[[str], Sequence[Any]]
+
+STUDENT = "Student"
+ASSISTANT = "Assistant"
+
+
+def simple_tokenize(text: str) -> List[str]:
+    """Word and punctuation tokens; a close proxy for subword counts."""
+    return _TOKEN_PATTERN.findall(text)
+
+
+@dataclass
+class ContextBuilderConfig:
+    """Token budgets for prompt context."""
+    max_context_tokens: int = DEFAULT_MAX_CONTEXT_TOKENS
+    summary_tokens: int = DEFAULT_SUMMARY_TOKENS
+    summary_turn_words: int = DEFAULT_SUMMARY_TURN_WORDS
+    min_recent_turns: int = 1  # Kept verbatim even if over budget
+    max_sessions: int = DEFAULT_MAX_SESSIONS
+
+
+@dataclass
+class PromptContext:
+    """Prompt assembled for one LLM call.
+
+    Attributes:
+        prompt: User prompt including summary and recent turns
+        system_prompt: System prompt, unchanged
+        total_tokens: Tokens across system prompt, summary, verbatim
+            turns and message
+        verbatim_turns: History turns included verbatim
+        summarized_turns: History turns folded into the summary so far
+        tokenized_turns: History turns tokenized by this call (the delta)
+    """
+    prompt: str
+    system_prompt: str
+    total_tokens: int
+    verbatim_turns: int
+    summarized_turns: int
+    tokenized_turns: int
+
+    @property
+    def has_history(self) -> bool:
+        return self.verbatim_turns > 0 or self.summarized_turns > 0
+
+
+@dataclass
+class _Turn:
+    role: str
+    content: str
+    tokens: int
+
+
+@dataclass
+class _SessionState:
+    turns: List[_Turn] = field(default_factory=list)
+    summarized: int = 0  # Turns [0, summarized) are in the summary
+    summary: Deque[Tuple[str, int]] = field(default_factory=deque)
+    summary_tokens: int = 0
+    system_prompt: Optional[str] = None
+    system_tokens: int = 0
+
+
+def _parse_turn(turn: Any) -> Tuple[str, str]:
+    """(role, content) from a history entry; plain strings are student turns."""
+    if isinstance(turn, dict):
+        role = ASSISTANT if turn.get("role") == "assistant" else STUDENT
+        return role, str(turn.get("content") or turn.get("text") or "")
+    return STUDENT, str(turn)
+
+
+class ContextBuilder:
+    """Builds budgeted prompts, caching per-session tokenization.
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ContextBuilderConfig] = None,
+        tokenizer: Tokenizer = simple_tokenize,
+    ):
+        """Initialize builder.
+
+        Args:
+            config: Token budgets
+            tokenizer: Function returning the tokens of a string
+        """
+        self.config = config or ContextBuilderConfig()
+        self._tokenize = tokenizer
+        self._sessions: "OrderedDict[str, _SessionState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def build(
+        self,
+        system_prompt: str,
+        message: str,
+        conversation_history: Optional[Sequence[Any]] = None,
+        session_key: Optional[str] = None,
+    ) -> PromptContext:
+        """Assemble the prompt for the next turn.
+
+        Args:
+            system_prompt: System prompt for this turn
+            message: Current student message
+            conversation_history: Prior turns, oldest first; dicts with
+                "role" and "content", or plain strings
+            session_key: Stable per-session key; None disables caching
+
+        Returns:
+            PromptContext within the token budget (except for the
+            min_recent_turns guarantee)
+        """
+        history = [_parse_turn(turn) for turn in conversation_history or ()]
+
+        with self._lock:
+            state = self._session(session_key)
+            tokenized = self._sync_turns(state, history)
+            if state.system_prompt != system_prompt:
+                state.system_prompt = system_prompt
+                state.system_tokens = len(self._tokenize(system_prompt))
+            message_tokens = len(self._tokenize(message))
+
+            start = self._verbatim_start(state, message_tokens)
+            self._fold_into_summary(state, start)
+            recent = state.turns[start:]
+            summary = [line for line, _ in state.summary]
+            summary_tokens = state.summary_tokens
+            context = PromptContext(
+                prompt=self._assemble(summary, recent, message),
+                system_prompt=system_prompt,
+                total_tokens=(
+                    state.system_tokens + summary_tokens
+                    + sum(turn.tokens for turn in recent) + message_tokens
+                ),
+                verbatim_turns=len(recent),
+                summarized_turns=state.summarized,
+                tokenized_turns=tokenized,
+            )
+
+        return context
+
+    def end_session(self, session_key: str) -> None:
+        """Drop cached state for a finished session."""
+        with self._lock:
+            self._sessions.pop(session_key, None)
+
+    def _session(self, session_key: Optional[str]) -> _SessionState:
+        if session_key is None:
+            return _SessionState()
+        state = self._sessions.get(session_key)
+        if state is None:
+            state = _SessionState()
+            self._sessions[session_key] = state
+            while len(self._sessions) > self.config.max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_key)
+        return state
+
+    def _sync_turns(self, state: _SessionState, history: List[Tuple[str, str]]) -> int:
+        """Tokenize turns not seen before; returns how many were tokenized."""
+        known = state.turns
+        if len(history) < len(known) or (
+            known and (known[-1].role, known[-1].content) != history[len(known) - 1]
+        ):
+            logger.info(
+                "CONTEXT_HISTORY_DIVERGED",
+                extra={"cached_turns": len(known), "history_turns": len(history)}
+            )
+            state.turns = []
+            state.summarized = 0
+            state.summary.clear()
+            state.summary_tokens = 0
+
+        new_turns = history[len(state.turns):]
+        for role, content in new_turns:
+            state.turns.append(_Turn(role, content, len(self._tokenize(content))))
+        return len(new_turns)
+
+    def _verbatim_start(self, state: _SessionState, message_tokens: int) -> int:
+        """Index of the oldest turn that stays verbatim."""
+        budget = (
+            self.config.max_context_tokens
+            - state.system_tokens
+            - message_tokens
+            - self.config.summary_tokens
+        )
+        start = len(state.turns)
+        used = 0
+        while start > state.summarized:
+            tokens = state.turns[start - 1].tokens
+            kept = len(state.turns) - start
+            if used + tokens > budget and kept >= self.config.min_recent_turns:
+                break
+            used += tokens
+            start -= 1
+        return start
+
+    def _fold_into_summary(self, state: _SessionState, start: int) -> None:
+        """Summarize turns that left the verbatim window since last call."""
+        for turn in state.turns[state.summarized:start]:
+            # The student's own words carry the context worth keeping
+            if turn.role != STUDENT:
+                continue
+            words = turn.content.split()
+            line = " ".join(words[:self.config.summary_turn_words])
+            if len(words) > self.config.summary_turn_words:
+                line += " ..."
+            tokens = len(self._tokenize(line))
+            state.summary.append((line, tokens))
+            state.summary_tokens += tokens
+        state.summarized = max(state.summarized, start)
+
+        while state.summary and state.summary_tokens > self.config.summary_tokens:
+            _, tokens = state.summary.popleft()
+            state.summary_tokens -= tokens
+
+    def _assemble(self, summary: List[str], recent: List[_Turn], message: str) -> str:
+        if not summary and not recent:
+            return message
+        parts = []
+        if summary:
+            parts.append(
+                "Earlier in this conversation the student said:\n"
+                + "\n".join(f"- {line}" for line in summary)
+            )
+        if recent:
+            parts.append(
+                "Recent conversation:\n"
+                + "\n".join(f"{turn.role}: {turn.content}" for turn in recent)
+            )
+        parts.append(f"{STUDENT}: {message}")
+        return "\n\n".join(parts)
@@ -10,18 +10,27 @@ This module provides the glue code to connect the new LLM capabilities
 with your existing production services while maintaining ADR compliance.
 """
 
+import asyncio
 import logging
 import os
 from typing import Optional, Dict
 from dataclasses import dataclass
 
+from .audit_queue import AuditWriteQueue, DEFAULT_MAX_QUEUE_SIZE
 from .base_llm import create_llm, LLMConfig, LLMProvider
-from .safe_llm_service import SafeLLMService, SafeResponse
-from ..safety_service.scanner import CrisisScanner
+from .circuit_breaker import CircuitBreakerConfig, CircuitBreakerLLM
+from .response_cache import (
+    DEFAULT_MAX_ENTRIES,
+    EmbeddingFunction,
+    ResponseCache,
+    ResponseCacheConfig,
+)
+from .safe_llm_service import ResponseSource, SafeLLMService, SafeResponse
+from .single_flight import DEFAULT_WINDOW_SECONDS, SingleFlight
+from ..safety_service.crisis_publisher import CrisisEventPublisher
+from ..safety_service.scanner import SafetyScanner
 from ..safety_service.text_normalizer import TextNormalizer
-from ..safety_service.semantic_analyzer import SemanticAnalyzer
-from ..audit_service.audit_logger import AuditLogger
-from ..crisis_engine.handler import publish_crisis_event
+from ..audit_service.audit_logger import AuditAction, AuditEntity, AuditLogger
 from ...shared.models.risk import RiskLevel
 
 logger = logging.getLogger(__name__)
@@ -41,11 +50,22 @@ class FeelwellLLMConfig:
     enable_crisis_bypass: bool = True  # ADR-001 compliance
     enable_audit_logging: bool = True  # ADR-005 compliance
     enable_crisis_publishing: bool = True  # ADR-004 compliance
+    async_audit_logging: bool = True  # Queue audit writes off the response path
+    enable_response_cache: bool = False  # Reuse SAFE-band LLM responses
+    enable_circuit_breaker: bool = True  # Fail fast when the provider is unhealthy
+    hedge_llm_requests: bool = False  # Duplicate calls slower than p95
+    enable_request_coalescing: bool = True  # One computation per duplicate request
     
     # Performance
     max_tokens: int = 512
     temperature: float = 0.7
     timeout_seconds: int = 30
+    audit_queue_size: int = DEFAULT_MAX_QUEUE_SIZE
+    response_cache_ttl_seconds: float = 3600.0  # SAFE band only
+    response_cache_max_entries: int = DEFAULT_MAX_ENTRIES
+    circuit_slow_call_ms: float = 5000.0
+    circuit_open_seconds: float = 30.0
+    coalesce_window_seconds: float = DEFAULT_WINDOW_SECONDS
     
     @classmethod
     def from_env(cls) -> 'FeelwellLLMConfig':
@@ -59,6 +79,17 @@ class FeelwellLLMConfig:
             enable_crisis_bypass=os.environ.get("ENABLE_CRISIS_BYPASS", "true").lower() == "true",
             enable_audit_logging=os.environ.get("ENABLE_AUDIT_LOGGING", "true").lower() == "true",
             enable_crisis_publishing=os.environ.get("ENABLE_CRISIS_PUBLISHING", "true").lower() == "true",
+            async_audit_logging=os.environ.get("ASYNC_AUDIT_LOGGING", "true").lower() == "true",
+            audit_queue_size=int(os.environ.get("AUDIT_QUEUE_SIZE", DEFAULT_MAX_QUEUE_SIZE)),
+            enable_response_cache=os.environ.get("ENABLE_RESPONSE_CACHE", "false").lower() == "true",
+            response_cache_ttl_seconds=float(os.environ.get("RESPONSE_CACHE_TTL_SECONDS", 3600.0)),
+            response_cache_max_entries=int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            enable_circuit_breaker=os.environ.get("ENABLE_CIRCUIT_BREAKER", "true").lower() == "true",
+            hedge_llm_requests=os.environ.get("HEDGE_LLM_REQUESTS", "false").lower() == "true",
+            circuit_slow_call_ms=float(os.environ.get("CIRCUIT_SLOW_CALL_MS", 5000.0)),
+            circuit_open_seconds=float(os.environ.get("CIRCUIT_OPEN_SECONDS", 30.0)),
+            enable_request_coalescing=os.environ.get("ENABLE_REQUEST_COALESCING", "true").lower() == "true",
+            coalesce_window_seconds=float(os.environ.get("COALESCE_WINDOW_SECONDS", DEFAULT_WINDOW_SECONDS)),
         )
 
 
@@ -72,27 +103,59 @@ class FeelwellLLMService:
     def __init__(
         self,
         config: Optional[FeelwellLLMConfig] = None,
-        crisis_scanner: Optional[CrisisScanner] = None,
+        crisis_scanner: Optional[SafetyScanner] = None,
         text_normalizer: Optional[TextNormalizer] = None,
-        semantic_analyzer: Optional[SemanticAnalyzer] = None,
-        audit_logger: Optional[AuditLogger] = None
+        audit_logger: Optional[AuditLogger] = None,
+        embed_fn: Optional[EmbeddingFunction] = None,
+        crisis_publisher: Optional[CrisisEventPublisher] = None
     ):
         """Initialize Feelwell LLM Service.
         
         Args:
             config: LLM configuration (uses env vars if None)
-            crisis_scanner: Crisis detection scanner (creates new if None)
+            crisis_scanner: Safety scanner, including semantic analysis
+                (creates new if None)
             text_normalizer: Text normalization utility (creates new if None)
-            semantic_analyzer: Semantic analysis service (creates new if None)
             audit_logger: Audit logging service (creates new if None)
+            embed_fn: Local embedding function for similarity lookups in
+                the response cache (exact match only if None)
+            crisis_publisher: Crisis event publisher (creates new if None)
         """
         self.config = config or FeelwellLLMConfig.from_env()
         
         # Initialize components
-        self.crisis_scanner = crisis_scanner or CrisisScanner()
+        self.crisis_scanner = crisis_scanner or SafetyScanner()
         self.text_normalizer = text_normalizer or TextNormalizer()
-        self.semantic_analyzer = semantic_analyzer or SemanticAnalyzer()
         self.audit_logger = audit_logger or AuditLogger()
+        self.crisis_publisher = crisis_publisher or CrisisEventPublisher(
+            enabled=self.config.enable_crisis_publishing
+        )
+        
+        # Audit writes go through a bounded queue unless disabled
+        self._audit_queue: Optional[AuditWriteQueue] = None
+        if self.config.async_audit_logging:
+            self._audit_queue = AuditWriteQueue(
+                writer=self._write_audit_record,
+                max_size=self.config.audit_queue_size,
+            )
+        
+        # Duplicate (student, session, message) requests share one result
+        self._single_flight: Optional[SingleFlight[Dict]] = None
+        if self.config.enable_request_coalescing:
+            self._single_flight = SingleFlight(
+                self.config.coalesce_window_seconds,
+                replay_if=self._is_replayable,
+            )
+        
+        self.response_cache: Optional[ResponseCache] = None
+        if self.config.enable_response_cache:
+            self.response_cache = ResponseCache(
+                ResponseCacheConfig(
+                    ttl_seconds={RiskLevel.SAFE: self.config.response_cache_ttl_seconds},
+                    max_entries=self.config.response_cache_max_entries,
+                ),
+                embed=embed_fn,
+            )
         
         # Initialize LLM if enabled
         self.safe_llm = None
@@ -124,13 +187,19 @@ class FeelwellLLMService:
             
             # Create LLM instance
             llm = create_llm(llm_config)
+            if self.config.enable_circuit_breaker:
+                llm = CircuitBreakerLLM(llm, CircuitBreakerConfig(
+                    slow_call_ms=self.config.circuit_slow_call_ms,
+                    open_seconds=self.config.circuit_open_seconds,
+                    hedge_requests=self.config.hedge_llm_requests,
+                ))
             
             # Create Safe LLM Service (ADR-001 compliant)
             self.safe_llm = SafeLLMService(
                 llm=llm,
                 crisis_scanner=self.crisis_scanner,
                 text_normalizer=self.text_normalizer,
-                semantic_analyzer=self.semantic_analyzer
+                response_cache=self.response_cache
             )
             
             logger.info("LLM initialized successfully")
@@ -170,7 +239,47 @@ class FeelwellLLMService:
                 "session_id": str,
                 "metadata": dict
             }
+            Duplicates of an in-flight or just-completed request get the
+            same response with metadata["coalesced"] set; they write no
+            audit record and publish no crisis event of their own. A
+            fallback response is not replayed once completed, so a retry
+            gets a fresh attempt.
         """
+        if self._single_flight is None:
+            return await self._generate_response(
+                student_id, message, conversation_history, session_id
+            )
+        
+        student_id_hash = self._hash_student_id(student_id)
+        key = (student_id_hash, session_id, self._hash_message(message))
+        result, shared = await self._single_flight.do(
+            key,
+            lambda: self._generate_response(
+                student_id, message, conversation_history, session_id
+            )
+        )
+        if not shared:
+            return result
+        
+        logger.info(
+            "DUPLICATE_REQUEST_COALESCED",
+            extra={"student_id_hash": student_id_hash, "session_id": session_id}
+        )
+        return {**result, "metadata": {**result["metadata"], "coalesced": True}}
+    
+    @staticmethod
+    def _is_replayable(result: Dict) -> bool:
+        """Whether a completed response may be replayed to duplicates."""
+        return result["source"] != ResponseSource.FALLBACK.value
+    
+    async def _generate_response(
+        self,
+        student_id: str,
+        message: str,
+        conversation_history: Optional[list],
+        session_id: Optional[str]
+    ) -> Dict:
+        """Run safety checks, LLM, audit and crisis publishing once."""
         logger.info(
             "RESPONSE_GENERATION_STARTED",
             extra={
@@ -186,7 +295,8 @@ class FeelwellLLMService:
                 safe_response = await self.safe_llm.generate_safe_response(
                     message=message,
                     student_id=student_id,
-                    conversation_history=conversation_history
+                    conversation_history=conversation_history,
+                    session_id=session_id
                 )
             else:
                 # Fallback if LLM not available
@@ -220,7 +330,7 @@ class FeelwellLLMService:
                 "metadata": {
                     "student_id_hash": safe_response.student_id_hash,
                     "safety_checks_passed": safe_response.safety_checks_passed,
-                    **safe_response.metadata
+                    **(safe_response.metadata or {})
                 }
             }
             
@@ -238,7 +348,7 @@ class FeelwellLLMService:
                 "text": self._get_error_fallback_text(),
                 "risk_level": RiskLevel.SAFE.value,
                 "crisis_detected": False,
-                "source": "fallback",
+                "source": ResponseSource.FALLBACK.value,
                 "llm_bypassed": True,
                 "session_id": session_id,
                 "metadata": {"error": str(e)}
@@ -253,32 +363,32 @@ class FeelwellLLMService:
     ):
         """Log interaction to audit trail (ADR-005).
         
+        With async audit logging the record is queued and written by the
+        background flusher; this only waits when the queue is full.
+        
         Args:
             student_id: Student identifier
             message: Student's message
             response: Safe response object
             session_id: Session identifier
         """
+        record = {
+            "student_id_hash": response.student_id_hash,
+            "session_id": session_id,
+            "message_hash": self._hash_message(message),
+            "risk_level": response.risk_level.value,
+            "crisis_detected": response.crisis_detected,
+            "llm_bypassed": response.llm_bypassed,
+            "response_source": response.source.value,
+            "metadata": response.metadata,
+        }
+        
+        if self._audit_queue is not None:
+            await self._audit_queue.submit(record)
+            return
+        
         try:
-            await self.audit_logger.log_interaction(
-                student_id_hash=response.student_id_hash,
-                session_id=session_id,
-                message_hash=self._hash_message(message),
-                risk_level=response.risk_level.value,
-                crisis_detected=response.crisis_detected,
-                llm_bypassed=response.llm_bypassed,
-                response_source=response.source.value,
-                metadata=response.metadata
-            )
-            
-            logger.info(
-                "INTERACTION_LOGGED",
-                extra={
-                    "student_id_hash": response.student_id_hash,
-                    "session_id": session_id
-                }
-            )
-            
+            self._write_audit_record(record)
         except Exception as e:
             logger.error(
                 "AUDIT_LOGGING_FAILED",
@@ -288,35 +398,70 @@ class FeelwellLLMService:
                 }
             )
     
+    def _write_audit_record(self, record: Dict):
+        """Persist one interaction record to the audit logger.
+        
+        The student (hashed) is both actor and entity; the remaining
+        record fields go in the entry details. Raises on failure so the
+        audit queue can retry.
+        
+        Args:
+            record: Interaction fields built by _log_interaction
+        """
+        self.audit_logger.log(
+            action=AuditAction.LLM_INTERACTION,
+            entity_type=AuditEntity.STUDENT,
+            entity_id=record["student_id_hash"],
+            actor_id=record["student_id_hash"],
+            actor_role="student",
+            details={k: v for k, v in record.items() if k != "student_id_hash"}
+        )
+        
+        logger.info(
+            "INTERACTION_LOGGED",
+            extra={
+                "student_id_hash": record["student_id_hash"],
+                "session_id": record["session_id"]
+            }
+        )
+    
+    async def shutdown(self):
+        """Flush pending audit records and close LLM connections.
+        
+        Must be awaited on shutdown so no FERPA audit record is lost.
+        """
+        if self._audit_queue is not None:
+            await self._audit_queue.close()
+        if self.safe_llm is not None:
+            await self.safe_llm.llm.close()
+    
     async def _publish_crisis_event(
         self,
         student_id: str,
         response: SafeResponse,
         session_id: Optional[str]
     ):
-        """Publish crisis event to EventBridge/Kafka (ADR-004).
+        """Publish crisis event to Kinesis for the Crisis Engine (ADR-004).
+        
+        The publisher is synchronous (boto3), so it runs in a worker
+        thread. It logs its own outcome and falls back to a CRITICAL log
+        when Kinesis is unavailable.
         
         Args:
             student_id: Student identifier
             response: Safe response object
             session_id: Session identifier
         """
+        metadata = response.metadata or {}
         try:
-            await publish_crisis_event(
+            await asyncio.to_thread(
+                self.crisis_publisher.publish_crisis,
+                message_id=metadata.get("message_id", "unknown"),
+                session_id=session_id or "unknown",
                 student_id_hash=response.student_id_hash,
-                session_id=session_id,
-                crisis_type=response.metadata.get("crisis_type", "unknown"),
-                risk_level=response.risk_level.value,
-                keywords_matched=response.metadata.get("keywords_matched", [])
-            )
-            
-            logger.critical(
-                "CRISIS_EVENT_PUBLISHED",
-                extra={
-                    "student_id_hash": response.student_id_hash,
-                    "crisis_type": response.metadata.get("crisis_type"),
-                    "session_id": session_id
-                }
+                matched_keywords=metadata.get("keywords_matched", []),
+                risk_score=metadata.get("risk_score", 1.0),
+                scanner_version=metadata.get("scanner_version", "")
             )
             
         except Exception as e:
@@ -346,7 +491,7 @@ class FeelwellLLMService:
         
         return SafeResponse(
             text=self._get_error_fallback_text(),
-            source="fallback",
+            source=ResponseSource.FALLBACK,
             risk_level=RiskLevel.SAFE,
             crisis_detected=False,
             safety_checks_passed=True,
@@ -389,7 +534,24 @@ You don't have to go through this alone."""
             "provider": self.config.llm_provider,
             "crisis_bypass_enabled": self.config.enable_crisis_bypass,
             "audit_logging_enabled": self.config.enable_audit_logging,
-            "crisis_publishing_enabled": self.config.enable_crisis_publishing
+            "crisis_publishing_enabled": self.config.enable_crisis_publishing,
+            "audit_queue": (
+                self._audit_queue.stats.to_dict()
+                if self._audit_queue is not None else None
+            ),
+            "response_cache": (
+                self.response_cache.stats.to_dict()
+                if self.response_cache is not None else None
+            ),
+            "request_coalescing": (
+                self._single_flight.stats.to_dict()
+                if self._single_flight is not None else None
+            ),
+            "circuit_breaker": (
+                self.safe_llm.llm.snapshot()
+                if self.safe_llm is not None
+                and isinstance(self.safe_llm.llm, CircuitBreakerLLM) else None
+            )
         }
 
 
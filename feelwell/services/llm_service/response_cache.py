@@ -0,0 +1,307 @@
+"""Opt-in cache of LLM responses for low-risk messages.
+
+Many SAFE-band messages are near-duplicates ("I'm stressed about exams")
+and each costs a full LLM call. Responses are cached on:
+
+- The normalized message (TextNormalizer output, case and whitespace
+  folded)
+- The assessed risk level
+- The system prompt version, so prompt changes never serve old answers
+
+Lookup is exact-match first. With an embedding function configured, a
+miss falls back to the most similar cached message for the same risk
+level and prompt version, if its cosine similarity clears a threshold.
+
+Only risk levels with a TTL are cached. CAUTION and CRISIS are never
+cached regardless of configuration: those responses must always be
+generated (or deterministic) for the message at hand.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ...shared.models.risk import RiskLevel
+
+logger = logging.getLogger(__name__)
+
+
+# Risk levels that must never be served from cache (ADR-001)
+NEVER_CACHED = frozenset({RiskLevel.CAUTION, RiskLevel.CRISIS})
+
+DEFAULT_TTL_SECONDS = {RiskLevel.SAFE: 3600.0}
+
+DEFAULT_MAX_ENTRIES = 5000
+
+# Cosine similarity a cached message needs to answer a new one
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+EmbeddingFunction = Callable[[str], Sequence[float]]
+CacheKey = Tuple[str, RiskLevel, str]
+
+
+@dataclass
+class ResponseCacheConfig:
+    """Configuration for the response cache."""
+    ttl_seconds: Dict[RiskLevel, float] = field(
+        default_factory=lambda: dict(DEFAULT_TTL_SECONDS)
+    )
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached LLM response.
+
+    Attributes:
+        text: Response text
+        model: Model that generated it
+        llm_latency_ms: Latency of the original LLM call
+        expires_at: Monotonic time after which the entry is stale
+        match: "exact" or "similar" (set on lookup)
+        similarity: Cosine similarity for similar matches
+    """
+    text: str
+    model: str
+    llm_latency_ms: float
+    expires_at: float
+    match: str = "exact"
+    similarity: float = 1.0
+
+
+@dataclass
+class ResponseCacheStats:
+    """Counters for cache effectiveness."""
+    exact_hits: int = 0
+    similar_hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    stores: int = 0
+    evictions: int = 0
+    rejected: int = 0
+    latency_saved_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.exact_hits + self.similar_hits + self.misses
+        return (self.exact_hits + self.similar_hits) / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "exact_hits": self.exact_hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "rejected": self.rejected,
+            "hit_rate": round(self.hit_rate, 4),
+            "latency_saved_ms": round(self.latency_saved_ms, 1),
+        }
+
+
+def cache_text(normalized_message: str) -> str:
+    """Fold case and whitespace of a normalized message for keying."""
+    return " ".join(normalized_message.lower().split())
+
+
+class _EmbeddingIndex:
+    """Unit-normalized embeddings of cached messages for one bucket."""
+
+    def __init__(self):
+        self.keys: List[CacheKey] = []
+        self.matrix: Optional[np.ndarray] = None
+
+    def add(self, key: CacheKey, vector: np.ndarray) -> None:
+        self.keys.append(key)
+        row = vector[np.newaxis, :]
+        self.matrix = row if self.matrix is None else np.vstack([self.matrix, row])
+
+    def remove(self, key: CacheKey) -> None:
+        index = self.keys.index(key)
+        del self.keys[index]
+        self.matrix = np.delete(self.matrix, index, axis=0) if self.keys else None
+
+    def nearest(self, vector: np.ndarray) -> Tuple[Optional[CacheKey], float]:
+        if self.matrix is None:
+            return None, 0.0
+        scores = self.matrix @ vector
+        best = int(np.argmax(scores))
+        return self.keys[best], float(scores[best])
+
+
+class ResponseCache:
+    """TTL + LRU cache of LLM responses, with optional similarity lookup.
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ResponseCacheConfig] = None,
+        embed: Optional[EmbeddingFunction] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            config: Cache configuration
+            embed: Local embedding function; None for exact match only
+            clock: Monotonic time source (injected for testing)
+        """
+        self.config = config or ResponseCacheConfig()
+        self._embed = embed
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[CachedResponse, Optional[np.ndarray]]]" = OrderedDict()
+        self._indexes: Dict[Tuple[RiskLevel, str], _EmbeddingIndex] = {}
+        self._stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+
+        logger.info(
+            "RESPONSE_CACHE_INITIALIZED",
+            extra={
+                "cached_risk_levels": [r.value for r in self._cacheable_levels()],
+                "similarity_lookup": embed is not None,
+            }
+        )
+
+    @property
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(**vars(self._stats))
+
+    def _cacheable_levels(self) -> List[RiskLevel]:
+        return [r for r in self.config.ttl_seconds if r not in NEVER_CACHED]
+
+    def is_cacheable(self, risk_level: RiskLevel) -> bool:
+        """True if responses at this risk level may be cached."""
+        return risk_level not in NEVER_CACHED and risk_level in self.config.ttl_seconds
+
+    def get(
+        self,
+        normalized_message: str,
+        risk_level: RiskLevel,
+        prompt_version: str,
+    ) -> Optional[CachedResponse]:
+        """Look up a response for a message.
+
+        Args:
+            normalized_message: TextNormalizer output for the message
+            risk_level: Assessed risk level
+            prompt_version: System prompt version
+
+        Returns:
+            CachedResponse with match set, or None on a miss
+        """
+        if not self.is_cacheable(risk_level):
+            with self._lock:
+                self._stats.bypassed += 1
+            return None
+
+        text = cache_text(normalized_message)
+        key = (text, risk_level, prompt_version)
+        # Embed outside the lock; the embedding model may be slow
+        vector = self._vector(text) if self._embed is not None else None
+
+        with self._lock:
+            now = self._clock()
+            hit = self._live_entry(key, now)
+            if hit is not None:
+                self._entries.move_to_end(key)
+                self._stats.exact_hits += 1
+                self._stats.latency_saved_ms += hit.llm_latency_ms
+                return hit
+
+            index = self._indexes.get((risk_level, prompt_version))
+            if vector is not None and index is not None:
+                nearest, similarity = index.nearest(vector)
+                if nearest is not None and similarity >= self.config.similarity_threshold:
+                    hit = self._live_entry(nearest, now)
+                    if hit is not None:
+                        self._entries.move_to_end(nearest)
+                        self._stats.similar_hits += 1
+                        self._stats.latency_saved_ms += hit.llm_latency_ms
+                        return CachedResponse(
+                            text=hit.text,
+                            model=hit.model,
+                            llm_latency_ms=hit.llm_latency_ms,
+                            expires_at=hit.expires_at,
+                            match="similar",
+                            similarity=similarity,
+                        )
+
+            self._stats.misses += 1
+            return None
+
+    def put(
+        self,
+        normalized_message: str,
+        risk_level: RiskLevel,
+        prompt_version: str,
+        text: str,
+        model: str,
+        llm_latency_ms: float,
+    ) -> bool:
+        """Cache a validated LLM response.
+
+        Returns:
+            True if stored; False if the risk level is not cacheable
+        """
+        if not self.is_cacheable(risk_level):
+            return False
+
+        key_text = cache_text(normalized_message)
+        key = (key_text, risk_level, prompt_version)
+        vector = self._vector(key_text) if self._embed is not None else None
+        entry = CachedResponse(
+            text=text,
+            model=model,
+            llm_latency_ms=llm_latency_ms or 0.0,
+            expires_at=self._clock() + self.config.ttl_seconds[risk_level],
+        )
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (entry, vector)
+            if vector is not None:
+                self._indexes.setdefault((risk_level, prompt_version), _EmbeddingIndex()).add(
+                    key, vector
+                )
+            self._stats.stores += 1
+            while len(self._entries) > self.config.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats.evictions += 1
+        return True
+
+    def reject(self, normalized_message: str, risk_level: RiskLevel, prompt_version: str) -> None:
+        """Drop an entry that failed re-validation."""
+        key = (cache_text(normalized_message), risk_level, prompt_version)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._stats.rejected += 1
+
+    def _vector(self, text: str) -> np.ndarray:
+        vector = np.asarray(self._embed(text), dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def _live_entry(self, key: CacheKey, now: float) -> Optional[CachedResponse]:
+        stored = self._entries.get(key)
+        if stored is None:
+            return None
+        if stored[0].expires_at <= now:
+            self._remove(key)
+            return None
+        return stored[0]
+
+    def _remove(self, key: CacheKey) -> None:
+        _, vector = self._entries.pop(key)
+        if vector is not None:
+            self._indexes[(key[1], key[2])].remove(key)
@@ -0,0 +1,286 @@
+"""Compiled validator for LLM output.
+
+Blocked phrases are loaded once from versioned config
+(response_patterns.json) and compiled into an Aho-Corasick automaton.
+A response is normalized with the same TextNormalizer used for inbound
+messages, so spacing, leetspeak and unicode evasions are caught, then
+scanned in a single pass. Scan cost is linear in the response length
+plus the number of matches, independent of how many phrases are loaded.
+
+A match is only a violation outside a benign context. Counselor replies
+quote, negate and ask about harmful phrases ("please don't ever kill
+yourself", "have you had thoughts to kill yourself?"), so a match is
+dismissed when its clause negates it, its clause opens a check-in
+question, or it sits inside quotation marks. Only text before the match
+is consulted, so the streaming guard can decide without lookahead.
+"""
+import json
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from ..safety_service.text_normalizer import TextNormalizer, get_normalizer
+
+logger = logging.getLogger(__name__)
+
+
+# Versioned phrase set shipped with the service
+DEFAULT_PATTERNS_PATH = Path(__file__).parent / "response_patterns.json"
+
+T = TypeVar("T")
+
+# Ends a sentence; quotation marks are only matched within one. "!" is
+# leetspeak for "i" and only survives in un-normalized text
+SENTENCE_BREAKS = ".?!;\n"
+
+# Ends a clause; negation and check-in cues only apply within one, so
+# "don't worry, just <phrase>" is still a violation
+CLAUSE_BREAKS = SENTENCE_BREAKS + ",:"
+
+QUOTE_CHARS = frozenset('"\u201c\u201d')
+
+# Words that negate a phrase later in their clause; any "n't" word counts
+NEGATION_WORDS = frozenset({"not", "no", "never", "nobody", "cannot", "dont", "stop"})
+
+# A clause opening with one of these asks about the phrase instead of
+# suggesting it ("have you had thoughts to ...", "are you thinking of ...")
+CHECK_IN_OPENERS = (
+    "have you", "are you", "do you", "did you", "were you", "has anyone",
+    "has someone", "is anyone", "is someone",
+)
+
+WORD_PATTERN = re.compile(r"[a-z'\u2019]+")
+
+
+def is_benign_context(text: str, start: int) -> bool:
+    """Check whether a phrase match is quoted, negated or asked about.
+
+    Args:
+        text: Lowercased (or normalized) response text
+        start: Offset where the matched phrase begins
+
+    Returns:
+        True if the text before the match makes it benign
+    """
+    sentence_start = max(text.rfind(c, 0, start) for c in SENTENCE_BREAKS) + 1
+    if sum(text.count(q, sentence_start, start) for q in QUOTE_CHARS) % 2:
+        return True
+
+    clause_start = max(text.rfind(c, 0, start) for c in CLAUSE_BREAKS) + 1
+    clause = text[clause_start:start].strip()
+    words = WORD_PATTERN.findall(clause)
+    if "why" in words:
+        # "why don't you just ..." suggests the phrase despite the negation
+        return False
+    if clause.startswith(CHECK_IN_OPENERS):
+        return True
+    negations = sum(
+        1 for w in words if w in NEGATION_WORDS or w.endswith(("n't", "n\u2019t"))
+    )
+    # "no reason not to ..." cancels out
+    return negations % 2 == 1
+
+
+class PhraseAutomaton(Generic[T]):
+    """Aho-Corasick automaton over a fixed set of phrases.
+
+    Each phrase carries a payload returned with its matches. Matching is
+    exact; callers lowercase or normalize text and phrases beforehand.
+    """
+
+    def __init__(self, phrases: Iterable[Tuple[str, T]]):
+        """Compile the automaton.
+
+        Args:
+            phrases: (phrase, payload) pairs; empty phrases are ignored
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[Tuple[int, T]]] = [[]]
+        self.max_length = 0
+        self.size = 0
+
+        for phrase, payload in phrases:
+            if not phrase:
+                continue
+            state = 0
+            for char in phrase:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append((len(phrase), payload))
+            self.max_length = max(self.max_length, len(phrase))
+            self.size += 1
+
+        # Breadth-first failure links; each state inherits the outputs of
+        # its failure state so a scan never has to walk the chain
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                if self._fail[child] == child:
+                    self._fail[child] = 0
+                outputs[child].extend(outputs[self._fail[child]])
+        self._outputs: List[Tuple[Tuple[int, T], ...]] = [tuple(o) for o in outputs]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, T]]:
+        """Yield every occurrence of every phrase, overlaps included.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            (start, end, payload) in order of match end
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                end = index + 1
+                for length, payload in outputs[state]:
+                    yield end - length, end, payload
+
+    def first_match(self, text: str) -> Optional[Tuple[int, int, T]]:
+        """Return the match that ends first, or None."""
+        return next(self.iter_matches(text), None)
+
+
+@dataclass(frozen=True)
+class ResponseViolation:
+    """A blocked phrase found in an LLM response.
+
+    Attributes:
+        phrase: The matched phrase (normalized)
+        category: Phrase category (e.g. "harmful", "medical")
+        start: Start offset in the normalized response
+        end: End offset in the normalized response
+    """
+    phrase: str
+    category: str
+    start: int
+    end: int
+
+
+class ResponseValidator:
+    """Scans normalized LLM responses against the blocked phrase set.
+
+    Build once and share; scanning is read-only and thread-safe.
+    """
+
+    def __init__(
+        self,
+        phrases: Mapping[str, Iterable[str]],
+        version: str,
+        normalizer: Optional[TextNormalizer] = None,
+    ):
+        """Compile the validator.
+
+        Args:
+            phrases: Category -> blocked phrases
+            version: Phrase set version, for the audit trail
+            normalizer: Normalizer applied to phrases and responses
+                (shared singleton if None)
+        """
+        self.version = version
+        self.normalizer = normalizer or get_normalizer()
+        # Phrases go through the same normalization as responses so they
+        # are compared in the form the scan sees (case, leetspeak, unicode)
+        self.phrases: List[Tuple[str, str]] = sorted({
+            (self.normalizer.normalize(phrase), category)
+            for category, category_phrases in phrases.items()
+            for phrase in category_phrases
+        })
+        self._automaton: PhraseAutomaton[Tuple[str, str]] = PhraseAutomaton(
+            (phrase, (phrase, category)) for phrase, category in self.phrases
+        )
+
+        logger.info(
+            "RESPONSE_VALIDATOR_COMPILED",
+            extra={
+                "pattern_version": version,
+                "phrase_count": self._automaton.size,
+                "categories": sorted(phrases),
+            }
+        )
+
+    @classmethod
+    def from_config(
+        cls,
+        path: Optional[Path] = None,
+        normalizer: Optional[TextNormalizer] = None,
+    ) -> "ResponseValidator":
+        """Load the phrase set from a versioned JSON file.
+
+        Args:
+            path: Config file (defaults to the bundled response_patterns.json)
+            normalizer: Normalizer applied to phrases and responses
+
+        Returns:
+            Compiled ResponseValidator
+
+        Raises:
+            ValueError: If the file has no version or categories
+        """
+        path = Path(path or DEFAULT_PATTERNS_PATH)
+        config = json.loads(path.read_text(encoding="utf-8"))
+        if not config.get("version") or not config.get("categories"):
+            raise ValueError(f"{path} must define 'version' and 'categories'")
+        return cls(config["categories"], config["version"], normalizer)
+
+    @property
+    def phrase_count(self) -> int:
+        return self._automaton.size
+
+    def validate(self, response: str) -> List[ResponseViolation]:
+        """Return every blocked phrase in a response outside a benign context.
+
+        Args:
+            response: Raw LLM response text
+
+        Returns:
+            Violations ordered by position in the normalized response;
+            empty if the response is safe
+        """
+        return self.scan(self.normalizer.normalize(response))
+
+    def scan(self, normalized: str) -> List[ResponseViolation]:
+        """Scan text that has already been normalized.
+
+        Args:
+            normalized: TextNormalizer output
+
+        Returns:
+            Violations ordered by position; empty if none
+        """
+        violations = [
+            ResponseViolation(phrase=phrase, category=category, start=start, end=end)
+            for start, end, (phrase, category) in self._automaton.iter_matches(normalized)
+            if not is_benign_context(normalized, start)
+        ]
+        violations.sort(key=lambda v: (v.start, v.end))
+        return violations
@@ -8,16 +8,23 @@ ensuring that deterministic safety guardrails always take precedence over AI res
 """
 
 import logging
-from typing import Optional, Dict
+import time
+import uuid
+from typing import AsyncIterator, Optional, Dict, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 from ...shared.models.risk import RiskLevel
 from ...shared.utils.pii import hash_pii
-from ..safety_service.scanner import CrisisScanner
+from ..safety_service.config import CRISIS_KEYWORD_TYPES
+from ..safety_service.scanner import SafetyScanner
 from ..safety_service.text_normalizer import TextNormalizer
-from ..safety_service.semantic_analyzer import SemanticAnalyzer
 from .base_llm import BaseLLM, LLMResponse
+from .circuit_breaker import CircuitOpenError
+from .context_builder import ContextBuilder, PromptContext
+from .response_cache import ResponseCache
+from .response_validator import ResponseValidator
+from .stream_guard import StreamingResponseGuard
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +50,32 @@ class SafeResponse:
     metadata: Optional[Dict] = None
 
 
+@dataclass
+class SafeStreamChunk:
+    """A piece of a streamed response that has passed safety validation.
+    
+    Attributes:
+        text: Text to append to what the student sees
+        source: Source of the text
+        replaces_previous: True if the client must discard the text
+            released so far and show this text instead (fallback cut-over)
+        done: True on the last chunk
+        response: Complete SafeResponse, set on the last chunk
+    """
+    text: str
+    source: ResponseSource
+    replaces_previous: bool = False
+    done: bool = False
+    response: Optional[SafeResponse] = None
+
+
 class SafeLLMService:
     """LLM service with integrated safety guardrails (ADR-001 compliant)."""
     
+    # Bump whenever _create_system_prompt changes; part of the response
+    # cache key so cached answers never outlive the prompt that made them
+    SYSTEM_PROMPT_VERSION = "1"
+    
     # Deterministic crisis responses (bypass LLM)
     CRISIS_RESPONSES = {
         "suicide": """I'm really concerned about what you've shared with me. Your safety is the most important thing right now.
@@ -91,22 +121,33 @@ You did the right thing by reaching out."""
     def __init__(
         self,
         llm: BaseLLM,
-        crisis_scanner: CrisisScanner,
+        crisis_scanner: SafetyScanner,
         text_normalizer: TextNormalizer,
-        semantic_analyzer: SemanticAnalyzer
+        response_cache: Optional[ResponseCache] = None,
+        response_validator: Optional[ResponseValidator] = None,
+        context_builder: Optional[ContextBuilder] = None
     ):
         """Initialize Safe LLM Service.
         
         Args:
             llm: LLM instance for generating responses
-            crisis_scanner: Deterministic crisis detection scanner
+            crisis_scanner: Safety scanner (crisis keywords, then
+                semantic risk assessment)
             text_normalizer: Text normalization utility
-            semantic_analyzer: Semantic analysis for risk assessment
+            response_cache: Optional cache of low-risk LLM responses
+            response_validator: Compiled output validator (loads the
+                bundled phrase set if None)
+            context_builder: Token-budgeted prompt builder for
+                multi-turn sessions (default budgets if None)
         """
         self.llm = llm
         self.crisis_scanner = crisis_scanner
         self.text_normalizer = text_normalizer
-        self.semantic_analyzer = semantic_analyzer
+        self.response_cache = response_cache
+        self.response_validator = response_validator or ResponseValidator.from_config(
+            normalizer=text_normalizer
+        )
+        self.context_builder = context_builder or ContextBuilder()
         
         logger.info("Safe LLM Service initialized (ADR-001 compliant)")
     
@@ -114,7 +155,8 @@ You did the right thing by reaching out."""
         self,
         message: str,
         student_id: str,
-        conversation_history: Optional[list] = None
+        conversation_history: Optional[list] = None,
+        session_id: Optional[str] = None
     ) -> SafeResponse:
         """Generate response with safety-first approach (ADR-001).
         
@@ -125,6 +167,8 @@ You did the right thing by reaching out."""
             message: Student's message
             student_id: Student identifier (will be hashed for logging)
             conversation_history: Optional conversation context
+            session_id: Optional session identifier; enables cached
+                tokenization of the history across turns
             
         Returns:
             SafeResponse with safety metadata
@@ -139,66 +183,33 @@ You did the right thing by reaching out."""
             }
         )
         
-        # Step 1: Text Normalization
-        normalized_message = self.text_normalizer.normalize(message)
-        
-        # Step 2: DETERMINISTIC CRISIS DETECTION (ADR-001)
-        # This MUST run before LLM and bypass it if crisis detected
-        crisis_result = self.crisis_scanner.scan(normalized_message)
-        
-        if crisis_result.is_crisis:
-            logger.critical(
-                "CRISIS_DETECTED_LLM_BYPASSED",
-                extra={
-                    "student_id_hash": student_id_hash,
-                    "crisis_type": crisis_result.crisis_type,
-                    "keywords_matched": crisis_result.keywords_matched
-                }
-            )
-            
-            # Return deterministic crisis response (NO LLM)
-            crisis_response = self._get_crisis_response(crisis_result.crisis_type)
-            
-            return SafeResponse(
-                text=crisis_response,
-                source=ResponseSource.CRISIS_PROTOCOL,
-                risk_level=RiskLevel.CRISIS,
-                crisis_detected=True,
-                safety_checks_passed=True,
-                llm_bypassed=True,
-                student_id_hash=student_id_hash,
-                metadata={
-                    "crisis_type": crisis_result.crisis_type,
-                    "keywords_matched": crisis_result.keywords_matched
-                }
-            )
-        
-        # Step 3: Semantic Analysis for Risk Level
-        semantic_result = self.semantic_analyzer.analyze(
-            normalized_message,
-            conversation_history
+        crisis_response, risk_level, normalized_message = self._run_safety_checks(
+            message, student_id, student_id_hash
         )
+        if crisis_response is not None:
+            return crisis_response
         
-        risk_level = semantic_result.risk_level
-        
-        logger.info(
-            "SAFETY_CHECKS_PASSED",
-            extra={
-                "student_id_hash": student_id_hash,
-                "risk_level": risk_level.value
-            }
+        context = self._build_context(
+            message, risk_level, student_id_hash, conversation_history, session_id
         )
         
-        # Step 4: Generate LLM Response (only if safe)
+        # Step 4: Serve a cached response (SAFE band, first turn only,
+        # re-validated); later turns depend on the conversation so far
+        if not context.has_history:
+            cached_response = self._get_cached_response(
+                normalized_message, risk_level, student_id_hash
+            )
+            if cached_response is not None:
+                return cached_response
+        
+        # Step 5: Generate LLM Response (only if safe)
         try:
-            system_prompt = self._create_system_prompt(risk_level)
-            
             llm_response = await self.llm.generate(
-                prompt=message,
-                system_prompt=system_prompt
+                prompt=context.prompt,
+                system_prompt=context.system_prompt
             )
             
-            # Step 5: Post-generation safety check
+            # Step 6: Post-generation safety check
             if not self._validate_llm_response(llm_response.text):
                 logger.warning(
                     "LLM_RESPONSE_FAILED_SAFETY_CHECK",
@@ -218,6 +229,16 @@ You did the right thing by reaching out."""
                 }
             )
             
+            if self.response_cache is not None and not context.has_history:
+                self.response_cache.put(
+                    normalized_message,
+                    risk_level,
+                    self.SYSTEM_PROMPT_VERSION,
+                    text=llm_response.text,
+                    model=llm_response.model,
+                    llm_latency_ms=llm_response.latency_ms,
+                )
+            
             return SafeResponse(
                 text=llm_response.text,
                 source=ResponseSource.LLM_GENERATED,
@@ -229,10 +250,20 @@ You did the right thing by reaching out."""
                 metadata={
                     "model": llm_response.model,
                     "latency_ms": llm_response.latency_ms,
-                    "tokens_used": llm_response.tokens_used
+                    "tokens_used": llm_response.tokens_used,
+                    "prompt_tokens": context.total_tokens,
+                    "summarized_turns": context.summarized_turns
                 }
             )
             
+        except CircuitOpenError:
+            # Provider is unhealthy; fall back without waiting on it
+            logger.warning(
+                "LLM_CIRCUIT_OPEN_FALLBACK",
+                extra={"student_id_hash": student_id_hash}
+            )
+            return self._get_fallback_response(student_id_hash, risk_level)
+            
         except Exception as e:
             logger.error(
                 "LLM_GENERATION_FAILED",
@@ -245,6 +276,341 @@ You did the right thing by reaching out."""
             # Return safe fallback response
             return self._get_fallback_response(student_id_hash, risk_level)
     
+    async def generate_stream(
+        self,
+        message: str,
+        student_id: str,
+        conversation_history: Optional[list] = None,
+        session_id: Optional[str] = None
+    ) -> AsyncIterator[SafeStreamChunk]:
+        """Stream a response, releasing only text that passed validation.
+        
+        Same safety-first flow as generate_safe_response (ADR-001): crisis
+        detection runs before the LLM and bypasses it. LLM output is
+        checked incrementally by a StreamingResponseGuard over the
+        response validator's phrase set, and the complete response is
+        validated again before the final chunk. On a violation or LLM
+        error the stream cuts over to the fallback response, which
+        replaces everything released so far.
+        
+        Args:
+            message: Student's message
+            student_id: Student identifier (will be hashed for logging)
+            conversation_history: Optional conversation context
+            session_id: Optional session identifier
+            
+        Yields:
+            SafeStreamChunk; the last one has done=True and carries the
+            complete SafeResponse, with time-to-first-token in metadata
+        """
+        started = time.perf_counter()
+        student_id_hash = hash_pii(student_id)
+        
+        logger.info(
+            "SAFE_LLM_STREAM_STARTED",
+            extra={
+                "student_id_hash": student_id_hash,
+                "message_length": len(message)
+            }
+        )
+        
+        crisis_response, risk_level, _ = self._run_safety_checks(
+            message, student_id, student_id_hash
+        )
+        if crisis_response is not None:
+            yield SafeStreamChunk(
+                text=crisis_response.text,
+                source=crisis_response.source,
+                done=True,
+                response=crisis_response,
+            )
+            return
+        
+        guard = StreamingResponseGuard(self.response_validator)
+        released = []
+        first_token_ms = None
+        first_release_ms = None
+        failure = None
+        
+        context = self._build_context(
+            message, risk_level, student_id_hash, conversation_history, session_id
+        )
+        stream = self.llm.generate_stream(
+            prompt=context.prompt,
+            system_prompt=context.system_prompt
+        )
+        try:
+            async for token in stream:
+                if first_token_ms is None:
+                    first_token_ms = (time.perf_counter() - started) * 1000
+                text = guard.feed(token)
+                if guard.violation is not None:
+                    break
+                if text:
+                    if first_release_ms is None:
+                        first_release_ms = (time.perf_counter() - started) * 1000
+                    released.append(text)
+                    yield SafeStreamChunk(text=text, source=ResponseSource.LLM_GENERATED)
+            else:
+                text = guard.finish()
+                if text:
+                    if first_release_ms is None:
+                        first_release_ms = (time.perf_counter() - started) * 1000
+                    released.append(text)
+                    yield SafeStreamChunk(text=text, source=ResponseSource.LLM_GENERATED)
+        except Exception as e:
+            failure = e
+        finally:
+            await stream.aclose()
+        
+        latency_ms = (time.perf_counter() - started) * 1000
+        metrics = {
+            "time_to_first_token_ms": first_token_ms,
+            "time_to_first_release_ms": first_release_ms,
+            "latency_ms": latency_ms,
+            "released_chars": guard.released_chars,
+        }
+        
+        if guard.violation is not None or failure is not None:
+            if guard.violation is not None and guard.violation.category == "harmful":
+                logger.critical(
+                    "HARMFUL_CONTENT_IN_LLM_RESPONSE",
+                    extra={"pattern": guard.violation.pattern, "streaming": True}
+                )
+            elif guard.violation is not None:
+                logger.warning(
+                    "MEDICAL_ADVICE_IN_LLM_RESPONSE",
+                    extra={"pattern": guard.violation.pattern, "streaming": True}
+                )
+            else:
+                logger.error(
+                    "LLM_GENERATION_FAILED",
+                    extra={
+                        "student_id_hash": student_id_hash,
+                        "error": str(failure),
+                        "streaming": True
+                    }
+                )
+            logger.warning(
+                "LLM_STREAM_CUT_OVER_TO_FALLBACK",
+                extra={"student_id_hash": student_id_hash, **metrics}
+            )
+            fallback = self._get_fallback_response(student_id_hash, risk_level)
+            fallback.metadata = metrics
+            yield SafeStreamChunk(
+                text=fallback.text,
+                source=fallback.source,
+                replaces_previous=True,
+                done=True,
+                response=fallback,
+            )
+            return
+        
+        logger.info(
+            "LLM_STREAM_COMPLETED",
+            extra={"student_id_hash": student_id_hash, **metrics}
+        )
+        yield SafeStreamChunk(
+            text="",
+            source=ResponseSource.LLM_GENERATED,
+            done=True,
+            response=SafeResponse(
+                text="".join(released),
+                source=ResponseSource.LLM_GENERATED,
+                risk_level=risk_level,
+                crisis_detected=False,
+                safety_checks_passed=True,
+                llm_bypassed=False,
+                student_id_hash=student_id_hash,
+                metadata={"model": self.llm.config.model_name, **metrics}
+            ),
+        )
+    
+    def _run_safety_checks(
+        self,
+        message: str,
+        student_id: str,
+        student_id_hash: str
+    ) -> Tuple[Optional[SafeResponse], RiskLevel, str]:
+        """Deterministic crisis detection, then semantic risk assessment.
+        
+        Args:
+            message: Student's message
+            student_id: Student identifier (hashed by the scanner)
+            student_id_hash: Hashed student ID
+            
+        Returns:
+            Tuple of (crisis response if the LLM must be bypassed, else
+            None; assessed risk level; normalized message)
+        """
+        # Step 1: Text Normalization (cache key; the scanner normalizes
+        # on its own)
+        normalized_message = self.text_normalizer.normalize(message)
+        
+        # Step 2: DETERMINISTIC CRISIS DETECTION (ADR-001)
+        # This MUST run before LLM and bypass it if crisis detected
+        scan_result = self.crisis_scanner.scan(
+            message_id=f"msg_{uuid.uuid4().hex[:12]}",
+            text=message,
+            student_id=student_id
+        )
+        
+        if scan_result.bypass_llm:
+            # Matched keywords come back regex-escaped ("hurt\\ myself")
+            keywords_matched = [
+                keyword.replace("\\", "") for keyword in scan_result.matched_keywords
+            ]
+            crisis_type = self._classify_crisis(keywords_matched)
+            logger.critical(
+                "CRISIS_DETECTED_LLM_BYPASSED",
+                extra={
+                    "student_id_hash": student_id_hash,
+                    "crisis_type": crisis_type,
+                    "keywords_matched": keywords_matched
+                }
+            )
+            
+            # Return deterministic crisis response (NO LLM)
+            crisis_response = self._get_crisis_response(crisis_type)
+            
+            return SafeResponse(
+                text=crisis_response,
+                source=ResponseSource.CRISIS_PROTOCOL,
+                risk_level=RiskLevel.CRISIS,
+                crisis_detected=True,
+                safety_checks_passed=True,
+                llm_bypassed=True,
+                student_id_hash=student_id_hash,
+                metadata={
+                    "crisis_type": crisis_type,
+                    "keywords_matched": keywords_matched,
+                    "message_id": scan_result.message_id,
+                    "risk_score": scan_result.risk_score,
+                    "scanner_version": scan_result.scanner_version
+                }
+            ), RiskLevel.CRISIS, normalized_message
+        
+        # Step 3: Semantic risk level (assessed by the scanner)
+        risk_level = scan_result.risk_level
+        
+        logger.info(
+            "SAFETY_CHECKS_PASSED",
+            extra={
+                "student_id_hash": student_id_hash,
+                "risk_level": risk_level.value
+            }
+        )
+        
+        return None, risk_level, normalized_message
+    
+    def _build_context(
+        self,
+        message: str,
+        risk_level: RiskLevel,
+        student_id_hash: str,
+        conversation_history: Optional[list],
+        session_id: Optional[str]
+    ) -> PromptContext:
+        """Budgeted prompt with the system prompt and conversation so far.
+        
+        Args:
+            message: Student's message
+            risk_level: Assessed risk level (selects the system prompt)
+            student_id_hash: Hashed student ID
+            conversation_history: Optional conversation context
+            session_id: Optional session identifier
+            
+        Returns:
+            PromptContext for the LLM call
+        """
+        session_key = f"{student_id_hash}:{session_id}" if session_id else None
+        return self.context_builder.build(
+            self._create_system_prompt(risk_level),
+            message,
+            conversation_history,
+            session_key
+        )
+    
+    def _get_cached_response(
+        self,
+        normalized_message: str,
+        risk_level: RiskLevel,
+        student_id_hash: str
+    ) -> Optional[SafeResponse]:
+        """Look up a cached LLM response for this message.
+        
+        Cached text is re-validated with _validate_llm_response on every
+        hit, so a pattern added after it was cached still blocks it.
+        
+        Args:
+            normalized_message: Normalized student message
+            risk_level: Assessed risk level
+            student_id_hash: Hashed student ID
+            
+        Returns:
+            SafeResponse on a validated hit, None otherwise
+        """
+        if self.response_cache is None:
+            return None
+        
+        cached = self.response_cache.get(
+            normalized_message, risk_level, self.SYSTEM_PROMPT_VERSION
+        )
+        if cached is None:
+            return None
+        
+        if not self._validate_llm_response(cached.text):
+            logger.warning(
+                "CACHED_RESPONSE_FAILED_SAFETY_CHECK",
+                extra={"student_id_hash": student_id_hash}
+            )
+            self.response_cache.reject(
+                normalized_message, risk_level, self.SYSTEM_PROMPT_VERSION
+            )
+            return None
+        
+        logger.info(
+            "LLM_RESPONSE_SERVED_FROM_CACHE",
+            extra={
+                "student_id_hash": student_id_hash,
+                "match": cached.match,
+                "similarity": cached.similarity
+            }
+        )
+        
+        return SafeResponse(
+            text=cached.text,
+            source=ResponseSource.LLM_GENERATED,
+            risk_level=risk_level,
+            crisis_detected=False,
+            safety_checks_passed=True,
+            llm_bypassed=True,
+            student_id_hash=student_id_hash,
+            metadata={
+                "model": cached.model,
+                "cache_hit": True,
+                "cache_match": cached.match,
+                "cache_similarity": cached.similarity,
+                "latency_saved_ms": cached.llm_latency_ms
+            }
+        )
+    
+    def _classify_crisis(self, matched_keywords: list) -> str:
+        """Crisis type for the keywords the scanner matched.
+        
+        Args:
+            matched_keywords: Crisis keywords the scanner matched
+            
+        Returns:
+            "abuse", "self_harm" or "suicide" (the default, and the most
+            serious, when keywords are mixed or only semantic markers hit)
+        """
+        keywords = set(matched_keywords)
+        for crisis_type, type_keywords in CRISIS_KEYWORD_TYPES.items():
+            if keywords and keywords <= type_keywords:
+                return crisis_type
+        return "suicide"
+    
     def _get_crisis_response(self, crisis_type: str) -> str:
         """Get deterministic crisis response.
         
@@ -295,43 +661,26 @@ IMPORTANT: This student may be experiencing elevated distress. Be extra supporti
         Returns:
             True if safe, False otherwise
         """
-        # Check for harmful content
-        harmful_patterns = [
-            "kill yourself",
-            "end your life",
-            "you should die",
-            "harm yourself",
-            "commit suicide"
-        ]
-        
-        response_lower = response.lower()
+        violations = self.response_validator.validate(response)
+        if not violations:
+            return True
         
-        for pattern in harmful_patterns:
-            if pattern in response_lower:
-                logger.critical(
-                    "HARMFUL_CONTENT_IN_LLM_RESPONSE",
-                    extra={"pattern": pattern}
-                )
-                return False
-        
-        # Check for medical advice (not allowed)
-        medical_patterns = [
-            "i diagnose",
-            "you have depression",
-            "you have anxiety disorder",
-            "take this medication",
-            "stop taking your medication"
+        spans = [
+            {"pattern": v.phrase, "category": v.category, "span": [v.start, v.end]}
+            for v in violations
         ]
+        extra = {
+            "violations": spans,
+            "pattern_version": self.response_validator.version
+        }
         
-        for pattern in medical_patterns:
-            if pattern in response_lower:
-                logger.warning(
-                    "MEDICAL_ADVICE_IN_LLM_RESPONSE",
-                    extra={"pattern": pattern}
-                )
-                return False
+        # Harmful content outranks medical advice (not allowed either)
+        if any(v.category == "harmful" for v in violations):
+            logger.critical("HARMFUL_CONTENT_IN_LLM_RESPONSE", extra=extra)
+        else:
+            logger.warning("MEDICAL_ADVICE_IN_LLM_RESPONSE", extra=extra)
         
-        return True
+        return False
     
     def _get_fallback_response(
         self,
@@ -0,0 +1,160 @@
+"""Single-flight coalescing of duplicate concurrent requests.
+
+A double-tapped send or a client retry can submit the same request
+twice while the first is still running. SingleFlight runs one
+computation per key; concurrent duplicates await the same result. The
+result is also replayed to duplicates arriving within a short window
+after completion. Failures are never replayed, so a retry after an
+error runs again; neither are results rejected by a replay_if
+predicate (e.g. an error fallback returned instead of raised).
+
+Side effects inside the computation (audit writes, crisis events)
+therefore happen once per coalesced group.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Completed results are replayed to duplicates for this long
+DEFAULT_WINDOW_SECONDS = 2.0
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Coalescing counters."""
+    leaders: int = 0  # Computations started
+    coalesced: int = 0  # Duplicates that joined an in-flight computation
+    replayed: int = 0  # Duplicates served a just-completed result
+    failures: int = 0  # Computations that raised (not replayed)
+    not_replayable: int = 0  # Results rejected by replay_if
+    in_flight: int = 0
+
+    @property
+    def duplicate_rate(self) -> float:
+        total = self.leaders + self.coalesced + self.replayed
+        return (self.coalesced + self.replayed) / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "replayed": self.replayed,
+            "failures": self.failures,
+            "not_replayable": self.not_replayable,
+            "in_flight": self.in_flight,
+            "duplicate_rate": round(self.duplicate_rate, 4),
+        }
+
+
+@dataclass
+class _Flight(Generic[T]):
+    task: "asyncio.Future[T]"
+    loop: asyncio.AbstractEventLoop
+
+
+class SingleFlight(Generic[T]):
+    """Coalesces concurrent calls that share a key.
+
+    Use from a single event loop thread; flights started on another
+    loop are ignored rather than awaited across loops.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        replay_if: Optional[Callable[[T], bool]] = None,
+    ):
+        """Initialize.
+
+        Args:
+            window_seconds: How long a completed result is replayed to
+                duplicates (0 to coalesce in-flight calls only)
+            clock: Monotonic time source (injected for testing)
+            replay_if: Whether a completed result may be replayed; a
+                rejected result still reaches callers already waiting
+                on it, but later duplicates compute again
+        """
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._replay_if = replay_if
+        self._flights: Dict[Hashable, _Flight[T]] = {}
+        self._expiry: Deque[Tuple[float, Hashable, _Flight[T]]] = deque()
+        self.stats = SingleFlightStats()
+
+    async def do(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[T]],
+    ) -> Tuple[T, bool]:
+        """Run compute once per key, sharing its result with duplicates.
+
+        The computation runs as its own task, so a cancelled caller
+        does not cancel it for the others.
+
+        Args:
+            key: Identity of the request
+            compute: Coroutine factory producing the result
+
+        Returns:
+            Tuple of (result, shared); shared is True for duplicates
+
+        Raises:
+            Whatever compute raises, to every caller awaiting it
+        """
+        loop = asyncio.get_running_loop()
+        self._expire()
+
+        flight = self._flights.get(key)
+        if flight is not None and flight.loop is loop:
+            if flight.task.done():
+                self.stats.replayed += 1
+            else:
+                self.stats.coalesced += 1
+            return await asyncio.shield(flight.task), True
+
+        flight = _Flight(task=asyncio.ensure_future(compute()), loop=loop)
+        self._flights[key] = flight
+        self.stats.leaders += 1
+        self.stats.in_flight += 1
+        flight.task.add_done_callback(lambda task: self._complete(key, flight))
+        return await asyncio.shield(flight.task), False
+
+    def _complete(self, key: Hashable, flight: _Flight[T]) -> None:
+        self.stats.in_flight -= 1
+        drop = flight.task.cancelled() or flight.task.exception() is not None
+        if drop:
+            self.stats.failures += 1
+        elif self._replay_if is not None and not self._replay_if(flight.task.result()):
+            self.stats.not_replayable += 1
+            drop = True
+        if drop or self.window_seconds <= 0:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            return
+        self._expiry.append((self._clock() + self.window_seconds, key, flight))
+
+    def _expire(self) -> None:
+        now = self._clock()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, key, flight = self._expiry.popleft()
+            if self._flights.get(key) is flight:
+                del self._flights[key]
@@ -0,0 +1,165 @@
+"""Incremental safety validation for streamed LLM responses.
+
+A streamed response is released to the student while it is generated,
+so the post-generation check cannot run on the complete text. The guard
+scans a sliding window instead:
+
+- Incoming text is appended to a pending buffer and scanned for the
+  validator's blocked phrases, first as-is (case-insensitive), then
+  normalized like ResponseValidator.validate (leetspeak, unicode,
+  spacing evasions)
+- The last (longest pattern - 1) characters are always held back, so a
+  pattern split across chunks is still seen whole before any of it is
+  released
+- Matches are judged with the validator's benign-context check, which
+  only looks back. The released text since the last sentence break is
+  kept as context for it
+- Everything before the held-back tail has been scanned and is released,
+  cut at a word boundary where possible
+- At end of stream the complete response is validated once more. An
+  evasion can be longer than the hold-back and the kept context (e.g.
+  padded with spaces), so part of it may already have been released
+  when it is found
+
+Once a violation is found the guard stops releasing text and the caller
+cuts over to the fallback response, replacing anything released.
+"""
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from .response_validator import (
+    SENTENCE_BREAKS,
+    PhraseAutomaton,
+    ResponseValidator,
+    is_benign_context,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Released text kept as context for the benign-context check; bounds the
+# rescan cost when a stream has no sentence breaks
+MAX_CONTEXT_CHARS = 200
+
+
+@dataclass(frozen=True)
+class StreamViolation:
+    """A blocked pattern found in the stream.
+
+    Attributes:
+        pattern: The matched pattern
+        category: Pattern category (e.g. "harmful", "medical")
+        offset: Character offset of the match in the full response;
+            in the normalized response for matches that only appear
+            after normalization
+    """
+    pattern: str
+    category: str
+    offset: int
+
+
+class StreamingResponseGuard:
+    """Sliding-window pattern check that releases only scanned text.
+
+    Not thread-safe; use one guard per stream.
+    """
+
+    def __init__(self, validator: ResponseValidator):
+        """Initialize guard.
+
+        Args:
+            validator: Response validator supplying the (normalized)
+                phrase set and the normalizer
+        """
+        self._validator = validator
+        self._automaton: PhraseAutomaton[Tuple[str, str]] = PhraseAutomaton(
+            (pattern, (pattern, category)) for pattern, category in validator.phrases
+        )
+        self._holdback = max(self._automaton.max_length - 1, 0)
+        self._released: List[str] = []
+        self._pending = ""
+        self._context = ""
+        self._released_chars = 0
+        self.violation: Optional[StreamViolation] = None
+
+    @property
+    def released_chars(self) -> int:
+        """Characters released so far."""
+        return self._released_chars
+
+    def feed(self, text: str) -> str:
+        """Scan newly generated text.
+
+        Args:
+            text: Next chunk of the response
+
+        Returns:
+            Text that is now safe to release (may be empty). Always empty
+            once a violation has been found.
+        """
+        if self.violation is not None:
+            return ""
+
+        self._pending += text
+        if self._scan():
+            return ""
+
+        releasable = len(self._pending) - self._holdback
+        if releasable <= 0:
+            return ""
+
+        # Prefer whole words; fall back to a hard cut for long tokens
+        cut = self._pending.rfind(" ", 0, releasable) + 1 or releasable
+        return self._release(cut)
+
+    def finish(self) -> str:
+        """Validate the complete response and release the held-back tail.
+
+        Returns:
+            Remaining text, or empty if a violation was found
+        """
+        if self.violation is not None or self._scan():
+            return ""
+        violations = self._validator.validate("".join(self._released) + self._pending)
+        if violations:
+            first = violations[0]
+            self.violation = StreamViolation(
+                pattern=first.phrase, category=first.category, offset=first.start
+            )
+            return ""
+        return self._release(len(self._pending))
+
+    def _scan(self) -> bool:
+        window = self._context + self._pending
+        match = self._first_violation(window.lower())
+        if match is None:
+            match = self._first_violation(self._validator.normalizer.normalize(window))
+        if match is None:
+            return False
+        start, _, (pattern, category) = match
+        self.violation = StreamViolation(
+            pattern=pattern,
+            category=category,
+            offset=max(self._released_chars - len(self._context) + start, 0),
+        )
+        return True
+
+    def _first_violation(self, text: str) -> Optional[Tuple[int, int, Tuple[str, str]]]:
+        return next(
+            (
+                match for match in self._automaton.iter_matches(text)
+                if not is_benign_context(text, match[0])
+            ),
+            None,
+        )
+
+    def _release(self, length: int) -> str:
+        released = self._pending[:length]
+        self._pending = self._pending[length:]
+        self._released.append(released)
+        self._released_chars += len(released)
+        context = self._context + released
+        sentence_start = max(context.rfind(c) for c in SENTENCE_BREAKS) + 1
+        self._context = context[sentence_start:][-MAX_CONTEXT_CHARS:]
+        return released
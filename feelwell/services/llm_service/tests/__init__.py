@@ -0,0 +1 @@
+"""Tests for LLM Service."""
@@ -0,0 +1,151 @@
+"""Tests for the bounded asynchronous audit write queue."""
+import asyncio
+import threading
+import time
+import pytest
+
+from feelwell.services.llm_service.audit_queue import AuditWriteQueue
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class RecordingWriter:
+    """Synchronous writer that records calls and can be slowed or failed."""
+
+    def __init__(self, delay: float = 0.0, failures: int = 0):
+        self.records = []
+        self.delay = delay
+        self.failures = failures
+        self.threads = set()
+
+    def __call__(self, record):
+        self.threads.add(threading.get_ident())
+        if self.delay:
+            time.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise IOError("storage unavailable")
+        self.records.append(record)
+
+
+class TestAuditWriteQueue:
+    def test_rejects_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            AuditWriteQueue(writer=RecordingWriter(), max_size=0)
+
+    def test_submit_does_not_wait_for_write(self):
+        writer = RecordingWriter(delay=0.05)
+
+        async def scenario():
+            queue = AuditWriteQueue(writer=writer)
+            started = time.perf_counter()
+            await queue.submit({"session_id": "s1"})
+            elapsed = time.perf_counter() - started
+            await queue.close()
+            return elapsed
+
+        elapsed = run(scenario())
+
+        assert elapsed < 0.05
+        assert writer.records == [{"session_id": "s1"}]
+
+    def test_close_flushes_pending_in_order(self):
+        writer = RecordingWriter(delay=0.001)
+
+        async def scenario():
+            queue = AuditWriteQueue(writer=writer, max_size=100, batch_size=7)
+            for i in range(40):
+                await queue.submit({"index": i})
+            await queue.close()
+            return queue.stats
+
+        stats = run(scenario())
+
+        assert [r["index"] for r in writer.records] == list(range(40))
+        assert stats.written == 40
+        assert stats.depth == 0
+
+    def test_sync_writer_runs_off_event_loop_thread(self):
+        writer = RecordingWriter()
+
+        async def scenario():
+            queue = AuditWriteQueue(writer=writer)
+            await queue.submit({"index": 0})
+            await queue.close()
+
+        run(scenario())
+
+        assert threading.get_ident() not in writer.threads
+
+    def test_backpressure_when_full(self):
+        writer = RecordingWriter(delay=0.01)
+
+        async def scenario():
+            queue = AuditWriteQueue(writer=writer, max_size=2, batch_size=1)
+            for i in range(8):
+                await queue.submit({"index": i})
+                assert queue.stats.depth <= 2
+            await queue.close()
+            return queue.stats
+
+        stats = run(scenario())
+
+        assert stats.backpressure_waits > 0
+        assert stats.max_depth <= 2
+        assert len(writer.records) == 8
+
+    def test_failed_write_is_retried(self):
+        writer = RecordingWriter(failures=2)
+
+        async def scenario():
+            queue = AuditWriteQueue(writer=writer, max_attempts=3)
+            await queue.submit({"index": 0})
+            await queue.close()
+            return queue.stats
+
+        stats = run(scenario())
+
+        assert writer.records == [{"index": 0}]
+        assert stats.failed == 0
+
+    def test_exhausted_retries_are_counted(self):
+        writer = RecordingWriter(failures=2)
+
+        async def scenario():
+            queue = AuditWriteQueue(writer=writer, max_attempts=2)
+            await queue.submit({"index": 0})
+            await queue.submit({"index": 1})
+            await queue.close()
+            return queue.stats
+
+        stats = run(scenario())
+
+        assert stats.failed == 1
+        assert writer.records == [{"index": 1}]
+
+    def test_async_writer_is_awaited(self):
+        records = []
+
+        async def writer(record):
+            await asyncio.sleep(0)
+            records.append(record)
+
+        async def scenario():
+            queue = AuditWriteQueue(writer=writer)
+            await queue.submit({"index": 0})
+            await queue.flush()
+            assert records == [{"index": 0}]
+            await queue.close()
+
+        run(scenario())
+
+    def test_submit_after_close_raises(self):
+        async def scenario():
+            queue = AuditWriteQueue(writer=RecordingWriter())
+            await queue.close()
+            with pytest.raises(RuntimeError):
+                await queue.submit({"index": 0})
+
+        run(scenario())
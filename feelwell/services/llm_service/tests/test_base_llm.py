@@ -0,0 +1,276 @@
+"""Tests for LLM client connection pooling, bounded batches and streaming.
+
+Runs HuggingFaceLLM against a local aiohttp stub of the inference API.
+"""
+import asyncio
+import json
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+
+from feelwell.services.llm_service.base_llm import (
+    BaseLLM,
+    HuggingFaceLLM,
+    LLMConfig,
+    LLMProvider,
+)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class StubInferenceServer:
+    """Echoes the prompt back and records connections and concurrency."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.peers = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.authorization = None
+
+    async def handle(self, request):
+        self.requests += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.authorization = request.headers.get("Authorization")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            payload = await request.json()
+            await asyncio.sleep(self.delay)
+            return web.json_response([{"generated_text": f"echo: {payload['inputs']}"}])
+        finally:
+            self.in_flight -= 1
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/generate", self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/generate"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+def make_llm(endpoint, **overrides):
+    return HuggingFaceLLM(LLMConfig(
+        provider=LLMProvider.HUGGINGFACE,
+        model_name="stub-model",
+        endpoint=endpoint,
+        api_key="hf_test_token",
+        **overrides,
+    ))
+
+
+class TestConnectionPooling:
+    """The client session is shared across calls."""
+
+    def test_sequential_calls_reuse_one_connection(self):
+        async def scenario():
+            server = StubInferenceServer()
+            endpoint = await server.start()
+            llm = make_llm(endpoint)
+            try:
+                for i in range(5):
+                    response = await llm.generate(f"hello {i}")
+                    assert response.text == f"echo: hello {i}"
+            finally:
+                await llm.close()
+                await server.stop()
+            return server
+
+        server = run(scenario())
+
+        assert server.requests == 5
+        assert len(server.peers) == 1
+        assert server.authorization == "Bearer hf_test_token"
+
+    def test_connection_limit_caps_concurrency(self):
+        async def scenario():
+            server = StubInferenceServer(delay=0.02)
+            endpoint = await server.start()
+            llm = make_llm(endpoint, max_connections=2)
+            try:
+                await asyncio.gather(*(llm.generate(f"p{i}") for i in range(8)))
+            finally:
+                await llm.close()
+                await server.stop()
+            return server
+
+        server = run(scenario())
+
+        assert server.max_in_flight <= 2
+        assert len(server.peers) <= 2
+
+    def test_close_releases_session_and_reopens_on_use(self):
+        async def scenario():
+            server = StubInferenceServer()
+            endpoint = await server.start()
+            llm = make_llm(endpoint)
+            try:
+                await llm.generate("first")
+                session = llm._session
+                await llm.close()
+                assert session.closed
+                assert llm._session is None
+                await llm.generate("second")
+            finally:
+                await llm.close()
+                await server.stop()
+            return server
+
+        assert run(scenario()).requests == 2
+
+    def test_context_manager_closes(self):
+        async def scenario():
+            server = StubInferenceServer()
+            endpoint = await server.start()
+            try:
+                async with make_llm(endpoint) as llm:
+                    await llm.generate("hello")
+                    session = llm._session
+            finally:
+                await server.stop()
+            return session
+
+        assert run(scenario()).closed
+
+
+class TestBoundedBatch:
+    """generate_batch limits requests in flight and keeps order."""
+
+    def test_batch_respects_concurrency_limit(self):
+        async def scenario():
+            server = StubInferenceServer(delay=0.01)
+            endpoint = await server.start()
+            llm = make_llm(endpoint, max_batch_concurrency=3)
+            try:
+                responses = await llm.generate_batch([f"p{i}" for i in range(12)])
+            finally:
+                await llm.close()
+                await server.stop()
+            return server, responses
+
+        server, responses = run(scenario())
+
+        assert [r.text for r in responses] == [f"echo: p{i}" for i in range(12)]
+        assert server.max_in_flight == 3
+
+    def test_concurrent_batches_share_limit(self):
+        async def scenario():
+            server = StubInferenceServer(delay=0.01)
+            endpoint = await server.start()
+            llm = make_llm(endpoint, max_batch_concurrency=4)
+            try:
+                await asyncio.gather(
+                    llm.generate_batch([f"a{i}" for i in range(8)]),
+                    llm.generate_batch([f"b{i}" for i in range(8)]),
+                )
+            finally:
+                await llm.close()
+                await server.stop()
+            return server
+
+        assert run(scenario()).max_in_flight <= 4
+
+    def test_instance_usable_across_event_loops(self):
+        async def scenario(llm_holder):
+            server = StubInferenceServer()
+            endpoint = await server.start()
+            if not llm_holder:
+                llm_holder.append(make_llm(endpoint))
+            llm = llm_holder[0]
+            llm.endpoint = endpoint
+            try:
+                responses = await llm.generate_batch(["x", "y"])
+            finally:
+                await llm.close()
+                await server.stop()
+            return [r.text for r in responses]
+
+        holder = []
+        assert run(scenario(holder)) == ["echo: x", "echo: y"]
+        assert run(scenario(holder)) == ["echo: x", "echo: y"]
+
+    def test_session_from_finished_loop_is_closed(self):
+        llm_holder = []
+
+        async def scenario(close):
+            server = StubInferenceServer()
+            endpoint = await server.start()
+            if not llm_holder:
+                llm_holder.append(make_llm(endpoint))
+            llm = llm_holder[0]
+            llm.endpoint = endpoint
+            try:
+                await llm.generate("x")
+                return llm._session
+            finally:
+                if close:
+                    await llm.close()
+                await server.stop()
+
+        # The first loop ends without closing; the next loop's call must
+        # release the stale pool instead of leaking it
+        stale = run(scenario(close=False))
+        fresh = run(scenario(close=True))
+
+        assert stale.closed
+        assert fresh is not stale and fresh.closed
+
+
+class StubStreamingServer(StubInferenceServer):
+    """Streams tokens as text-generation-inference server-sent events."""
+
+    TOKENS = ["It ", "sounds ", "stressful", ".", "</s>"]
+
+    async def handle(self, request):
+        payload = await request.json()
+        assert payload["stream"] is True
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for i, text in enumerate(self.TOKENS):
+            event = {"token": {"id": i, "text": text, "special": text == "</s>"}}
+            await response.write(f"data:{json.dumps(event)}\n\n".encode())
+        await response.write_eof()
+        return response
+
+
+class TestStreaming:
+    """Tests for generate_stream."""
+
+    def test_huggingface_streams_tokens(self):
+        async def scenario():
+            server = StubStreamingServer()
+            endpoint = await server.start()
+            llm = make_llm(endpoint)
+            try:
+                return [token async for token in llm.generate_stream("exams")]
+            finally:
+                await llm.close()
+                await server.stop()
+
+        assert run(scenario()) == ["It ", "sounds ", "stressful", "."]
+
+    def test_default_stream_yields_full_response(self):
+        async def scenario():
+            server = StubInferenceServer()
+            endpoint = await server.start()
+            llm = make_llm(endpoint)
+            try:
+                return [
+                    token
+                    async for token in BaseLLM.generate_stream(llm, "exams")
+                ]
+            finally:
+                await llm.close()
+                await server.stop()
+
+        assert run(scenario()) == ["echo: exams"]
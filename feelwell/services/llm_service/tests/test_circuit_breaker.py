@@ -0,0 +1,273 @@
+"""Tests for the LLM circuit breaker and hedged requests."""
+import asyncio
+import pytest
+
+from feelwell.services.llm_service.base_llm import (
+    BaseLLM,
+    LLMConfig,
+    LLMProvider,
+    LLMResponse,
+)
+from feelwell.services.llm_service.circuit_breaker import (
+    CircuitBreakerConfig,
+    CircuitBreakerLLM,
+    CircuitOpenError,
+    CircuitState,
+    LatencyHistogram,
+)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptedLLM(BaseLLM):
+    """Fails while `failing` is set; each call sleeps for the next delay."""
+
+    def __init__(self, delays=None):
+        super().__init__(LLMConfig(provider=LLMProvider.HUGGINGFACE, model_name="fake"))
+        self.failing = False
+        self.delays = list(delays or [])
+        self.calls = 0
+        self.in_flight = 0
+
+    async def generate(self, prompt, system_prompt=None, **kwargs):
+        self.calls += 1
+        call = self.calls
+        self.in_flight += 1
+        try:
+            if self.delays:
+                await asyncio.sleep(self.delays.pop(0))
+        finally:
+            self.in_flight -= 1
+        if self.failing:
+            raise TimeoutError("provider timed out")
+        return LLMResponse(text=f"{prompt} #{call}", model="fake", provider=LLMProvider.HUGGINGFACE)
+
+    async def generate_batch(self, prompts, system_prompt=None, **kwargs):
+        return [await self.generate(p, system_prompt) for p in prompts]
+
+
+class StreamingLLM(ScriptedLLM):
+    """Streams `chunks`; counts closed streams."""
+
+    def __init__(self, chunks):
+        super().__init__()
+        self.chunks = chunks
+        self.streams_closed = 0
+
+    async def generate_stream(self, prompt, system_prompt=None, **kwargs):
+        try:
+            for chunk in self.chunks:
+                yield chunk
+        finally:
+            self.streams_closed += 1
+
+
+def make_breaker(llm, clock, **overrides):
+    config = CircuitBreakerConfig(window_size=10, min_calls=4, open_seconds=30, **overrides)
+    return CircuitBreakerLLM(llm, config, clock=clock)
+
+
+async def call_n(breaker, n):
+    outcomes = []
+    for i in range(n):
+        try:
+            await breaker.generate(f"p{i}")
+            outcomes.append("ok")
+        except CircuitOpenError:
+            outcomes.append("open")
+        except TimeoutError:
+            outcomes.append("error")
+    return outcomes
+
+
+class TestCircuitBreaker:
+    def test_opens_on_error_rate_and_short_circuits(self):
+        llm = ScriptedLLM()
+        llm.failing = True
+        breaker = make_breaker(llm, FakeClock())
+
+        outcomes = run(call_n(breaker, 6))
+
+        assert outcomes == ["error"] * 4 + ["open"] * 2
+        assert breaker.state == CircuitState.OPEN
+        assert llm.calls == 4
+        assert breaker.snapshot()["short_circuited"] == 2
+
+    def test_stays_closed_below_min_calls(self):
+        llm = ScriptedLLM()
+        llm.failing = True
+        breaker = make_breaker(llm, FakeClock())
+
+        run(call_n(breaker, 3))
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_opens_on_slow_calls(self):
+        llm = ScriptedLLM(delays=[0.02] * 4)
+        breaker = make_breaker(llm, FakeClock(), slow_call_ms=10)
+
+        assert run(call_n(breaker, 4)) == ["ok"] * 4
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_probes_close_breaker(self):
+        llm = ScriptedLLM()
+        llm.failing = True
+        clock = FakeClock()
+        breaker = make_breaker(llm, clock, half_open_probes=2)
+        run(call_n(breaker, 4))
+
+        clock.now = 31
+        llm.failing = False
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert run(call_n(breaker, 3)) == ["ok"] * 3
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self):
+        llm = ScriptedLLM()
+        llm.failing = True
+        clock = FakeClock()
+        breaker = make_breaker(llm, clock)
+        run(call_n(breaker, 4))
+
+        clock.now = 31
+        assert run(call_n(breaker, 2)) == ["error", "open"]
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.snapshot()["times_opened"] == 2
+
+    def test_half_open_limits_concurrent_probes(self):
+        llm = ScriptedLLM(delays=[0.01] * 10)
+        llm.failing = True
+        clock = FakeClock()
+        breaker = make_breaker(llm, clock, half_open_probes=1)
+        run(call_n(breaker, 4))
+        llm.failing = False
+        clock.now = 31
+
+        async def concurrent():
+            return await asyncio.gather(
+                *(breaker.generate("probe") for _ in range(3)), return_exceptions=True
+            )
+
+        results = run(concurrent())
+
+        assert sum(isinstance(r, CircuitOpenError) for r in results) == 2
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_cancelled_probe_frees_its_slot(self):
+        llm = ScriptedLLM(delays=[0, 0, 0, 0, 1.0])
+        llm.failing = True
+        clock = FakeClock()
+        breaker = make_breaker(llm, clock, half_open_probes=1)
+        run(call_n(breaker, 4))
+        llm.failing = False
+        clock.now = 31
+
+        async def scenario():
+            probe = asyncio.ensure_future(breaker.generate("probe"))
+            await asyncio.sleep(0.01)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+            return await call_n(breaker, 1)
+
+        assert run(scenario()) == ["ok"]
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.snapshot()["failures"] == 4
+
+    def test_stream_closed_midway_frees_probe_slot(self):
+        llm = StreamingLLM(["one ", "two ", "three"])
+        llm.failing = True
+        clock = FakeClock()
+        breaker = make_breaker(llm, clock, half_open_probes=1)
+        run(call_n(breaker, 4))
+        llm.failing = False
+        clock.now = 31
+
+        async def scenario():
+            stream = breaker.generate_stream("probe")
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first, [chunk async for chunk in breaker.generate_stream("again")]
+
+        first, chunks = run(scenario())
+
+        assert first == "one "
+        assert chunks == ["one ", "two ", "three"]
+        assert llm.streams_closed == 2
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.parametrize("cancel_after", [0.01, 0.1])
+    def test_cancelled_hedged_call_cancels_provider_calls(self, cancel_after):
+        # Cancelled while waiting on the primary alone, then after hedging
+        llm = ScriptedLLM(delays=[0.001] * 4 + [1.0, 1.0])
+        breaker = make_breaker(llm, FakeClock(), hedge_requests=True, hedge_min_delay_ms=50)
+
+        async def scenario():
+            await call_n(breaker, 4)
+            call = asyncio.ensure_future(breaker.generate("slow"))
+            await asyncio.sleep(cancel_after)
+            call.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await call
+            await asyncio.sleep(0)
+            return llm.in_flight
+
+        assert run(scenario()) == 0
+        assert breaker.snapshot()["hedges"] == (1 if cancel_after > 0.05 else 0)
+
+    def test_snapshot_has_histogram(self):
+        breaker = make_breaker(ScriptedLLM(), FakeClock())
+        run(call_n(breaker, 3))
+
+        snapshot = breaker.snapshot()
+
+        assert snapshot["state"] == "closed"
+        assert snapshot["provider"] == "huggingface"
+        assert sum(snapshot["latency_histogram_ms"].values()) == 3
+
+
+class TestHedging:
+    def test_slow_primary_is_hedged(self):
+        # Four fast calls establish p95; the fifth stalls, its hedge is fast
+        llm = ScriptedLLM(delays=[0.001] * 4 + [0.5, 0.001])
+        breaker = make_breaker(llm, FakeClock(), hedge_requests=True, hedge_min_delay_ms=20)
+
+        async def scenario():
+            await call_n(breaker, 4)
+            started = asyncio.get_running_loop().time()
+            response = await breaker.generate("slow")
+            return response, asyncio.get_running_loop().time() - started
+
+        response, elapsed = run(scenario())
+
+        assert response.text == "slow #6"
+        assert elapsed < 0.3
+        assert breaker.snapshot()["hedges"] == 1
+        assert breaker.snapshot()["hedge_wins"] == 1
+
+    def test_fast_primary_not_hedged(self):
+        llm = ScriptedLLM()
+        breaker = make_breaker(llm, FakeClock(), hedge_requests=True, hedge_min_delay_ms=20)
+
+        run(call_n(breaker, 6))
+
+        assert llm.calls == 6
+        assert breaker.snapshot()["hedges"] == 0
+
+
+def test_histogram_buckets():
+    histogram = LatencyHistogram(bounds=(10, 100))
+    for latency in (5, 10, 50, 1000):
+        histogram.record(latency)
+
+    assert histogram.to_dict() == {"le_10": 2, "le_100": 1, "le_inf": 1}
@@ -0,0 +1,143 @@
+"""Tests for token-budgeted conversation context."""
+import pytest
+
+from feelwell.services.llm_service.context_builder import (
+    ContextBuilder,
+    ContextBuilderConfig,
+    simple_tokenize,
+)
+
+
+SYSTEM = "You are a supportive assistant."
+
+
+class CountingTokenizer:
+    """simple_tokenize that records every string it tokenizes."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        return simple_tokenize(text)
+
+
+def make_history(turns):
+    history = []
+    for i in range(turns):
+        role = "user" if i % 2 == 0 else "assistant"
+        history.append({"role": role, "content": f"turn {i} " + "word " * 30})
+    return history
+
+
+def make_builder(**overrides):
+    config = ContextBuilderConfig(max_context_tokens=300, summary_tokens=60, **overrides)
+    return ContextBuilder(config, tokenizer=CountingTokenizer())
+
+
+class TestContextBuilder:
+    def test_no_history_prompt_is_message(self):
+        context = ContextBuilder().build(SYSTEM, "I'm stressed about exams")
+
+        assert context.prompt == "I'm stressed about exams"
+        assert context.system_prompt == SYSTEM
+        assert not context.has_history
+
+    def test_short_history_kept_verbatim(self):
+        history = [
+            {"role": "user", "content": "I failed my test"},
+            {"role": "assistant", "content": "That sounds hard."},
+        ]
+
+        context = ContextBuilder().build(SYSTEM, "What should I do?", history)
+
+        assert context.verbatim_turns == 2
+        assert context.summarized_turns == 0
+        assert "Student: I failed my test\nAssistant: That sounds hard." in context.prompt
+        assert context.prompt.endswith("Student: What should I do?")
+
+    def test_long_session_stays_within_budget(self):
+        builder = make_builder()
+        history = make_history(50)
+
+        for n in range(1, 51):
+            context = builder.build(SYSTEM, "and now?", history[:n], session_key="s1")
+            assert context.total_tokens <= 300
+
+        assert context.summarized_turns > 0
+        assert context.verbatim_turns >= 1
+        assert "Earlier in this conversation the student said:" in context.prompt
+        # Most recent turn is always verbatim
+        assert history[49]["content"] in context.prompt
+
+    def test_only_new_turns_tokenized(self):
+        builder = make_builder()
+        history = make_history(10)
+
+        first = builder.build(SYSTEM, "hi", history[:9], session_key="s1")
+        second = builder.build(SYSTEM, "hi", history, session_key="s1")
+
+        assert first.tokenized_turns == 9
+        assert second.tokenized_turns == 1
+
+    def test_without_session_key_nothing_cached(self):
+        builder = make_builder()
+        history = make_history(10)
+
+        builder.build(SYSTEM, "hi", history[:9])
+        context = builder.build(SYSTEM, "hi", history)
+
+        assert context.tokenized_turns == 10
+
+    def test_diverged_history_rebuilds_state(self):
+        builder = make_builder()
+        builder.build(SYSTEM, "hi", make_history(6), session_key="s1")
+        edited = make_history(6)
+        edited[-1] = {"role": "assistant", "content": "edited"}
+
+        context = builder.build(SYSTEM, "hi", edited, session_key="s1")
+
+        assert context.tokenized_turns == 6
+        assert "Assistant: edited" in context.prompt
+
+    def test_summary_is_capped(self):
+        builder = make_builder(summary_turn_words=5)
+        history = make_history(50)
+
+        for n in range(1, 51):
+            builder.build(SYSTEM, "hi", history[:n], session_key="s1")
+        state = builder._sessions["s1"]
+
+        assert state.summary_tokens <= 60
+        # Oldest lines are dropped first
+        assert state.summary[-1][0].startswith("turn 4")
+
+    def test_summary_keeps_student_turns_only(self):
+        builder = make_builder()
+        history = make_history(30)
+
+        context = builder.build(SYSTEM, "hi", history, session_key="s1")
+        summary = context.prompt.split("Recent conversation:")[0]
+
+        assert "turn 1 " not in summary
+        assert "- turn " in summary
+
+    def test_plain_string_history_treated_as_student(self):
+        context = ContextBuilder().build(SYSTEM, "hi", ["I can't sleep"])
+
+        assert "Student: I can't sleep" in context.prompt
+
+    def test_sessions_evicted_lru(self):
+        builder = make_builder(max_sessions=2)
+        for key in ("a", "b", "c"):
+            builder.build(SYSTEM, "hi", make_history(2), session_key=key)
+
+        assert list(builder._sessions) == ["b", "c"]
+
+    def test_end_session_drops_state(self):
+        builder = make_builder()
+        builder.build(SYSTEM, "hi", make_history(2), session_key="s1")
+
+        builder.end_session("s1")
+
+        assert "s1" not in builder._sessions
@@ -0,0 +1,193 @@
+"""Tests for the Feelwell LLM service wiring."""
+import asyncio
+import pytest
+
+from feelwell.shared.utils import configure_pii_salt, hash_pii
+from feelwell.services.audit_service.audit_logger import (
+    AuditAction,
+    AuditEntity,
+    AuditLogger,
+)
+from feelwell.services.safety_service.scanner import SafetyScanner
+from feelwell.services.llm_service import feelwell_integration
+from feelwell.services.llm_service.base_llm import (
+    BaseLLM,
+    LLMConfig,
+    LLMProvider,
+    LLMResponse,
+)
+from feelwell.services.llm_service.feelwell_integration import (
+    FeelwellLLMConfig,
+    FeelwellLLMService,
+)
+
+MESSAGE = "Any tips for studying for exams?"
+REPLY = "Try breaking your study time into short sessions."
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class SlowLLM(BaseLLM):
+    """Answers after `delay` seconds; raises while `failing` is set."""
+
+    def __init__(self, delay=0.05):
+        super().__init__(LLMConfig(provider=LLMProvider.HUGGINGFACE, model_name="fake"))
+        self.delay = delay
+        self.failing = False
+        self.calls = 0
+
+    async def generate(self, prompt, system_prompt=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.failing:
+            raise ConnectionError("provider reset")
+        return LLMResponse(text=REPLY, model="fake", provider="fake")
+
+    async def generate_batch(self, prompts, system_prompt=None, **kwargs):
+        return [await self.generate(p, system_prompt) for p in prompts]
+
+
+class RecordingPublisher:
+    def __init__(self):
+        self.events = []
+
+    def publish_crisis(self, **event):
+        self.events.append(event)
+        return True
+
+
+@pytest.fixture(autouse=True)
+def pii_salt():
+    configure_pii_salt("test-salt-for-feelwell-integration-tests")
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    return SafetyScanner()
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    llm = SlowLLM()
+    monkeypatch.setattr(feelwell_integration, "create_llm", lambda config: llm)
+    return llm
+
+
+def make_service(scanner, audit_logger=None, **overrides):
+    config = FeelwellLLMConfig(
+        enable_circuit_breaker=False,
+        enable_audit_logging=audit_logger is not None,
+        **overrides,
+    )
+    return FeelwellLLMService(
+        config=config,
+        crisis_scanner=scanner,
+        audit_logger=audit_logger,
+        crisis_publisher=RecordingPublisher(),
+    )
+
+
+class TestCoalescing:
+    def test_duplicate_requests_share_one_llm_call(self, scanner, llm):
+        service = make_service(scanner)
+
+        async def scenario():
+            return await asyncio.gather(*[
+                service.generate_response("student-1", MESSAGE, session_id="session-1")
+                for _ in range(3)
+            ])
+
+        results = run(scenario())
+
+        assert llm.calls == 1
+        assert all(r["text"] == REPLY for r in results)
+        assert [bool(r["metadata"].get("coalesced")) for r in results].count(False) == 1
+
+
+    def test_retry_after_fallback_is_not_replayed(self, scanner, llm):
+        service = make_service(scanner, coalesce_window_seconds=60.0)
+
+        async def scenario():
+            llm.failing = True
+            first = await service.generate_response("student-1", MESSAGE, session_id="s1")
+            llm.failing = False
+            retry = await service.generate_response("student-1", MESSAGE, session_id="s1")
+            duplicate = await service.generate_response("student-1", MESSAGE, session_id="s1")
+            return first, retry, duplicate
+
+        first, retry, duplicate = run(scenario())
+
+        assert first["source"] == "fallback"
+        assert retry["text"] == REPLY and not retry["metadata"].get("coalesced")
+        assert duplicate["text"] == REPLY and duplicate["metadata"]["coalesced"]
+        assert llm.calls == 2
+
+    def test_pipeline_error_is_not_replayed(self, scanner, llm, monkeypatch):
+        service = make_service(scanner, coalesce_window_seconds=60.0)
+        scan = scanner.scan
+
+        def broken_scan(**kwargs):
+            raise RuntimeError("scanner unavailable")
+
+        async def scenario():
+            monkeypatch.setattr(scanner, "scan", broken_scan)
+            first = await service.generate_response("student-1", MESSAGE)
+            monkeypatch.setattr(scanner, "scan", scan)
+            return first, await service.generate_response("student-1", MESSAGE)
+
+        first, retry = run(scenario())
+
+        assert first["metadata"]["error"] == "scanner unavailable"
+        assert retry["text"] == REPLY
+        assert service.health_check()["request_coalescing"]["not_replayable"] == 1
+
+
+class TestAuditLogging:
+    @pytest.mark.parametrize("async_audit_logging", [True, False])
+    def test_interaction_is_written_to_audit_log(self, scanner, llm, async_audit_logging):
+        audit_logger = AuditLogger()
+        service = make_service(scanner, audit_logger, async_audit_logging=async_audit_logging)
+
+        async def scenario():
+            result = await service.generate_response("student-1", MESSAGE, session_id="s1")
+            await service.shutdown()  # Drains the audit queue
+            return result
+
+        result = run(scenario())
+
+        student_id_hash = hash_pii("student-1")
+        (entry,) = audit_logger.query(entity_type=AuditEntity.STUDENT, entity_id=student_id_hash)
+        assert entry.action == AuditAction.LLM_INTERACTION
+        assert entry.actor_id == student_id_hash
+        assert entry.actor_role == "student"
+        assert entry.details["session_id"] == "s1"
+        assert entry.details["response_source"] == result["source"] == "llm_generated"
+        assert entry.details["crisis_detected"] is False
+        assert audit_logger.verify_chain(full=True)
+
+
+class TestCrisisPublishing:
+    def test_crisis_is_published_once(self, scanner, llm):
+        service = make_service(scanner)
+
+        result = run(service.generate_response("student-1", "I want to kill myself", session_id="s1"))
+
+        assert result["crisis_detected"] and result["source"] == "crisis_protocol"
+        assert llm.calls == 0
+        (event,) = service.crisis_publisher.events
+        assert event["student_id_hash"] == hash_pii("student-1")
+        assert event["session_id"] == "s1"
+        assert event["matched_keywords"] == ["kill myself"]
+        assert event["message_id"] == result["metadata"]["message_id"]
+
+
+class TestFallback:
+    def test_llm_disabled_returns_fallback(self, scanner):
+        service = make_service(scanner, enable_llm=False)
+
+        result = run(service.generate_response("student-1", MESSAGE))
+
+        assert result["source"] == "fallback"
+        assert "error" not in result["metadata"]
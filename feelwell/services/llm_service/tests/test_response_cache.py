@@ -0,0 +1,129 @@
+"""Tests for the LLM response cache."""
+import pytest
+
+from feelwell.shared.models.risk import RiskLevel
+from feelwell.services.llm_service.response_cache import (
+    ResponseCache,
+    ResponseCacheConfig,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def bag_of_words(text):
+    """Tiny deterministic embedding: counts of a fixed vocabulary."""
+    vocab = ["stressed", "exams", "tired", "friends", "sleep", "school", "about"]
+    words = text.split()
+    return [float(words.count(w)) for w in vocab]
+
+
+def store(cache, message, text="It sounds stressful.", risk=RiskLevel.SAFE, version="1"):
+    return cache.put(message, risk, version, text=text, model="m", llm_latency_ms=800.0)
+
+
+class TestExactLookup:
+    def test_hit_after_put(self):
+        cache = ResponseCache()
+        store(cache, "I'm stressed about exams")
+
+        hit = cache.get("i'm   STRESSED about exams ", RiskLevel.SAFE, "1")
+
+        assert hit.text == "It sounds stressful."
+        assert hit.match == "exact"
+        assert cache.stats.exact_hits == 1
+        assert cache.stats.latency_saved_ms == 800.0
+
+    def test_prompt_version_is_part_of_key(self):
+        cache = ResponseCache()
+        store(cache, "stressed about exams", version="1")
+
+        assert cache.get("stressed about exams", RiskLevel.SAFE, "2") is None
+        assert cache.stats.misses == 1
+
+    @pytest.mark.parametrize("risk", [RiskLevel.CAUTION, RiskLevel.CRISIS])
+    def test_elevated_risk_never_cached(self, risk):
+        cache = ResponseCache(ResponseCacheConfig(
+            ttl_seconds={RiskLevel.SAFE: 60, RiskLevel.CAUTION: 60, RiskLevel.CRISIS: 60}
+        ))
+
+        assert store(cache, "stressed about exams", risk=risk) is False
+        assert cache.get("stressed about exams", risk, "1") is None
+        assert cache.stats.bypassed == 1
+        assert cache.stats.stores == 0
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = ResponseCache(ResponseCacheConfig(ttl_seconds={RiskLevel.SAFE: 60}), clock=clock)
+        store(cache, "stressed about exams")
+
+        clock.now += 59
+        assert cache.get("stressed about exams", RiskLevel.SAFE, "1") is not None
+        clock.now += 2
+        assert cache.get("stressed about exams", RiskLevel.SAFE, "1") is None
+
+    def test_least_recently_used_evicted(self):
+        cache = ResponseCache(ResponseCacheConfig(max_entries=2))
+        store(cache, "a")
+        store(cache, "b")
+        cache.get("a", RiskLevel.SAFE, "1")
+        store(cache, "c")
+
+        assert cache.get("b", RiskLevel.SAFE, "1") is None
+        assert cache.get("a", RiskLevel.SAFE, "1") is not None
+        assert cache.stats.evictions == 1
+
+    def test_reject_drops_entry(self):
+        cache = ResponseCache()
+        store(cache, "stressed about exams")
+
+        cache.reject("stressed about exams", RiskLevel.SAFE, "1")
+
+        assert cache.get("stressed about exams", RiskLevel.SAFE, "1") is None
+        assert cache.stats.rejected == 1
+
+
+class TestSimilarityLookup:
+    def test_similar_message_hits(self):
+        cache = ResponseCache(embed=bag_of_words)
+        store(cache, "so stressed about exams")
+
+        hit = cache.get("stressed about exams", RiskLevel.SAFE, "1")
+
+        assert hit is not None
+        assert hit.match == "similar"
+        assert hit.similarity >= 0.95
+        assert cache.stats.similar_hits == 1
+
+    def test_dissimilar_message_misses(self):
+        cache = ResponseCache(embed=bag_of_words)
+        store(cache, "stressed about exams")
+
+        assert cache.get("tired no sleep", RiskLevel.SAFE, "1") is None
+
+    def test_similarity_scoped_to_prompt_version(self):
+        cache = ResponseCache(embed=bag_of_words)
+        store(cache, "so stressed about exams", version="1")
+
+        assert cache.get("stressed about exams", RiskLevel.SAFE, "2") is None
+
+    def test_evicted_entries_leave_index(self):
+        cache = ResponseCache(ResponseCacheConfig(max_entries=1), embed=bag_of_words)
+        store(cache, "stressed about exams", text="first")
+        store(cache, "tired no sleep", text="second")
+
+        assert cache.get("so stressed about exams", RiskLevel.SAFE, "1") is None
+        assert cache.get("tired sleep", RiskLevel.SAFE, "1").text == "second"
+
+    def test_hit_rate(self):
+        cache = ResponseCache(embed=bag_of_words)
+        store(cache, "stressed about exams")
+        cache.get("stressed about exams", RiskLevel.SAFE, "1")
+        cache.get("friends school", RiskLevel.SAFE, "1")
+
+        assert cache.stats.to_dict()["hit_rate"] == 0.5
@@ -0,0 +1,126 @@
+"""Tests for the compiled LLM response validator."""
+import json
+import random
+import pytest
+
+from feelwell.services.llm_service.response_validator import (
+    DEFAULT_PATTERNS_PATH,
+    PhraseAutomaton,
+    ResponseValidator,
+)
+
+
+PHRASES = {
+    "harmful": ["kill yourself", "you should die"],
+    "medical": ["you have depression", "take this medication"],
+}
+
+
+@pytest.fixture
+def validator():
+    return ResponseValidator(PHRASES, version="test")
+
+
+class TestPhraseAutomaton:
+    def test_finds_overlapping_and_nested_phrases(self):
+        automaton = PhraseAutomaton([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+
+        matches = sorted(automaton.iter_matches("ushers"))
+
+        assert matches == [(1, 4, 2), (2, 4, 1), (2, 6, 4)]
+
+    def test_matches_naive_search(self):
+        rng = random.Random(3)
+        phrases = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(30)]
+        automaton = PhraseAutomaton((p, p) for p in set(phrases))
+        text = "".join(rng.choice("abcd") for _ in range(300))
+
+        expected = sorted(
+            (i, i + len(p), p)
+            for p in set(phrases)
+            for i in range(len(text))
+            if text.startswith(p, i)
+        )
+
+        assert sorted(automaton.iter_matches(text)) == expected
+
+    def test_empty_automaton_never_matches(self):
+        automaton = PhraseAutomaton([])
+
+        assert automaton.first_match("anything") is None
+        assert automaton.max_length == 0
+
+
+class TestResponseValidator:
+    def test_safe_response_has_no_violations(self, validator):
+        assert validator.validate("It sounds like exams are stressful. Want to talk?") == []
+
+    def test_returns_all_violations_with_spans(self, validator):
+        violations = validator.validate("You have depression. Take this medication.")
+
+        assert [(v.phrase, v.category) for v in violations] == [
+            ("you have depression", "medical"),
+            ("take this medication", "medical"),
+        ]
+        assert (violations[0].start, violations[0].end) == (0, 19)
+
+    @pytest.mark.parametrize("evasion", [
+        "kill y0urs3lf",
+        "K1LL YOURSELF",
+        "ｋｉｌｌ yourself",
+        "kill​ yourself",
+        "kill    yourself",
+    ])
+    def test_catches_evasions(self, validator, evasion):
+        violations = validator.validate(f"Honestly, {evasion}.")
+
+        assert [v.category for v in violations] == ["harmful"]
+
+    def test_bundled_config_loads(self):
+        validator = ResponseValidator.from_config()
+        config = json.loads(DEFAULT_PATTERNS_PATH.read_text())
+
+        assert validator.version == config["version"]
+        assert validator.phrase_count >= 100
+        assert validator.validate("I diagnose you with anxiety")[0].category == "medical"
+
+    @pytest.mark.parametrize("reply", [
+        "Please don't think you should give up on yourself.",
+        "It sounds like you feel you are a burden, but that is not true.",
+        "Have you had thoughts to hurt yourself?",
+        "Are you having thoughts to kill yourself right now?",
+        "Nobody should ever tell you that you are worthless.",
+        "You don't need help from me to see how strong you are.",
+        "How many pills did you take? I want to make sure you are safe.",
+        "I can't keep this a secret, because your safety matters most.",
+        "Please, never kill yourself over a grade.",
+        'If someone says "kill yourself" online, report it.',
+    ])
+    def test_supportive_replies_pass_bundled_config(self, reply):
+        assert ResponseValidator.from_config().validate(reply) == []
+
+    @pytest.mark.parametrize("reply", [
+        "Don't worry, just kill yourself.",
+        "Why don't you kill yourself?",
+        "There is no reason not to kill yourself.",
+        "Honestly, nobody would miss you.",
+    ])
+    def test_harmful_replies_fail_bundled_config(self, reply):
+        assert [v.category for v in ResponseValidator.from_config().validate(reply)] == ["harmful"]
+
+    def test_config_without_version_rejected(self, tmp_path):
+        path = tmp_path / "patterns.json"
+        path.write_text(json.dumps({"categories": PHRASES}))
+
+        with pytest.raises(ValueError):
+            ResponseValidator.from_config(path)
+
+    def test_large_phrase_set_still_exact(self):
+        words = ["".join(chr(97 + (i // 26 ** k) % 26) for k in range(3)) for i in range(5000)]
+        phrases = {"generated": [f"blocked phrase {w}" for w in words]}
+        phrases["harmful"] = ["kill yourself"]
+        validator = ResponseValidator(phrases, version="test")
+
+        violations = validator.validate(f"just kill yourself over blocked phrase {words[-1]}")
+
+        assert [v.phrase for v in violations] == ["kill yourself", f"blocked phrase {words[-1]}"]
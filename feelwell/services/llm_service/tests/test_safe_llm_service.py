@@ -0,0 +1,253 @@
+"""Tests for the safety-first LLM service."""
+import asyncio
+import pytest
+
+from feelwell.shared.models.risk import RiskLevel
+from feelwell.shared.utils import configure_pii_salt
+from feelwell.services.safety_service.config import CRISIS_KEYWORD_TYPES
+from feelwell.services.safety_service.scanner import SafetyScanner
+from feelwell.services.safety_service.text_normalizer import TextNormalizer
+from feelwell.services.llm_service.base_llm import (
+    BaseLLM,
+    LLMConfig,
+    LLMProvider,
+    LLMResponse,
+)
+from feelwell.services.llm_service.circuit_breaker import (
+    CircuitBreakerConfig,
+    CircuitBreakerLLM,
+)
+from feelwell.services.llm_service.context_builder import (
+    ContextBuilder,
+    ContextBuilderConfig,
+)
+from feelwell.services.llm_service.response_cache import ResponseCache
+from feelwell.services.llm_service.safe_llm_service import (
+    ResponseSource,
+    SafeLLMService,
+)
+
+SAFE_MESSAGE = "Any tips for studying for exams?"
+REPLY = "Try breaking your study time into short sessions."
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class FakeLLM(BaseLLM):
+    """Returns `reply` or streams `tokens`, then raises `error` if set."""
+
+    def __init__(self, reply=REPLY, tokens=None, error=None):
+        super().__init__(LLMConfig(provider=LLMProvider.HUGGINGFACE, model_name="fake"))
+        self.reply = reply
+        self.tokens = list(tokens or [reply])
+        self.error = error
+        self.calls = []
+        self.streams_closed = 0
+
+    async def generate(self, prompt, system_prompt=None, **kwargs):
+        self.calls.append((prompt, system_prompt))
+        if self.error is not None:
+            raise self.error
+        return LLMResponse(text=self.reply, model="fake", provider="fake", latency_ms=120.0)
+
+    async def generate_batch(self, prompts, system_prompt=None, **kwargs):
+        return [await self.generate(p, system_prompt) for p in prompts]
+
+    async def generate_stream(self, prompt, system_prompt=None, **kwargs):
+        self.calls.append((prompt, system_prompt))
+        try:
+            for token in self.tokens:
+                yield token
+            if self.error is not None:
+                raise self.error
+        finally:
+            self.streams_closed += 1
+
+
+@pytest.fixture(autouse=True)
+def pii_salt():
+    configure_pii_salt("test-salt-for-safe-llm-service-tests")
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    return SafetyScanner()
+
+
+def make_service(llm, scanner, **kwargs):
+    return SafeLLMService(
+        llm=llm, crisis_scanner=scanner, text_normalizer=TextNormalizer(), **kwargs
+    )
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestSafetyChecks:
+    @pytest.mark.parametrize("message,crisis_type,keyword", [
+        ("I want to kill myself", "suicide", "kill myself"),
+        ("I keep cutting myself", "self_harm", "cutting myself"),
+        ("My uncle touches me when nobody is home", "abuse", "touches me"),
+    ])
+    def test_crisis_bypasses_llm(self, scanner, message, crisis_type, keyword):
+        llm = FakeLLM()
+
+        response = run(make_service(llm, scanner).generate_safe_response(message, "student-1"))
+
+        assert llm.calls == []
+        assert response.source == ResponseSource.CRISIS_PROTOCOL
+        assert response.risk_level == RiskLevel.CRISIS
+        assert response.text == SafeLLMService.CRISIS_RESPONSES[crisis_type]
+        assert response.metadata["crisis_type"] == crisis_type
+        assert keyword in response.metadata["keywords_matched"]
+        assert response.metadata["message_id"].startswith("msg_")
+
+    @pytest.mark.parametrize("crisis_type,keyword", [
+        (crisis_type, keyword)
+        for crisis_type, keywords in CRISIS_KEYWORD_TYPES.items()
+        for keyword in sorted(keywords)
+    ])
+    def test_configured_keywords_select_their_protocol(self, scanner, crisis_type, keyword):
+        response = run(make_service(FakeLLM(), scanner).generate_safe_response(
+            f"Lately {keyword} when things get bad", "student-1"
+        ))
+
+        assert response.source == ResponseSource.CRISIS_PROTOCOL
+        assert response.metadata["crisis_type"] == crisis_type
+
+    def test_scanner_risk_level_selects_prompt(self, scanner):
+        llm = FakeLLM()
+
+        response = run(make_service(llm, scanner).generate_safe_response(
+            "I feel hopeless and alone", "student-1"
+        ))
+
+        assert response.source == ResponseSource.LLM_GENERATED
+        assert response.risk_level == RiskLevel.CAUTION
+        assert "elevated distress" in llm.calls[0][1]
+
+    def test_stream_crisis_is_one_final_chunk(self, scanner):
+        llm = FakeLLM()
+
+        chunks = run(collect(make_service(llm, scanner).generate_stream(
+            "I want to kill myself", "student-1"
+        )))
+
+        assert llm.calls == []
+        assert len(chunks) == 1 and chunks[0].done
+        assert chunks[0].source == ResponseSource.CRISIS_PROTOCOL
+
+
+class TestStreaming:
+    def test_clean_stream_releases_everything(self, scanner):
+        llm = FakeLLM(tokens=["Try breaking ", "your study time ", "into short sessions."])
+
+        chunks = run(collect(make_service(llm, scanner).generate_stream(SAFE_MESSAGE, "student-1")))
+
+        final = chunks[-1]
+        assert final.done and not final.replaces_previous
+        assert "".join(c.text for c in chunks) == REPLY
+        assert final.response.text == REPLY
+        assert final.response.metadata["time_to_first_token_ms"] is not None
+        assert llm.streams_closed == 1
+
+    def test_violation_cuts_over_to_fallback(self, scanner):
+        llm = FakeLLM(tokens=["Honestly you could ", "just kill ", "yourself", " and stop."])
+
+        chunks = run(collect(make_service(llm, scanner).generate_stream(SAFE_MESSAGE, "student-1")))
+
+        released = "".join(c.text for c in chunks[:-1])
+        assert "kill" not in released
+        final = chunks[-1]
+        assert final.done and final.replaces_previous
+        assert final.source == ResponseSource.FALLBACK
+        assert final.response.metadata["released_chars"] == len(released)
+        assert llm.streams_closed == 1
+
+    def test_evasion_cuts_over_to_fallback(self, scanner):
+        tokens = ["Honestly, just ", "k1ll", "                    ", "y0urself. ", "Bye for now."]
+        llm = FakeLLM(tokens=tokens)
+
+        chunks = run(collect(make_service(llm, scanner).generate_stream(SAFE_MESSAGE, "student-1")))
+
+        assert chunks[-1].replaces_previous
+        assert chunks[-1].response.source == ResponseSource.FALLBACK
+
+    def test_llm_error_cuts_over_to_fallback(self, scanner):
+        llm = FakeLLM(tokens=["Try breaking "], error=ConnectionError("reset"))
+
+        chunks = run(collect(make_service(llm, scanner).generate_stream(SAFE_MESSAGE, "student-1")))
+
+        assert chunks[-1].replaces_previous
+        assert chunks[-1].response.source == ResponseSource.FALLBACK
+
+
+class TestResponseCache:
+    def test_cached_response_is_revalidated(self, scanner):
+        llm = FakeLLM()
+        cache = ResponseCache()
+        service = make_service(llm, scanner, response_cache=cache)
+        cache.put(
+            TextNormalizer().normalize(SAFE_MESSAGE),
+            RiskLevel.SAFE,
+            SafeLLMService.SYSTEM_PROMPT_VERSION,
+            text="You should die.",
+            model="old",
+            llm_latency_ms=900.0,
+        )
+
+        first = run(service.generate_safe_response(SAFE_MESSAGE, "student-1"))
+        second = run(service.generate_safe_response(SAFE_MESSAGE, "student-2"))
+
+        assert first.text == REPLY and not (first.metadata or {}).get("cache_hit")
+        assert cache.stats.rejected == 1
+        assert second.text == REPLY and second.metadata["cache_hit"]
+        assert len(llm.calls) == 1
+
+    def test_later_turns_skip_cache(self, scanner):
+        llm = FakeLLM()
+        service = make_service(llm, scanner, response_cache=ResponseCache())
+        history = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello!"}]
+
+        run(service.generate_safe_response(SAFE_MESSAGE, "student-1"))
+        run(service.generate_safe_response(SAFE_MESSAGE, "student-1", history, "session-1"))
+
+        assert len(llm.calls) == 2
+
+
+class TestCircuitBreaker:
+    def test_open_circuit_falls_back_without_calling_provider(self, scanner):
+        llm = FakeLLM(error=TimeoutError("provider timed out"))
+        breaker = CircuitBreakerLLM(llm, CircuitBreakerConfig(window_size=2, min_calls=2))
+        service = make_service(breaker, scanner)
+
+        responses = [
+            run(service.generate_safe_response(SAFE_MESSAGE, "student-1")) for _ in range(3)
+        ]
+
+        assert all(r.source == ResponseSource.FALLBACK for r in responses)
+        assert len(llm.calls) == 2
+        assert breaker.snapshot()["state"] == "open"
+
+
+class TestTokenBudget:
+    def test_long_history_is_summarized_within_budget(self, scanner):
+        llm = FakeLLM()
+        builder = ContextBuilder(ContextBuilderConfig(max_context_tokens=300, summary_tokens=60))
+        service = make_service(llm, scanner, context_builder=builder)
+        history = [
+            f"Turn {i}: school has been busy and I have a lot of reading to finish this week"
+            for i in range(30)
+        ]
+
+        response = run(service.generate_safe_response(
+            SAFE_MESSAGE, "student-1", history, "session-1"
+        ))
+
+        assert response.metadata["summarized_turns"] > 0
+        assert response.metadata["prompt_tokens"] <= 300
+        prompt = llm.calls[0][0]
+        assert "Turn 29" in prompt and SAFE_MESSAGE in prompt
@@ -0,0 +1,166 @@
+"""Tests for single-flight request coalescing."""
+import asyncio
+import pytest
+
+from feelwell.services.llm_service.single_flight import SingleFlight
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Pipeline:
+    """Stands in for generate_response: counts runs and side effects."""
+
+    def __init__(self, delay=0.01, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.runs = 0
+        self.audit_writes = 0
+
+    async def __call__(self):
+        self.runs += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("llm down")
+        self.audit_writes += 1
+        return {"text": f"response {self.runs}"}
+
+
+class TestSingleFlight:
+    def test_concurrent_duplicates_share_one_run(self):
+        flight = SingleFlight()
+        pipeline = Pipeline()
+
+        async def scenario():
+            return await asyncio.gather(*(flight.do("k", pipeline) for _ in range(5)))
+
+        results = run(scenario())
+
+        assert pipeline.runs == 1
+        assert pipeline.audit_writes == 1
+        assert {r["text"] for r, _ in results} == {"response 1"}
+        assert [shared for _, shared in results].count(False) == 1
+        assert flight.stats.coalesced == 4
+
+    def test_distinct_keys_run_separately(self):
+        flight = SingleFlight()
+        pipeline = Pipeline()
+
+        async def scenario():
+            await asyncio.gather(flight.do("a", pipeline), flight.do("b", pipeline))
+
+        run(scenario())
+
+        assert pipeline.runs == 2
+        assert flight.stats.leaders == 2
+
+    def test_retry_within_window_is_replayed(self):
+        clock = FakeClock()
+        flight = SingleFlight(window_seconds=2.0, clock=clock)
+        pipeline = Pipeline()
+
+        async def scenario():
+            first = await flight.do("k", pipeline)
+            clock.now = 1.5
+            retry = await flight.do("k", pipeline)
+            clock.now = 4.0
+            later = await flight.do("k", pipeline)
+            return first, retry, later
+
+        first, retry, later = run(scenario())
+
+        assert retry == (first[0], True)
+        assert later == ({"text": "response 2"}, False)
+        assert flight.stats.replayed == 1
+
+    def test_zero_window_coalesces_in_flight_only(self):
+        flight = SingleFlight(window_seconds=0)
+        pipeline = Pipeline()
+
+        async def scenario():
+            await flight.do("k", pipeline)
+            await flight.do("k", pipeline)
+
+        run(scenario())
+
+        assert pipeline.runs == 2
+
+    def test_failures_propagate_and_are_not_replayed(self):
+        flight = SingleFlight()
+        pipeline = Pipeline(fail=True)
+
+        async def scenario():
+            results = await asyncio.gather(
+                flight.do("k", pipeline), flight.do("k", pipeline), return_exceptions=True
+            )
+            pipeline.fail = False
+            return results, await flight.do("k", pipeline)
+
+        results, retry = run(scenario())
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert pipeline.runs == 2
+        assert retry == ({"text": "response 2"}, False)
+        assert flight.stats.failures == 1
+
+    def test_rejected_results_are_not_replayed(self):
+        flight = SingleFlight(replay_if=lambda result: result["text"] != "response 1")
+        pipeline = Pipeline()
+
+        async def scenario():
+            first = await flight.do("k", pipeline)
+            retry = await flight.do("k", pipeline)
+            return first, retry, await flight.do("k", pipeline)
+
+        first, retry, replay = run(scenario())
+
+        assert first == ({"text": "response 1"}, False)
+        assert retry == ({"text": "response 2"}, False)
+        assert replay == ({"text": "response 2"}, True)
+        assert flight.stats.not_replayable == 1
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        flight = SingleFlight()
+        pipeline = Pipeline(delay=0.05)
+
+        async def scenario():
+            leader = asyncio.ensure_future(flight.do("k", pipeline))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flight.do("k", pipeline))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await follower
+
+        result, shared = run(scenario())
+
+        assert result == {"text": "response 1"}
+        assert shared is True
+        assert pipeline.audit_writes == 1
+
+    def test_stats_to_dict(self):
+        flight = SingleFlight()
+        pipeline = Pipeline()
+
+        async def scenario():
+            await asyncio.gather(flight.do("k", pipeline), flight.do("k", pipeline))
+
+        run(scenario())
+
+        assert flight.stats.to_dict() == {
+            "leaders": 1,
+            "coalesced": 1,
+            "replayed": 0,
+            "failures": 0,
+            "not_replayable": 0,
+            "in_flight": 0,
+            "duplicate_rate": 0.5,
+        }
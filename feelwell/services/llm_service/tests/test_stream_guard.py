@@ -0,0 +1,132 @@
+"""Tests for incremental validation of streamed LLM responses."""
+import random
+import pytest
+
+from feelwell.services.llm_service.response_validator import ResponseValidator
+from feelwell.services.llm_service.stream_guard import (
+    MAX_CONTEXT_CHARS,
+    StreamingResponseGuard,
+)
+
+
+VALIDATOR = ResponseValidator(
+    {"harmful": ["kill yourself"], "medical": ["you have depression"]}, version="test"
+)
+
+
+def stream(guard, chunks):
+    released = [guard.feed(chunk) for chunk in chunks]
+    released.append(guard.finish())
+    return "".join(released)
+
+
+def random_chunks(text, seed):
+    rng = random.Random(seed)
+    chunks, i = [], 0
+    while i < len(text):
+        step = rng.randint(1, 6)
+        chunks.append(text[i:i + step])
+        i += step
+    return chunks
+
+
+class TestStreamingResponseGuard:
+    """Tests for StreamingResponseGuard."""
+
+    def test_safe_stream_is_released_in_full(self):
+        text = "It sounds like exams are weighing on you. Want to talk about it?"
+        guard = StreamingResponseGuard(VALIDATOR)
+
+        assert stream(guard, random_chunks(text, 1)) == text
+        assert guard.violation is None
+        assert guard.released_chars == len(text)
+
+    def test_releases_before_end_of_stream(self):
+        guard = StreamingResponseGuard(VALIDATOR)
+        words = ["That ", "sounds ", "really ", "hard. ", "I'm ", "here ", "for ", "you ", "today."]
+
+        early = "".join(guard.feed(w) for w in words)
+
+        assert early.startswith("That sounds")
+        assert "".join(words).startswith(early)
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_split_pattern_is_caught_before_release(self, seed):
+        text = "I hear you. Maybe you have depression and should rest."
+        guard = StreamingResponseGuard(VALIDATOR)
+
+        released = stream(guard, random_chunks(text, seed))
+
+        assert guard.violation is not None
+        assert guard.violation.category == "medical"
+        assert guard.violation.offset == text.index("you have depression")
+        assert "you have" not in released.lower()
+        assert text.startswith(released)
+
+    def test_case_insensitive(self):
+        guard = StreamingResponseGuard(VALIDATOR)
+
+        stream(guard, ["Just ", "KILL ", "Yourself"])
+
+        assert guard.violation.pattern == "kill yourself"
+        assert guard.violation.category == "harmful"
+
+    def test_nothing_released_after_violation(self):
+        guard = StreamingResponseGuard(VALIDATOR)
+        guard.feed("kill yourself ")
+
+        assert guard.feed("and more text that is long enough to release") == ""
+        assert guard.finish() == ""
+
+    def test_releases_at_word_boundaries(self):
+        guard = StreamingResponseGuard(VALIDATOR)
+
+        released = guard.feed("one two three four five six seven eight nine ten eleven")
+
+        assert released.endswith(" ")
+
+    @pytest.mark.parametrize("evasion", [
+        "kill y0urs3lf",
+        "K1LL YOURSELF",
+        "ｋｉｌｌ yourself",
+        "kill\u200b yourself",
+        "kill    yourself",
+    ])
+    @pytest.mark.parametrize("seed", range(5))
+    def test_agrees_with_validator_on_evasions(self, evasion, seed):
+        text = f"Honestly, {evasion}."
+        guard = StreamingResponseGuard(VALIDATOR)
+
+        stream(guard, random_chunks(text, seed))
+
+        assert [v.category for v in VALIDATOR.validate(text)] == ["harmful"]
+        assert guard.violation is not None
+        assert guard.violation.category == "harmful"
+
+    def test_evasion_longer_than_holdback_is_caught_from_context(self):
+        text = "Honestly, just kill" + " " * 20 + "yourself and be done. " + "More words. " * 4
+        guard = StreamingResponseGuard(VALIDATOR)
+
+        released = "".join(guard.feed(chunk) for chunk in random_chunks(text, 3))
+
+        assert "kill" in released and "yourself" not in released
+        assert guard.violation.pattern == "kill yourself"
+
+    def test_evasion_longer_than_context_is_caught_at_finish(self):
+        padding = " " * (MAX_CONTEXT_CHARS + 20)
+        text = "Honestly, just kill" + padding + "yourself and be done. " + "More words. " * 4
+        guard = StreamingResponseGuard(VALIDATOR)
+
+        released = "".join(guard.feed(chunk) for chunk in random_chunks(text, 3))
+
+        assert "kill" in released and guard.violation is None
+        assert guard.finish() == ""
+        assert guard.violation.pattern == "kill yourself"
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_negated_phrase_is_released(self, seed):
+        text = "Whatever happens at school, please don't ever kill yourself. I'm here."
+        guard = StreamingResponseGuard(VALIDATOR)
+
+        assert stream(guard, random_chunks(text, seed)) == text
+        assert guard.violation is None
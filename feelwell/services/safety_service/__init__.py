@@ -21,7 +21,15 @@ Usage:
 """
 
 from .scanner import SafetyScanner, ScanResult
-from .config import SafetyConfig, ClinicalThresholds, CRISIS_KEYWORDS, CAUTION_KEYWORDS
+from .config import (
+    SafetyConfig,
+    ClinicalThresholds,
+    CRISIS_KEYWORDS,
+    CAUTION_KEYWORDS,
+    SELF_HARM_CRISIS_KEYWORDS,
+    ABUSE_CRISIS_KEYWORDS,
+    CRISIS_KEYWORD_TYPES,
+)
 from .crisis_publisher import CrisisEventPublisher, SafetyCrisisEvent
 
 __all__ = [
@@ -31,6 +39,9 @@ __all__ = [
     "ClinicalThresholds",
     "CRISIS_KEYWORDS",
     "CAUTION_KEYWORDS",
+    "SELF_HARM_CRISIS_KEYWORDS",
+    "ABUSE_CRISIS_KEYWORDS",
+    "CRISIS_KEYWORD_TYPES",
     "CrisisEventPublisher",
     "SafetyCrisisEvent",
 ]
@@ -4,7 +4,7 @@ Source: PHQ-9 scoring guidelines
 https://www.apa.org/depression-guideline/patient-health-questionnaire.pdf
 """
 from dataclasses import dataclass
-from typing import FrozenSet
+from typing import Dict, FrozenSet
 
 
 @dataclass(frozen=True)
@@ -37,6 +37,22 @@ class SafetyConfig:
     pattern_version: str = "2026.01.14"
 
 
+# Self-harm crisis keywords; they select the self-harm crisis protocol
+SELF_HARM_CRISIS_KEYWORDS: FrozenSet[str] = frozenset({
+    "hurt myself",
+    "harm myself",
+    "cut myself",
+    "cutting myself",
+    "cutting",
+    "burned myself",
+})
+
+# Abuse disclosure crisis keywords (mandatory reporting); they select the
+# abuse crisis protocol
+ABUSE_CRISIS_KEYWORDS: FrozenSet[str] = frozenset({
+    "touches me",
+})
+
 # Crisis keywords that trigger immediate bypass (regex-based safety net)
 # These are hard-coded per ADR-001 - LLM never sees messages with these
 # Updated: 2026-01-15 - Phase 1 safety fixes: expanded patterns for adversarial evasion
@@ -50,8 +66,7 @@ CRISIS_KEYWORDS: FrozenSet[str] = frozenset({
     "want to die",
     "suicide",
     "suicidal",
-    "hurt myself",
-    "harm myself",
+    # Plus SELF_HARM_CRISIS_KEYWORDS (added below)
     
     # ==========================================================================
     # METHODS (critical - indicates planning)
@@ -63,10 +78,6 @@ CRISIS_KEYWORDS: FrozenSet[str] = frozenset({
     "gun",
     "rope",
     "noose",
-    "cut myself",
-    "cutting myself",
-    "cutting",
-    "burned myself",
     "jump off",
     "hang myself",
     
@@ -125,11 +136,6 @@ CRISIS_KEYWORDS: FrozenSet[str] = frozenset({
     "hurt other people",
     "hurt people at school",
     
-    # ==========================================================================
-    # ABUSE DISCLOSURE (mandatory reporting)
-    # ==========================================================================
-    "touches me",
-    
     # ==========================================================================
     # SEVERE EATING DISORDER
     # ==========================================================================
@@ -144,7 +150,14 @@ CRISIS_KEYWORDS: FrozenSet[str] = frozenset({
     "not real",
     "voices in my head",
     "voices",               # Broader catch for command hallucinations
-})
+}) | SELF_HARM_CRISIS_KEYWORDS | ABUSE_CRISIS_KEYWORDS
+
+# Crisis type -> the crisis keywords that select it. Any other crisis
+# keyword selects the suicide protocol, the most serious
+CRISIS_KEYWORD_TYPES: Dict[str, FrozenSet[str]] = {
+    "self_harm": SELF_HARM_CRISIS_KEYWORDS,
+    "abuse": ABUSE_CRISIS_KEYWORDS,
+}
 
 # Caution keywords that elevate risk score but don't trigger bypass
 CAUTION_KEYWORDS: FrozenSet[str] = frozenset({
@@ -251,7 +251,7 @@ class ConnectionManager:
 class MockConnection:
     """Mock connection for development without psycopg2."""
     
-    def cursor(self):
+    def cursor(self, name: Optional[str] = None):
         return MockCursor()
     
     def commit(self):
@@ -273,6 +273,9 @@ class MockCursor:
     def fetchall(self):
         return []
     
+    def __iter__(self):
+        return iter([])
+    
     def close(self):
         pass
     